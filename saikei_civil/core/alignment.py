@@ -31,7 +31,8 @@ Usage:
         pis = [{"x": 0, "y": 0}, {"x": 100, "y": 0}]
         entity = alignment_core.create_alignment(ifc, alignment, "Main Road", pis)
 """
-from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple, Union
 import math
 
 # Re-export the pure geometry functions - these already have no Blender deps
@@ -42,10 +43,12 @@ from .horizontal_alignment.curve_geometry import (
     calculate_point_on_curve,
     get_tangent_intersection,
 )
+from .horizontal_alignment.evaluator import CompiledHorizontalAlignment
 
 if TYPE_CHECKING:
     import saikei_civil.tool as tool
     import ifcopenshell
+    from .horizontal_alignment.stationing import StationingManager
 
 
 # =============================================================================
@@ -268,8 +271,62 @@ def interpolate_position_on_arc(
     return position, tangent_dir
 
 
+# Number of compiled layouts kept by compile_segments()
+MAX_COMPILED_LAYOUTS = 8
+
+_compiled_cache: "OrderedDict[Tuple, CompiledHorizontalAlignment]" = OrderedDict()
+
+
+def _segments_key(segments: List[Dict]) -> Tuple:
+    """Hashable key of the geometry-defining values of segment dictionaries."""
+    def xy(point):
+        return None if point is None else (point.x, point.y)
+
+    return tuple(
+        (
+            seg.get('type'),
+            seg.get('length', 0.0),
+            xy(seg.get('start')),
+            seg.get('direction'),
+            xy(seg.get('center')),
+            seg.get('radius'),
+            seg.get('start_angle'),
+            seg.get('is_ccw'),
+        )
+        for seg in segments
+    )
+
+
+def compile_segments(segments: List[Dict]) -> CompiledHorizontalAlignment:
+    """
+    Compile segment dictionaries into an array-backed evaluator.
+
+    Compiled layouts are memoized on the segment geometry, so repeated
+    queries with the same dictionaries (e.g. get_point_at_station() in a
+    per-station loop) compile once. Passing the compiled evaluator directly
+    skips even the key computation.
+
+    Args:
+        segments: List of segment dictionaries
+
+    Returns:
+        CompiledHorizontalAlignment for the segments
+    """
+    key = _segments_key(segments)
+    compiled = _compiled_cache.get(key)
+    if compiled is not None:
+        _compiled_cache.move_to_end(key)
+        return compiled
+
+    compiled = CompiledHorizontalAlignment.from_segment_dicts(segments)
+    _compiled_cache[key] = compiled
+    while len(_compiled_cache) > MAX_COMPILED_LAYOUTS:
+        _compiled_cache.popitem(last=False)
+    return compiled
+
+
 def get_point_at_station(
-    segments: List[Dict],
+    segments: Union[List[Dict], CompiledHorizontalAlignment],
     station: float,
     start_station: float = 0.0
 ) -> Optional[Dict]:
@@ -277,136 +334,63 @@ def get_point_at_station(
     Get position and direction at a station value.
 
     Args:
-        segments: List of segment dictionaries
+        segments: List of segment dictionaries, or a compiled evaluator
+            from compile_segments()
         station: Station value to query
         start_station: Starting station of alignment
 
     Returns:
         Dictionary with 'x', 'y', 'direction' keys, or None if out of range
     """
+    if not isinstance(segments, CompiledHorizontalAlignment):
+        segments = compile_segments(segments)
+
     distance = station - start_station
-    if distance < 0:
+    if distance < 0 or segments.segment_count == 0 or distance > segments.total_length:
         return None
 
-    cumulative = 0.0
-
-    for seg in segments:
-        seg_length = seg.get('length', 0.0)
-
-        if cumulative + seg_length >= distance:
-            local_dist = distance - cumulative
-
-            if seg.get('type') == 'LINE':
-                pos = interpolate_position_on_line(
-                    seg['start'],
-                    seg['direction'],
-                    local_dist
-                )
-                return {
-                    'x': pos.x,
-                    'y': pos.y,
-                    'direction': seg['direction']
-                }
-
-            elif seg.get('type') == 'CIRCULARARC':
-                center = seg['center']
-                radius = seg['radius']
-                start_angle = seg['start_angle']
-                is_ccw = seg.get('is_ccw', True)
-
-                pos, direction = interpolate_position_on_arc(
-                    center, radius, start_angle, local_dist, is_ccw
-                )
-                return {
-                    'x': pos.x,
-                    'y': pos.y,
-                    'direction': direction
-                }
-
-        cumulative += seg_length
-
-    return None
+    x, y, direction, _ = segments.evaluate_at(distance)
+    return {
+        'x': x,
+        'y': y,
+        'direction': direction
+    }
 
 
 def get_station_at_point(
-    segments: List[Dict],
+    segments: Union[List[Dict], CompiledHorizontalAlignment],
     point: Tuple[float, float],
     start_station: float = 0.0,
-    tolerance: float = 10.0
+    tolerance: float = 10.0,
+    stationing: Optional["StationingManager"] = None
 ) -> Optional[float]:
     """
     Get station value at a point (projected onto alignment).
 
+    For many points use CompiledHorizontalAlignment.project_points().
+
     Args:
-        segments: List of segment dictionaries
+        segments: List of segment dictionaries, or a compiled evaluator
+            from compile_segments()
         point: (x, y) coordinates to query
         start_station: Starting station of alignment
         tolerance: Maximum perpendicular distance to consider
+        stationing: Optional StationingManager; when given, its referents
+            (including station equations) give the station and
+            start_station is ignored
 
     Returns:
         Station value, or None if point is too far from alignment
     """
-    target = SimpleVector(point[0], point[1])
-    best_station = None
-    best_distance = tolerance
-
-    cumulative = 0.0
-
-    for seg in segments:
-        seg_length = seg.get('length', 0.0)
-
-        if seg.get('type') == 'LINE':
-            # Project point onto line segment
-            start = seg['start']
-            direction = seg['direction']
-
-            # Vector from start to target
-            to_target = target - start
-
-            # Unit direction vector
-            dir_vec = SimpleVector(
-                math.cos(direction),
-                math.sin(direction)
-            )
-
-            # Project onto line
-            proj_dist = to_target.dot(dir_vec)
-            proj_dist = max(0, min(proj_dist, seg_length))
-
-            # Calculate projected point
-            proj_point = start + dir_vec * proj_dist
-            perp_dist = target.distance_to(proj_point)
-
-            if perp_dist < best_distance:
-                best_distance = perp_dist
-                best_station = start_station + cumulative + proj_dist
-
-        elif seg.get('type') == 'CIRCULARARC':
-            # Project point onto arc
-            center = seg['center']
-            radius = seg['radius']
-
-            # Vector from center to target
-            to_target = target - center
-            dist_to_center = to_target.length
+    if not isinstance(segments, CompiledHorizontalAlignment):
+        segments = compile_segments(segments)
 
-            if dist_to_center > 0:
-                # Perpendicular distance is difference from radius
-                perp_dist = abs(dist_to_center - radius)
-
-                if perp_dist < best_distance:
-                    # Calculate arc angle to this point
-                    angle = math.atan2(to_target.y, to_target.x)
-
-                    # Check if within arc bounds (simplified)
-                    arc_dist = radius * abs(angle - seg['start_angle'])
-                    if arc_dist <= seg_length:
-                        best_distance = perp_dist
-                        best_station = start_station + cumulative + arc_dist
-
-        cumulative += seg_length
-
-    return best_station
+    stations, offsets, _ = segments.project_points(
+        [point], start_station, max_offset=tolerance, stationing=stationing
+    )
+    if math.isnan(stations[0]) or abs(offsets[0]) >= tolerance:
+        return None
+    return float(stations[0])
 
 
 # =============================================================================
@@ -757,6 +741,7 @@ __all__ = [
     'get_total_alignment_length',
     'interpolate_position_on_line',
     'interpolate_position_on_arc',
+    'compile_segments',
     'get_point_at_station',
     'get_station_at_point',
 
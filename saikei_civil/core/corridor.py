@@ -45,14 +45,20 @@ Usage:
         pass
 """
 from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 # Import from native_ifc_corridor for IFC-specific logic
 from .native_ifc_corridor import (
     StationPoint,
     StationManager,
     CorridorModeler,
+    DEFAULT_CHORD_TOLERANCE,
 )
+from .horizontal_alignment.evaluator import CompiledHorizontalAlignment
+from .horizontal_alignment.stationing import StationingManager
+from .vertical_alignment.profile_table import VerticalProfileTable
 
 if TYPE_CHECKING:
     import saikei_civil.tool as tool
@@ -70,6 +76,7 @@ class CorridorParams:
     end_station: float
     interval: float = 10.0
     curve_densification: float = 1.5
+    chord_tolerance: float = DEFAULT_CHORD_TOLERANCE
     lod: str = 'medium'  # 'low', 'medium', 'high'
 
 
@@ -143,9 +150,12 @@ def generate_corridor(
     assembly_wrapper = create_assembly_wrapper(assembly_data)
 
     # Generate stations using StationManager
-    station_manager = StationManager(alignment_3d, params.interval)
+    station_manager = StationManager(
+        alignment_3d, params.interval, chord_tolerance=params.chord_tolerance
+    )
     stations = station_manager.calculate_stations(
-        curve_densification_factor=params.curve_densification
+        curve_densification_factor=params.curve_densification,
+        constraint_manager=assembly_wrapper.constraint_manager
     )
 
     if len(stations) < 2:
@@ -227,6 +237,42 @@ def _parent_object(child: Any, parent: Any) -> None:
 # Alignment Wrapper (Pure Python)
 # =============================================================================
 
+def evaluate_alignment(
+    horizontal: CompiledHorizontalAlignment,
+    vertical: Optional[VerticalProfileTable],
+    stations: np.ndarray,
+    distances: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate 3D positions, bearings and grades at many stations at once.
+
+    Matches AlignmentWrapper.get_3d_position(), get_direction() and
+    get_grade() station by station: outside the vertical profile the
+    first elevation and a zero grade are used.
+
+    Args:
+        horizontal: Compiled horizontal layout (queried by distance along)
+        vertical: Vertical profile table, or None for a flat alignment
+        stations: (N,) station values (m)
+        distances: (N,) distances along the alignment for those stations
+
+    Returns:
+        Tuple of ((N, 3) positions, (N,) bearings, (N,) grades)
+    """
+    stations = np.asarray(stations, dtype=np.float64)
+    x, y, bearings, _ = horizontal.evaluate(distances)
+
+    if vertical is None or vertical.segment_count == 0:
+        z = np.zeros_like(stations)
+        grades = np.zeros_like(stations)
+    else:
+        z = vertical.elevations(stations)
+        z = np.where(np.isnan(z), vertical.start_elevations[0], z)
+        grades = np.nan_to_num(vertical.grades(stations))
+
+    return np.column_stack((x, y, z)), bearings, grades
+
+
 class AlignmentWrapper:
     """
     Wrapper for IFC alignment that provides 3D position sampling.
@@ -243,15 +289,15 @@ class AlignmentWrapper:
             start_sta: Starting station (user-specified, may be offset from 0)
             end_sta: Ending station (user-specified)
         """
-        import math
-        self._math = math
-
         self.ifc_alignment = ifc_alignment
         self._start = start_sta
         self._end = end_sta
         self.horizontal = None
         self.vertical = None
         self.segments = []
+        self.horizontal_evaluator = CompiledHorizontalAlignment.from_ifc_segments([])
+        self.vertical_profile: Optional[VerticalProfileTable] = None
+        self.stationing: Optional[StationingManager] = None
         # This will be set from alignment data - the station value at distance=0
         self.starting_station = 0.0
         self._load_alignment_data()
@@ -275,33 +321,19 @@ class AlignmentWrapper:
         logger = get_logger(__name__)
 
         # Try to get starting station from vertical alignment
-        if self.vertical:
-            v_segments = []
-            for rel in self.vertical.IsNestedBy or []:
-                for obj in rel.RelatedObjects:
-                    if obj.is_a("IfcAlignmentSegment"):
-                        if hasattr(obj, 'DesignParameters') and obj.DesignParameters:
-                            if obj.DesignParameters.is_a("IfcAlignmentVerticalSegment"):
-                                v_segments.append(obj.DesignParameters)
-
-            if v_segments:
-                v_segments.sort(key=lambda s: s.StartDistAlong)
-                # The first vertical segment's StartDistAlong tells us what station
-                # corresponds to the start of the vertical alignment
-                self.starting_station = v_segments[0].StartDistAlong
-                logger.info(f"Starting station from vertical alignment: {self.starting_station:.2f}")
-                return
+        if self.vertical_profile is not None and self.vertical_profile.segment_count > 0:
+            # The first vertical segment's StartDistAlong tells us what station
+            # corresponds to the start of the vertical alignment
+            self.starting_station = self.vertical_profile.start_station
+            logger.info(f"Starting station from vertical alignment: {self.starting_station:.2f}")
+            return
 
         # If no vertical alignment, try to infer from horizontal alignment extent
         # The user's start station (e.g., 10000) maps to geometry distance 0
         # This assumes the horizontal geometry starts at the user's start station
         if self.segments:
             # Calculate total horizontal length
-            total_h_length = sum(
-                seg.DesignParameters.SegmentLength
-                for seg in self.segments
-                if seg.DesignParameters
-            )
+            total_h_length = self.horizontal_evaluator.total_length
             # If user station range matches horizontal length, use user's start
             user_length = self._end - self._start
             if abs(total_h_length - user_length) < 10.0:  # Within 10m tolerance
@@ -337,6 +369,17 @@ class AlignmentWrapper:
                 elif obj.is_a("IfcAlignmentVertical"):
                     self.vertical = obj
 
+        self.horizontal_evaluator = CompiledHorizontalAlignment.from_ifc_segments(self.segments)
+        if self.vertical:
+            self.vertical_profile = VerticalProfileTable.from_ifc_vertical(self.vertical)
+
+        # Station equations (read-only, no default referent is written)
+        stationing = StationingManager(None, self.ifc_alignment)
+        stationing.load_from_ifc(create_default=False)
+        if len(stationing.referents) > 1:
+            self.stationing = stationing
+            logger.info(f"  Loaded {len(stationing.referents) - 1} station equation(s)")
+
         logger.info(f"  Horizontal alignment: {'Found' if self.horizontal else 'NOT FOUND'}")
         logger.info(f"  Vertical alignment: {'Found' if self.vertical else 'NOT FOUND'}")
         logger.info(f"  Loaded {len(self.segments)} horizontal segments")
@@ -380,207 +423,102 @@ class AlignmentWrapper:
 
     def _station_to_distance(self, station: float) -> float:
         """Convert station value to distance along alignment."""
+        if self.stationing is not None:
+            distance = self.stationing.get_distance_at_station(station)
+            if distance is not None:
+                return distance
         return station - self.starting_station
 
-    def get_3d_position(self, station: float) -> Tuple[float, float, float]:
-        """Get 3D position (x, y, z) at a given station."""
-        from .logging_config import get_logger
-        logger = get_logger(__name__)
+    def distances_at(self, stations: np.ndarray) -> np.ndarray:
+        """
+        Convert many station values to distances along the alignment.
 
-        math = self._math
-        distance_along = self._station_to_distance(station)
+        Vectorized form of _station_to_distance(), including its fallback
+        for stations the station equations do not cover.
 
-        x, y = 0.0, 0.0
-        cumulative_distance = 0.0
-        found_segment = False
-
-        # Log only for first few stations to avoid spam
-        debug_this_call = (station == self._start)
-        if debug_this_call:
-            logger.info(f"get_3d_position(station={station:.2f})")
-            logger.info(f"  distance_along={distance_along:.2f}, segments={len(self.segments)}")
-
-        for segment in self.segments:
-            params = segment.DesignParameters
-            if not params:
-                if debug_this_call:
-                    logger.warning(f"  Segment has no DesignParameters, skipping")
-                continue
-
-            segment_length = params.SegmentLength
-            if debug_this_call:
-                logger.info(f"  Segment: type={params.PredefinedType}, length={segment_length:.2f}")
-                logger.info(f"    cumulative={cumulative_distance:.2f}, target={distance_along:.2f}")
-
-            if cumulative_distance + segment_length >= distance_along:
-                local_distance = distance_along - cumulative_distance
-
-                if params.PredefinedType == "LINE":
-                    start_point = params.StartPoint.Coordinates
-                    direction_angle = params.StartDirection
-
-                    x = start_point[0] + local_distance * math.cos(direction_angle)
-                    y = start_point[1] + local_distance * math.sin(direction_angle)
-                    found_segment = True
-                    if debug_this_call:
-                        logger.info(f"    LINE: start={start_point}, dir={direction_angle:.4f}")
-                        logger.info(f"    Result: x={x:.2f}, y={y:.2f}")
-                    break
-
-                elif params.PredefinedType == "CIRCULARARC":
-                    start_point = params.StartPoint.Coordinates
-                    radius = abs(params.StartRadiusOfCurvature)
-                    start_direction = params.StartDirection
-                    signed_radius = params.StartRadiusOfCurvature
-
-                    if signed_radius > 0:
-                        center_angle = start_direction + math.pi / 2
-                    else:
-                        center_angle = start_direction - math.pi / 2
+        Args:
+            stations: (N,) station values (m)
 
-                    center_x = start_point[0] + radius * math.cos(center_angle)
-                    center_y = start_point[1] + radius * math.sin(center_angle)
+        Returns:
+            (N,) distances along the alignment (m)
+        """
+        stations = np.asarray(stations, dtype=np.float64)
+        fallback = stations - self.starting_station
+        if self.stationing is None:
+            return fallback
+        distances = self.stationing.distances_from_stations(stations)
+        return np.where(np.isnan(distances), fallback, distances)
+
+    def stations_from_distances(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Convert many distances along the alignment to station values.
 
-                    arc_angle = local_distance / radius
-                    if signed_radius < 0:
-                        arc_angle = -arc_angle
+        Inverse of distances_at().
 
-                    current_angle = start_direction + arc_angle
-                    if signed_radius > 0:
-                        current_angle -= math.pi / 2
-                    else:
-                        current_angle += math.pi / 2
+        Args:
+            distances: (N,) distances along the alignment (m)
 
-                    x = center_x + radius * math.cos(current_angle)
-                    y = center_y + radius * math.sin(current_angle)
-                    found_segment = True
-                    if debug_this_call:
-                        logger.info(f"    ARC: start={start_point}, radius={radius:.2f}")
-                        logger.info(f"    Result: x={x:.2f}, y={y:.2f}")
-                    break
+        Returns:
+            (N,) station values (m)
+        """
+        distances = np.asarray(distances, dtype=np.float64)
+        if self.stationing is None:
+            return distances + self.starting_station
+        return self.stationing.stations_from_distances(distances)
 
-                else:
-                    if debug_this_call:
-                        logger.warning(f"    Unknown segment type: {params.PredefinedType}")
+    def evaluate_stations(
+        self,
+        stations: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate positions, bearings and grades at many stations at once.
 
-            cumulative_distance += segment_length
+        Args:
+            stations: (N,) station values (m)
 
-        if not found_segment and debug_this_call:
-            logger.error(f"  NO SEGMENT FOUND for station {station:.2f}!")
-            logger.error(f"  Total cumulative distance: {cumulative_distance:.2f}")
+        Returns:
+            Tuple of ((N, 3) positions, (N,) bearings, (N,) grades)
+        """
+        stations = np.asarray(stations, dtype=np.float64)
+        return evaluate_alignment(
+            self.horizontal_evaluator,
+            self.vertical_profile,
+            stations,
+            self.distances_at(stations),
+        )
 
+    def get_3d_position(self, station: float) -> Tuple[float, float, float]:
+        """Get 3D position (x, y, z) at a given station."""
+        distance_along = self._station_to_distance(station)
+        x, y, _, _ = self.horizontal_evaluator.evaluate_at(distance_along)
         z = self._get_elevation(station)
-        if debug_this_call:
-            logger.info(f"  Final position: ({x:.2f}, {y:.2f}, {z:.2f})")
         return x, y, z
 
     def _get_elevation(self, station: float) -> float:
-        """Get elevation at station from vertical alignment."""
-        if not self.vertical:
-            return 0.0
-
-        v_segments = []
-        for rel in self.vertical.IsNestedBy or []:
-            for obj in rel.RelatedObjects:
-                if obj.is_a("IfcAlignmentSegment"):
-                    if hasattr(obj, 'DesignParameters') and obj.DesignParameters:
-                        if obj.DesignParameters.is_a("IfcAlignmentVerticalSegment"):
-                            v_segments.append(obj.DesignParameters)
-
-        if not v_segments:
+        """Get elevation at station from the vertical snapshot."""
+        profile = self.vertical_profile
+        if profile is None or profile.segment_count == 0:
             return 0.0
 
-        v_segments.sort(key=lambda s: s.StartDistAlong)
-
-        for seg in v_segments:
-            start_sta = seg.StartDistAlong
-            end_sta = start_sta + seg.HorizontalLength
-
-            if start_sta <= station <= end_sta:
-                local_dist = station - start_sta
-
-                if seg.PredefinedType == "CONSTANTGRADIENT":
-                    return seg.StartHeight + seg.StartGradient * local_dist
-
-                elif seg.PredefinedType == "PARABOLICARC":
-                    g1 = seg.StartGradient
-                    g2 = seg.EndGradient
-                    L = seg.HorizontalLength
-                    A = (g2 - g1) / (2.0 * L)
-                    return seg.StartHeight + g1 * local_dist + A * (local_dist ** 2)
-
-        if v_segments:
-            return v_segments[0].StartHeight
-        return 0.0
+        elevation = profile.elevation_at(station)
+        if elevation is None:
+            return float(profile.start_elevations[0])
+        return elevation
 
     def get_direction(self, station: float) -> float:
         """Get direction (bearing) at station."""
-        math = self._math
         distance_along = self._station_to_distance(station)
-        cumulative_distance = 0.0
-
-        for segment in self.segments:
-            params = segment.DesignParameters
-            if not params:
-                continue
-
-            segment_length = params.SegmentLength
-
-            if cumulative_distance + segment_length >= distance_along:
-                local_distance = distance_along - cumulative_distance
-
-                if params.PredefinedType == "LINE":
-                    return params.StartDirection
-
-                elif params.PredefinedType == "CIRCULARARC":
-                    radius = abs(params.StartRadiusOfCurvature)
-                    signed_radius = params.StartRadiusOfCurvature
-                    start_direction = params.StartDirection
-
-                    arc_angle = local_distance / radius
-                    if signed_radius < 0:
-                        arc_angle = -arc_angle
-
-                    return start_direction + arc_angle
-
-            cumulative_distance += segment_length
-
-        return 0.0
+        _, _, bearing, _ = self.horizontal_evaluator.evaluate_at(distance_along)
+        return bearing
 
     def get_grade(self, station: float) -> float:
-        """Get grade at station from vertical alignment."""
-        if not self.vertical:
-            return 0.0
-
-        v_segments = []
-        for rel in self.vertical.IsNestedBy or []:
-            for obj in rel.RelatedObjects:
-                if obj.is_a("IfcAlignmentSegment"):
-                    if hasattr(obj, 'DesignParameters') and obj.DesignParameters:
-                        if obj.DesignParameters.is_a("IfcAlignmentVerticalSegment"):
-                            v_segments.append(obj.DesignParameters)
-
-        if not v_segments:
+        """Get grade at station from the vertical snapshot."""
+        profile = self.vertical_profile
+        if profile is None:
             return 0.0
 
-        v_segments.sort(key=lambda s: s.StartDistAlong)
-
-        for seg in v_segments:
-            start_sta = seg.StartDistAlong
-            end_sta = start_sta + seg.HorizontalLength
-
-            if start_sta <= station <= end_sta:
-                if seg.PredefinedType == "CONSTANTGRADIENT":
-                    return seg.StartGradient
-
-                elif seg.PredefinedType == "PARABOLICARC":
-                    local_dist = station - start_sta
-                    g1 = seg.StartGradient
-                    g2 = seg.EndGradient
-                    L = seg.HorizontalLength
-                    return g1 + (g2 - g1) * (local_dist / L)
-
-        return 0.0
+        grade = profile.grade_at(station)
+        return 0.0 if grade is None else grade
 
 
 def create_alignment_wrapper(
@@ -619,12 +557,234 @@ class ComponentData:
     thickness: float = 0.15  # Surface thickness in meters
 
 
+# Parameters that change the cross-section polygon
+PROFILE_PARAMETERS = ("width", "cross_slope")
+
+# Used when an assembly has no components
+DEFAULT_PAVEMENT_THICKNESS = 0.15
+FALLBACK_HALF_WIDTH = 3.6
+
+# Profile points closer than this are merged when building meshes (m)
+COINCIDENT_TOLERANCE = 0.001
+
+
+@dataclass
+class CompiledAssembly:
+    """
+    Cross-section assembly flattened into per-component arrays.
+
+    Profiles are closed polygons: the top edge runs left to right
+    (left edge, ..., centerline, ..., right edge) and the bottom edge
+    returns right to left, offset down by the pavement thickness. Every
+    profile from the same assembly has the same point count, so profiles
+    for many stations stack into a single (N, P, 2) array.
+
+    Attributes:
+        names: Component names (constraint lookup keys)
+        sides: -1 for left components, +1 for right components
+        widths: Design widths (m)
+        slopes: Design cross slopes (m/m, positive falls away from center)
+        thicknesses: Surface thickness per component (m)
+        thickness: Pavement thickness applied to the whole profile (m)
+        left: Indices of left components, centerline outward
+        right: Indices of right components, centerline outward
+        template: (P, 2) profile with no constraints applied
+        source: Component data the arrays were compiled from
+        component_types: Component types (IFC point tags)
+    """
+    names: List[str]
+    sides: np.ndarray
+    widths: np.ndarray
+    slopes: np.ndarray
+    thicknesses: np.ndarray
+    thickness: float
+    left: np.ndarray
+    right: np.ndarray
+    template: np.ndarray
+    source: Tuple = ()
+    component_types: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_components(cls, components: List[ComponentData]) -> "CompiledAssembly":
+        """
+        Compile assembly components into arrays.
+
+        Args:
+            components: Components with design widths, slopes and offsets
+
+        Returns:
+            CompiledAssembly instance
+        """
+        names = [c.name for c in components]
+        offsets = np.array([c.offset for c in components], dtype=np.float64)
+        sides = np.where(offsets < 0, -1, 1).astype(np.int8)
+        widths = np.array([c.width for c in components], dtype=np.float64)
+        slopes = np.array([c.slope for c in components], dtype=np.float64)
+        thicknesses = np.array(
+            [getattr(c, 'thickness', DEFAULT_PAVEMENT_THICKNESS) for c in components],
+            dtype=np.float64,
+        )
+        thickness = float(thicknesses.max()) if components else DEFAULT_PAVEMENT_THICKNESS
+
+        # Left offsets are negative: closest to centerline has the largest offset
+        left = np.flatnonzero(sides < 0)
+        left = left[np.argsort(-offsets[left], kind="stable")]
+        right = np.flatnonzero(sides > 0)
+        right = right[np.argsort(offsets[right], kind="stable")]
+
+        compiled = cls(
+            names=names,
+            sides=sides,
+            widths=widths,
+            slopes=slopes,
+            thicknesses=thicknesses,
+            thickness=thickness,
+            left=left,
+            right=right,
+            template=np.zeros((0, 2)),
+            source=_component_key(components),
+            component_types=[c.component_type for c in components],
+        )
+        compiled.template = compiled.sections(widths[np.newaxis], slopes[np.newaxis])[0]
+        return compiled
+
+    @property
+    def point_count(self) -> int:
+        """Number of points in each closed profile."""
+        return len(self.template)
+
+    def sections(self, widths: np.ndarray, slopes: np.ndarray) -> np.ndarray:
+        """
+        Build closed profiles from per-station component widths and slopes.
+
+        Args:
+            widths: (N, K) component widths, columns in component order
+            slopes: (N, K) component cross slopes
+
+        Returns:
+            (N, P, 2) array of (offset, elevation) points
+        """
+        n = widths.shape[0]
+        if not self.names:
+            half = FALLBACK_HALF_WIDTH
+            top = np.array([[-half, 0.0], [half, 0.0]])
+            top = np.broadcast_to(top, (n, 2, 2))
+        else:
+            rise = -widths * slopes
+            n_left, n_right = len(self.left), len(self.right)
+            top = np.zeros((n, n_left + 1 + n_right, 2))
+
+            # Left edge points, outermost first
+            top[:, :n_left, 0] = -np.cumsum(widths[:, self.left], axis=1)[:, ::-1]
+            top[:, :n_left, 1] = np.cumsum(rise[:, self.left], axis=1)[:, ::-1]
+            # Centerline stays at (0, 0); right edge points, innermost first
+            top[:, n_left + 1:, 0] = np.cumsum(widths[:, self.right], axis=1)
+            top[:, n_left + 1:, 1] = np.cumsum(rise[:, self.right], axis=1)
+
+        profiles = np.concatenate([top, top[:, ::-1]], axis=1)
+        profiles[:, top.shape[1]:, 1] -= self.thickness
+        return profiles
+
+    def profiles_at(
+        self,
+        stations: np.ndarray,
+        constraint_manager: Optional[Any] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate closed profiles at many stations.
+
+        Constraints on component widths and cross slopes override the
+        design values at the stations they cover. Stations where every
+        parameter keeps its design value share the constant template.
+
+        Args:
+            stations: (N,) stations along the alignment (m)
+            constraint_manager: Optional ConstraintManager
+
+        Returns:
+            (N, P, 2) array of (offset, elevation) points. When no
+            constraint touches any station this is a read-only view of
+            the template.
+        """
+        stations = np.atleast_1d(np.asarray(stations, dtype=np.float64))
+        n = len(stations)
+
+        overrides = self._parameter_overrides(stations, constraint_manager)
+        if not overrides:
+            return np.broadcast_to(self.template, (n,) + self.template.shape)
+
+        touched = np.zeros(n, dtype=bool)
+        for mask, _ in overrides.values():
+            touched |= mask
+
+        rows = np.flatnonzero(touched)
+        widths = np.tile(self.widths, (len(rows), 1))
+        slopes = np.tile(self.slopes, (len(rows), 1))
+        columns = {"width": widths, "cross_slope": slopes}
+        for (k, parameter), (mask, values) in overrides.items():
+            columns[parameter][:, k] = values[rows]
+
+        profiles = np.empty((n,) + self.template.shape)
+        profiles[:] = self.template
+        profiles[rows] = self.sections(widths, slopes)
+        return profiles
+
+    def _parameter_overrides(
+        self,
+        stations: np.ndarray,
+        constraint_manager: Optional[Any],
+    ) -> Dict[Tuple[int, str], Tuple[np.ndarray, np.ndarray]]:
+        """
+        Evaluate constrained parameters at the stations their constraints cover.
+
+        Args:
+            stations: (N,) query stations
+            constraint_manager: Optional ConstraintManager
+
+        Returns:
+            Dict mapping (component index, parameter) to (mask, values),
+            where mask marks stations that differ from the design value
+            and values holds the effective value at every station
+        """
+        overrides = {}
+        if constraint_manager is None:
+            return overrides
+
+        defaults = {"width": self.widths, "cross_slope": self.slopes}
+        for k, name in enumerate(self.names):
+            for parameter in PROFILE_PARAMETERS:
+                if not constraint_manager.has_constraints(name, parameter):
+                    continue
+
+                default = float(defaults[parameter][k])
+                values = constraint_manager.effective_values(
+                    name, parameter, stations, default
+                )
+                mask = values != default
+                if mask.any():
+                    overrides[(k, parameter)] = (mask, values)
+
+        return overrides
+
+
+def _component_key(components: List[ComponentData]) -> Tuple:
+    """Snapshot of the component fields that shape and tag the profile."""
+    return tuple(
+        (c.name, c.component_type, c.width, c.slope, c.offset,
+         getattr(c, 'thickness', DEFAULT_PAVEMENT_THICKNESS))
+        for c in components
+    )
+
+
 @dataclass
 class AssemblyWrapper:
     """Wrapper for cross-section assembly data."""
     name: str
     components: List[ComponentData]
     constraint_manager: Optional[Any] = None  # ConstraintManager from parametric_constraints
+    _compiled: Optional[CompiledAssembly] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_component_value(
         self,
@@ -655,6 +815,35 @@ class AssemblyWrapper:
             default_value=default_value
         )
 
+    def compile(self) -> CompiledAssembly:
+        """
+        Get the array form of this assembly.
+
+        The compiled arrays are cached and rebuilt only when component
+        types, widths, slopes, offsets or thicknesses change.
+
+        Returns:
+            CompiledAssembly for the current components
+        """
+        key = _component_key(self.components)
+        if self._compiled is None or self._compiled.source != key:
+            self._compiled = CompiledAssembly.from_components(self.components)
+        return self._compiled
+
+    def profiles_at(self, stations: np.ndarray) -> np.ndarray:
+        """
+        Evaluate closed cross-section profiles at many stations at once.
+
+        Args:
+            stations: (N,) stations along the alignment (m)
+
+        Returns:
+            (N, P, 2) array of (offset, elevation) points, top edge left to
+            right then bottom edge right to left. May be a read-only view
+            when no constraint applies at any station.
+        """
+        return self.compile().profiles_at(stations, self.constraint_manager)
+
 
 def create_assembly_wrapper(assembly_props: Any) -> AssemblyWrapper:
     """
@@ -763,6 +952,172 @@ def create_assembly_wrapper(assembly_props: Any) -> AssemblyWrapper:
     )
 
 
+# =============================================================================
+# Mesh Arrays (Pure Python + NumPy)
+# =============================================================================
+
+def transform_profiles(
+    positions: np.ndarray,
+    bearings: np.ndarray,
+    profiles: np.ndarray,
+) -> np.ndarray:
+    """
+    Place 2D cross-section profiles in world space at every station.
+
+    Offsets are measured perpendicular to the alignment direction, positive
+    to the left of the direction of travel; elevations are added to the
+    station Z.
+
+    Args:
+        positions: (N, 3) station coordinates (x, y, z)
+        bearings: (N,) alignment direction at each station (radians)
+        profiles: (N, P, 2) or (P, 2) array of (offset, elevation) points.
+            A single (P, 2) profile is used at every station.
+
+    Returns:
+        (N, P, 3) array of world coordinates
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    bearings = np.asarray(bearings, dtype=np.float64)
+    profiles = np.asarray(profiles, dtype=np.float64)
+    if profiles.ndim == 2:
+        profiles = profiles[np.newaxis, :, :]
+
+    offsets = profiles[..., 0]
+    elevations = profiles[..., 1]
+    sin_b = np.sin(bearings)[:, np.newaxis]
+    cos_b = np.cos(bearings)[:, np.newaxis]
+
+    vertices = np.empty(
+        (positions.shape[0], offsets.shape[-1], 3), dtype=np.float64
+    )
+    vertices[..., 0] = positions[:, 0:1] - offsets * sin_b
+    vertices[..., 1] = positions[:, 1:2] + offsets * cos_b
+    vertices[..., 2] = positions[:, 2:3] + elevations
+    return vertices
+
+
+def build_tube_topology(
+    station_count: int,
+    point_count: int,
+    start_cap: bool = True,
+    end_cap: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build face topology for a closed profile swept along N stations.
+
+    Vertices are expected in station-major order (vertex index is
+    ``station * point_count + point``). Each pair of adjacent stations is
+    joined by a ring of quads that wraps from the last profile point back
+    to the first. End caps are single n-gons: the start cap follows the
+    profile order, the end cap is reversed so both face outward. Chunks in
+    the middle of a corridor leave their ends open.
+
+    The result maps directly onto Blender's ``loops.vertex_index``,
+    ``polygons.loop_start`` and ``polygons.loop_total`` arrays.
+
+    Args:
+        station_count: Number of stations (N)
+        point_count: Points per closed profile (P)
+        start_cap: Whether to close the tube at the first station
+        end_cap: Whether to close the tube at the last station
+
+    Returns:
+        Tuple of (loop_vertex_indices, loop_starts, loop_totals) as int32
+    """
+    n, p = station_count, point_count
+    if n < 2 or p < 2:
+        empty = np.zeros(0, dtype=np.int32)
+        return empty, empty.copy(), empty.copy()
+
+    j = np.arange(p, dtype=np.int32)
+    j_next = (j + 1) % p
+    base = (np.arange(n - 1, dtype=np.int32) * p)[:, np.newaxis]
+
+    quads = np.empty((n - 1, p, 4), dtype=np.int32)
+    quads[..., 0] = base + j
+    quads[..., 1] = base + j_next
+    quads[..., 2] = base + p + j_next
+    quads[..., 3] = base + p + j
+
+    loops = [quads.ravel()]
+    totals = [np.full((n - 1) * p, 4, dtype=np.int32)]
+
+    if start_cap and p > 2:
+        loops.append(j)
+        totals.append(np.array([p], dtype=np.int32))
+    if end_cap and p > 2:
+        loops.append((n - 1) * p + j[::-1])
+        totals.append(np.array([p], dtype=np.int32))
+
+    loop_totals = np.concatenate(totals)
+    loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+    return np.concatenate(loops), loop_starts, loop_totals
+
+
+def collapse_coincident_points(
+    vertices: np.ndarray,
+    loop_vertices: np.ndarray,
+    loop_totals: np.ndarray,
+    tolerance: float = COINCIDENT_TOLERANCE,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Merge coincident neighbouring profile points and drop degenerate faces.
+
+    Zero-width components (e.g. a lane tapered out by a constraint) put two
+    profile points at the same place. Every point closer than ``tolerance``
+    to the previous point of its profile is merged into it, repeated
+    corners are removed from each polygon, polygons left with fewer than
+    three corners are dropped and unused vertices are compacted away.
+
+    Args:
+        vertices: (N, P, 3) station-major vertex array
+        loop_vertices: Loop vertex indices from build_tube_topology()
+        loop_totals: Polygon sizes from build_tube_topology()
+        tolerance: Merge distance (m)
+
+    Returns:
+        Tuple of ((V, 3) vertices, loop_vertex_indices, loop_starts,
+        loop_totals); unchanged when no points coincide
+    """
+    n, p = vertices.shape[:2]
+    flat = vertices.reshape(-1, 3)
+
+    def starts_of(totals):
+        starts = np.zeros(len(totals), dtype=np.int32)
+        np.cumsum(totals[:-1], out=starts[1:])
+        return starts
+
+    same = np.zeros((n, p), dtype=bool)
+    if p > 1:
+        same[:, 1:] = np.linalg.norm(np.diff(vertices, axis=1), axis=2) <= tolerance
+    if not same.any() or len(loop_totals) == 0:
+        return flat, loop_vertices, starts_of(loop_totals), loop_totals
+
+    # Each point maps to the first point of its run of coincident points
+    j = np.arange(p)
+    first = np.maximum.accumulate(np.where(same, 0, j), axis=1)
+    remap = (np.arange(n)[:, np.newaxis] * p + first).ravel()
+    loops = remap[loop_vertices]
+
+    # Remove corners repeating the previous corner of the same polygon
+    polygon = np.repeat(np.arange(len(loop_totals)), loop_totals)
+    starts = starts_of(loop_totals)
+    previous = np.roll(loops, 1)
+    previous[starts] = loops[starts + loop_totals - 1]
+    keep = loops != previous
+
+    totals = np.bincount(polygon[keep], minlength=len(loop_totals))
+    valid = totals >= 3
+    keep &= valid[polygon]
+
+    used, loops = np.unique(loops[keep], return_inverse=True)
+    totals = totals[valid].astype(np.int32)
+    return flat[used], loops.astype(np.int32), starts_of(totals), totals
+
+
 # =============================================================================
 # Exports
 # =============================================================================
@@ -773,11 +1128,16 @@ __all__ = [
     "MeshStats",
     "ComponentData",
     "AssemblyWrapper",
+    "CompiledAssembly",
     "AlignmentWrapper",
     # Functions
     "generate_corridor",
     "create_alignment_wrapper",
     "create_assembly_wrapper",
+    "evaluate_alignment",
+    "transform_profiles",
+    "build_tube_topology",
+    "collapse_coincident_points",
     # Re-exports from native_ifc_corridor
     "StationPoint",
     "StationManager",
@@ -0,0 +1,275 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Corridor Chunks
+===============
+
+Station-range partitioning of corridor meshes.
+
+Long corridors are split into chunks (500 m by default), each built as its
+own mesh so that an edit only regenerates the chunks whose station range
+it touches. Adjacent chunks share the station at their seam, so their
+vertices coincide exactly and the assembled corridor stays watertight
+without any span being built twice.
+End caps are only placed at the very start and end of the corridor.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> layout = CorridorChunkLayout(0.0, 1800.0, chunk_length=500.0)
+    >>> [(c.start_station, c.end_station) for c in layout.chunks]
+    [(0.0, 500.0), (500.0, 1000.0), (1000.0, 1500.0), (1500.0, 1800.0)]
+    >>> layout.clear_dirty()
+    >>> layout.mark_dirty(620.0, 700.0)
+    [1]
+"""
+
+import bisect
+import math
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+
+DEFAULT_CHUNK_LENGTH = 500.0
+
+# Chunk boundaries closer than this to the corridor ends are dropped (m)
+MIN_CHUNK_LENGTH = 1.0
+
+
+@dataclass
+class CorridorChunk:
+    """
+    A station range of a corridor built as one mesh.
+
+    Attributes:
+        index: Position along the corridor (0 = first chunk)
+        start_station: First station covered (m)
+        end_station: Last station covered (m)
+        is_first: Whether this chunk carries the corridor start cap
+        is_last: Whether this chunk carries the corridor end cap
+        dirty: Whether the chunk needs regenerating
+    """
+    index: int
+    start_station: float
+    end_station: float
+    is_first: bool = False
+    is_last: bool = False
+    dirty: bool = True
+
+    def overlaps(self, start: float, end: float) -> bool:
+        """Check if a closed station interval touches this chunk."""
+        return start <= self.end_station and end >= self.start_station
+
+
+class CorridorChunkLayout:
+    """
+    Fixed partition of a corridor station range into chunks.
+
+    Boundaries fall on multiples of ``chunk_length`` so they stay put when
+    the corridor is regenerated. All chunks start dirty.
+    """
+
+    def __init__(
+        self,
+        start_station: float,
+        end_station: float,
+        chunk_length: float = DEFAULT_CHUNK_LENGTH
+    ):
+        """
+        Create a chunk layout.
+
+        Args:
+            start_station: Corridor start station (m)
+            end_station: Corridor end station (m)
+            chunk_length: Nominal chunk length (m)
+
+        Raises:
+            ValueError: If the station range is empty or chunk_length <= 0
+        """
+        if end_station <= start_station:
+            raise ValueError("Corridor end station must be after start station")
+        if chunk_length <= 0:
+            raise ValueError("Chunk length must be positive")
+
+        self.start_station = float(start_station)
+        self.end_station = float(end_station)
+        self.chunk_length = float(chunk_length)
+
+        first = math.floor(self.start_station / self.chunk_length) + 1
+        last = math.ceil(self.end_station / self.chunk_length) - 1
+        self.boundaries = [
+            k * self.chunk_length for k in range(first, last + 1)
+            if self.start_station + MIN_CHUNK_LENGTH < k * self.chunk_length
+            < self.end_station - MIN_CHUNK_LENGTH
+        ]
+
+        edges = [self.start_station] + self.boundaries + [self.end_station]
+        self.chunks = [
+            CorridorChunk(
+                index=i,
+                start_station=edges[i],
+                end_station=edges[i + 1],
+                is_first=(i == 0),
+                is_last=(i == len(edges) - 2),
+            )
+            for i in range(len(edges) - 1)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def chunk_at(self, station: float) -> CorridorChunk:
+        """
+        Get the chunk containing a station.
+
+        Stations exactly on a boundary belong to the later chunk; stations
+        outside the corridor are clamped to the first or last chunk.
+
+        Args:
+            station: Query station (m)
+
+        Returns:
+            CorridorChunk covering the station
+        """
+        return self.chunks[bisect.bisect_right(self.boundaries, station)]
+
+    # =========================================================================
+    # Dirty Tracking
+    # =========================================================================
+
+    def mark_dirty(self, start: float, end: Optional[float] = None) -> List[int]:
+        """
+        Mark all chunks touching a station interval for regeneration.
+
+        A change on a boundary marks the chunks on both sides, since both
+        contain the seam station.
+
+        Args:
+            start: Start of the changed interval (m)
+            end: End of the changed interval (m). Defaults to ``start``.
+
+        Returns:
+            Indices of the chunks marked dirty
+        """
+        if end is None:
+            end = start
+        if end < start:
+            start, end = end, start
+
+        marked = []
+        for chunk in self.chunks:
+            if chunk.overlaps(start, end):
+                chunk.dirty = True
+                marked.append(chunk.index)
+        return marked
+
+    def mark_all_dirty(self) -> None:
+        """Mark every chunk for regeneration."""
+        for chunk in self.chunks:
+            chunk.dirty = True
+
+    def clear_dirty(self) -> None:
+        """Mark every chunk as up to date."""
+        for chunk in self.chunks:
+            chunk.dirty = False
+
+    def dirty_chunks(self) -> List[CorridorChunk]:
+        """Get the chunks awaiting regeneration, in station order."""
+        return [chunk for chunk in self.chunks if chunk.dirty]
+
+    # =========================================================================
+    # Station Partitioning
+    # =========================================================================
+
+    def seam_indices(self, stations: Sequence[float]) -> List[int]:
+        """
+        Get the station each chunk boundary is built on.
+
+        Station planning puts a station on every boundary (see
+        StationManager's ``chunk_boundaries``). When a station list has
+        none there, the boundary snaps to the nearest station (the later
+        one on a tie), so neighbouring chunks still share exactly one
+        ring instead of overlapping.
+
+        Args:
+            stations: Sorted station values (m)
+
+        Returns:
+            Index into ``stations`` for each boundary, in order
+        """
+        values = np.asarray(stations, dtype=np.float64)
+        n = len(values)
+        if n < 2 or not self.boundaries:
+            return [0] * len(self.boundaries) if n else []
+
+        boundaries = np.asarray(self.boundaries, dtype=np.float64)
+        after = np.clip(np.searchsorted(values, boundaries, side="left"), 1, n - 1)
+        before = after - 1
+        closer_before = (boundaries - values[before]) < (values[after] - boundaries)
+        return np.where(closer_before, before, after).tolist()
+
+    def station_slice(self, chunk: CorridorChunk, stations: Sequence[float]) -> slice:
+        """
+        Get the range of a sorted station list that a chunk is built from.
+
+        The slice runs from the station of the chunk's start seam to the
+        station of its end seam inclusive (see seam_indices()), so
+        neighbouring chunks share exactly one station.
+
+        Args:
+            chunk: Chunk from this layout
+            stations: Sorted station values (m)
+
+        Returns:
+            Slice into ``stations``
+        """
+        n = len(stations)
+        seams = self.seam_indices(stations)
+        lo = 0 if chunk.is_first else seams[chunk.index - 1]
+        hi = n if chunk.is_last else seams[chunk.index] + 1
+        return slice(lo, hi)
+
+    def split_stations(self, stations: Sequence[Any]) -> List[List[Any]]:
+        """
+        Partition station points into per-chunk lists.
+
+        Args:
+            stations: Sorted StationPoint objects (anything with ``.station``)
+
+        Returns:
+            One list per chunk; neighbouring lists share their seam station
+        """
+        stations = list(stations)
+        values = [s.station for s in stations]
+        return [list(stations[self.station_slice(chunk, values)]) for chunk in self.chunks]
+
+
+__all__ = [
+    "DEFAULT_CHUNK_LENGTH",
+    "CorridorChunk",
+    "CorridorChunkLayout",
+]
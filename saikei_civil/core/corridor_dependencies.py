@@ -0,0 +1,505 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Corridor Dependencies
+=====================
+
+Links corridors back to the alignment, assembly and constraints they were
+built from, and turns edits to those sources into station ranges to
+regenerate.
+
+Each corridor carries a CorridorDependency record (alignment GlobalId,
+assembly name, constraint fingerprint, station range, generation settings).
+Corridors are identified by a GUID stored with the corridor rather than by
+object name, so renaming a corridor does not break tracking.
+The CorridorChangeTracker holds the records of all live corridors. Source
+objects report edits to it as station intervals; the tracker clips each
+interval to the corridors that depend on that source and queues it as a
+pending range. The tool layer listens for new ranges, marks the matching
+corridor chunks dirty and regenerates them.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> tracker = get_change_tracker()
+    >>> tracker.register(CorridorDependency(
+    ...     corridor_id="3vB2YO$MX4xv5uCqZZG05x",
+    ...     alignment_guid=alignment.GlobalId,
+    ...     assembly_name="Two Lane Rural",
+    ...     start_station=0.0,
+    ...     end_station=2000.0,
+    ... ))
+    >>> tracker.alignment_changed(alignment.GlobalId, 640.0, 910.0)
+    ['3vB2YO$MX4xv5uCqZZG05x']
+    >>> tracker.take_pending()
+    {'3vB2YO$MX4xv5uCqZZG05x': [(640.0, 910.0)]}
+"""
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .corridor_chunks import DEFAULT_CHUNK_LENGTH
+from .native_ifc_corridor import DEFAULT_CHORD_TOLERANCE
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Values closer than this compare equal when diffing segment tables
+COMPARE_DECIMALS = 9
+
+# A source segment: (start_station, end_station, signature)
+SegmentEntry = Tuple[float, float, Tuple]
+
+
+# =============================================================================
+# Dependency Record
+# =============================================================================
+
+@dataclass
+class CorridorDependency:
+    """
+    What a corridor was built from.
+
+    Attributes:
+        corridor_id: Stable GUID of the corridor, stored on its parent object
+        alignment_guid: GlobalId of the IfcAlignment
+        assembly_name: Name of the cross-section assembly
+        start_station: First corridor station (m)
+        end_station: Last corridor station (m)
+        constraint_fingerprint: Hash of the assembly's enabled constraints
+        lod: Level of detail ('low', 'medium', 'high')
+        interval: Base station interval (m)
+        curve_densification: Station densification factor in curves
+        chord_tolerance: Maximum sagitta between stations in curves (m)
+        chunk_length: Mesh chunk length (m)
+    """
+    corridor_id: str
+    alignment_guid: str
+    assembly_name: str
+    start_station: float
+    end_station: float
+    constraint_fingerprint: str = ""
+    lod: str = 'medium'
+    interval: float = 10.0
+    curve_densification: float = 1.5
+    chord_tolerance: float = DEFAULT_CHORD_TOLERANCE
+    chunk_length: float = DEFAULT_CHUNK_LENGTH
+
+    def clip(self, start: float, end: float) -> Optional[Tuple[float, float]]:
+        """
+        Restrict a station interval to this corridor's range.
+
+        Args:
+            start: Interval start (m), may be -inf
+            end: Interval end (m), may be inf
+
+        Returns:
+            (start, end) inside the corridor, or None if they do not overlap
+        """
+        start = max(start, self.start_station)
+        end = min(end, self.end_station)
+        if start > end:
+            return None
+        return (start, end)
+
+    def to_dict(self) -> dict:
+        """Serialize for storage with the corridor."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CorridorDependency":
+        """
+        Deserialize a stored record, ignoring unknown keys.
+
+        Args:
+            data: Dictionary from to_dict()
+
+        Returns:
+            CorridorDependency instance
+        """
+        fields = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in fields})
+
+
+def constraint_fingerprint(constraint_manager: Optional[Any]) -> str:
+    """
+    Hash the enabled constraints of a ConstraintManager.
+
+    Args:
+        constraint_manager: ConstraintManager or None
+
+    Returns:
+        Hex digest, or "" when there are no enabled constraints
+    """
+    entries = _constraint_entries(constraint_manager)
+    if not entries:
+        return ""
+    payload = json.dumps(
+        sorted(json.dumps(e, sort_keys=True) for e in entries)
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _constraint_entries(constraint_manager: Optional[Any]) -> List[dict]:
+    """
+    Serialized enabled constraints of a manager.
+
+    IDs are dropped: constraints built from UI properties without a stored
+    ID get a fresh one on every conversion.
+    """
+    if constraint_manager is None:
+        return []
+    entries = []
+    for c in constraint_manager.constraints:
+        if c.enabled:
+            entry = c.to_dict()
+            entry.pop('id', None)
+            entries.append(entry)
+    return entries
+
+
+# =============================================================================
+# Change Intervals
+# =============================================================================
+
+def _rounded(value: Any) -> Any:
+    """Round floats (recursively) so tables compare with a tolerance."""
+    if isinstance(value, float):
+        return round(value, COMPARE_DECIMALS)
+    if isinstance(value, (tuple, list)):
+        return tuple(_rounded(v) for v in value)
+    return value
+
+
+def changed_interval(
+    before: Sequence[SegmentEntry],
+    after: Sequence[SegmentEntry],
+) -> Optional[Tuple[float, float]]:
+    """
+    Find the station interval where two segment tables differ.
+
+    Segments are compared from both ends and the interval spans the
+    segments in between. When an edit changes where the table ends (e.g.
+    the alignment gets longer) every later station shifts, so the interval
+    runs to the end (inf); likewise to -inf if the table start moves.
+
+    Args:
+        before: Segment table before the edit
+        after: Segment table after the edit
+
+    Returns:
+        (start, end) station interval, or None if the tables are equal
+    """
+    before = [_rounded(tuple(e)) for e in before]
+    after = [_rounded(tuple(e)) for e in after]
+    if before == after:
+        return None
+    if not before or not after:
+        return (-math.inf, math.inf)
+
+    head = 0
+    limit = min(len(before), len(after))
+    while head < limit and before[head] == after[head]:
+        head += 1
+
+    tail = 0
+    while (tail < limit - head
+           and before[len(before) - 1 - tail] == after[len(after) - 1 - tail]):
+        tail += 1
+
+    changed = before[head:len(before) - tail] + after[head:len(after) - tail]
+
+    if before[0][0] != after[0][0]:
+        start = -math.inf
+    else:
+        start = min(e[0] for e in changed)
+
+    if before[-1][1] != after[-1][1]:
+        end = math.inf
+    else:
+        end = max(e[1] for e in changed)
+    return (start, end)
+
+
+def constraint_set_interval(
+    before: Sequence[dict],
+    after: Sequence[dict],
+) -> Optional[Tuple[float, float]]:
+    """
+    Find the station interval covered by constraints that changed.
+
+    A constraint counts as changed if it was added, removed, enabled or
+    disabled, or any of its fields differ. Both its old and new station
+    ranges are included.
+
+    Args:
+        before: Serialized enabled constraints before the edit
+        after: Serialized enabled constraints after the edit
+
+    Returns:
+        (start, end) station interval, or None if nothing changed
+    """
+    old = {json.dumps(c, sort_keys=True): c for c in before}
+    new = {json.dumps(c, sort_keys=True): c for c in after}
+    changed = [old[k] for k in old.keys() - new.keys()]
+    changed += [new[k] for k in new.keys() - old.keys()]
+    if not changed:
+        return None
+    return (
+        min(c['start_station'] for c in changed),
+        max(c['end_station'] for c in changed),
+    )
+
+
+def merge_intervals(intervals: Sequence[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """
+    Merge overlapping or touching station intervals.
+
+    Args:
+        intervals: (start, end) pairs in any order
+
+    Returns:
+        Disjoint intervals sorted by start
+    """
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# =============================================================================
+# Change Tracker
+# =============================================================================
+
+class CorridorChangeTracker:
+    """
+    Routes source edits to the corridor station ranges they affect.
+
+    Listeners are called as ``listener(corridor_id, start, end)`` each
+    time a range is queued. Queued ranges accumulate until take_pending().
+    """
+
+    def __init__(self):
+        self._dependencies: Dict[str, CorridorDependency] = {}
+        self._pending: Dict[str, List[Tuple[float, float]]] = {}
+        self._constraint_sets: Dict[str, List[dict]] = {}
+        self._listeners: List[Callable[[str, float, float], None]] = []
+
+    # =========================================================================
+    # Registration
+    # =========================================================================
+
+    def register(
+        self,
+        dependency: CorridorDependency,
+        constraint_manager: Optional[Any] = None
+    ) -> None:
+        """
+        Start tracking a corridor.
+
+        Args:
+            dependency: The corridor's dependency record
+            constraint_manager: Constraints the corridor was built with,
+                used as the baseline for later constraint diffs
+        """
+        self._dependencies[dependency.corridor_id] = dependency
+        if constraint_manager is not None or dependency.assembly_name not in self._constraint_sets:
+            self._constraint_sets[dependency.assembly_name] = _constraint_entries(constraint_manager)
+        logger.debug("Tracking corridor '%s'", dependency.corridor_id)
+
+    def unregister(self, corridor_id: str) -> None:
+        """Stop tracking a corridor and drop its pending ranges."""
+        self._dependencies.pop(corridor_id, None)
+        self._pending.pop(corridor_id, None)
+
+    def clear(self) -> None:
+        """Forget all corridors (e.g. when a new file is loaded)."""
+        self._dependencies.clear()
+        self._pending.clear()
+        self._constraint_sets.clear()
+
+    def get(self, corridor_id: str) -> Optional[CorridorDependency]:
+        """Get the dependency record of a corridor."""
+        return self._dependencies.get(corridor_id)
+
+    def dependencies(self) -> List[CorridorDependency]:
+        """Get all tracked dependency records."""
+        return list(self._dependencies.values())
+
+    def is_tracking_alignment(self, alignment_guid: str) -> bool:
+        """Check if any corridor depends on an alignment."""
+        return any(d.alignment_guid == alignment_guid for d in self._dependencies.values())
+
+    def add_listener(self, listener: Callable[[str, float, float], None]) -> None:
+        """Call ``listener(corridor_id, start, end)`` for each queued range."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, float, float], None]) -> None:
+        """Stop calling a listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    # =========================================================================
+    # Source Notifications
+    # =========================================================================
+
+    def alignment_changed(
+        self,
+        alignment_guid: str,
+        start: float = -math.inf,
+        end: float = math.inf
+    ) -> List[str]:
+        """
+        Report a horizontal or vertical alignment edit.
+
+        Args:
+            alignment_guid: GlobalId of the edited IfcAlignment
+            start: First affected station (m)
+            end: Last affected station (m)
+
+        Returns:
+            IDs of corridors that received a pending range
+        """
+        return [
+            d.corridor_id
+            for d in list(self._dependencies.values())
+            if d.alignment_guid == alignment_guid
+            and self._schedule(d, start, end)
+        ]
+
+    def assembly_changed(self, assembly_name: str) -> List[str]:
+        """
+        Report an edit to an assembly's components.
+
+        Component edits change every cross-section, so dependent corridors
+        are scheduled over their full range.
+
+        Args:
+            assembly_name: Name of the edited assembly
+
+        Returns:
+            IDs of corridors that received a pending range
+        """
+        return [
+            d.corridor_id
+            for d in list(self._dependencies.values())
+            if d.assembly_name == assembly_name
+            and self._schedule(d, -math.inf, math.inf)
+        ]
+
+    def constraints_changed(
+        self,
+        assembly_name: str,
+        constraint_manager: Optional[Any]
+    ) -> List[str]:
+        """
+        Report the current constraint set of an assembly.
+
+        The set is compared with the one last seen for this assembly; only
+        the station ranges of constraints that changed are scheduled, and
+        dependent records get the new fingerprint.
+
+        Args:
+            assembly_name: Name of the assembly owning the constraints
+            constraint_manager: ConstraintManager with the current constraints
+
+        Returns:
+            IDs of corridors that received a pending range
+        """
+        entries = _constraint_entries(constraint_manager)
+        previous = self._constraint_sets.get(assembly_name, [])
+        self._constraint_sets[assembly_name] = entries
+
+        interval = constraint_set_interval(previous, entries)
+        if interval is None:
+            return []
+
+        fingerprint = constraint_fingerprint(constraint_manager)
+        scheduled = []
+        for d in list(self._dependencies.values()):
+            if d.assembly_name != assembly_name:
+                continue
+            d.constraint_fingerprint = fingerprint
+            if self._schedule(d, *interval):
+                scheduled.append(d.corridor_id)
+        return scheduled
+
+    def _schedule(self, dependency: CorridorDependency, start: float, end: float) -> bool:
+        """Queue a clipped range for a corridor and notify listeners."""
+        clipped = dependency.clip(start, end)
+        if clipped is None:
+            return False
+
+        self._pending.setdefault(dependency.corridor_id, []).append(clipped)
+        for listener in list(self._listeners):
+            try:
+                listener(dependency.corridor_id, *clipped)
+            except Exception as e:
+                logger.warning("Corridor change listener failed: %s", e)
+        return True
+
+    # =========================================================================
+    # Pending Ranges
+    # =========================================================================
+
+    def pending_ranges(self, corridor_id: str) -> List[Tuple[float, float]]:
+        """Get the merged pending ranges of a corridor without clearing them."""
+        return merge_intervals(self._pending.get(corridor_id, []))
+
+    def take_pending(self) -> Dict[str, List[Tuple[float, float]]]:
+        """
+        Get and clear all pending ranges.
+
+        Returns:
+            Dict mapping corridor ID to merged (start, end) ranges
+        """
+        pending = {name: merge_intervals(ranges) for name, ranges in self._pending.items() if ranges}
+        self._pending.clear()
+        return pending
+
+
+# Module-level tracker shared by the alignment classes and the tool layer
+_tracker = CorridorChangeTracker()
+
+
+def get_change_tracker() -> CorridorChangeTracker:
+    """Get the shared CorridorChangeTracker."""
+    return _tracker
+
+
+__all__ = [
+    "CorridorDependency",
+    "CorridorChangeTracker",
+    "get_change_tracker",
+    "constraint_fingerprint",
+    "changed_interval",
+    "constraint_set_interval",
+    "merge_intervals",
+]
@@ -0,0 +1,343 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Parallel Corridor Evaluation
+============================
+
+Evaluates corridor geometry for long station lists across worker processes.
+
+The alignment and assembly are frozen into a CorridorSnapshot made only of
+NumPy arrays (compiled horizontal layout, vertical profile table, compiled
+assembly and constraints), which pickles cheaply. The station list is split
+into contiguous ranges; each worker evaluates positions, bearings, grades and
+constraint-applied profiles for its ranges and returns flat arrays. The
+results are stitched back in station order into one CorridorArrays, which the
+tool layer turns into mesh and IFC on the main thread.
+
+Short corridors, single-core machines and failing pools are evaluated
+serially in the calling process with identical results.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> snapshot = CorridorSnapshot.from_wrappers(alignment_3d, assembly_wrapper)
+    >>> stations = np.arange(0.0, 60000.0, 5.0)
+    >>> arrays = compute_corridor_arrays(
+    ...     snapshot, stations, alignment_3d.distances_at(stations)
+    ... )
+    >>> arrays.profiles.shape
+    (12000, 10, 2)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pickle import PicklingError
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .corridor import (
+    AlignmentWrapper,
+    AssemblyWrapper,
+    CompiledAssembly,
+    evaluate_alignment,
+)
+from .horizontal_alignment.evaluator import CompiledHorizontalAlignment
+from .vertical_alignment.profile_table import VerticalProfileTable
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Below this many stations the pool start-up and result transfer cost more
+# than they save. 50 km at 2.5 m spacing is 20,000 stations; callers can
+# pass min_parallel to move the break-even point for their machine.
+MIN_PARALLEL_STATIONS = 20000
+
+# Smallest station range handed to one task
+MIN_PARTITION_SIZE = 1000
+
+# Tasks per worker, so uneven ranges still balance across the pool
+PARTITIONS_PER_WORKER = 4
+
+
+# =============================================================================
+# Result Arrays
+# =============================================================================
+
+@dataclass
+class CorridorArrays:
+    """
+    Evaluated corridor geometry as flat arrays, one row per station.
+
+    Attributes:
+        stations: (N,) station values (m)
+        positions: (N, 3) centerline x, y, z
+        bearings: (N,) horizontal bearings (radians from +X)
+        grades: (N,) vertical grades (decimal)
+        profiles: (N, P, 2) constraint-applied (offset, elevation) profiles
+    """
+    stations: np.ndarray
+    positions: np.ndarray
+    bearings: np.ndarray
+    grades: np.ndarray
+    profiles: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def slice(self, rows: slice) -> "CorridorArrays":
+        """
+        Get the rows of a station range.
+
+        Args:
+            rows: Slice over the station axis
+
+        Returns:
+            CorridorArrays viewing the selected stations
+        """
+        return CorridorArrays(
+            stations=self.stations[rows],
+            positions=self.positions[rows],
+            bearings=self.bearings[rows],
+            grades=self.grades[rows],
+            profiles=self.profiles[rows],
+        )
+
+    @classmethod
+    def concatenate(cls, parts: Sequence["CorridorArrays"]) -> "CorridorArrays":
+        """
+        Join station ranges evaluated separately, in the given order.
+
+        Args:
+            parts: Consecutive CorridorArrays
+
+        Returns:
+            CorridorArrays covering all parts
+        """
+        return cls(
+            stations=np.concatenate([p.stations for p in parts]),
+            positions=np.concatenate([p.positions for p in parts]),
+            bearings=np.concatenate([p.bearings for p in parts]),
+            grades=np.concatenate([p.grades for p in parts]),
+            profiles=np.concatenate([p.profiles for p in parts]),
+        )
+
+
+# =============================================================================
+# Snapshot
+# =============================================================================
+
+@dataclass
+class CorridorSnapshot:
+    """
+    Picklable, read-only view of everything needed to evaluate a corridor.
+
+    Attributes:
+        horizontal: Compiled horizontal layout (queried by distance along)
+        vertical: Vertical profile table, or None for a flat corridor
+        assembly: Compiled cross-section assembly
+        constraint_manager: Parametric constraints, or None
+    """
+    horizontal: CompiledHorizontalAlignment
+    vertical: Optional[VerticalProfileTable]
+    assembly: CompiledAssembly
+    constraint_manager: Optional[Any] = None
+
+    @classmethod
+    def from_wrappers(
+        cls,
+        alignment: AlignmentWrapper,
+        assembly: AssemblyWrapper
+    ) -> "CorridorSnapshot":
+        """
+        Freeze the compiled state of an alignment and assembly.
+
+        Args:
+            alignment: AlignmentWrapper for the corridor alignment
+            assembly: AssemblyWrapper with components and constraints
+
+        Returns:
+            CorridorSnapshot sharing the wrappers' compiled arrays
+        """
+        return cls(
+            horizontal=alignment.horizontal_evaluator,
+            vertical=alignment.vertical_profile,
+            assembly=assembly.compile(),
+            constraint_manager=assembly.constraint_manager,
+        )
+
+    def evaluate(self, stations: np.ndarray, distances: np.ndarray) -> CorridorArrays:
+        """
+        Evaluate corridor geometry at many stations in this process.
+
+        Positions, bearings and grades come from evaluate_alignment().
+
+        Args:
+            stations: (N,) station values (m)
+            distances: (N,) distances along the alignment for those stations
+
+        Returns:
+            CorridorArrays for the stations
+        """
+        stations = np.asarray(stations, dtype=np.float64)
+        positions, bearings, grades = evaluate_alignment(
+            self.horizontal, self.vertical, stations, distances
+        )
+
+        profiles = self.assembly.profiles_at(stations, self.constraint_manager)
+
+        return CorridorArrays(
+            stations=stations,
+            positions=positions,
+            bearings=bearings,
+            grades=grades,
+            # Template profiles come back as a broadcast view; give each
+            # worker result its own memory so it pickles at full size once
+            profiles=np.ascontiguousarray(profiles),
+        )
+
+
+# =============================================================================
+# Partitioning and Workers
+# =============================================================================
+
+def partition_stations(
+    count: int,
+    parts: int,
+    min_size: int = MIN_PARTITION_SIZE
+) -> List[Tuple[int, int]]:
+    """
+    Split a station list into contiguous index ranges.
+
+    Args:
+        count: Number of stations
+        parts: Desired number of ranges
+        min_size: Smallest range size (the last range may be shorter)
+
+    Returns:
+        List of (start, stop) index pairs covering range(count) in order
+    """
+    if count <= 0:
+        return []
+    parts = max(1, min(parts, -(-count // max(min_size, 1))))
+    bounds = np.linspace(0, count, parts + 1).round().astype(int)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+# Per-process state set by _init_worker (one copy per worker, not per task)
+_worker_state: dict = {}
+
+
+def _init_worker(
+    snapshot: CorridorSnapshot,
+    stations: np.ndarray,
+    distances: np.ndarray
+) -> None:
+    """Pool initializer: receive the snapshot and station arrays once."""
+    _worker_state['snapshot'] = snapshot
+    _worker_state['stations'] = stations
+    _worker_state['distances'] = distances
+
+
+def _evaluate_partition(bounds: Tuple[int, int]) -> CorridorArrays:
+    """Pool task: evaluate one station range."""
+    start, stop = bounds
+    return _worker_state['snapshot'].evaluate(
+        _worker_state['stations'][start:stop],
+        _worker_state['distances'][start:stop],
+    )
+
+
+def default_worker_count() -> int:
+    """Number of worker processes to use when none is given."""
+    return os.cpu_count() or 1
+
+
+def compute_corridor_arrays(
+    snapshot: CorridorSnapshot,
+    stations: Sequence[float],
+    distances: Sequence[float],
+    workers: Optional[int] = None,
+    mp_context: Optional[Any] = None,
+    min_parallel: int = MIN_PARALLEL_STATIONS
+) -> CorridorArrays:
+    """
+    Evaluate corridor geometry, in parallel for long station lists.
+
+    Args:
+        snapshot: CorridorSnapshot of the alignment and assembly
+        stations: Sorted station values (m)
+        distances: Distance along the alignment for each station
+            (see AlignmentWrapper.distances_at())
+        workers: Worker process count; None uses every core, 1 (or 0)
+            evaluates serially
+        mp_context: multiprocessing context for the pool (e.g. fork), or
+            None for the platform default
+        min_parallel: Station count below which evaluation stays serial
+
+    Returns:
+        CorridorArrays in station order
+    """
+    stations = np.asarray(stations, dtype=np.float64)
+    distances = np.asarray(distances, dtype=np.float64)
+    if stations.shape != distances.shape:
+        raise ValueError(
+            f"stations and distances differ in shape: "
+            f"{stations.shape} vs {distances.shape}"
+        )
+
+    workers = default_worker_count() if workers is None else workers
+    partitions = partition_stations(len(stations), workers * PARTITIONS_PER_WORKER)
+    if workers <= 1 or len(stations) < min_parallel or len(partitions) < 2:
+        return snapshot.evaluate(stations, distances)
+
+    workers = min(workers, len(partitions))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(snapshot, stations, distances),
+        ) as pool:
+            parts = list(pool.map(_evaluate_partition, partitions))
+    except (BrokenProcessPool, OSError, PicklingError) as e:
+        logger.warning("Parallel corridor evaluation failed (%s), running serially", e)
+        return snapshot.evaluate(stations, distances)
+
+    logger.info(
+        "Evaluated %d stations in %d ranges on %d processes",
+        len(stations), len(partitions), workers
+    )
+    return CorridorArrays.concatenate(parts)
+
+
+__all__ = [
+    "CorridorArrays",
+    "CorridorSnapshot",
+    "compute_corridor_arrays",
+    "partition_stations",
+    "default_worker_count",
+    "MIN_PARALLEL_STATIONS",
+]
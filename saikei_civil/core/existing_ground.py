@@ -0,0 +1,182 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Existing-Ground Sections
+========================
+
+Samples existing ground across the corridor at every station for earthwork
+and daylight work.
+
+Every (station, offset) pair is placed in plan with the same transform the
+corridor mesh uses (core.corridor.transform_profiles), all points are looked
+up in a terrain index in one elevations_at() call, and the result is kept
+as one compact (N_stations x N_offsets) float32 array.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> offsets = section_offsets(assembly_wrapper, station_values, buffer=10.0)
+    >>> ground = sample_ground_sections(terrain_index, stations, offsets)
+    >>> ground.elevations.shape
+    (len(stations), len(offsets))
+"""
+
+from dataclasses import dataclass
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+from .corridor import transform_profiles
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Ground is sampled this far beyond the assembly edges on both sides (m)
+DEFAULT_GROUND_BUFFER = 10.0
+
+# Default spacing between sampled offsets (m)
+DEFAULT_OFFSET_SPACING = 1.0
+
+
+@dataclass
+class GroundSections:
+    """
+    Existing-ground elevations at every corridor station.
+
+    Attributes:
+        stations: (N,) station values (m)
+        offsets: (M,) offsets from the centerline (m), same sign convention
+            as the corridor profiles
+        elevations: (N, M) float32 ground elevations; NaN where the terrain
+            does not cover the point
+    """
+    stations: np.ndarray
+    offsets: np.ndarray
+    elevations: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(N_stations, N_offsets)."""
+        return self.elevations.shape
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of sampled points that hit the terrain."""
+        if self.elevations.size == 0:
+            return 0.0
+        return float(np.count_nonzero(~np.isnan(self.elevations))) / self.elevations.size
+
+    def section_at(self, station: float) -> np.ndarray:
+        """
+        Ground section at the sampled station nearest to a station value.
+
+        Args:
+            station: Station value (m)
+
+        Returns:
+            (M,) elevations across the offsets
+        """
+        index = int(np.argmin(np.abs(self.stations - station)))
+        return self.elevations[index]
+
+
+def section_offsets(
+    assembly: Any,
+    stations: Sequence[float],
+    buffer: float = DEFAULT_GROUND_BUFFER,
+    spacing: float = DEFAULT_OFFSET_SPACING
+) -> np.ndarray:
+    """
+    Offsets spanning the widest assembly over the stations plus a buffer.
+
+    The assembly width includes constraint widenings at the given stations.
+    The centerline (offset 0) and both buffered edges are always included.
+
+    Args:
+        assembly: AssemblyWrapper
+        stations: Station values the corridor is built at (m)
+        buffer: Extra width sampled beyond each edge (m)
+        spacing: Target distance between offsets (m)
+
+    Returns:
+        (M,) sorted offsets (m)
+    """
+    profile_offsets = assembly.profiles_at(np.asarray(stations, dtype=np.float64))[..., 0]
+    left = min(float(profile_offsets.min()), 0.0) - buffer
+    right = max(float(profile_offsets.max()), 0.0) + buffer
+
+    left_count = max(int(np.ceil(-left / spacing)), 1)
+    right_count = max(int(np.ceil(right / spacing)), 1)
+    return np.concatenate([
+        np.linspace(left, 0.0, left_count + 1)[:-1],
+        np.linspace(0.0, right, right_count + 1),
+    ])
+
+
+def sample_ground_sections(
+    terrain: Any,
+    stations: List[Any],
+    offsets: np.ndarray
+) -> GroundSections:
+    """
+    Sample existing ground at every (station, offset) pair in one query.
+
+    Args:
+        terrain: Terrain source with elevations_at(xy), e.g. TerrainIndex
+        stations: StationPoint objects (station, x, y and direction are used)
+        offsets: (M,) offsets from the centerline (m)
+
+    Returns:
+        GroundSections with an (N, M) elevation array
+    """
+    offsets = np.asarray(offsets, dtype=np.float64)
+    frames = np.array(
+        [(s.station, s.x, s.y, s.direction) for s in stations], dtype=np.float64
+    ).reshape(-1, 4)
+
+    positions = np.zeros((len(frames), 3))
+    positions[:, :2] = frames[:, 1:3]
+    template = np.column_stack([offsets, np.zeros_like(offsets)])
+    points = transform_profiles(positions, frames[:, 3], template)
+
+    elevations = terrain.elevations_at(points[..., :2].reshape(-1, 2))
+    sections = GroundSections(
+        stations=frames[:, 0].copy(),
+        offsets=offsets,
+        elevations=elevations.reshape(len(frames), len(offsets)).astype(np.float32),
+    )
+
+    logger.info(
+        "Sampled ground sections: %d stations x %d offsets (%.0f%% on terrain)",
+        len(frames), len(offsets), sections.coverage * 100.0
+    )
+    return sections
+
+
+__all__ = [
+    "GroundSections",
+    "section_offsets",
+    "sample_ground_sections",
+    "DEFAULT_GROUND_BUFFER",
+    "DEFAULT_OFFSET_SPACING",
+]
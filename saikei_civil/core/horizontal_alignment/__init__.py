@@ -54,13 +54,23 @@ from .curve_geometry import (
 from .segment_builder import (
     create_tangent_segment,
     create_curve_segment,
+    update_tangent_segment,
+    update_curve_segment,
     build_composite_curve,
+    update_composite_curve,
+    find_composite_curve,
+    collect_entity_ids,
+    remove_segment_entities,
     cleanup_old_geometry,
 )
 
 # Stationing manager
 from .stationing import StationingManager
 
+# Compiled geometry evaluator
+from .evaluator import CompiledHorizontalAlignment
+from .spatial_index import AlignmentSpatialIndex
+
 # Main alignment class
 from .manager import NativeIfcAlignment
 
@@ -72,6 +82,8 @@ __all__ = [
     "SimpleVector",
     "StationingManager",
     "NativeIfcAlignment",
+    "CompiledHorizontalAlignment",
+    "AlignmentSpatialIndex",
     # Curve geometry functions
     "calculate_curve_geometry",
     "calculate_curve_center",
@@ -80,6 +92,12 @@ __all__ = [
     # Segment building functions
     "create_tangent_segment",
     "create_curve_segment",
+    "update_tangent_segment",
+    "update_curve_segment",
     "build_composite_curve",
+    "update_composite_curve",
+    "find_composite_curve",
+    "collect_entity_ids",
+    "remove_segment_entities",
     "cleanup_old_geometry",
 ]
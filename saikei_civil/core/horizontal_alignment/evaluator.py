@@ -0,0 +1,392 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Compiled Horizontal Alignment Evaluator
+========================================
+
+Flattens an IFC horizontal layout into NumPy arrays once so that position,
+bearing and curvature queries no longer walk the IFC segment list per station.
+
+Segments are located with a binary search over the cumulative segment end
+distances, so a query costs O(log n) in the number of segments and a batch of
+stations is evaluated in a single vectorized pass.
+
+Example:
+    >>> evaluator = CompiledHorizontalAlignment.from_ifc_segments(segments)
+    >>> x, y, bearing, curvature = evaluator.evaluate(np.arange(0.0, 500.0, 1.0))
+"""
+
+import bisect
+import logging
+import math
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .stationing import StationingManager
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledHorizontalAlignment:
+    """Array-backed evaluator for a horizontal alignment layout.
+
+    All queries are made in *distance along* the alignment (0 at the start of
+    the first segment). Station values must be converted to distances by the
+    caller, which keeps station equations out of the geometry layer.
+
+    Distances before the start or past the end are extrapolated along the
+    first or last segment respectively; callers that need strict range checks
+    should compare against ``total_length``.
+
+    Attributes:
+        start_distances: Cumulative distance at the start of each segment
+        end_distances: Cumulative distance at the end of each segment
+        start_x: X coordinate of each segment start point
+        start_y: Y coordinate of each segment start point
+        start_directions: Bearing at each segment start (radians from +X)
+        curvatures: Signed curvature (1/R, positive = left turn, 0 = tangent)
+        start_curvatures: Design curvature at each segment start
+        end_curvatures: Design curvature at each segment end
+        source_indices: Index of each compiled segment in the source list
+
+    Transition segments (clothoids and other spirals) are evaluated as
+    tangents, so their ``curvatures`` entry is 0; their design curvatures
+    at both ends are kept in ``start_curvatures`` and ``end_curvatures``.
+    """
+
+    def __init__(
+        self,
+        start_x: Sequence[float],
+        start_y: Sequence[float],
+        start_directions: Sequence[float],
+        curvatures: Sequence[float],
+        lengths: Sequence[float],
+        source_indices: Optional[Sequence[int]] = None,
+        start_curvatures: Optional[Sequence[float]] = None,
+        end_curvatures: Optional[Sequence[float]] = None
+    ):
+        """Initialize from per-segment parameter arrays.
+
+        Args:
+            start_x: Segment start X coordinates
+            start_y: Segment start Y coordinates
+            start_directions: Segment start bearings in radians
+            curvatures: Signed segment curvatures (1/R)
+            lengths: Segment lengths
+            source_indices: Optional mapping back to the source segment list
+            start_curvatures: Design curvatures at segment starts
+                (default: curvatures)
+            end_curvatures: Design curvatures at segment ends
+                (default: curvatures)
+        """
+        self.start_x = np.asarray(start_x, dtype=float)
+        self.start_y = np.asarray(start_y, dtype=float)
+        self.start_directions = np.asarray(start_directions, dtype=float)
+        self.curvatures = np.asarray(curvatures, dtype=float)
+        self.lengths = np.asarray(lengths, dtype=float)
+        self.start_curvatures = np.asarray(
+            curvatures if start_curvatures is None else start_curvatures, dtype=float
+        )
+        self.end_curvatures = np.asarray(
+            curvatures if end_curvatures is None else end_curvatures, dtype=float
+        )
+
+        self.end_distances = np.cumsum(self.lengths)
+        self.start_distances = self.end_distances - self.lengths
+
+        if source_indices is None:
+            source_indices = range(len(self.lengths))
+        self.source_indices = np.asarray(source_indices, dtype=int)
+
+        # Plain-list copies for scalar bisect lookups (avoids NumPy overhead)
+        self._end_list: List[float] = self.end_distances.tolist()
+        self._rows: List[Tuple[float, float, float, float, float]] = list(zip(
+            self.start_distances.tolist(),
+            self.start_x.tolist(),
+            self.start_y.tolist(),
+            self.start_directions.tolist(),
+            self.curvatures.tolist(),
+        ))
+
+        self._spatial_index = None
+
+    def __getstate__(self) -> dict:
+        """Pickle the layout arrays only; the spatial index is rebuilt lazily."""
+        state = self.__dict__.copy()
+        state['_spatial_index'] = None
+        return state
+
+    # ========================================================================
+    # CONSTRUCTION
+    # ========================================================================
+
+    @classmethod
+    def from_ifc_segments(cls, segments: Sequence) -> "CompiledHorizontalAlignment":
+        """Compile from a list of IfcAlignmentSegment entities.
+
+        Reads each segment's IfcAlignmentHorizontalSegment DesignParameters
+        exactly once. Zero-length segments (BSI ALB015 endpoints) and
+        segments without DesignParameters are skipped.
+
+        Args:
+            segments: IfcAlignmentSegment entities in layout order
+
+        Returns:
+            CompiledHorizontalAlignment instance
+        """
+        start_x, start_y, directions, curvatures, lengths, indices = [], [], [], [], [], []
+        start_curvatures, end_curvatures = [], []
+
+        for i, segment in enumerate(segments):
+            params = segment.DesignParameters
+            if not params:
+                continue
+
+            length = params.SegmentLength
+            if not length or length <= 0.0:
+                continue
+
+            curvature = 0.0
+            start_curvature = end_curvature = 0.0
+            if params.PredefinedType == "CIRCULARARC":
+                radius = params.StartRadiusOfCurvature
+                if radius:
+                    curvature = 1.0 / radius
+                start_curvature = end_curvature = curvature
+            elif params.PredefinedType != "LINE":
+                # Transition: a radius of 0 stands for an infinite radius
+                start_radius = params.StartRadiusOfCurvature
+                end_radius = params.EndRadiusOfCurvature
+                start_curvature = 1.0 / start_radius if start_radius else 0.0
+                end_curvature = 1.0 / end_radius if end_radius else 0.0
+                logger.debug(
+                    "Segment %d: %s evaluated as tangent", i, params.PredefinedType
+                )
+
+            coords = params.StartPoint.Coordinates
+            start_x.append(coords[0])
+            start_y.append(coords[1])
+            directions.append(params.StartDirection)
+            curvatures.append(curvature)
+            start_curvatures.append(start_curvature)
+            end_curvatures.append(end_curvature)
+            lengths.append(length)
+            indices.append(i)
+
+        return cls(
+            start_x, start_y, directions, curvatures, lengths, indices,
+            start_curvatures=start_curvatures, end_curvatures=end_curvatures
+        )
+
+    @classmethod
+    def from_horizontal(cls, horizontal) -> "CompiledHorizontalAlignment":
+        """Compile from an IfcAlignmentHorizontal entity.
+
+        Args:
+            horizontal: IfcAlignmentHorizontal entity
+
+        Returns:
+            CompiledHorizontalAlignment instance
+        """
+        segments = []
+        for rel in horizontal.IsNestedBy or []:
+            for obj in rel.RelatedObjects or []:
+                if obj.is_a("IfcAlignmentSegment"):
+                    segments.append(obj)
+        return cls.from_ifc_segments(segments)
+
+    @classmethod
+    def from_segment_dicts(cls, segments: Sequence[dict]) -> "CompiledHorizontalAlignment":
+        """Compile from core segment dictionaries.
+
+        Accepts the dictionaries produced by compute_segments_with_curves()
+        and tool.Alignment. Arcs are positioned from their 'center',
+        'radius', 'start_angle' and 'is_ccw' keys.
+
+        Args:
+            segments: Segment dictionaries with 'type' and 'length' keys
+
+        Returns:
+            CompiledHorizontalAlignment instance
+        """
+        start_x, start_y, directions, curvatures, lengths, indices = [], [], [], [], [], []
+
+        for i, seg in enumerate(segments):
+            length = seg.get('length', 0.0)
+            if length <= 0.0:
+                continue
+
+            if seg.get('type') == 'CIRCULARARC':
+                center = seg['center']
+                radius = seg['radius']
+                start_angle = seg['start_angle']
+                is_ccw = seg.get('is_ccw', True)
+
+                start_x.append(center.x + radius * math.cos(start_angle))
+                start_y.append(center.y + radius * math.sin(start_angle))
+                if is_ccw:
+                    directions.append(start_angle + math.pi / 2)
+                    curvatures.append(1.0 / radius)
+                else:
+                    directions.append(start_angle - math.pi / 2)
+                    curvatures.append(-1.0 / radius)
+            else:
+                start_x.append(seg['start'].x)
+                start_y.append(seg['start'].y)
+                directions.append(seg['direction'])
+                curvatures.append(0.0)
+
+            lengths.append(length)
+            indices.append(i)
+
+        return cls(start_x, start_y, directions, curvatures, lengths, indices)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    @property
+    def total_length(self) -> float:
+        """Total length of the compiled layout."""
+        return self._end_list[-1] if self._end_list else 0.0
+
+    @property
+    def segment_count(self) -> int:
+        """Number of compiled (non-zero-length) segments."""
+        return len(self._end_list)
+
+    def locate(self, distances) -> np.ndarray:
+        """Find the compiled segment index containing each distance.
+
+        A distance exactly on a segment boundary belongs to the earlier
+        segment, matching the historic linear walk.
+
+        Args:
+            distances: Distances along the alignment
+
+        Returns:
+            Integer array of compiled segment indices
+        """
+        distances = np.asarray(distances, dtype=float)
+        indices = np.searchsorted(self.end_distances, distances, side='left')
+        return np.clip(indices, 0, max(self.segment_count - 1, 0))
+
+    def evaluate(
+        self,
+        distances
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate position, bearing and curvature at many distances.
+
+        Args:
+            distances: Array-like of distances along the alignment
+
+        Returns:
+            Tuple of (x, y, bearing, curvature) arrays with the input's shape
+        """
+        distances = np.asarray(distances, dtype=float)
+        if self.segment_count == 0:
+            zeros = np.zeros_like(distances)
+            return zeros, zeros.copy(), zeros.copy(), zeros.copy()
+
+        idx = self.locate(distances)
+        local = distances - self.start_distances[idx]
+        x0 = self.start_x[idx]
+        y0 = self.start_y[idx]
+        d0 = self.start_directions[idx]
+        k = self.curvatures[idx]
+
+        bearing = d0 + k * local
+
+        is_line = k == 0.0
+        safe_k = np.where(is_line, 1.0, k)
+        arc_x = x0 + (np.sin(bearing) - np.sin(d0)) / safe_k
+        arc_y = y0 - (np.cos(bearing) - np.cos(d0)) / safe_k
+        line_x = x0 + local * np.cos(d0)
+        line_y = y0 + local * np.sin(d0)
+
+        x = np.where(is_line, line_x, arc_x)
+        y = np.where(is_line, line_y, arc_y)
+        return x, y, bearing, k.copy()
+
+    def evaluate_at(self, distance: float) -> Tuple[float, float, float, float]:
+        """Evaluate a single distance without NumPy overhead.
+
+        Args:
+            distance: Distance along the alignment
+
+        Returns:
+            Tuple of (x, y, bearing, curvature)
+        """
+        count = self.segment_count
+        if count == 0:
+            return 0.0, 0.0, 0.0, 0.0
+
+        i = min(bisect.bisect_left(self._end_list, distance), count - 1)
+        start, x0, y0, d0, k = self._rows[i]
+        local = distance - start
+
+        bearing = d0 + k * local
+        if k == 0.0:
+            return x0 + local * math.cos(d0), y0 + local * math.sin(d0), bearing, 0.0
+
+        x = x0 + (math.sin(bearing) - math.sin(d0)) / k
+        y = y0 - (math.cos(bearing) - math.cos(d0)) / k
+        return x, y, bearing, k
+
+    # ========================================================================
+    # PROJECTION
+    # ========================================================================
+
+    @property
+    def spatial_index(self):
+        """AlignmentSpatialIndex over this layout, built on first use."""
+        if self._spatial_index is None:
+            from .spatial_index import AlignmentSpatialIndex
+            self._spatial_index = AlignmentSpatialIndex(self)
+        return self._spatial_index
+
+    def project_points(
+        self,
+        xy,
+        start_station: float = 0.0,
+        max_offset: Optional[float] = None,
+        stationing: Optional["StationingManager"] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project points onto the alignment (station, offset, segment).
+
+        See AlignmentSpatialIndex.project_points().
+
+        Args:
+            xy: Array-like of shape (N, 2) with point coordinates
+            start_station: Station at distance 0
+            max_offset: Optional maximum distance from the alignment
+            stationing: Optional StationingManager whose referents (and
+                station equations) convert distances to stations
+
+        Returns:
+            Tuple of (stations, offsets, segment_indices)
+        """
+        return self.spatial_index.project_points(xy, start_station, max_offset, stationing)
+
+
+__all__ = ["CompiledHorizontalAlignment"]
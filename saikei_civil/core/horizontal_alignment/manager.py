@@ -27,7 +27,9 @@ PIs are pure intersection points (no radius property).
 """
 
 import math
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 import ifcopenshell
 import ifcopenshell.guid
@@ -37,14 +39,30 @@ from .curve_geometry import calculate_curve_geometry
 from .segment_builder import (
     create_tangent_segment,
     create_curve_segment,
+    update_tangent_segment,
+    update_curve_segment,
     build_composite_curve,
+    update_composite_curve,
+    find_composite_curve,
+    collect_entity_ids,
+    remove_segment_entities,
     cleanup_old_geometry,
 )
 from .stationing import StationingManager
+from .evaluator import CompiledHorizontalAlignment
+from ..corridor_dependencies import get_change_tracker, changed_interval
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Chained segment ends closer than this are considered unchanged
+CHAIN_TOLERANCE = 1e-9
+
+
+def _same_point(a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+    """Check whether two chained segment end points coincide."""
+    return abs(a[0] - b[0]) < CHAIN_TOLERANCE and abs(a[1] - b[1]) < CHAIN_TOLERANCE
+
 
 class NativeIfcAlignment:
     """Native IFC alignment with PI-driven design.
@@ -91,6 +109,18 @@ class NativeIfcAlignment:
         self.curve_segments: List[ifcopenshell.entity_instance] = []
         self.auto_update = True
 
+        # Incremental regeneration state (see mark_pi_moved())
+        self._dirty_pis: Set[int] = set()
+        self._segment_layout: List[Tuple[str, int]] = []
+        self._exact_ends: List[Tuple[float, float]] = []
+
+        # Entity churn of the last regeneration (see _rebuild_segments())
+        self.last_edit_stats: Dict[str, int] = {'created': 0, 'removed': 0, 'reused': 0}
+
+        # Bumped whenever the segment layout changes; keys the evaluator cache
+        self._segments_version = 0
+        self._evaluator_cache = None
+
         if alignment_entity:
             self._load_from_ifc(alignment_entity)
         else:
@@ -204,6 +234,7 @@ class NativeIfcAlignment:
                         logger.debug("      - Segment: %s (no DesignParameters!)", obj.Name)
 
         self.segments = segments
+        self._segments_changed()
         logger.info("  Loaded %d segments from IFC", len(self.segments))
 
         if not self.segments:
@@ -224,6 +255,9 @@ class NativeIfcAlignment:
         self.stationing = StationingManager(self.ifc, self.alignment)
         self.stationing.load_from_ifc()
 
+        # Baseline for reporting edits to dependent corridors
+        self._corridor_table = self._segment_table()
+
         logger.info(
             f"Loaded '{alignment_entity.Name}': "
             f"{len(self.pis)} PIs, {len(self.segments)} segments"
@@ -488,130 +522,408 @@ class NativeIfcAlignment:
     # SEGMENT GENERATION
     # ========================================================================
 
+    def mark_pi_moved(self, pi_index: int) -> None:
+        """Record that a PI was moved since the last regeneration.
+
+        The next regenerate_segments()/regenerate_segments_with_curves() call
+        then only rewrites the segments that depend on the moved PIs, as long
+        as the segment layout (which PIs carry curves) is unchanged.
+
+        Args:
+            pi_index: Index of the moved PI
+        """
+        if not hasattr(self, '_dirty_pis'):
+            self._dirty_pis = set()
+        self._dirty_pis.add(pi_index)
+
     def regenerate_segments(self) -> None:
         """Regenerate IFC tangent segments from PIs.
 
         Creates straight line segments between consecutive PIs.
         Curves are added separately via insert_curve_at_pi().
         """
-        cleanup_old_geometry(self.ifc, self.curve_segments)
+        if self._regenerate_dirty(with_curves=False):
+            pass
+        elif len(self.pis) < 2:
+            self._clear_segments()
+        else:
+            self._rebuild_segments(with_curves=False)
+
+            logger.debug(
+                f"Regenerated {len(self.segments)} tangent segments "
+                f"from {len(self.pis)} PIs"
+            )
+
+        self._notify_corridors()
+
+    def regenerate_segments_with_curves(self) -> None:
+        """Regenerate segments considering curves at PIs."""
+        if self._regenerate_dirty(with_curves=True):
+            pass
+        elif len(self.pis) < 2:
+            self._clear_segments()
+        else:
+            # Recalculate all curve geometries
+            self._recalculate_curves()
+
+            self._rebuild_segments(with_curves=True)
+
+            logger.debug(f"Regenerated {len(self.segments)} segments with curves")
+
+        self._notify_corridors()
+
+    def _segment_table(self) -> List[Tuple[float, float, Tuple]]:
+        """Station range and design parameters of each segment.
+
+        Returns:
+            List of (start_station, end_station, signature) tuples
+        """
+        signatures = []
+        lengths = []
+        for segment in self.segments:
+            params = segment.DesignParameters
+            if params is None:
+                signatures.append(None)
+                lengths.append(0.0)
+                continue
+            signatures.append((
+                params.PredefinedType,
+                tuple(params.StartPoint.Coordinates),
+                params.StartDirection,
+                params.StartRadiusOfCurvature,
+                params.EndRadiusOfCurvature,
+            ))
+            lengths.append(params.SegmentLength)
+
+        ends = np.cumsum([0.0] + lengths)
+        if getattr(self, 'stationing', None) is not None:
+            ends = self.stations_from_distances(ends)
+        ends = ends.tolist()
+        return [(ends[i], ends[i + 1], sig) for i, sig in enumerate(signatures)]
+
+    def _notify_corridors(self) -> None:
+        """Report the station interval changed by the last regeneration.
+
+        Corridors built on this alignment then regenerate only the affected
+        range (see corridor_dependencies.CorridorChangeTracker).
+        """
+        if self.alignment is None:
+            return
+
+        table = self._segment_table()
+        previous = getattr(self, '_corridor_table', None)
+        self._corridor_table = table
+
+        if previous is None:
+            interval = (-math.inf, math.inf)
+        else:
+            interval = changed_interval(previous, table)
+        if interval is not None:
+            get_change_tracker().alignment_changed(self.alignment.GlobalId, *interval)
 
+    def _clear_segments(self) -> None:
+        """Drop the segment lists and their curve geometry (fewer than 2 PIs)."""
+        cleanup_old_geometry(self.ifc, self.curve_segments)
         self.segments = []
         self.curve_segments = []
+        self._segment_layout = []
+        self._exact_ends = []
+        self._segments_changed()
 
-        if len(self.pis) < 2:
-            return
+    def _rebuild_segments(self, with_curves: bool) -> None:
+        """Rebuild the full segment chain, reusing existing IFC entities.
+
+        Existing segments are reused in order for segments of the same type
+        (LINE or CIRCULARARC) and edited in place; entities are only created
+        when the new layout has more segments of a type than before, and
+        only the surplus old segments are removed. The zero-length endpoint,
+        the IfcRelNests and the IfcCompositeCurve are kept as well.
+
+        The number of entities created and removed and the number of
+        segments reused is stored in last_edit_stats.
+
+        Args:
+            with_curves: Whether to insert curves at PIs that have them
+        """
+        stats = {'created': 0, 'removed': 0, 'reused': 0}
+        pools, endpoint, surplus = self._reusable_segments()
+
+        segments = []
+        curve_segments = []
+        layout = self._plan_layout(with_curves)
+        exact_ends = []
 
         # Track exact position for C0 continuity chaining
         current_exact_pos = None
 
-        for i in range(len(self.pis) - 1):
-            curr_pi = self.pis[i]
-            next_pi = self.pis[i + 1]
+        for kind, j in layout:
+            pool = pools[kind]
+            reused = pool.pop(0) if pool else None
+
+            if kind == "LINE":
+                if with_curves:
+                    start_pos, end_pos = self._tangent_endpoints(j)
+                    index = len(segments)
+                else:
+                    start_pos, end_pos = self.pis[j]['position'], self.pis[j + 1]['position']
+                    index = j
+
+                if reused:
+                    segment, curve_geom = reused
+                    current_exact_pos = update_tangent_segment(
+                        self.ifc, segment, curve_geom, start_pos, end_pos,
+                        exact_start=current_exact_pos
+                    )
+                    segment.Name = f"Tangent_{index}"
+                else:
+                    segment, curve_geom, current_exact_pos = create_tangent_segment(
+                        self.ifc, start_pos, end_pos, index,
+                        exact_start=current_exact_pos
+                    )
+            else:
+                pi = self.pis[j]
+                if reused:
+                    segment, curve_geom = reused
+                    current_exact_pos = update_curve_segment(
+                        self.ifc, segment, curve_geom, pi['curve'],
+                        exact_start=current_exact_pos
+                    )
+                    segment.Name = f"Curve_{pi['id']}"
+                else:
+                    segment, curve_geom, current_exact_pos = create_curve_segment(
+                        self.ifc, pi['curve'], pi['id'],
+                        exact_start=current_exact_pos
+                    )
+
+            if reused:
+                stats['reused'] += 1
+            else:
+                stats['created'] += len(collect_entity_ids(self.ifc, (segment, curve_geom)))
 
-            segment, curve_geom, exact_end = create_tangent_segment(
-                self.ifc,
-                curr_pi['position'],
-                next_pi['position'],
-                i,
-                exact_start=current_exact_pos
-            )
-            self.segments.append(segment)
-            self.curve_segments.append(curve_geom)
+            segments.append(segment)
+            curve_segments.append(curve_geom)
+            exact_ends.append(current_exact_pos)
 
-            # Chain end position to next segment's start
-            current_exact_pos = exact_end
+        self.segments = segments
+        self.curve_segments = curve_segments
+        self._segment_layout = layout
+        self._exact_ends = exact_ends
 
         # Store final position for zero-length segment
         self._last_exact_pos = current_exact_pos
 
-        # BSI ALB015: Add zero-length final segment (business logic requirement)
-        # Per IFC 4.3: Each alignment layout must end with a zero-length segment
-        if self.segments and len(self.pis) >= 2:
+        # BSI ALB015: Each alignment layout must end with a zero-length segment
+        if endpoint:
+            self.segments.append(endpoint[0])
+            self.curve_segments.append(endpoint[1])
+            self._update_zero_length_final_segment()
+            stats['reused'] += 1
+        else:
             self._add_zero_length_final_segment()
-
-        self._update_ifc_nesting()
-        build_composite_curve(self.ifc, self.curve_segments, self.alignment)
-
+            stats['created'] += len(collect_entity_ids(
+                self.ifc, (self.segments[-1], self.curve_segments[-1])
+            ))
+        self._segments_changed()
+
+        for leftover in pools.values():
+            surplus.extend(leftover)
+
+        # Re-point the nesting and composite curve before removing anything
+        stale = self._update_ifc_nesting(stats)
+        if update_composite_curve(self.ifc, self.curve_segments, self.alignment) is None:
+            before = collect_entity_ids(self.ifc, (self.alignment.Representation,))
+            build_composite_curve(self.ifc, self.curve_segments, self.alignment)
+            after = collect_entity_ids(self.ifc, (self.alignment.Representation,))
+            shape = self.alignment.Representation
+            counted = collect_entity_ids(self.ifc, self.curve_segments + [
+                rep.ContextOfItems for rep in (shape.Representations if shape else [])
+            ])
+            stats['created'] += len(after - before - counted)
+
+        kept = {segment.id() for segment in self.segments}
+        removed_ids = set()
+        for segment, curve_geom in surplus + [(obj, None) for obj in stale]:
+            if segment is not None:
+                if segment.id() in kept or segment.id() in removed_ids:
+                    continue
+                removed_ids.add(segment.id())
+            stats['removed'] += remove_segment_entities(self.ifc, segment, curve_geom)
+
+        self.last_edit_stats = stats
         logger.debug(
-            f"Regenerated {len(self.segments)} tangent segments "
-            f"from {len(self.pis)} PIs"
+            f"Segment rebuild: {stats['reused']} reused, "
+            f"{stats['created']} entities created, {stats['removed']} removed"
         )
 
-    def regenerate_segments_with_curves(self) -> None:
-        """Regenerate segments considering curves at PIs."""
-        cleanup_old_geometry(self.ifc, self.curve_segments)
+    def _reusable_segments(self) -> Tuple[
+        Dict[str, List[tuple]],
+        Optional[tuple],
+        List[tuple]
+    ]:
+        """Sort the current segments into pools for reuse by _rebuild_segments().
 
-        self.segments = []
-        self.curve_segments = []
+        Segments are paired with their IfcCurveSegment from curve_segments or,
+        after loading from IFC, from the alignment's composite curve. Segments
+        that cannot be paired are returned as surplus for removal.
 
-        if len(self.pis) < 2:
-            return
+        Returns:
+            Tuple of (pools, endpoint, surplus): pools maps "LINE" and
+            "CIRCULARARC" to (segment, curve_segment) pairs in layout order,
+            endpoint is the zero-length (segment, curve_segment) pair or None
+        """
+        pools = {"LINE": [], "CIRCULARARC": []}
+        endpoint = None
+        surplus = []
+
+        composite_curve = find_composite_curve(self.alignment) if self.alignment else None
+        composite_segments = list(composite_curve.Segments or []) if composite_curve else []
+
+        curve_segments = list(self.curve_segments)
+        if len(curve_segments) != len(self.segments):
+            curve_segments = composite_segments
+
+        if len(curve_segments) != len(self.segments):
+            surplus.extend((segment, None) for segment in self.segments)
+            orphans = {curve_geom.id(): curve_geom
+                       for curve_geom in self.curve_segments + composite_segments}
+            surplus.extend((None, curve_geom) for curve_geom in orphans.values())
+            return pools, endpoint, surplus
+
+        parent_types = {"LINE": "IfcLine", "CIRCULARARC": "IfcCircle"}
+        for segment, curve_geom in zip(self.segments, curve_segments):
+            params = segment.DesignParameters
+            parent = curve_geom.ParentCurve if curve_geom.is_a("IfcCurveSegment") else None
+            kind = params.PredefinedType if params else None
+
+            if params and not params.SegmentLength and endpoint is None and \
+                    parent is not None and parent.is_a("IfcLine"):
+                endpoint = (segment, curve_geom)
+            elif kind in pools and parent is not None and parent.is_a(parent_types[kind]) \
+                    and params.SegmentLength:
+                pools[kind].append((segment, curve_geom))
+            else:
+                surplus.append((segment, curve_geom))
 
-        # Recalculate all curve geometries
-        self._recalculate_curves()
+        return pools, endpoint, surplus
 
-        # Track exact position for C0 continuity chaining
-        current_exact_pos = None
+    def _tangent_endpoints(self, i: int) -> Tuple[SimpleVector, SimpleVector]:
+        """Get start/end of the tangent from PI i to PI i+1 (EC to BC)."""
+        curr_pi = self.pis[i]
+        next_pi = self.pis[i + 1]
+        start_pos = curr_pi['curve']['ec'] if 'curve' in curr_pi else curr_pi['position']
+        end_pos = next_pi['curve']['bc'] if 'curve' in next_pi else next_pi['position']
+        return start_pos, end_pos
 
-        # Generate segments
+    def _plan_layout(self, with_curves: bool) -> List[Tuple[str, int]]:
+        """Segment layout the current PIs would generate, as (type, PI index)."""
+        layout = []
         for i in range(len(self.pis) - 1):
-            curr_pi = self.pis[i]
-            next_pi = self.pis[i + 1]
+            layout.append(("LINE", i))
+            if with_curves and 'curve' in self.pis[i + 1]:
+                layout.append(("CIRCULARARC", i + 1))
+        return layout
 
-            # Determine tangent start
-            if 'curve' in curr_pi:
-                start_pos = curr_pi['curve']['ec']
-            else:
-                start_pos = curr_pi['position']
+    def _regenerate_dirty(self, with_curves: bool) -> bool:
+        """Rewrite only the segments that depend on moved PIs.
 
-            # Determine tangent end
-            if 'curve' in next_pi:
-                end_pos = next_pi['curve']['bc']
-            else:
-                end_pos = next_pi['position']
+        A tangent from PI j to j+1 depends on PIs j..j+1 (j-1..j+2 when its
+        ends are curve EC/BC points) and a curve at PI j on PIs j-1..j+1.
+        Dependent segments are edited in place; the C0 chain is then followed
+        forward until it rejoins the unchanged segments, and the nesting and
+        composite curve are left as they are.
 
-            # Create tangent segment (use chained position for C0 continuity)
-            segment, curve_geom, exact_end = create_tangent_segment(
-                self.ifc, start_pos, end_pos, len(self.segments),
-                exact_start=current_exact_pos
+        Args:
+            with_curves: Whether the layout includes curves at PIs
+
+        Returns:
+            True if handled incrementally, False if a full rebuild is needed
+        """
+        dirty = getattr(self, '_dirty_pis', None)
+        self._dirty_pis = set()
+        layout = getattr(self, '_segment_layout', None)
+        if not dirty or not layout or len(self.pis) < 2:
+            return False
+
+        # Segment count must match the recorded layout plus the endpoint
+        if len(self.segments) != len(layout) + 1 or len(self.curve_segments) != len(self.segments):
+            return False
+
+        if with_curves:
+            self._recalculate_curves(
+                {j for i in dirty for j in (i - 1, i, i + 1)}
             )
-            self.segments.append(segment)
-            self.curve_segments.append(curve_geom)
-
-            # Chain end position to next segment's start
-            current_exact_pos = exact_end
-
-            # Add curve at next PI if exists
-            if 'curve' in next_pi:
-                curve_seg, curve_geom, curve_exact_end = create_curve_segment(
-                    self.ifc,
-                    next_pi['curve'],
-                    next_pi['id'],
-                    exact_start=current_exact_pos
+
+        if self._plan_layout(with_curves) != layout:
+            return False
+
+        reach = 2 if with_curves else 1
+        dirty_segments = []
+        for k, (kind, j) in enumerate(layout):
+            if kind == "LINE":
+                depends = range(j - reach + 1, j + reach + 1)
+            else:
+                depends = range(j - 1, j + 2)
+            if any(p in dirty for p in depends):
+                dirty_segments.append(k)
+
+        self.last_edit_stats = {'created': 0, 'removed': 0, 'reused': 0}
+        if not dirty_segments:
+            return True
+
+        first, last = dirty_segments[0], dirty_segments[-1]
+        old_ends = list(self._exact_ends)
+        exact = old_ends[first - 1] if first > 0 else None
+        rejoined = False
+        updated = 0
+
+        for k in range(first, len(layout)):
+            # Past the dirty range, stop once the chain meets the old start
+            if k > last and _same_point(exact, old_ends[k - 1]):
+                rejoined = True
+                break
+
+            kind, j = layout[k]
+            if kind == "LINE":
+                if with_curves:
+                    start_pos, end_pos = self._tangent_endpoints(j)
+                else:
+                    start_pos, end_pos = self.pis[j]['position'], self.pis[j + 1]['position']
+                exact = update_tangent_segment(
+                    self.ifc, self.segments[k], self.curve_segments[k],
+                    start_pos, end_pos, exact_start=exact
                 )
-                self.segments.append(curve_seg)
-                self.curve_segments.append(curve_geom)
+            else:
+                exact = update_curve_segment(
+                    self.ifc, self.segments[k], self.curve_segments[k],
+                    self.pis[j]['curve'], exact_start=exact
+                )
+            self._exact_ends[k] = exact
+            updated += 1
 
-                # Chain curve end to next segment's start
-                current_exact_pos = curve_exact_end
+        self.last_edit_stats['reused'] = updated
 
-        # Store final position for zero-length segment
-        self._last_exact_pos = current_exact_pos
+        if not rejoined:
+            self._last_exact_pos = exact
+            self._update_zero_length_final_segment()
 
-        # BSI ALB015: Add zero-length final segment (business logic requirement)
-        # Per IFC 4.3: Each alignment layout must end with a zero-length segment
-        if self.segments and len(self.pis) >= 2:
-            self._add_zero_length_final_segment()
+        self._segments_changed()
 
-        self._update_ifc_nesting()
-        build_composite_curve(self.ifc, self.curve_segments, self.alignment)
+        logger.debug(
+            f"Incrementally updated {updated} of {len(layout)} segments "
+            f"for PIs {sorted(dirty)}"
+        )
+        return True
 
-        logger.debug(f"Regenerated {len(self.segments)} segments with curves")
+    def _recalculate_curves(self, pi_indices: Optional[Set[int]] = None) -> None:
+        """Recalculate curve geometries from current PI positions.
 
-    def _recalculate_curves(self) -> None:
-        """Recalculate all curve geometries from current PI positions."""
+        Args:
+            pi_indices: Only recalculate curves at these PIs (default: all)
+        """
         for i, pi in enumerate(self.pis):
+            if pi_indices is not None and i not in pi_indices:
+                continue
+
             if 'curve' not in pi:
                 continue
 
@@ -634,21 +946,15 @@ class NativeIfcAlignment:
                 del pi['curve']
                 logger.info(f"Removed invalid curve at PI {i}")
 
-    def _add_zero_length_final_segment(self) -> None:
-        """Add zero-length final segment per BSI ALB015.
-
-        Per IFC 4.3 specification, each alignment layout must end with
-        a zero-length segment to mark the endpoint.
-        """
-        if not self.segments:
-            return
-
-        # Get endpoint from last segment
-        last_seg = self.segments[-1]
+    def _final_endpoint(
+        self,
+        last_seg: ifcopenshell.entity_instance
+    ) -> Optional[Tuple[float, float, float]]:
+        """Get (x, y, direction) at the end of the last real segment."""
         last_params = last_seg.DesignParameters
 
         if not last_params:
-            return
+            return None
 
         # Use chained exact position if available (for C0 continuity)
         if hasattr(self, '_last_exact_pos') and self._last_exact_pos is not None:
@@ -694,6 +1000,22 @@ class NativeIfcAlignment:
                 end_y = end_pos.y
                 end_direction = start_dir
 
+        return end_x, end_y, end_direction
+
+    def _add_zero_length_final_segment(self) -> None:
+        """Add zero-length final segment per BSI ALB015.
+
+        Per IFC 4.3 specification, each alignment layout must end with
+        a zero-length segment to mark the endpoint.
+        """
+        if not self.segments:
+            return
+
+        endpoint = self._final_endpoint(self.segments[-1])
+        if endpoint is None:
+            return
+        end_x, end_y, end_direction = endpoint
+
         # Create zero-length horizontal segment at endpoint
         end_point = self.ifc.create_entity(
             "IfcCartesianPoint",
@@ -759,34 +1081,63 @@ class NativeIfcAlignment:
 
         logger.debug("Added zero-length final segment (ALB015/ALS015)")
 
-    def _update_ifc_nesting(self) -> None:
-        """Update IFC nesting relationships for segments."""
-        # Remove old segments and nesting
-        old_segments = []
-        for rel in self.horizontal.IsNestedBy or []:
-            if rel.is_a("IfcRelNests"):
-                for obj in rel.RelatedObjects:
-                    if obj.is_a("IfcAlignmentSegment"):
-                        old_segments.append(obj)
+    def _update_zero_length_final_segment(self) -> None:
+        """Move the existing zero-length final segment to the new endpoint.
+
+        The endpoint IfcCartesianPoint is shared by the design parameters and
+        the IfcCurveSegment placement, so only it and the two directions change.
+        """
+        final_segment = self.segments[-1]
+        endpoint = self._final_endpoint(self.segments[-2])
+        if endpoint is None:
+            return
+        end_x, end_y, end_direction = endpoint
+
+        params = final_segment.DesignParameters
+        params.StartPoint.Coordinates = (float(end_x), float(end_y))
+        params.StartDirection = float(end_direction)
+
+        placement = self.curve_segments[-1].Placement
+        placement.Location.Coordinates = (float(end_x), float(end_y))
+        placement.RefDirection.DirectionRatios = (
+            math.cos(end_direction), math.sin(end_direction)
+        )
+
+    def _update_ifc_nesting(
+        self,
+        stats: Optional[Dict[str, int]] = None
+    ) -> List[ifcopenshell.entity_instance]:
+        """Update IFC nesting relationships for segments.
+
+        The first existing IfcRelNests is kept and pointed at self.segments;
+        any further nesting relationships are removed.
+
+        Args:
+            stats: Optional edit counters to add created/removed entities to
+
+        Returns:
+            Previously nested segments that are no longer in self.segments
+            (the caller removes them)
+        """
+        kept = {segment.id() for segment in self.segments}
+        stale = []
+        nesting = None
+        created = removed = 0
+
+        for rel in list(self.horizontal.IsNestedBy or []):
+            if not rel.is_a("IfcRelNests"):
+                continue
+            for obj in rel.RelatedObjects or []:
+                if obj.is_a("IfcAlignmentSegment") and obj.id() not in kept:
+                    stale.append(obj)
+            if nesting is None and self.segments:
+                nesting = rel
+                rel.RelatedObjects = self.segments
+            else:
                 self.ifc.remove(rel)
+                removed += 1
 
-        # Remove old segment entities
-        for segment in old_segments:
-            try:
-                if hasattr(segment, 'DesignParameters') and segment.DesignParameters:
-                    params = segment.DesignParameters
-                    if hasattr(params, 'StartPoint') and params.StartPoint:
-                        self.ifc.remove(params.StartPoint)
-                    self.ifc.remove(params)
-                self.ifc.remove(segment)
-            except RuntimeError:
-                pass
-
-        if old_segments:
-            logger.debug(f"Removed {len(old_segments)} old segments")
-
-        # Create new nesting
-        if self.segments:
+        if nesting is None and self.segments:
             self.ifc.create_entity(
                 "IfcRelNests",
                 GlobalId=ifcopenshell.guid.new(),
@@ -794,6 +1145,34 @@ class NativeIfcAlignment:
                 RelatingObject=self.horizontal,
                 RelatedObjects=self.segments
             )
+            created += 1
+
+        if stats is not None:
+            stats['created'] += created
+            stats['removed'] += removed
+
+        return stale
+
+    def get_horizontal_evaluator(self) -> CompiledHorizontalAlignment:
+        """Get the compiled evaluator for the current horizontal layout.
+
+        The evaluator is cached against a layout version that every segment
+        rebuild or in-place update bumps (see _segments_changed()), so a
+        cache hit costs O(1) regardless of the segment count.
+
+        Returns:
+            CompiledHorizontalAlignment for self.segments
+        """
+        version = getattr(self, '_segments_version', 0)
+        cached = getattr(self, '_evaluator_cache', None)
+        if cached is None or cached[0] != version:
+            cached = (version, CompiledHorizontalAlignment.from_ifc_segments(self.segments))
+            self._evaluator_cache = cached
+        return cached[1]
+
+    def _segments_changed(self) -> None:
+        """Invalidate the cached evaluator after the segment layout changed."""
+        self._segments_version = getattr(self, '_segments_version', 0) + 1
 
     # ========================================================================
     # STATIONING (Delegated to StationingManager)
@@ -827,6 +1206,27 @@ class NativeIfcAlignment:
         """Get distance at station. See StationingManager.get_distance_at_station()."""
         return self.stationing.get_distance_at_station(station_value)
 
+    def stations_from_distances(self, distances) -> np.ndarray:
+        """Bulk distance to station. See StationingManager.stations_from_distances()."""
+        return self.stationing.stations_from_distances(distances)
+
+    def distances_from_stations(self, stations) -> np.ndarray:
+        """Bulk station to distance. See StationingManager.distances_from_stations()."""
+        return self.stationing.distances_from_stations(stations)
+
+    def project_points(
+        self,
+        xy,
+        max_offset: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project points to (station, offset, segment) with station equations.
+
+        See CompiledHorizontalAlignment.project_points().
+        """
+        return self.get_horizontal_evaluator().project_points(
+            xy, max_offset=max_offset, stationing=self.stationing
+        )
+
     @property
     def referents(self) -> List[dict]:
         """Access stationing referents."""
@@ -28,7 +28,7 @@ Handles tangent (LINE) and curve (CIRCULARARC) segments.
 
 import logging
 import math
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
 
 import ifcopenshell
 import ifcopenshell.guid
@@ -277,6 +277,302 @@ def create_curve_segment(
     return segment, curve_geometry, exact_end
 
 
+def update_tangent_segment(
+    ifc_file: ifcopenshell.file,
+    segment: ifcopenshell.entity_instance,
+    curve_geometry: ifcopenshell.entity_instance,
+    start_pos: SimpleVector,
+    end_pos: SimpleVector,
+    exact_start: Tuple[float, float] = None
+) -> Tuple[float, float]:
+    """Update an existing tangent segment in place.
+
+    Writes the same values create_tangent_segment() would, but into the
+    existing design parameters and IfcCurveSegment geometry, so entity ids
+    and the rest of the IFC graph are left untouched.
+
+    Args:
+        ifc_file: Active IFC file
+        segment: IfcAlignmentSegment created by create_tangent_segment()
+        curve_geometry: Its IfcCurveSegment
+        start_pos: Start point of tangent
+        end_pos: End point of tangent
+        exact_start: Optional (x, y) tuple for exact start position
+
+    Returns:
+        End point (x, y) for chaining to next segment
+    """
+    direction = end_pos - start_pos
+    length = float(direction.length)
+    angle = math.atan2(direction.y, direction.x)
+
+    if exact_start is not None:
+        start_x, start_y = exact_start
+    else:
+        start_x, start_y = float(start_pos.x), float(start_pos.y)
+
+    # Business logic layer
+    params = segment.DesignParameters
+    params.StartPoint.Coordinates = (float(start_x), float(start_y))
+    params.StartDirection = float(angle)
+    params.SegmentLength = length
+
+    # Geometric representation layer (IfcLine at the actual start point)
+    line = curve_geometry.ParentCurve
+    line.Pnt.Coordinates = (float(start_x), float(start_y))
+    dx = float(end_pos.x) - start_x
+    dy = float(end_pos.y) - start_y
+    norm = math.hypot(dx, dy)
+    if norm < 1e-10:
+        dx, dy, norm = 1.0, 0.0, 1.0
+    line.Dir.Orientation.DirectionRatios = (dx / norm, dy / norm)
+
+    placement = curve_geometry.Placement
+    placement.Location.Coordinates = (float(start_x), float(start_y))
+    placement.RefDirection.DirectionRatios = (math.cos(angle), math.sin(angle))
+    curve_geometry.SegmentLength = ifc_file.create_entity("IfcLengthMeasure", length)
+
+    return (start_x + length * math.cos(angle), start_y + length * math.sin(angle))
+
+
+def update_curve_segment(
+    ifc_file: ifcopenshell.file,
+    segment: ifcopenshell.entity_instance,
+    curve_geometry: ifcopenshell.entity_instance,
+    curve_data: dict,
+    exact_start: Tuple[float, float] = None
+) -> Tuple[float, float]:
+    """Update an existing curve segment in place.
+
+    Counterpart of create_curve_segment() for an unchanged layout: the
+    design parameters, parent IfcCircle and IfcCurveSegment are edited
+    rather than recreated.
+
+    Args:
+        ifc_file: Active IFC file
+        segment: IfcAlignmentSegment created by create_curve_segment()
+        curve_geometry: Its IfcCurveSegment
+        curve_data: Curve geometry dictionary from calculate_curve_geometry()
+        exact_start: Optional (x, y) tuple for exact start position (BC)
+
+    Returns:
+        End point (x, y) for chaining to next segment (EC)
+    """
+    bc = curve_data['bc']
+    radius = curve_data['radius']
+    arc_length = curve_data['arc_length']
+    start_direction = curve_data['start_direction']
+    turn_direction = curve_data['turn_direction']
+    deflection = curve_data['deflection']
+
+    if exact_start is not None:
+        bc_x, bc_y = exact_start
+    else:
+        bc_x, bc_y = float(bc.x), float(bc.y)
+
+    signed_radius = radius if deflection > 0 else -radius
+
+    # Business logic layer
+    params = segment.DesignParameters
+    params.StartPoint.Coordinates = (float(bc_x), float(bc_y))
+    params.StartDirection = float(start_direction)
+    params.StartRadiusOfCurvature = float(signed_radius)
+    params.EndRadiusOfCurvature = float(signed_radius)
+    params.SegmentLength = float(arc_length)
+
+    # Geometric representation layer (same frame as create_curve_segment)
+    if turn_direction == 'LEFT':
+        center_angle = start_direction + math.pi / 2
+        circle_ref_dir = start_direction - math.pi / 2
+    else:
+        center_angle = start_direction - math.pi / 2
+        circle_ref_dir = start_direction + math.pi / 2
+
+    center_x = bc_x + radius * math.cos(center_angle)
+    center_y = bc_y + radius * math.sin(center_angle)
+
+    circle = curve_geometry.ParentCurve
+    circle.Radius = float(abs(radius))
+    circle.Position.Location.Coordinates = (float(center_x), float(center_y))
+    circle.Position.RefDirection.DirectionRatios = (
+        math.cos(circle_ref_dir), math.sin(circle_ref_dir)
+    )
+
+    placement = curve_geometry.Placement
+    placement.Location.Coordinates = (float(bc_x), float(bc_y))
+    placement.RefDirection.DirectionRatios = (
+        math.cos(start_direction), math.sin(start_direction)
+    )
+
+    angular_extent = arc_length / radius
+    if turn_direction == 'RIGHT':
+        angular_extent = -angular_extent
+    curve_geometry.SegmentLength = ifc_file.create_entity(
+        "IfcLengthMeasure", float(angular_extent)
+    )
+
+    if turn_direction == 'LEFT':
+        ec_angle = center_angle + math.pi + abs(deflection)
+    else:
+        ec_angle = center_angle + math.pi - abs(deflection)
+
+    return (
+        center_x + radius * math.cos(ec_angle),
+        center_y + radius * math.sin(ec_angle),
+    )
+
+
+def collect_entity_ids(
+    ifc_file: ifcopenshell.file,
+    roots: Iterable[ifcopenshell.entity_instance]
+) -> Set[int]:
+    """Collect the ids of the entities reachable from the given roots.
+
+    Used to count the entities a segment owns when it is created or removed.
+    Inline values such as IfcLengthMeasure have no id and are not counted.
+
+    Args:
+        ifc_file: Active IFC file
+        roots: Entities to traverse (None entries are skipped)
+
+    Returns:
+        Set of entity ids
+    """
+    ids = set()
+    for root in roots:
+        if root is None:
+            continue
+        for entity in ifc_file.traverse(root):
+            if entity.id():
+                ids.add(entity.id())
+    return ids
+
+
+def remove_segment_entities(
+    ifc_file: ifcopenshell.file,
+    segment: Optional[ifcopenshell.entity_instance] = None,
+    curve_geometry: Optional[ifcopenshell.entity_instance] = None
+) -> int:
+    """Remove an alignment segment and/or its IfcCurveSegment geometry.
+
+    Args:
+        ifc_file: Active IFC file
+        segment: IfcAlignmentSegment to remove with its design parameters
+        curve_geometry: IfcCurveSegment to remove with its nested geometry
+
+    Returns:
+        Number of entities removed from the file
+    """
+    ids = collect_entity_ids(ifc_file, (segment, curve_geometry))
+
+    if segment is not None:
+        try:
+            params = segment.DesignParameters
+            ifc_file.remove(segment)
+            if params:
+                start_point = params.StartPoint
+                ifc_file.remove(params)
+                if start_point:
+                    ifc_file.remove(start_point)
+        except RuntimeError:
+            pass  # Already removed
+
+    if curve_geometry is not None:
+        _remove_curve_segment_with_geometry(ifc_file, curve_geometry)
+
+    removed = 0
+    for entity_id in ids:
+        try:
+            ifc_file.by_id(entity_id)
+        except RuntimeError:
+            removed += 1
+    return removed
+
+
+# IfcCompositeCurve subtypes that carry a BaseCurve rather than the
+# horizontal layout itself
+_BASED_CURVE_TYPES = ("IfcGradientCurve", "IfcSegmentedReferenceCurve")
+
+
+def _is_based_curve(curve: ifcopenshell.entity_instance) -> bool:
+    """Check whether a composite curve is a gradient or reference curve."""
+    return any(curve.is_a(curve_type) for curve_type in _BASED_CURVE_TYPES)
+
+
+def find_composite_curve(
+    alignment: ifcopenshell.entity_instance
+) -> Optional[ifcopenshell.entity_instance]:
+    """Find the horizontal IfcCompositeCurve of an alignment.
+
+    IfcGradientCurve and IfcSegmentedReferenceCurve are subtypes of
+    IfcCompositeCurve. Once a vertical profile is attached, the Axis
+    representation may hold only the gradient curve, so such curves are
+    followed through BaseCurve to the horizontal curve instead of being
+    returned.
+
+    Args:
+        alignment: IfcAlignment entity
+
+    Returns:
+        Horizontal IfcCompositeCurve entity, or None if the alignment has none
+    """
+    representation = getattr(alignment, 'Representation', None)
+    if not representation or not representation.is_a("IfcProductDefinitionShape"):
+        return None
+
+    based_curve = None
+    for shape_rep in representation.Representations or []:
+        for item in shape_rep.Items or []:
+            if not item.is_a("IfcCompositeCurve"):
+                continue
+            if not _is_based_curve(item):
+                return item
+            if based_curve is None:
+                based_curve = item
+
+    # A reference curve's BaseCurve is a gradient curve, whose BaseCurve
+    # is the horizontal curve
+    while based_curve is not None and _is_based_curve(based_curve):
+        based_curve = based_curve.BaseCurve
+    if based_curve is not None and based_curve.is_a("IfcCompositeCurve"):
+        return based_curve
+    return None
+
+
+def update_composite_curve(
+    ifc_file: ifcopenshell.file,
+    curve_segments: List[ifcopenshell.entity_instance],
+    alignment: ifcopenshell.entity_instance
+) -> Optional[ifcopenshell.entity_instance]:
+    """Point the alignment's existing IfcCompositeCurve at new segments.
+
+    Unlike build_composite_curve(), the representation, shape and composite
+    curve entities are kept; only the Segments list is replaced. Segments
+    dropped from the list are NOT removed here. With a vertical profile
+    attached, the gradient curve's BaseCurve is updated and its own
+    (vertical) segments are left alone.
+
+    Args:
+        ifc_file: Active IFC file
+        curve_segments: List of IfcCurveSegment entities
+        alignment: IfcAlignment whose representation to update
+
+    Returns:
+        The updated IfcCompositeCurve, or None if the alignment has none
+        (callers then fall back to build_composite_curve())
+    """
+    if not curve_segments:
+        return None
+
+    composite_curve = find_composite_curve(alignment)
+    if composite_curve is None:
+        return None
+
+    composite_curve.Segments = curve_segments
+    logger.debug(f"Updated IfcCompositeCurve with {len(curve_segments)} segments")
+    return composite_curve
+
+
 def build_composite_curve(
     ifc_file: ifcopenshell.file,
     curve_segments: List[ifcopenshell.entity_instance],
@@ -528,6 +824,12 @@ def cleanup_old_geometry(
 __all__ = [
     "create_tangent_segment",
     "create_curve_segment",
+    "update_tangent_segment",
+    "update_curve_segment",
     "build_composite_curve",
+    "update_composite_curve",
+    "find_composite_curve",
+    "collect_entity_ids",
+    "remove_segment_entities",
     "cleanup_old_geometry",
 ]
@@ -0,0 +1,369 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Alignment Spatial Index
+========================
+
+Projects large point sets (survey shots, utility points) onto a compiled
+horizontal alignment to get station, offset and segment.
+
+Segment bounding boxes are registered in a uniform grid. Each query point
+only tests the segments near it: a ring search over the grid finds a first
+candidate distance, then every segment whose box lies within that distance is
+projected exactly. Lines use an orthogonal projection clamped to the segment
+ends; arcs use the polar angle about the arc center, clamped to the arc sweep.
+
+Offsets are positive to the left of the direction of increasing station, the
+same normal (-sin, cos) used to place corridor cross-section vertices.
+
+Distances along the alignment become stations either by adding a constant
+start station or, when a StationingManager is given, through its referents
+so station equations apply.
+
+Example:
+    >>> index = AlignmentSpatialIndex(evaluator)
+    >>> stations, offsets, segments = index.project_points(xy, start_station=10000.0)
+    >>> stations, offsets, segments = index.project_points(xy, stationing=stationing)
+"""
+
+import logging
+import math
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+
+from .evaluator import CompiledHorizontalAlignment
+
+if TYPE_CHECKING:
+    from .stationing import StationingManager
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on grid cells per axis
+MAX_GRID_DIMENSION = 512
+
+TWO_PI = 2.0 * math.pi
+
+
+class AlignmentSpatialIndex:
+    """Uniform-grid index over the segments of a compiled alignment.
+
+    Attributes:
+        evaluator: The CompiledHorizontalAlignment being indexed
+        cell_size: Grid cell edge length
+        origin: (x, y) of the grid's lower-left corner
+        shape: (nx, ny) number of grid cells
+    """
+
+    def __init__(self, evaluator: CompiledHorizontalAlignment):
+        """Build the grid for an evaluator.
+
+        Args:
+            evaluator: Compiled horizontal alignment
+        """
+        self.evaluator = evaluator
+
+        ev = evaluator
+        self._x0 = ev.start_x
+        self._y0 = ev.start_y
+        self._d0 = ev.start_directions
+        self._k = ev.curvatures
+        self._length = ev.lengths
+
+        is_arc = self._k != 0.0
+        safe_k = np.where(is_arc, self._k, 1.0)
+        self._is_arc = is_arc
+        self._safe_k = safe_k
+        self._radius = np.where(is_arc, 1.0 / np.abs(safe_k), 0.0)
+        self._cx = self._x0 - np.sin(self._d0) / safe_k
+        self._cy = self._y0 + np.cos(self._d0) / safe_k
+        self._phi0 = np.arctan2(self._y0 - self._cy, self._x0 - self._cx)
+
+        self._boxes = self._segment_boxes()
+        self._build_grid()
+
+    # ========================================================================
+    # CONSTRUCTION
+    # ========================================================================
+
+    def _segment_boxes(self) -> np.ndarray:
+        """Compute an exact (min_x, min_y, max_x, max_y) box per segment."""
+        count = self.evaluator.segment_count
+        boxes = np.zeros((count, 4))
+        if count == 0:
+            return boxes
+
+        end_x, end_y, _, _ = self.evaluator.evaluate(self.evaluator.end_distances)
+        boxes[:, 0] = np.minimum(self._x0, end_x)
+        boxes[:, 1] = np.minimum(self._y0, end_y)
+        boxes[:, 2] = np.maximum(self._x0, end_x)
+        boxes[:, 3] = np.maximum(self._y0, end_y)
+
+        # Arcs also reach the circle's axis extremes that lie inside the sweep
+        for i in np.flatnonzero(self._is_arc):
+            sweep = abs(self._k[i]) * self._length[i]
+            sense = 1.0 if self._k[i] > 0.0 else -1.0
+            radius = self._radius[i]
+            for quarter in range(4):
+                angle = quarter * math.pi / 2.0
+                if ((angle - self._phi0[i]) * sense) % TWO_PI <= sweep:
+                    px = self._cx[i] + radius * math.cos(angle)
+                    py = self._cy[i] + radius * math.sin(angle)
+                    boxes[i, 0] = min(boxes[i, 0], px)
+                    boxes[i, 1] = min(boxes[i, 1], py)
+                    boxes[i, 2] = max(boxes[i, 2], px)
+                    boxes[i, 3] = max(boxes[i, 3], py)
+
+        return boxes
+
+    def _build_grid(self) -> None:
+        """Register every segment in the grid cells its box overlaps."""
+        boxes = self._boxes
+        if len(boxes) == 0:
+            self.origin = (0.0, 0.0)
+            self.cell_size = 1.0
+            self.shape = (1, 1)
+            self._cell_start = np.zeros(2, dtype=int)
+            self._cell_segments = np.zeros(0, dtype=int)
+            return
+
+        min_x, min_y = boxes[:, 0].min(), boxes[:, 1].min()
+        max_x, max_y = boxes[:, 2].max(), boxes[:, 3].max()
+        extent = max(max_x - min_x, max_y - min_y, 1e-9)
+
+        # Cells about the size of a typical segment keep candidate lists short
+        sizes = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+        cell = max(float(np.median(sizes)), extent / MAX_GRID_DIMENSION, 1e-9)
+
+        nx = min(int((max_x - min_x) / cell) + 1, MAX_GRID_DIMENSION)
+        ny = min(int((max_y - min_y) / cell) + 1, MAX_GRID_DIMENSION)
+        self.origin = (float(min_x), float(min_y))
+        self.cell_size = cell
+        self.shape = (nx, ny)
+
+        lo_x, lo_y = self._cell_coords(boxes[:, 0], boxes[:, 1])
+        hi_x, hi_y = self._cell_coords(boxes[:, 2], boxes[:, 3])
+
+        cell_ids: List[np.ndarray] = []
+        segment_ids: List[np.ndarray] = []
+        for i in range(len(boxes)):
+            gx, gy = np.meshgrid(
+                np.arange(lo_x[i], hi_x[i] + 1), np.arange(lo_y[i], hi_y[i] + 1)
+            )
+            ids = (gx * ny + gy).ravel()
+            cell_ids.append(ids)
+            segment_ids.append(np.full(ids.size, i, dtype=int))
+
+        cell_ids_arr = np.concatenate(cell_ids)
+        segment_ids_arr = np.concatenate(segment_ids)
+        order = np.argsort(cell_ids_arr, kind='stable')
+
+        # CSR layout: segments of cell c are _cell_segments[start[c]:start[c+1]]
+        self._cell_segments = segment_ids_arr[order]
+        counts = np.bincount(cell_ids_arr, minlength=nx * ny)
+        self._cell_start = np.concatenate(([0], np.cumsum(counts)))
+
+        logger.debug(
+            "Spatial index: %d segments in %dx%d grid (cell %.3f)",
+            len(boxes), nx, ny, cell
+        )
+
+    def _cell_coords(self, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        """Grid cell coordinates of points, clipped to the grid."""
+        nx, ny = self.shape
+        gx = np.floor((np.asarray(x) - self.origin[0]) / self.cell_size).astype(int)
+        gy = np.floor((np.asarray(y) - self.origin[1]) / self.cell_size).astype(int)
+        return np.clip(gx, 0, nx - 1), np.clip(gy, 0, ny - 1)
+
+    def _segments_in_cells(self, gx0: int, gy0: int, gx1: int, gy1: int) -> np.ndarray:
+        """Unique segment indices registered in a block of cells."""
+        nx, ny = self.shape
+        gx0, gy0 = max(gx0, 0), max(gy0, 0)
+        gx1, gy1 = min(gx1, nx - 1), min(gy1, ny - 1)
+
+        chunks = []
+        for gx in range(gx0, gx1 + 1):
+            first = self._cell_start[gx * ny + gy0]
+            last = self._cell_start[gx * ny + gy1 + 1]
+            if last > first:
+                chunks.append(self._cell_segments[first:last])
+
+        if not chunks:
+            return np.zeros(0, dtype=int)
+        return np.unique(np.concatenate(chunks))
+
+    # ========================================================================
+    # PROJECTION
+    # ========================================================================
+
+    def _project_pairs(
+        self,
+        px: np.ndarray,
+        py: np.ndarray,
+        segments: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project each point onto each candidate segment.
+
+        Args:
+            px: Point X coordinates, shape (m, 1)
+            py: Point Y coordinates, shape (m, 1)
+            segments: Candidate segment indices, shape (c,)
+
+        Returns:
+            Tuple of (distance, local_distance, signed_offset), each (m, c)
+        """
+        x0 = self._x0[segments]
+        y0 = self._y0[segments]
+        d0 = self._d0[segments]
+        k = self._k[segments]
+        length = self._length[segments]
+        is_arc = self._is_arc[segments]
+
+        # Lines: orthogonal projection onto the tangent, clamped to the ends
+        t_line = (px - x0) * np.cos(d0) + (py - y0) * np.sin(d0)
+
+        # Arcs: polar angle measured from the start point in the turn direction
+        radius = self._radius[segments]
+        sense = np.sign(k)
+        phi = np.arctan2(py - self._cy[segments], px - self._cx[segments])
+        t_arc = ((phi - self._phi0[segments]) * sense) % TWO_PI * radius
+        past_end = t_arc - length
+        before_start = TWO_PI * radius - t_arc
+        t_arc = np.where(
+            t_arc <= length, t_arc, np.where(past_end < before_start, length, 0.0)
+        )
+
+        t = np.clip(np.where(is_arc, t_arc, t_line), 0.0, length)
+
+        bearing = d0 + k * t
+        safe_k = self._safe_k[segments]
+        qx = np.where(
+            is_arc, x0 + (np.sin(bearing) - np.sin(d0)) / safe_k, x0 + t * np.cos(d0)
+        )
+        qy = np.where(
+            is_arc, y0 - (np.cos(bearing) - np.cos(d0)) / safe_k, y0 + t * np.sin(d0)
+        )
+
+        dx = px - qx
+        dy = py - qy
+        distance = np.hypot(dx, dy)
+        side = np.cos(bearing) * dy - np.sin(bearing) * dx
+        offset = np.where(side < 0.0, -distance, distance)
+        return distance, t, offset
+
+    def project_points(
+        self,
+        xy,
+        start_station: float = 0.0,
+        max_offset: Optional[float] = None,
+        stationing: Optional["StationingManager"] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project points onto the closest point of the alignment.
+
+        Args:
+            xy: Array-like of shape (N, 2) with point coordinates
+            start_station: Station at distance 0 of the alignment
+            max_offset: Optional maximum distance from the alignment; points
+                farther away get NaN station/offset and segment index -1
+            stationing: Optional StationingManager; distances along are then
+                converted with its referents (station equations included)
+                and start_station is ignored
+
+        Returns:
+            Tuple of (stations, offsets, segment_indices). Segment indices
+            refer to the evaluator's source segment list.
+        """
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        count = len(xy)
+        distances = np.full(count, np.nan)
+        offsets = np.full(count, np.nan)
+        indices = np.full(count, -1, dtype=int)
+
+        if count == 0 or self.evaluator.segment_count == 0:
+            return distances, offsets, indices
+
+        nx, ny = self.shape
+        gx, gy = self._cell_coords(xy[:, 0], xy[:, 1])
+        groups, inverse = np.unique(gx * ny + gy, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(inverse))))
+
+        max_rings = max(nx, ny)
+        if max_offset is not None:
+            max_rings = min(max_rings, int(math.ceil(max_offset / self.cell_size)) + 1)
+
+        for g, cell_id in enumerate(groups):
+            members = order[bounds[g]:bounds[g + 1]]
+            cgx, cgy = divmod(int(cell_id), ny)
+            px = xy[members, 0][:, None]
+            py = xy[members, 1][:, None]
+
+            # Phase 1: nearest non-empty ring gives an upper bound on distance
+            candidates = np.zeros(0, dtype=int)
+            for ring in range(max_rings + 1):
+                candidates = self._segments_in_cells(
+                    cgx - ring, cgy - ring, cgx + ring, cgy + ring
+                )
+                if candidates.size:
+                    break
+            if candidates.size == 0:
+                continue
+
+            distance, local, offset = self._project_pairs(px, py, candidates)
+            reach = float(distance.min(axis=1).max())
+            if max_offset is not None:
+                reach = min(reach, max_offset)
+
+            # Phase 2: every segment whose box lies within reach of the group,
+            # unless the ring block already covered that area
+            lo_x, lo_y = self._cell_coords(px.min() - reach, py.min() - reach)
+            hi_x, hi_y = self._cell_coords(px.max() + reach, py.max() + reach)
+            if (lo_x < cgx - ring or lo_y < cgy - ring
+                    or hi_x > cgx + ring or hi_y > cgy + ring):
+                candidates = self._segments_in_cells(lo_x, lo_y, hi_x, hi_y)
+                distance, local, offset = self._project_pairs(px, py, candidates)
+
+            best = np.argmin(distance, axis=1)
+            rows = np.arange(len(members))
+            best_distance = distance[rows, best]
+            hit = np.ones(len(members), dtype=bool)
+            if max_offset is not None:
+                hit = best_distance <= max_offset
+
+            segments = candidates[best]
+            hit_members = members[hit]
+            distances[hit_members] = (
+                self.evaluator.start_distances[segments[hit]]
+                + local[rows, best][hit]
+            )
+            offsets[hit_members] = offset[rows, best][hit]
+            indices[hit_members] = self.evaluator.source_indices[segments[hit]]
+
+        if stationing is None:
+            return distances + start_station, offsets, indices
+
+        stations = np.full(count, np.nan)
+        found = indices >= 0
+        stations[found] = stationing.stations_from_distances(distances[found])
+        return stations, offsets, indices
+
+
+__all__ = ["AlignmentSpatialIndex"]
@@ -29,11 +29,18 @@ IFC Implementation:
 - IfcReferent entities with PredefinedType="STATION"
 - Pset_Stationing property set for station values
 - IfcLinearPlacement for positioning along alignment
+
+Station/distance lookups use an array-backed copy of the referent list
+(rebuilt whenever the referents change), giving O(log n) scalar queries and
+vectorized bulk conversion.
 """
 
+import bisect
 import logging
 from typing import List, Optional
 
+import numpy as np
+
 import ifcopenshell
 import ifcopenshell.guid
 
@@ -70,6 +77,7 @@ class StationingManager:
         self.ifc = ifc_file
         self.alignment = alignment
         self.referents: List[dict] = []
+        self._table = None
 
     def set_starting_station(self, station_value: float) -> None:
         """Set the starting station of the alignment.
@@ -162,11 +170,46 @@ class StationingManager:
         removed = len(self.referents) < initial_count
 
         if removed:
+            self._table = None
             self._update_referent_entities()
             logger.info(f"Removed station equation at {distance_along:.2f}m")
 
         return removed
 
+    # ========================================================================
+    # STATION / DISTANCE CONVERSION
+    # ========================================================================
+
+    def _get_table(self) -> dict:
+        """Get the array-backed referent table, building it if needed.
+
+        Station region i starts at referent i and runs (in station terms) up
+        to the incoming station of referent i+1; the last region is open.
+        """
+        if self._table is not None:
+            return self._table
+
+        distances = np.array([r['distance_along'] for r in self.referents], dtype=float)
+        stations = np.array([r['station'] for r in self.referents], dtype=float)
+        region_ends = np.full(len(self.referents), np.inf)
+        for i, ref in enumerate(self.referents[1:]):
+            incoming = ref['incoming_station']
+            region_ends[i] = ref['station'] if incoming is None else incoming
+
+        # Regions are disjoint and increasing unless an equation steps back
+        monotonic = bool(np.all(stations[1:] >= region_ends[:-1]))
+
+        self._table = {
+            'distances': distances,
+            'stations': stations,
+            'region_ends': region_ends,
+            'monotonic': monotonic,
+            'distance_list': distances.tolist(),
+            'station_list': stations.tolist(),
+            'region_end_list': region_ends.tolist(),
+        }
+        return self._table
+
     def get_station_at_distance(self, distance_along: float) -> float:
         """Calculate station value at a given distance along alignment.
 
@@ -181,27 +224,19 @@ class StationingManager:
         if not self.referents:
             return distance_along
 
-        # Find applicable referent (last one at or before this distance)
-        applicable_referent = None
-        for ref in reversed(self.referents):
-            if ref['distance_along'] <= distance_along:
-                applicable_referent = ref
-                break
-
-        if not applicable_referent:
-            # Before first referent, extrapolate backwards
-            first_ref = self.referents[0]
-            delta = distance_along - first_ref['distance_along']
-            return first_ref['station'] + delta
+        table = self._get_table()
 
-        # Calculate station from applicable referent
-        delta = distance_along - applicable_referent['distance_along']
-        return applicable_referent['station'] + delta
+        # Last referent at or before this distance; before the first referent
+        # extrapolate backwards from it
+        i = max(bisect.bisect_right(table['distance_list'], distance_along) - 1, 0)
+        return table['station_list'][i] + (distance_along - table['distance_list'][i])
 
     def get_distance_at_station(self, station_value: float) -> Optional[float]:
         """Calculate distance along alignment at a given station value.
 
         Inverse of get_station_at_distance. Accounts for station equations.
+        Where a backward equation makes a station occur twice, the first
+        occurrence is returned.
 
         Args:
             station_value: Station value to find
@@ -212,31 +247,126 @@ class StationingManager:
         if not self.referents:
             return station_value
 
-        # Find which segment this station falls in
-        for i, current_ref in enumerate(self.referents):
-            if i == len(self.referents) - 1:
-                # Last referent - extrapolate forward
-                if station_value >= current_ref['station']:
-                    delta = station_value - current_ref['station']
-                    return current_ref['distance_along'] + delta
-            else:
-                next_ref = self.referents[i + 1]
-                next_station = next_ref.get('incoming_station', next_ref['station'])
-
-                if current_ref['station'] <= station_value < next_station:
-                    delta = station_value - current_ref['station']
-                    return current_ref['distance_along'] + delta
-
-        # Station before first referent
-        first_ref = self.referents[0]
-        if station_value < first_ref['station']:
-            delta = station_value - first_ref['station']
-            return first_ref['distance_along'] + delta
+        table = self._get_table()
+        if not table['monotonic']:
+            distance = self.distances_from_stations(np.array([station_value]))[0]
+            return None if np.isnan(distance) else float(distance)
 
+        stations = table['station_list']
+        i = max(bisect.bisect_right(stations, station_value) - 1, 0)
+        if stations[i] <= station_value < table['region_end_list'][i] or station_value < stations[0]:
+            return table['distance_list'][i] + (station_value - stations[i])
         return None
 
-    def load_from_ifc(self) -> None:
-        """Load stationing referents from existing IFC alignment."""
+    def stations_from_distances(self, distances) -> np.ndarray:
+        """Convert many distances along the alignment to station values.
+
+        Args:
+            distances: Array-like of distances along alignment (meters)
+
+        Returns:
+            Array of station values
+        """
+        distances = np.asarray(distances, dtype=float)
+        if not self.referents:
+            return distances.copy()
+
+        table = self._get_table()
+        i = np.searchsorted(table['distances'], distances, side='right') - 1
+        i = np.maximum(i, 0)
+        return table['stations'][i] + (distances - table['distances'][i])
+
+    def distances_from_stations(self, stations) -> np.ndarray:
+        """Convert many station values to distances along the alignment.
+
+        Args:
+            stations: Array-like of station values
+
+        Returns:
+            Array of distances (meters); NaN where a station falls in the gap
+            of a forward station equation
+        """
+        stations = np.asarray(stations, dtype=float)
+        if not self.referents:
+            return stations.copy()
+
+        table = self._get_table()
+        starts = table['stations']
+        ends = table['region_ends']
+
+        if table['monotonic']:
+            i = np.maximum(np.searchsorted(starts, stations, side='right') - 1, 0)
+            found = (stations >= starts[i]) & (stations < ends[i])
+        else:
+            # Overlapping regions: the lowest region containing the station wins
+            i = np.zeros(stations.shape, dtype=int)
+            found = np.zeros(stations.shape, dtype=bool)
+            for region in range(len(starts) - 1, -1, -1):
+                inside = (stations >= starts[region]) & (stations < ends[region])
+                i[inside] = region
+                found |= inside
+
+        # Stations before the first referent extrapolate backwards
+        before = (stations < starts[0]) & ~found
+        i[before] = 0
+        found |= before
+
+        result = table['distances'][i] + (stations - starts[i])
+        return np.where(found, result, np.nan)
+
+    def round_stations(self, interval: float, total_length: float):
+        """List every whole-interval station value along the alignment.
+
+        Each station region (between equations) is walked separately, so
+        station values are neither skipped nor doubled across equations.
+
+        Args:
+            interval: Station interval (e.g. 20.0 for every 20m)
+            total_length: Total alignment length (meters)
+
+        Returns:
+            Tuple of (stations, distances) arrays sorted by distance
+        """
+        if interval <= 0 or total_length < 0:
+            return np.zeros(0), np.zeros(0)
+
+        if not self.referents:
+            stations = np.arange(np.floor(total_length / interval + 1e-9) + 1) * interval
+            return stations, stations.copy()
+
+        table = self._get_table()
+        region_starts = np.maximum(table['distances'], 0.0)
+        region_stops = np.append(table['distances'][1:], total_length)
+
+        all_stations, all_distances = [], []
+        last = len(region_starts) - 1
+        for i, (start, stop) in enumerate(zip(region_starts, region_stops)):
+            stop = min(stop, total_length)
+            if stop < start:
+                continue
+
+            offset = table['stations'][i] - table['distances'][i]
+            first = np.ceil((start + offset) / interval - 1e-9)
+            final = np.floor((stop + offset) / interval + 1e-9)
+            stations = np.arange(first, final + 1) * interval
+            distances = stations - offset
+
+            # Region ends belong to the next region except at the alignment end
+            keep = distances < stop - 1e-9 if i < last else distances <= stop + 1e-9
+            all_stations.append(stations[keep])
+            all_distances.append(distances[keep])
+
+        if not all_stations:
+            return np.zeros(0), np.zeros(0)
+        return np.concatenate(all_stations), np.concatenate(all_distances)
+
+    def load_from_ifc(self, create_default: bool = True) -> None:
+        """Load stationing referents from existing IFC alignment.
+
+        Args:
+            create_default: Create a 10+000 starting referent when the
+                alignment has none. Pass False for read-only use.
+        """
         if not self.alignment:
             return
 
@@ -254,7 +384,7 @@ class StationingManager:
             logger.info(
                 f"Loaded {len(self.referents)} stationing referents from IFC"
             )
-        else:
+        elif create_default:
             logger.debug("No stationing referents found, setting default 10+000")
             self.set_starting_station(10000.0)
 
@@ -288,6 +418,7 @@ class StationingManager:
     def _sort_referents(self) -> None:
         """Sort referents by distance_along (required by IFC spec)."""
         self.referents.sort(key=lambda r: r['distance_along'])
+        self._table = None
 
     def _update_referent_entities(self) -> None:
         """Create/update IFC IfcReferent entities with Pset_Stationing."""
@@ -0,0 +1,364 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+LandXML TIN Surface Reader
+==========================
+
+Streams LandXML ``Surface/Definition`` TIN surfaces into compact NumPy
+arrays.
+
+The file is read twice, both times as a stream:
+
+1. A byte scan counts the ``</P>`` and ``</F>`` closing tags (with or
+   without a namespace prefix such as ``</lx:P>``) of the requested
+   surface so the point, id and face arrays can be allocated once at full
+   size. Should the scan come up short, the arrays grow as needed.
+2. ``xml.etree.ElementTree.iterparse`` walks the document. Every ``P``
+   and ``F`` container is cleared as soon as an element ends, in the
+   requested surface and in the ones skipped before it, so no element
+   tree is built; the text of the requested surface's elements is kept
+   and converted in bulk into the arrays every PARSE_BATCH_SIZE elements.
+
+Peak memory is therefore proportional to the output arrays, not to the
+XML or to the other surfaces in the file. LandXML points are "northing easting elevation"; they are returned
+as (x, y, z) = (easting, northing, elevation). Faces flagged invisible
+(``i="1"``) are skipped.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> surface = read_landxml_surface("survey.xml", surface_name="EG")
+    >>> surface.points.shape, surface.faces.shape
+    ((1250000, 3), (2499000, 3))
+    >>> z = surface.to_terrain_index().elevations_at(xy)
+"""
+
+import html
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Bytes read at a time when counting elements
+SCAN_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Elements whose text is converted to numbers in one go
+PARSE_BATCH_SIZE = 65536
+
+# Closing P and F tags, with an optional namespace prefix
+_CLOSING_TAG = re.compile(rb"</(?:[A-Za-z_][\w.-]*:)?([PF])\s*>")
+
+# Opening and closing Surface tags (not Surfaces), with the opening attributes
+_SURFACE_TAG = re.compile(rb"<(/?)(?:[A-Za-z_][\w.-]*:)?Surface(?=[\s/>])([^>]*)>")
+
+# The name attribute of an opening Surface tag
+_NAME_ATTRIBUTE = re.compile(rb"""\bname\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+@dataclass
+class TinSurface:
+    """
+    Triangulated surface read from LandXML.
+
+    Attributes:
+        name: Surface name
+        points: (N, 3) float64 (x, y, z) coordinates
+        faces: (F, 3) int64 indices into points
+        point_ids: (N,) LandXML point ids
+    """
+    name: str
+    points: np.ndarray
+    faces: np.ndarray
+    point_ids: np.ndarray
+
+    def to_terrain_index(self) -> Any:
+        """
+        Build (or fetch from cache) the elevation index of this surface.
+
+        Returns:
+            TerrainIndex over the surface triangles
+        """
+        from .terrain_index import get_terrain_index
+        return get_terrain_index(self.points, self.faces)
+
+
+def count_tin_elements(path: str, surface_name: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Count the point and face elements of one surface without parsing the file.
+
+    Scanning stops at the end of the surface.
+
+    Args:
+        path: Path to the LandXML file
+        surface_name: Surface to count; the first surface if None
+
+    Returns:
+        Tuple of (point count, face count); (0, 0) if the surface is not
+        in the file
+    """
+    points = faces = 0
+    inside = done = False
+    tail = b""
+
+    def count(data, start, end):
+        nonlocal points, faces
+        tags = _CLOSING_TAG.findall(data, start, end)
+        points += tags.count(b"P")
+        faces += tags.count(b"F")
+
+    with open(path, "rb") as f:
+        while not done:
+            chunk = f.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+            data = tail + chunk
+            # Hold back an unfinished tag for the next chunk
+            cut = data.rfind(b"<")
+            if cut >= 0 and data.find(b">", cut) < 0:
+                data, tail = data[:cut], data[cut:]
+            else:
+                tail = b""
+
+            position = 0
+            for match in _SURFACE_TAG.finditer(data):
+                if inside:
+                    count(data, position, match.start())
+                if match.group(1):
+                    if inside:
+                        inside, done = False, True
+                        break
+                elif match.group(2).rstrip().endswith(b"/"):
+                    pass  # <Surface/> has no elements
+                elif surface_name is None or _surface_name(match.group(2)) == surface_name:
+                    inside = True
+                position = match.end()
+            if inside:
+                count(data, position, len(data))
+    return points, faces
+
+
+def _surface_name(attributes: bytes) -> str:
+    """Get the name attribute of an opening Surface tag."""
+    match = _NAME_ATTRIBUTE.search(attributes)
+    if match is None:
+        return ""
+    value = match.group(1) if match.group(1) is not None else match.group(2)
+    return html.unescape(value.decode("utf-8", errors="replace"))
+
+
+def read_landxml_surface(
+    path: str,
+    surface_name: Optional[str] = None,
+    georeferencing: Optional[Any] = None
+) -> TinSurface:
+    """
+    Read one TIN surface from a LandXML file.
+
+    Args:
+        path: Path to the LandXML file
+        surface_name: Name of the surface to read; the first surface in
+            the file if None
+        georeferencing: Optional object with map_to_local_points()
+            (e.g. NativeIfcGeoreferencing) to convert map coordinates to
+            local coordinates
+
+    Returns:
+        TinSurface with compact point and face arrays
+
+    Raises:
+        ValueError: If the surface is not found, a point or face element
+            is empty, or a face references a point that does not exist
+    """
+    max_points, max_faces = count_tin_elements(path, surface_name)
+    points = np.empty((max_points, 3), dtype=np.float64)
+    point_ids = np.empty(max_points, dtype=np.int64)
+    faces = np.empty((max_faces, 3), dtype=np.int64)
+    n_points = 0
+    n_faces = 0
+    # Element text is collected in small batches and converted in bulk
+    point_text, id_text, face_text = [], [], []
+
+    def flush_points():
+        nonlocal n_points, points, point_ids
+        if not point_text:
+            return
+        values = _parse_batch(point_text, np.float64, 3, path)
+        count = len(values)
+        if n_points + count > len(points):
+            points = _grow(points, n_points + count)
+            point_ids = _grow(point_ids, n_points + count)
+        # LandXML order is northing, easting, elevation
+        points[n_points:n_points + count] = values[:, (1, 0, 2)]
+        ids = _parse_batch(id_text, np.int64, 1, path)
+        point_ids[n_points:n_points + count] = ids[:, 0]
+        n_points += count
+        point_text.clear()
+        id_text.clear()
+
+    def flush_faces():
+        nonlocal n_faces, faces
+        if not face_text:
+            return
+        values = _parse_batch(face_text, np.int64, 3, path)
+        if n_faces + len(values) > len(faces):
+            faces = _grow(faces, n_faces + len(values))
+        faces[n_faces:n_faces + len(values)] = values
+        n_faces += len(values)
+        face_text.clear()
+
+    name = None
+    in_surface = False
+    container = None
+    root = None
+    depth = 0
+    tags = {}
+
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+                namespace = elem.tag[:elem.tag.index('}') + 1] if '}' in elem.tag else ""
+                tags = {t: namespace + t for t in ("P", "F", "Surface", "Pnts", "Faces")}
+            depth += 1
+            if elem.tag == tags["Surface"] and name is None:
+                surface = elem.get("name", "")
+                if surface_name is None or surface == surface_name:
+                    name = surface
+                    in_surface = True
+            elif elem.tag == tags["Pnts"] or elem.tag == tags["Faces"]:
+                container = elem
+            continue
+
+        depth -= 1
+        tag = elem.tag
+        if tag == tags["P"] or tag == tags["F"]:
+            if in_surface and tag == tags["P"]:
+                point_text.append(_element_text(elem, "P", name, path))
+                id_text.append(elem.get("id") or str(n_points + len(id_text) + 1))
+                if len(point_text) >= PARSE_BATCH_SIZE:
+                    flush_points()
+            elif in_surface and elem.get("i") != "1":
+                # i="1" marks an invisible face (a hole in the surface)
+                face_text.append(_element_text(elem, "F", name, path))
+                if len(face_text) >= PARSE_BATCH_SIZE:
+                    flush_faces()
+            # Skipped surfaces are cleared as they stream past too
+            if container is not None:
+                container.clear()
+        elif tag == tags["Pnts"] or tag == tags["Faces"]:
+            container = None
+        elif tag == tags["Surface"]:
+            if in_surface:
+                break
+            # Drop what is left of a skipped surface (source data, ...)
+            elem.clear()
+        elif depth == 1:
+            # Drop finished top-level sections (Units, Alignments, ...)
+            root.clear()
+
+    flush_points()
+    flush_faces()
+
+    if name is None:
+        raise ValueError(
+            f"{path}: surface '{surface_name}' not found" if surface_name
+            else f"{path}: no surface found"
+        )
+
+    points, point_ids, faces = _compact(points, point_ids, faces, n_points, n_faces)
+    faces = _ids_to_indices(point_ids, faces, path)
+
+    if georeferencing is not None and len(points):
+        points = georeferencing.map_to_local_points(points)
+
+    logger.info(
+        "Read LandXML surface '%s': %d points, %d faces", name, len(points), len(faces)
+    )
+    return TinSurface(name=name, points=points, faces=faces, point_ids=point_ids)
+
+
+def _element_text(elem: ET.Element, label: str, surface: str, path: str) -> str:
+    """Get the text of a P or F element, rejecting empty elements."""
+    text = elem.text
+    if text is None or not text.strip():
+        element_id = elem.get("id")
+        where = f" with id {element_id}" if element_id else ""
+        raise ValueError(f"{path}: empty {label} element{where} in surface '{surface}'")
+    return text
+
+
+def _parse_batch(texts, dtype, width: int, path: str) -> np.ndarray:
+    """Convert a batch of element texts to a (len(texts), width) array."""
+    values = np.fromstring(" ".join(texts), dtype=dtype, sep=" ")
+    if len(values) != len(texts) * width:
+        raise ValueError(f"{path}: expected {width} values per element")
+    return values.reshape(-1, width)
+
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """Copy an array into a larger one holding at least ``size`` rows."""
+    grown = np.empty((max(size, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+def _compact(points, point_ids, faces, n_points, n_faces):
+    """Trim the preallocated arrays, copying only if they were oversized."""
+    if n_points < len(points):
+        points = points[:n_points].copy()
+        point_ids = point_ids[:n_points].copy()
+    if n_faces < len(faces):
+        faces = faces[:n_faces].copy()
+    return points, point_ids, faces
+
+
+def _ids_to_indices(point_ids: np.ndarray, faces: np.ndarray, path: str) -> np.ndarray:
+    """Convert face point ids to row indices into the point array."""
+    if len(point_ids) and np.array_equal(point_ids, np.arange(1, len(point_ids) + 1)):
+        # Ids numbered 1..N in file order (the usual case)
+        indices = faces - 1
+        valid = (indices >= 0) & (indices < len(point_ids))
+    else:
+        order = np.argsort(point_ids, kind="stable")
+        sorted_ids = point_ids[order]
+        positions = np.searchsorted(sorted_ids, faces)
+        positions = np.minimum(positions, max(len(sorted_ids) - 1, 0))
+        valid = sorted_ids[positions] == faces if len(sorted_ids) else np.zeros_like(faces, bool)
+        indices = order[positions] if len(sorted_ids) else faces
+
+    if not valid.all():
+        raise ValueError(f"{path}: faces reference undefined points")
+    return indices
+
+
+__all__ = [
+    "TinSurface",
+    "read_landxml_surface",
+    "count_tin_elements",
+]
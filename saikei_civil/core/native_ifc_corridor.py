@@ -61,9 +61,13 @@ Usage Example:
 
 import ifcopenshell
 import ifcopenshell.guid
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Sequence
 from dataclasses import dataclass
+import hashlib
 import math
+
+import numpy as np
+
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -185,20 +189,200 @@ def create_tagged_cross_section_profile(
     return profile
 
 
+# Coordinates are rounded to this many decimals (m) when comparing profiles
+PROFILE_KEY_DECIMALS = 6
+
+
+class ProfileCache:
+    """
+    Reuses identical tagged profiles within one corridor export.
+
+    Profiles are keyed by a hash of their rounded point list and tags, so a
+    corridor whose cross-section is constant over long stretches references
+    one IfcArbitraryClosedProfileDef (with its point list and curve) from
+    every station in the stretch instead of creating one per station.
+    A reused profile keeps the name of the station that first created it.
+
+    Attributes:
+        ifc_file: IFC file profiles are created in
+        decimals: Rounding applied to coordinates before hashing
+        request_count: Number of profiles requested so far
+    """
+
+    def __init__(self, ifc_file: Any, decimals: int = PROFILE_KEY_DECIMALS):
+        self.ifc_file = ifc_file
+        self.decimals = decimals
+        self.request_count = 0
+        self._profiles: Dict[bytes, Any] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct profiles created."""
+        return len(self._profiles)
+
+    def key(self, points: List[Tuple[float, float]], tags: List[str]) -> bytes:
+        """
+        Hash a profile's geometry and tags.
+
+        Args:
+            points: (offset, elevation) points
+            tags: Point tags
+
+        Returns:
+            Digest identifying the profile
+        """
+        # Adding 0.0 folds -0.0 into 0.0 so both hash the same
+        coords = np.round(np.asarray(points, dtype=np.float64), self.decimals) + 0.0
+        digest = hashlib.sha1(coords.tobytes())
+        digest.update("\x1f".join(tags).encode("utf-8"))
+        return digest.digest()
+
+    def get_or_create(
+        self,
+        points: List[Tuple[float, float]],
+        tags: List[str],
+        station: float,
+        profile_name: Optional[str] = None
+    ) -> Any:
+        """
+        Get the profile for these points and tags, creating it if new.
+
+        Args:
+            points: (offset, elevation) points
+            tags: Point tags (same length as points)
+            station: Station value for naming a new profile
+            profile_name: Optional name for a new profile
+
+        Returns:
+            IfcArbitraryClosedProfileDef entity
+        """
+        self.request_count += 1
+        key = self.key(points, tags)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = create_tagged_cross_section_profile(
+                ifc_file=self.ifc_file,
+                points=points,
+                tags=tags,
+                station=station,
+                profile_name=profile_name
+            )
+            self._profiles[key] = profile
+        return profile
+
+
+def assembly_point_tags(compiled: Any) -> List[str]:
+    """
+    Point tags for the closed profiles of a compiled assembly.
+
+    Top edge points are tagged by the component whose outer edge they are
+    (``L_LANE_OUT``, ``R_SHOULDER_OUT``, ...), numbered from the centerline
+    outward when a side has several components of one type; the centerline
+    point is ``CL``. Bottom edge points repeat the top tag with ``_BTM``.
+
+    Args:
+        compiled: CompiledAssembly the profiles were evaluated from
+
+    Returns:
+        One tag per profile point, in CompiledAssembly.sections() order
+    """
+    if not compiled.names:
+        top = [PointTags.EDGE_PAVEMENT_LEFT, PointTags.EDGE_PAVEMENT_RIGHT]
+    else:
+        tag_counter = {}
+
+        def get_tag(k: int, side: str) -> str:
+            key = f"{side}_{compiled.component_types[k]}_OUT"
+            tag_counter[key] = tag_counter.get(key, 0) + 1
+            count = tag_counter[key]
+            return key if count == 1 else f"{key}_{count}"
+
+        left = [get_tag(k, "L") for k in compiled.left]
+        right = [get_tag(k, "R") for k in compiled.right]
+        top = left[::-1] + [PointTags.CENTERLINE] + right
+
+    return top + [f"{tag}_BTM" for tag in reversed(top)]
+
+
+def create_profiles_from_assembly(
+    ifc_file: Any,
+    assembly: Any,
+    stations: Sequence[float],
+    pavement_thickness: float = None,
+    profile_cache: Optional[ProfileCache] = None
+) -> List[Any]:
+    """
+    Create closed, tagged cross-section profiles for many stations.
+
+    Profile points come from ``AssemblyWrapper.profiles_at``, the same
+    arrays the corridor mesh is built from, so constraints are applied in
+    one pass and the IFC sections match the Blender mesh. Points that
+    coincide with the previous point (zero-width components) are dropped,
+    as the mesh builder merges them.
+
+    Args:
+        ifc_file: IFC file object
+        assembly: AssemblyWrapper instance (may include constraint_manager)
+        stations: Station values for naming and constraint evaluation
+        pavement_thickness: Total thickness of pavement layers (meters).
+            If None, uses the maximum thickness from assembly components.
+        profile_cache: Optional ProfileCache; identical profiles are
+            created once and shared
+
+    Returns:
+        IfcArbitraryClosedProfileDef entities, one per station
+    """
+    from .corridor import COINCIDENT_TOLERANCE
+
+    stations = np.atleast_1d(np.asarray(stations, dtype=np.float64))
+    compiled = assembly.compile()
+    sections = np.array(assembly.profiles_at(stations), dtype=np.float64)
+
+    if pavement_thickness is not None:
+        half = compiled.point_count // 2
+        sections[:, half:, 1] = sections[:, :half][:, ::-1, 1] - pavement_thickness
+
+    tags = assembly_point_tags(compiled)
+    keep = np.ones(sections.shape[:2], dtype=bool)
+    keep[:, 1:] = np.linalg.norm(np.diff(sections, axis=1), axis=2) > COINCIDENT_TOLERANCE
+
+    profiles = []
+    for station, section, kept in zip(stations.tolist(), sections, keep):
+        points = section[kept].tolist()
+        point_tags = [tags[i] for i in np.flatnonzero(kept)]
+
+        # Close the loop on the first point
+        coord_list = points + [points[0]]
+        all_tags = point_tags + [point_tags[0]]
+        name = f"Corridor Section at Sta {station:.2f}"
+
+        if profile_cache is not None:
+            profile = profile_cache.get_or_create(
+                coord_list, all_tags, station, profile_name=name
+            )
+        else:
+            profile = create_tagged_cross_section_profile(
+                ifc_file=ifc_file,
+                points=coord_list,
+                tags=all_tags,
+                station=station,
+                profile_name=name
+            )
+        profiles.append(profile)
+
+    return profiles
+
+
 def create_profile_from_assembly(
     ifc_file: Any,
     assembly: Any,
     station: float,
-    pavement_thickness: float = None
+    pavement_thickness: float = None,
+    profile_cache: Optional[ProfileCache] = None
 ) -> Any:
     """
     Create a closed, tagged cross-section profile from an assembly wrapper.
 
-    This converts the assembly's component data into a closed polygon suitable
-    for IfcSectionedSolidHorizontal. Points are tagged for proper interpolation.
-
-    IMPORTANT: If the assembly has a constraint_manager, constraints are
-    applied at the given station to modify component widths and slopes.
+    Single-station form of ``create_profiles_from_assembly``.
 
     Args:
         ifc_file: IFC file object
@@ -206,168 +390,187 @@ def create_profile_from_assembly(
         station: Station value for naming and constraint evaluation
         pavement_thickness: Total thickness of pavement layers (meters).
             If None, uses the maximum thickness from assembly components.
+        profile_cache: Optional ProfileCache; an identical earlier profile
+            is returned instead of creating a new one
 
     Returns:
         IfcArbitraryClosedProfileDef entity with tagged points
     """
-    from .corridor import AssemblyWrapper, ComponentData
-
-    # Calculate actual thickness from assembly components if not provided
-    if pavement_thickness is None:
-        if assembly.components:
-            # Use maximum thickness across all components
-            pavement_thickness = max(
-                getattr(c, 'thickness', 0.15) for c in assembly.components
-            )
-        else:
-            pavement_thickness = 0.3  # Default fallback
+    return create_profiles_from_assembly(
+        ifc_file, assembly, [station], pavement_thickness, profile_cache
+    )[0]
 
-    # Check if we have constraints to apply
-    has_constraints = (
-        hasattr(assembly, 'constraint_manager') and
-        assembly.constraint_manager is not None
-    )
 
-    # Build the cross-section polygon from components
-    # Start from left-most component, go to right-most, then bottom back
-    top_points = []
-    top_tags = []
+def find_alignment_directrix(alignment: Any) -> Optional[Any]:
+    """
+    Find the geometric-layer curve of an IfcAlignment.
 
-    # Separate left and right components
-    left_components = []
-    right_components = []
+    The IfcGradientCurve (horizontal plus vertical) is preferred; an
+    alignment without a vertical profile falls back to its horizontal
+    IfcCompositeCurve.
 
-    for comp in assembly.components:
-        if comp.offset < 0:
-            left_components.append(comp)
-        else:
-            right_components.append(comp)
-
-    # Sort: left from most negative to least, right from least to most
-    left_components.sort(key=lambda c: c.offset)
-    right_components.sort(key=lambda c: c.offset)
-
-    # Counter for unique tags per component type
-    tag_counter = {}
-
-    def get_tag(comp_type: str, side: str, position: str) -> str:
-        """Generate unique tag for a point."""
-        key = f"{side}_{comp_type}_{position}"
-        if key not in tag_counter:
-            tag_counter[key] = 0
-        tag_counter[key] += 1
-        count = tag_counter[key]
-        if count == 1:
-            return key
-        return f"{key}_{count}"
-
-    # Track cumulative offsets for proper positioning with constraints
-    left_cumulative = 0.0
-    left_elev = 0.0
-
-    # Build left side points (from left edge toward center)
-    for comp in left_components:
-        # Apply constraints if available
-        if has_constraints:
-            width = assembly.get_component_value(comp.name, "width", station, comp.width)
-            slope = assembly.get_component_value(comp.name, "cross_slope", station, comp.slope)
-        else:
-            width = comp.width
-            slope = comp.slope
-
-        # Outer edge of component
-        outer_x = -(left_cumulative + width)
-        outer_z = left_elev - slope * width
-        top_points.append((outer_x, outer_z))
-        top_tags.append(get_tag(comp.component_type, "L", "OUT"))
-
-        # Inner edge (toward centerline)
-        inner_x = -left_cumulative
-        inner_z = left_elev
-        top_points.append((inner_x, inner_z))
-        top_tags.append(get_tag(comp.component_type, "L", "IN"))
-
-        # Update cumulative
-        left_cumulative += width
-        left_elev = outer_z
-
-    # Add centerline point if no components reach it exactly
-    if not left_components or left_cumulative < 0.001:
-        top_points.append((0.0, 0.0))
-        top_tags.append(PointTags.CENTERLINE)
-    elif right_components and right_components[0].offset > 0.001:
-        top_points.append((0.0, 0.0))
-        top_tags.append(PointTags.CENTERLINE)
-
-    # Track cumulative for right side
-    right_cumulative = 0.0
-    right_elev = 0.0
-
-    # Build right side points (from center outward)
-    for comp in right_components:
-        # Apply constraints if available
-        if has_constraints:
-            width = assembly.get_component_value(comp.name, "width", station, comp.width)
-            slope = assembly.get_component_value(comp.name, "cross_slope", station, comp.slope)
-        else:
-            width = comp.width
-            slope = comp.slope
-
-        # Inner edge (at offset)
-        inner_x = right_cumulative
-        inner_z = right_elev
-        top_points.append((inner_x, inner_z))
-        top_tags.append(get_tag(comp.component_type, "R", "IN"))
-
-        # Outer edge
-        outer_x = right_cumulative + width
-        outer_z = right_elev - slope * width
-        top_points.append((outer_x, outer_z))
-        top_tags.append(get_tag(comp.component_type, "R", "OUT"))
-
-        # Update cumulative
-        right_cumulative += width
-        right_elev = outer_z
-
-    # Remove duplicate points at centerline if needed
-    cleaned_points = []
-    cleaned_tags = []
-    for i, (pt, tag) in enumerate(zip(top_points, top_tags)):
-        if i == 0:
-            cleaned_points.append(pt)
-            cleaned_tags.append(tag)
-        else:
-            # Skip if same as previous point
-            prev = cleaned_points[-1]
-            if abs(pt[0] - prev[0]) > 0.001 or abs(pt[1] - prev[1]) > 0.001:
-                cleaned_points.append(pt)
-                cleaned_tags.append(tag)
-
-    top_points = cleaned_points
-    top_tags = cleaned_tags
-
-    # Now create bottom points by going back right to left with elevation offset
-    bottom_points = []
-    bottom_tags = []
-
-    for pt, tag in zip(reversed(top_points), reversed(top_tags)):
-        bottom_points.append((pt[0], pt[1] - pavement_thickness))
-        bottom_tags.append(f"{tag}_BTM")
-
-    # Combine: top (L→R) + bottom (R→L) to form closed polygon
-    all_points = top_points + bottom_points + [top_points[0]]  # Close loop
-    all_tags = top_tags + bottom_tags + [top_tags[0]]
-
-    # Convert tuples to list format for IFC
-    coord_list = [list(pt) for pt in all_points]
-
-    return create_tagged_cross_section_profile(
-        ifc_file=ifc_file,
-        points=coord_list,
-        tags=all_tags,
-        station=station,
-        profile_name=f"Corridor Section at Sta {station:.2f}"
-    )
+    Args:
+        alignment: IfcAlignment entity
+
+    Returns:
+        IfcGradientCurve or IfcCompositeCurve entity, or None if the
+        alignment has no Axis representation
+    """
+    representation = getattr(alignment, 'Representation', None)
+    if not representation or not representation.is_a("IfcProductDefinitionShape"):
+        return None
+
+    composite_curve = None
+    for shape_rep in representation.Representations or []:
+        for item in shape_rep.Items or []:
+            if item.is_a("IfcGradientCurve"):
+                return item
+            if composite_curve is None and item.is_a("IfcCompositeCurve"):
+                composite_curve = item
+    return composite_curve
+
+
+def select_changed_sections(profiles: List[Any]) -> np.ndarray:
+    """
+    Pick the cross-sections where the profile changes.
+
+    IfcSectionedSolidHorizontal interpolates linearly between neighbouring
+    tagged profiles, so within a run of identical profiles only the first
+    and last sections are needed. The first and last stations are always
+    kept.
+
+    Args:
+        profiles: Profile entity per station (identical profiles must be
+            the same entity, as returned through a ProfileCache)
+
+    Returns:
+        (M,) sorted indices into profiles
+    """
+    ids = np.array([p.id() for p in profiles], dtype=np.int64)
+    if len(ids) <= 2:
+        return np.arange(len(ids))
+
+    changed = ids[1:] != ids[:-1]
+    keep = np.ones(len(ids), dtype=bool)
+    # Interior station i is kept if it differs from either neighbour
+    keep[1:-1] = changed[:-1] | changed[1:]
+    return np.flatnonzero(keep)
+
+
+def create_section_positions(
+    ifc_file: Any,
+    directrix: Any,
+    distances: np.ndarray
+) -> List[Any]:
+    """
+    Create IfcAxis2PlacementLinear positions along a directrix.
+
+    DistanceAlong values are wrapped IfcLengthMeasure values, which are
+    not file entities, so each position costs one
+    IfcPointByDistanceExpression and one IfcAxis2PlacementLinear.
+
+    Args:
+        ifc_file: IFC file to create entities in
+        directrix: Curve the positions are measured along
+        distances: (N,) distances along the directrix (m)
+
+    Returns:
+        List of N IfcAxis2PlacementLinear entities
+    """
+    create = ifc_file.create_entity
+    positions = []
+    for distance in np.asarray(distances, dtype=np.float64).tolist():
+        # OffsetLongitudinal MUST NOT be used (non-manifold geometry)
+        point_by_distance = create(
+            "IfcPointByDistanceExpression",
+            DistanceAlong=create("IfcLengthMeasure", distance),
+            OffsetLateral=0.0,
+            OffsetVertical=0.0,
+            BasisCurve=directrix
+        )
+        positions.append(create(
+            "IfcAxis2PlacementLinear",
+            Location=point_by_distance
+        ))
+    return positions
+
+
+# Largest allowed gap (m) between a curve and the chord joining two
+# neighbouring stations; curved regions are sampled densely enough to stay
+# within it (see chord_spacing())
+DEFAULT_CHORD_TOLERANCE = 0.01
+
+
+def chord_spacing(radius: float, tolerance: float) -> float:
+    """
+    Longest arc whose chord stays within a sagitta tolerance.
+
+    Args:
+        radius: Radius of curvature (m)
+        tolerance: Maximum sagitta (m)
+
+    Returns:
+        Arc length between stations (m); inf for a straight line
+    """
+    if radius <= 0.0 or math.isinf(radius):
+        return math.inf
+    if tolerance >= radius:
+        return math.pi * radius
+    return 2.0 * radius * math.acos(1.0 - tolerance / radius)
+
+
+def parabola_chord_spacing(a: float, tolerance: float) -> float:
+    """
+    Longest station step whose chord stays within tolerance of a parabola.
+
+    A chord of length L across y = a*x^2 deviates from it by |a|*L^2/4.
+
+    Args:
+        a: Quadratic coefficient of the vertical curve (1/m)
+        tolerance: Maximum deviation (m)
+
+    Returns:
+        Station step (m); inf for a straight grade
+    """
+    if a == 0.0:
+        return math.inf
+    return 2.0 * math.sqrt(tolerance / abs(a))
+
+
+# Why a station was planned, highest merge priority first. When candidates
+# fall within the merge tolerance the one with the higher priority is kept.
+STATION_PRIORITY = {
+    "start": 5,
+    "end": 5,
+    "chunk_boundary": 5,
+    "pvi": 4,
+    "curve_start": 4,
+    "curve_end": 4,
+    "pi": 3,
+    "critical": 3,
+    "constraint": 3,
+    "vertical_curve": 2,
+    "curve_interior": 1,
+    "interval": 0,
+}
+
+# Reason codes stored in station arrays (index into this tuple)
+STATION_REASONS = tuple(STATION_PRIORITY)
+
+# Chunk boundary stations only merge with stations this close (m), so a
+# seam never displaces a nearby curve or grade break
+BOUNDARY_MERGE_TOLERANCE = 1e-6
+
+# Record layout of a planned station array (see StationManager.station_array)
+STATION_DTYPE = np.dtype([
+    ('station', np.float64),
+    ('x', np.float64),
+    ('y', np.float64),
+    ('z', np.float64),
+    ('direction', np.float64),
+    ('grade', np.float64),
+    ('reason', np.uint8),
+])
 
 
 @dataclass
@@ -416,17 +619,29 @@ class StationManager:
     7. Sort by station value
     """
     
-    def __init__(self, alignment_3d: Any, interval: float = 10.0):
+    def __init__(
+        self,
+        alignment_3d: Any,
+        interval: float = 10.0,
+        chord_tolerance: float = DEFAULT_CHORD_TOLERANCE
+    ):
         """
         Initialize station manager.
         
         Args:
-            alignment_3d: Alignment3D instance with H+V alignment
+            alignment_3d: AlignmentWrapper (or compatible) with H+V alignment
             interval: Base station interval in meters (default: 10m)
+            chord_tolerance: Maximum sagitta between stations in horizontal
+                and vertical curves (m)
         """
         self.alignment = alignment_3d
         self.interval = interval
+        self.chord_tolerance = chord_tolerance
         self.stations: List[StationPoint] = []
+        self.station_array = np.zeros(0, dtype=STATION_DTYPE)
+        
+        # Planned (station, reason) candidates before merging
+        self._candidates: List[Tuple[float, str]] = []
         
         # Tolerance for merging close stations
         self.merge_tolerance = 0.5  # meters
@@ -434,7 +649,9 @@ class StationManager:
     def calculate_stations(
         self,
         curve_densification_factor: float = 2.0,
-        critical_stations: Optional[List[float]] = None
+        critical_stations: Optional[List[float]] = None,
+        constraint_manager: Optional[Any] = None,
+        chunk_boundaries: Optional[Sequence[float]] = None
     ) -> List[StationPoint]:
         """
         Calculate all stations along the alignment.
@@ -442,18 +659,81 @@ class StationManager:
         Args:
             curve_densification_factor: How much denser to make curves (2.0 = 2x more stations)
             critical_stations: Optional list of additional critical stations
+            constraint_manager: Optional ConstraintManager whose constraint
+                start/end stations become stations
+            chunk_boundaries: Optional mesh chunk boundary stations
+                (CorridorChunkLayout.boundaries); each gets a station
             
         Returns:
             List of StationPoint objects, sorted by station
+        """
+        array = self.calculate_station_array(
+            curve_densification_factor, critical_stations, constraint_manager,
+            chunk_boundaries
+        )
+        self.stations = station_points_from_array(array)
+        return self.stations
+    
+    def calculate_station_array(
+        self,
+        curve_densification_factor: float = 2.0,
+        critical_stations: Optional[List[float]] = None,
+        constraint_manager: Optional[Any] = None,
+        chunk_boundaries: Optional[Sequence[float]] = None
+    ) -> np.ndarray:
+        """
+        Calculate all stations as a structured array (STATION_DTYPE).
+        
+        Station values are planned and merged first; geometry is then
+        evaluated once for the surviving stations only.
+        
+        Args:
+            curve_densification_factor: How much denser to make curves (2.0 = 2x more stations)
+            critical_stations: Optional list of additional critical stations
+            constraint_manager: Optional ConstraintManager whose constraint
+                start/end stations become stations
+            chunk_boundaries: Optional mesh chunk boundary stations
+            
+        Returns:
+            Structured array sorted by station
+        """
+        stations, reasons = self.plan_stations(
+            curve_densification_factor, critical_stations, constraint_manager,
+            chunk_boundaries
+        )
+        self.station_array = self._evaluate_stations(stations, reasons)
+        return self.station_array
+    
+    def plan_stations(
+        self,
+        curve_densification_factor: float = 2.0,
+        critical_stations: Optional[List[float]] = None,
+        constraint_manager: Optional[Any] = None,
+        chunk_boundaries: Optional[Sequence[float]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Plan merged station values without evaluating any geometry.
+        
+        Args:
+            curve_densification_factor: How much denser to make curves (2.0 = 2x more stations)
+            critical_stations: Optional list of additional critical stations
+            constraint_manager: Optional ConstraintManager whose constraint
+                start/end stations become stations
+            chunk_boundaries: Optional mesh chunk boundary stations, so
+                neighbouring chunks share a station exactly on their seam
+            
+        Returns:
+            Tuple of (station values, reason codes) sorted by station.
+            Reason codes index STATION_REASONS.
             
         Algorithm Steps:
         1. Generate base interval stations
         2. Add curve-specific stations
         3. Add vertical alignment stations
-        4. Add critical stations
+        4. Add critical, constraint and chunk boundary stations
         5. Merge and sort
         """
-        self.stations = []
+        self._candidates = []
         
         # Step 1: Base interval stations
         self._add_interval_stations()
@@ -464,14 +744,22 @@ class StationManager:
         # Step 3: Vertical alignment stations (PVIs, curve points)
         self._add_vertical_alignment_stations()
         
-        # Step 4: User-specified critical stations
+        # Step 4: User-specified critical stations and constraint breakpoints
         if critical_stations:
             self._add_critical_stations(critical_stations)
+        if constraint_manager is not None:
+            self._add_constraint_stations(constraint_manager)
+        for boundary in chunk_boundaries or ():
+            self._add_station_if_in_range(boundary, "chunk_boundary")
         
         # Step 5: Merge close stations and sort
-        self._merge_and_sort()
+        merged = self._merge_and_sort()
+        self._candidates = []
         
-        return self.stations
+        codes = {reason: i for i, reason in enumerate(STATION_REASONS)}
+        stations = np.array([station for station, _ in merged], dtype=np.float64)
+        reasons = np.array([codes[reason] for _, reason in merged], dtype=np.uint8)
+        return stations, reasons
     
     def _add_interval_stations(self):
         """Add uniform interval stations along the alignment."""
@@ -480,161 +768,207 @@ class StationManager:
         
         station = start
         while station <= end:
-            point = self._create_station_point(station, "interval")
-            if point:
-                self.stations.append(point)
+            self._candidates.append((station, "interval"))
             station += self.interval
         
         # Ensure end station is included
-        if abs(self.stations[-1].station - end) > 0.01:
-            point = self._create_station_point(end, "end")
-            if point:
-                self.stations.append(point)
+        if not self._candidates or abs(self._candidates[-1][0] - end) > 0.01:
+            self._candidates.append((end, "end"))
     
     def _add_horizontal_curve_stations(self, densification_factor: float):
         """
-        Add stations at horizontal curves.
+        Add stations at horizontal segment breaks and through curves.
         
-        Curves need more stations for smooth corridor generation.
+        Segments are read from the alignment's compiled layout
+        (horizontal_evaluator). Every segment boundary gets a station: a
+        curve start/end next to a curve, otherwise an angle point ("pi").
+        Inside a curve the spacing is the smaller of
+        interval / densification_factor and the chord_spacing() that keeps
+        the sagitta within chord_tolerance. Transition spirals are spaced
+        for the larger of their two end curvatures.
         """
-        # Access horizontal alignment
-        h_align = self.alignment.horizontal
-        
-        # Check if horizontal alignment has curve information
-        if not hasattr(h_align, 'segments'):
+        evaluator = getattr(self.alignment, 'horizontal_evaluator', None)
+        if evaluator is None or evaluator.segment_count == 0:
             return
         
-        for segment in h_align.segments:
-            # Check if segment is a curve
-            if hasattr(segment, 'type') and segment.type == 'CURVE':
-                # Add station at curve start
-                start_sta = segment.start_station
-                point = self._create_station_point(start_sta, "curve_start")
-                if point:
-                    self.stations.append(point)
-                
-                # Add stations within curve (denser than interval)
-                curve_interval = self.interval / densification_factor
-                length = segment.length
-                station = start_sta + curve_interval
-                
-                while station < start_sta + length - 0.01:
-                    point = self._create_station_point(station, "curve_interior")
-                    if point:
-                        self.stations.append(point)
-                    station += curve_interval
-                
-                # Add station at curve end
-                end_sta = segment.end_station
-                point = self._create_station_point(end_sta, "curve_end")
-                if point:
-                    self.stations.append(point)
+        starts = self.alignment.stations_from_distances(evaluator.start_distances).tolist()
+        ends = self.alignment.stations_from_distances(evaluator.end_distances).tolist()
+        curvatures = np.maximum(
+            np.abs(evaluator.start_curvatures), np.abs(evaluator.end_curvatures)
+        ).tolist()
+        base_spacing = self.interval / max(densification_factor, 1.0)
+        
+        for i, curvature in enumerate(curvatures):
+            if curvature != 0.0:
+                reason = "curve_start"
+            elif i > 0 and curvatures[i - 1] != 0.0:
+                reason = "curve_end"
+            else:
+                reason = "pi"
+            self._add_station_if_in_range(starts[i], reason)
+            
+            if curvature != 0.0:
+                spacing = min(
+                    base_spacing,
+                    chord_spacing(1.0 / curvature, self.chord_tolerance)
+                )
+                self._add_interior_stations(starts[i], ends[i], spacing, "curve_interior")
+        
+        self._add_station_if_in_range(
+            ends[-1], "curve_end" if curvatures[-1] != 0.0 else "pi"
+        )
     
     def _add_vertical_alignment_stations(self):
-        """Add stations at vertical alignment critical points (PVIs, curve points)."""
-        v_align = self.alignment.vertical
+        """
+        Add stations at grade breaks and through vertical curves.
         
-        # Check if vertical alignment has PVI information
-        if not hasattr(v_align, 'pvis'):
+        Segments are read from the alignment's vertical profile table. A
+        boundary between two grades is a PVI; a boundary next to a parabolic
+        curve is its BVC or EVC. Curves also get their PVI (midpoint) and
+        interior stations within chord_tolerance of the parabola.
+        """
+        profile = getattr(self.alignment, 'vertical_profile', None)
+        if profile is None or profile.segment_count == 0:
             return
         
-        for pvi in v_align.pvis:
-            # Add station at PVI
-            station = pvi.station
-            point = self._create_station_point(station, "pvi")
-            if point:
-                self.stations.append(point)
+        starts = profile.start_stations.tolist()
+        ends = profile.end_stations.tolist()
+        coefficients = profile.a.tolist()
+        
+        for i, a in enumerate(coefficients):
+            is_curve = a != 0.0 or (i > 0 and coefficients[i - 1] != 0.0)
+            self._add_station_if_in_range(starts[i], "vertical_curve" if is_curve else "pvi")
             
-            # If PVI has a curve, add stations throughout the curve
-            if hasattr(pvi, 'curve_length') and pvi.curve_length > 0:
-                curve_start = station - pvi.curve_length / 2
-                curve_end = station + pvi.curve_length / 2
-                
-                # Add quarter points on vertical curves
-                for fraction in [0.25, 0.75]:
-                    curve_station = curve_start + pvi.curve_length * fraction
-                    point = self._create_station_point(curve_station, "vertical_curve")
-                    if point:
-                        self.stations.append(point)
+            if a != 0.0:
+                self._add_station_if_in_range((starts[i] + ends[i]) / 2.0, "pvi")
+                spacing = min(self.interval, parabola_chord_spacing(a, self.chord_tolerance))
+                self._add_interior_stations(starts[i], ends[i], spacing, "vertical_curve")
+        
+        self._add_station_if_in_range(
+            ends[-1], "vertical_curve" if coefficients[-1] != 0.0 else "pvi"
+        )
+    
+    def _add_interior_stations(
+        self,
+        start: float,
+        end: float,
+        spacing: float,
+        reason: str
+    ):
+        """
+        Add evenly spaced stations strictly inside (start, end).
+        
+        Args:
+            start: Range start station (m)
+            end: Range end station (m)
+            spacing: Maximum spacing between stations (m)
+            reason: Reason for the added stations
+        """
+        spacing = max(spacing, self.merge_tolerance)
+        count = math.ceil((end - start) / spacing - 1e-9)
+        if count < 2:
+            return
+        step = (end - start) / count
+        for i in range(1, count):
+            self._add_station_if_in_range(start + i * step, reason)
+    
+    def _add_station_if_in_range(self, station: float, reason: str):
+        """Plan a station if it lies within the corridor's station range."""
+        if self.alignment.get_start_station() <= station <= self.alignment.get_end_station():
+            self._candidates.append((station, reason))
+    
+    def _add_constraint_stations(self, constraint_manager: Any):
+        """Add stations where enabled parametric constraints start and end."""
+        for constraint in constraint_manager.constraints:
+            if not constraint.enabled:
+                continue
+            self._add_station_if_in_range(constraint.start_station, "constraint")
+            if constraint.end_station != constraint.start_station:
+                self._add_station_if_in_range(constraint.end_station, "constraint")
     
     def _add_critical_stations(self, critical_stations: List[float]):
-        """Add user-specified critical stations."""
+        """Add user-specified critical stations within the corridor range."""
         for station in critical_stations:
-            point = self._create_station_point(station, "critical")
-            if point:
-                self.stations.append(point)
+            self._add_station_if_in_range(station, "critical")
     
-    def _create_station_point(self, station: float, reason: str) -> Optional[StationPoint]:
+    def _evaluate_stations(self, stations: np.ndarray, reasons: np.ndarray) -> np.ndarray:
         """
-        Create a StationPoint at a given station.
+        Evaluate geometry for planned stations in one batch.
+        
+        Uses the alignment's evaluate_stations() when available, otherwise
+        falls back to per-station queries (dropping stations the alignment
+        cannot evaluate).
         
         Args:
-            station: Station value
-            reason: Reason for this station
+            stations: Planned station values
+            reasons: Reason codes for the stations
             
         Returns:
-            StationPoint or None if station is out of range
+            Structured array (STATION_DTYPE)
         """
-        try:
-            # Get 3D position from Alignment3D
-            x, y, z = self.alignment.get_3d_position(station)
-            
-            # Get direction (bearing)
-            direction = self.alignment.get_direction(station)
-            
-            # Get grade
-            grade = self.alignment.get_grade(station)
-            
-            return StationPoint(
-                station=station,
-                x=x,
-                y=y,
-                z=z,
-                direction=direction,
-                grade=grade,
-                reason=reason
-            )
-        except (ValueError, AttributeError):
-            # Station out of range or alignment doesn't have method
-            return None
+        array = np.zeros(len(stations), dtype=STATION_DTYPE)
+        array['station'] = stations
+        array['reason'] = reasons
+        if len(stations) == 0:
+            return array
+        
+        evaluate = getattr(self.alignment, 'evaluate_stations', None)
+        if evaluate is not None:
+            positions, directions, grades = evaluate(stations)
+            array['x'] = positions[:, 0]
+            array['y'] = positions[:, 1]
+            array['z'] = positions[:, 2]
+            array['direction'] = directions
+            array['grade'] = grades
+            return array
+        
+        keep = np.ones(len(stations), dtype=bool)
+        for i, station in enumerate(stations.tolist()):
+            try:
+                x, y, z = self.alignment.get_3d_position(station)
+                direction = self.alignment.get_direction(station)
+                grade = self.alignment.get_grade(station)
+            except (ValueError, AttributeError):
+                # Station out of range or alignment doesn't have method
+                keep[i] = False
+                continue
+            array[i] = (station, x, y, z, direction, grade, reasons[i])
+        return array[keep]
     
-    def _merge_and_sort(self):
-        """Merge stations that are too close together and sort by station."""
-        if not self.stations:
-            return
+    def _merge_and_sort(self) -> List[Tuple[float, str]]:
+        """
+        Merge planned stations that are too close together and sort them.
+        
+        Returns:
+            Merged (station, reason) pairs sorted by station
+        """
+        if not self._candidates:
+            return []
         
         # Sort by station
-        self.stations.sort(key=lambda s: s.station)
+        candidates = sorted(self._candidates, key=lambda c: c[0])
         
         # Merge close stations
-        merged = [self.stations[0]]
+        merged = [candidates[0]]
         
-        for station in self.stations[1:]:
-            last = merged[-1]
+        for station, reason in candidates[1:]:
+            last_station, last_reason = merged[-1]
+            
+            tolerance = self.merge_tolerance
+            if "chunk_boundary" in (reason, last_reason):
+                tolerance = BOUNDARY_MERGE_TOLERANCE
             
             # If this station is very close to the last one, skip it
-            if abs(station.station - last.station) < self.merge_tolerance:
+            if abs(station - last_station) < tolerance:
                 # Keep the one with more important reason
-                priority = {
-                    "start": 5,
-                    "end": 5,
-                    "pvi": 4,
-                    "curve_start": 4,
-                    "curve_end": 4,
-                    "critical": 3,
-                    "vertical_curve": 2,
-                    "curve_interior": 1,
-                    "interval": 0
-                }
-                
-                if priority.get(station.reason, 0) > priority.get(last.reason, 0):
+                if STATION_PRIORITY.get(reason, 0) > STATION_PRIORITY.get(last_reason, 0):
                     # Replace last with this one
-                    merged[-1] = station
+                    merged[-1] = (station, reason)
             else:
                 # Add this station
-                merged.append(station)
+                merged.append((station, reason))
         
-        self.stations = merged
+        return merged
     
     def get_station_count(self) -> int:
         """Get the number of stations."""
@@ -649,6 +983,22 @@ class StationManager:
         return [s.station for s in self.stations]
 
 
+def station_points_from_array(array: np.ndarray) -> List[StationPoint]:
+    """
+    Convert a structured station array to StationPoint objects.
+    
+    Args:
+        array: Structured array with STATION_DTYPE records
+        
+    Returns:
+        List of StationPoint objects in array order
+    """
+    return [
+        StationPoint(station, x, y, z, direction, grade, STATION_REASONS[reason])
+        for station, x, y, z, direction, grade, reason in array.tolist()
+    ]
+
+
 class CorridorModeler:
     """
     Main corridor modeling class.
@@ -821,22 +1171,42 @@ class CorridorModeler:
         Create IFC cross-section profiles for each station.
         
         Uses RoadAssembly.to_ifc() to create IfcCompositeProfileDef
-        for each station, applying parametric constraints.
+        for each station, applying parametric constraints. Stations with
+        identical tagged profiles share one profile entity.
         
         Returns:
             List of IfcProfileDef entities (one per station)
         """
-        profiles = []
-        
-        for station_point in self.stations:
-            # Get cross-section profile from assembly at this station
-            # The assembly may have parametric constraints that vary the profile
-            profile = self._export_assembly_to_ifc(station_point.station)
-            profiles.append(profile)
+        profile_cache = ProfileCache(self.ifc_file)
+
+        from .corridor import AssemblyWrapper
+        if isinstance(self.assembly, AssemblyWrapper):
+            # All stations evaluated from the compiled assembly at once
+            profiles = create_profiles_from_assembly(
+                ifc_file=self.ifc_file,
+                assembly=self.assembly,
+                stations=[s.station for s in self.stations],
+                pavement_thickness=0.3,  # Default 300mm pavement
+                profile_cache=profile_cache
+            )
+        else:
+            profiles = []
+            for station_point in self.stations:
+                # Get cross-section profile from assembly at this station
+                # The assembly may have parametric constraints that vary the profile
+                profile = self._export_assembly_to_ifc(station_point.station, profile_cache)
+                profiles.append(profile)
         
+        logger.info(
+            f"{len(profiles)} cross-sections use {len(profile_cache)} tagged profiles"
+        )
         return profiles
     
-    def _export_assembly_to_ifc(self, station: float) -> Any:
+    def _export_assembly_to_ifc(
+        self,
+        station: float,
+        profile_cache: Optional[ProfileCache] = None
+    ) -> Any:
         """
         Export cross-section assembly to IFC profile at a specific station.
 
@@ -845,6 +1215,8 @@ class CorridorModeler:
 
         Args:
             station: Station where cross-section is placed
+            profile_cache: Optional ProfileCache for reusing identical
+                tagged profiles
 
         Returns:
             IfcArbitraryClosedProfileDef entity with tagged points
@@ -857,7 +1229,8 @@ class CorridorModeler:
                 ifc_file=self.ifc_file,
                 assembly=self.assembly,
                 station=station,
-                pavement_thickness=0.3  # Default 300mm pavement
+                pavement_thickness=0.3,  # Default 300mm pavement
+                profile_cache=profile_cache
             )
 
         # Check if assembly has native IFC export
@@ -889,6 +1262,12 @@ class CorridorModeler:
             PointTags.EDGE_PAVEMENT_LEFT  # Closing tag
         ]
 
+        if profile_cache is not None:
+            return profile_cache.get_or_create(
+                points, tags, station,
+                profile_name=f"Default Section at Sta {station:.2f}"
+            )
+
         return create_tagged_cross_section_profile(
             ifc_file=self.ifc_file,
             points=points,
@@ -920,42 +1299,11 @@ class CorridorModeler:
         Returns:
             List of IfcAxis2PlacementLinear entities
         """
-        positions = []
-
-        for station_point in self.stations:
-            # Create point by distance expression (parametric location on directrix)
-            # Per IFC 4.3: IfcAxis2PlacementLinear.Location must be IfcPointByDistanceExpression
-            # CRITICAL: OffsetLongitudinal must be None per IFC 4.3 spec
-            #
-            # CRITICAL: DistanceAlong is IfcCurveMeasureSelect which requires a wrapped
-            # entity instance (IfcLengthMeasure), NOT a raw float value.
-            distance_along = self.ifc_file.create_entity(
-                "IfcLengthMeasure",
-                float(station_point.station)
-            )
-
-            point_by_distance = self.ifc_file.create_entity(
-                "IfcPointByDistanceExpression",
-                DistanceAlong=distance_along,
-                OffsetLateral=0.0,  # No lateral offset
-                OffsetVertical=0.0,  # No vertical offset
-                BasisCurve=directrix,  # Required in IFC 4.3
-                # OffsetLongitudinal intentionally omitted - MUST NOT be used
-            )
-
-            # Create axis placement at this distance along directrix
-            # Per IFC 4.3: Location is the IfcPointByDistanceExpression
-            # Axis and RefDirection default to appropriate values based on directrix
-            placement = self.ifc_file.create_entity(
-                "IfcAxis2PlacementLinear",
-                Location=point_by_distance,
-                Axis=None,  # Default: derived from directrix, typically Z-up
-                RefDirection=None  # Default: perpendicular to directrix tangent
-            )
-
-            positions.append(placement)
-
-        return positions
+        return create_section_positions(
+            self.ifc_file,
+            directrix,
+            [station_point.station for station_point in self.stations]
+        )
     
     def get_station_count(self) -> int:
         """Get the number of stations in the corridor."""
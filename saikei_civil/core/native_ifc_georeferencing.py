@@ -31,6 +31,9 @@ import ifcopenshell.api
 from typing import Optional, Tuple, Dict
 import math
 import logging
+
+import numpy as np
+
 from .logging_config import get_logger
 
 try:
@@ -405,6 +408,66 @@ class NativeIfcGeoreferencing:
         
         return (x, y, z)
     
+    def local_to_map_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Transform many local points to map coordinates at once.
+
+        Array form of local_to_map(); the IfcMapConversion is read once.
+
+        Args:
+            points: (N, 3) local (X, Y, Z) coordinates
+
+        Returns:
+            (N, 3) (Easting, Northing, Elevation) coordinates
+        """
+        georef = self.get_georeferencing()
+        if not georef:
+            raise ValueError("No georeferencing set up")
+
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        scale = georef['scale']
+        rotation_rad = math.radians(georef['rotation'])
+        cos_r = math.cos(rotation_rad)
+        sin_r = math.sin(rotation_rad)
+
+        result = np.empty_like(points)
+        result[:, 0] = scale * (points[:, 0] * cos_r - points[:, 1] * sin_r)
+        result[:, 1] = scale * (points[:, 0] * sin_r + points[:, 1] * cos_r)
+        result[:, 2] = points[:, 2] * scale
+        result += georef['false_origin']
+        return result
+
+    def map_to_local_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Transform many map points to local coordinates at once.
+
+        Array form of map_to_local(); the IfcMapConversion is read once.
+
+        Args:
+            points: (N, 3) (Easting, Northing, Elevation) coordinates
+
+        Returns:
+            (N, 3) local (X, Y, Z) coordinates
+        """
+        georef = self.get_georeferencing()
+        if not georef:
+            raise ValueError("No georeferencing set up")
+
+        translated = (
+            np.asarray(points, dtype=np.float64).reshape(-1, 3)
+            - georef['false_origin']
+        )
+        scale = georef['scale']
+        rotation_rad = math.radians(georef['rotation'])
+        cos_r = math.cos(rotation_rad)
+        sin_r = math.sin(rotation_rad)
+
+        result = np.empty_like(translated)
+        result[:, 0] = (translated[:, 0] * cos_r + translated[:, 1] * sin_r) / scale
+        result[:, 1] = (-translated[:, 0] * sin_r + translated[:, 1] * cos_r) / scale
+        result[:, 2] = translated[:, 2] / scale
+        return result
+    
     def _get_or_create_geometric_context(self) -> ifcopenshell.entity_instance:
         """Get existing or create new geometric representation context"""
         contexts = self.ifc.by_type("IfcGeometricRepresentationContext")
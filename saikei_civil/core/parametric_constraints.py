@@ -69,8 +69,11 @@ Example Usage:
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 from enum import Enum
+import bisect
 import uuid
 
+import numpy as np
+
 
 class ConstraintType(Enum):
     """Type of parametric constraint."""
@@ -321,6 +324,139 @@ class ParametricConstraint:
                     f"-{self.end_station:.2f}, {self.interpolation.value})")
 
 
+# Interpolation codes used by the vectorized evaluator
+_LINEAR, _SMOOTH, _STEP = 0, 1, 2
+_INTERPOLATION_CODES = {
+    InterpolationType.LINEAR: _LINEAR,
+    InterpolationType.SMOOTH: _SMOOTH,
+    InterpolationType.STEP: _STEP,
+}
+
+# Ranges shorter than this behave like point constraints (1 mm)
+MIN_STATION_RANGE = 0.001
+
+
+class ConstraintInterval:
+    """
+    Sorted interval index over a set of enabled constraints.
+
+    Constraints are ordered by start station, with a running maximum of
+    end stations so that a station query only visits constraints that can
+    still cover it. Each constraint keeps its position in the manager's
+    list (``ranks``) so that last-write-wins resolution is preserved
+    regardless of the sort.
+    """
+
+    def __init__(self, entries: List[Tuple[int, ParametricConstraint]]):
+        """
+        Build the index.
+
+        Args:
+            entries: (list position, constraint) pairs, enabled constraints only
+        """
+        entries = sorted(entries, key=lambda e: (e[1].start_station, e[0]))
+        self.constraints = [c for _, c in entries]
+        self.ranks = np.array([r for r, _ in entries], dtype=np.int64)
+        self.starts = np.array([c.start_station for c in self.constraints], dtype=np.float64)
+        self.ends = np.array([c.end_station for c in self.constraints], dtype=np.float64)
+        self.start_values = np.array([c.start_value for c in self.constraints], dtype=np.float64)
+        self.end_values = np.array([c.end_value for c in self.constraints], dtype=np.float64)
+        self.interpolations = np.array(
+            [_INTERPOLATION_CODES[c.interpolation] for c in self.constraints],
+            dtype=np.int8,
+        )
+        self.max_ends = np.maximum.accumulate(self.ends) if entries else self.ends
+        self._start_list = self.starts.tolist()
+        self._max_end_list = self.max_ends.tolist()
+        self._end_list = self.ends.tolist()
+
+    def covering(self, station: float) -> List[int]:
+        """
+        Get indices of constraints covering a station.
+
+        Args:
+            station: Query station in meters
+
+        Returns:
+            Index positions (into this interval's arrays), unordered
+        """
+        i = bisect.bisect_right(self._start_list, station) - 1
+        found = []
+        while i >= 0 and self._max_end_list[i] >= station:
+            if self._end_list[i] >= station:
+                found.append(i)
+            i -= 1
+        return found
+
+    def winner(self, station: float) -> Optional[ParametricConstraint]:
+        """
+        Get the constraint that determines the value at a station.
+
+        Args:
+            station: Query station in meters
+
+        Returns:
+            Last constraint (in manager order) covering the station, or None
+        """
+        found = self.covering(station)
+        if not found:
+            return None
+        return self.constraints[max(found, key=lambda i: self.ranks[i])]
+
+    def values(self, stations: np.ndarray, default_value: float) -> np.ndarray:
+        """
+        Evaluate the effective value at many stations.
+
+        Args:
+            stations: (N,) query stations
+            default_value: Value where no constraint applies
+
+        Returns:
+            (N,) array of effective values
+        """
+        stations = np.asarray(stations, dtype=np.float64)
+        result = np.full(stations.shape, float(default_value))
+        if not self.constraints or stations.size == 0:
+            return result
+
+        # Resolve the winning constraint per station: write ranges in
+        # manager order so later constraints overwrite earlier ones
+        order = np.argsort(stations, kind="stable")
+        sorted_stations = stations[order]
+        lo = np.searchsorted(sorted_stations, self.starts, side="left")
+        hi = np.searchsorted(sorted_stations, self.ends, side="right")
+
+        winner = np.full(stations.shape, -1, dtype=np.int64)
+        for i in np.argsort(self.ranks, kind="stable"):
+            if hi[i] > lo[i]:
+                winner[lo[i]:hi[i]] = i
+
+        covered = winner >= 0
+        if not covered.any():
+            return result
+        w = winner[covered]
+        s = sorted_stations[covered]
+
+        start, end = self.starts[w], self.ends[w]
+        v0, v1 = self.start_values[w], self.end_values[w]
+        mode = self.interpolations[w]
+
+        station_range = end - start
+        short = station_range < MIN_STATION_RANGE
+        t = np.clip(
+            (s - start) / np.where(short, 1.0, station_range), 0.0, 1.0
+        )
+        t = np.where(mode == _SMOOTH, t * t * (3.0 - 2.0 * t), t)
+        t = np.where(mode == _STEP, np.where(t < 1.0, 0.0, 1.0), t)
+        t = np.where(short, 0.0, t)
+
+        values = np.empty(stations.shape)
+        values[covered] = v0 + t * (v1 - v0)
+        values[~covered] = default_value
+        result[order] = values
+        return result
+
+
 @dataclass
 class ConstraintManager:
     """
@@ -338,8 +474,20 @@ class ConstraintManager:
         When multiple constraints affect the same parameter at a station,
         later constraints in the list take priority (last-write-wins).
         Constraints are automatically sorted by start_station.
+
+    Queries go through an interval index grouped by (component_name,
+    parameter_name). The index is rebuilt after any change made through
+    the manager; call ``invalidate_index()`` after editing constraint
+    attributes directly.
     """
     constraints: List[ParametricConstraint] = field(default_factory=list)
+    _index: Optional[Dict[Tuple[str, str], ConstraintInterval]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _all_index: Optional[ConstraintInterval] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
 
     def add_constraint(self, constraint: ParametricConstraint) -> None:
         """
@@ -350,6 +498,7 @@ class ConstraintManager:
         """
         self.constraints.append(constraint)
         self._sort_constraints()
+        self.invalidate_index()
 
     def remove_constraint(self, constraint_id: str) -> bool:
         """
@@ -364,6 +513,7 @@ class ConstraintManager:
         for i, c in enumerate(self.constraints):
             if c.id == constraint_id:
                 del self.constraints[i]
+                self.invalidate_index()
                 return True
         return False
 
@@ -403,12 +553,39 @@ class ConstraintManager:
 
         # Re-sort in case stations changed
         self._sort_constraints()
+        self.invalidate_index()
         return True
 
     def _sort_constraints(self) -> None:
         """Sort constraints by start station."""
         self.constraints.sort(key=lambda c: c.start_station)
 
+    def invalidate_index(self) -> None:
+        """Discard the interval index so the next query rebuilds it."""
+        self._index = None
+        self._all_index = None
+
+    def _interval_index(self) -> Dict[Tuple[str, str], ConstraintInterval]:
+        """
+        Get the per-parameter interval index, rebuilding it if stale.
+
+        Returns:
+            Dict mapping (component_name, parameter_name) to its intervals
+        """
+        if self._index is None or self._indexed_count != len(self.constraints):
+            groups: Dict[Tuple[str, str], List[Tuple[int, ParametricConstraint]]] = {}
+            enabled = []
+            for rank, c in enumerate(self.constraints):
+                if not c.enabled:
+                    continue
+                enabled.append((rank, c))
+                groups.setdefault((c.component_name, c.parameter_name), []).append((rank, c))
+
+            self._index = {key: ConstraintInterval(entries) for key, entries in groups.items()}
+            self._all_index = ConstraintInterval(enabled)
+            self._indexed_count = len(self.constraints)
+        return self._index
+
     def get_constraints_at_station(self, station: float) -> List[ParametricConstraint]:
         """
         Get all active constraints at a station.
@@ -419,7 +596,10 @@ class ConstraintManager:
         Returns:
             List of constraints that apply at this station
         """
-        return [c for c in self.constraints if c.applies_to_station(station)]
+        self._interval_index()
+        intervals = self._all_index
+        found = sorted(intervals.covering(station), key=lambda i: intervals.ranks[i])
+        return [intervals.constraints[i] for i in found]
 
     def get_constraints_for_component(
         self,
@@ -462,17 +642,54 @@ class ConstraintManager:
         Returns:
             Effective parameter value
         """
-        value = default_value
+        intervals = self._interval_index().get((component_name, parameter_name))
+        if intervals is None:
+            return default_value
+
+        constraint = intervals.winner(station)
+        value = None if constraint is None else constraint.get_value_at_station(station)
+        return default_value if value is None else value
+
+    def effective_values(
+        self,
+        component_name: str,
+        parameter_name: str,
+        stations: np.ndarray,
+        default_value: float
+    ) -> np.ndarray:
+        """
+        Get effective parameter values at many stations.
+
+        Vectorized form of ``get_effective_value`` with the same
+        last-wins resolution and LINEAR/SMOOTH/STEP interpolation.
+
+        Args:
+            component_name: Name of component
+            parameter_name: Parameter to query
+            stations: (N,) query stations in meters
+            default_value: Default value where no constraint applies
+
+        Returns:
+            (N,) array of effective values
+        """
+        stations = np.atleast_1d(np.asarray(stations, dtype=np.float64))
+        intervals = self._interval_index().get((component_name, parameter_name))
+        if intervals is None:
+            return np.full(stations.shape, float(default_value))
+        return intervals.values(stations, default_value)
 
-        for constraint in self.constraints:
-            if (constraint.component_name == component_name and
-                constraint.parameter_name == parameter_name):
+    def has_constraints(self, component_name: str, parameter_name: str) -> bool:
+        """
+        Check whether any enabled constraint targets a parameter.
 
-                constraint_value = constraint.get_value_at_station(station)
-                if constraint_value is not None:
-                    value = constraint_value
+        Args:
+            component_name: Name of component
+            parameter_name: Parameter name
 
-        return value
+        Returns:
+            True if at least one enabled constraint exists
+        """
+        return (component_name, parameter_name) in self._interval_index()
 
     def get_modified_parameters(
         self,
@@ -553,6 +770,7 @@ class ConstraintManager:
     def clear(self) -> None:
         """Remove all constraints."""
         self.constraints.clear()
+        self.invalidate_index()
 
     def to_list(self) -> List[dict]:
         """
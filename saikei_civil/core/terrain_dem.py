@@ -0,0 +1,391 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Raster DEM Terrain
+==================
+
+Existing-ground terrain read straight from gridded elevation models, with
+the same batch elevations_at(xy) interface as the mesh TerrainIndex.
+
+Supported formats:
+- ESRI ASCII grid (.asc): converted once to a .npy cache next to the file
+  or in a cache directory (rebuilt when the source is newer), then
+  memory-mapped
+- ESRI binary float grid (.flt with its .hdr): memory-mapped directly
+
+Only the pages of the grid around the queried points are read from disk,
+so multi-gigabyte rasters never have to be loaded or turned into meshes.
+Elevations are interpolated bilinearly between cell centres; points
+outside the grid or next to NODATA cells return NaN.
+
+Query points are local (Blender/IFC engineering) coordinates. With a
+georeferencing object (NativeIfcGeoreferencing for the project's
+IfcMapConversion) they are transformed to map coordinates before lookup
+and the elevations transformed back to local heights.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> georef = NativeIfcGeoreferencing(ifc_file)
+    >>> dem = open_dem("ground.asc", georeferencing=georef)
+    >>> z = dem.elevations_at(np.column_stack([xs, ys]))
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Queries are processed in chunks of this many points
+QUERY_CHUNK_SIZE = 262144
+
+# Characters of ASCII grid text parsed at a time during cache conversion
+ASCII_BLOCK_SIZE = 64 * 1024 * 1024
+
+# Header keys of ESRI ASCII grids and .hdr files
+_HEADER_KEYS = {
+    "ncols", "nrows", "xllcorner", "yllcorner", "xllcenter", "yllcenter",
+    "cellsize", "nodata_value", "byteorder",
+}
+
+
+@dataclass
+class GridHeader:
+    """
+    Georeferencing of a north-up raster grid.
+
+    Attributes:
+        ncols: Number of columns
+        nrows: Number of rows (row 0 is the northernmost)
+        x_center: Map X of the centre of column 0
+        y_center: Map Y of the centre of the last (southernmost) row
+        cellsize: Cell edge length in map units
+        nodata: Value marking missing cells, or None
+        byteorder: "<" or ">" for binary grids
+    """
+    ncols: int
+    nrows: int
+    x_center: float
+    y_center: float
+    cellsize: float
+    nodata: Optional[float] = None
+    byteorder: str = "<"
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, str]) -> "GridHeader":
+        """
+        Build a header from ESRI keyword/value pairs.
+
+        Args:
+            values: Lower-case header keys mapped to their text values
+
+        Returns:
+            GridHeader
+
+        Raises:
+            ValueError: If a required key is missing
+        """
+        try:
+            cellsize = float(values["cellsize"])
+            if "xllcenter" in values:
+                x_center = float(values["xllcenter"])
+                y_center = float(values["yllcenter"])
+            else:
+                x_center = float(values["xllcorner"]) + cellsize / 2.0
+                y_center = float(values["yllcorner"]) + cellsize / 2.0
+            ncols = int(values["ncols"])
+            nrows = int(values["nrows"])
+        except KeyError as e:
+            raise ValueError(f"Grid header is missing {e.args[0]}") from None
+
+        nodata = values.get("nodata_value")
+        byteorder = values.get("byteorder", "lsbfirst").lower()
+        return cls(
+            ncols=ncols,
+            nrows=nrows,
+            x_center=x_center,
+            y_center=y_center,
+            cellsize=cellsize,
+            nodata=float(nodata) if nodata is not None else None,
+            byteorder=">" if byteorder in ("msbfirst", "big") else "<",
+        )
+
+
+def read_grid_header(path: str) -> Tuple[GridHeader, int]:
+    """
+    Read the keyword header of an ESRI ASCII grid or .hdr file.
+
+    Args:
+        path: Path to the .asc or .hdr file
+
+    Returns:
+        Tuple of (GridHeader, number of header lines)
+    """
+    values = {}
+    line_count = 0
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) != 2 or parts[0].lower() not in _HEADER_KEYS:
+                break
+            values[parts[0].lower()] = parts[1]
+            line_count += 1
+    return GridHeader.from_dict(values), line_count
+
+
+def convert_ascii_grid(path: str, cache_path: str) -> np.ndarray:
+    """
+    Convert an ESRI ASCII grid to a float32 .npy file.
+
+    The text is parsed in blocks straight into a memory-mapped output, so
+    the full grid is never held in memory. NODATA cells become NaN as each
+    block is written.
+
+    Args:
+        path: Path to the .asc file
+        cache_path: Path of the .npy file to write
+
+    Returns:
+        Read-only memory map of the converted grid
+
+    Raises:
+        ValueError: If the file holds fewer values than its header declares
+    """
+    header, header_lines = read_grid_header(path)
+    total = header.nrows * header.ncols
+    grid = np.lib.format.open_memmap(
+        cache_path, mode="w+", dtype=np.float32, shape=(header.nrows, header.ncols)
+    )
+    flat = grid.reshape(-1)
+    nodata = np.float32(header.nodata) if header.nodata is not None else None
+
+    filled = 0
+    remainder = ""
+    with open(path, "r") as f:
+        for _ in range(header_lines):
+            f.readline()
+        while filled < total:
+            block = f.read(ASCII_BLOCK_SIZE)
+            if not block and not remainder:
+                break
+            text = remainder + block
+            if block:
+                # Keep a token split across blocks for the next round
+                cut = max(text.rfind(" "), text.rfind("\n"))
+                text, remainder = text[:cut + 1], text[cut + 1:]
+            else:
+                remainder = ""
+            values = np.fromstring(text, dtype=np.float32, sep=" ")
+            count = min(len(values), total - filled)
+            values = values[:count]
+            if nodata is not None:
+                values[values == nodata] = np.nan
+            flat[filled:filled + count] = values
+            filled += count
+
+    if filled < total:
+        del grid
+        os.remove(cache_path)
+        raise ValueError(f"{path}: expected {total} values, found {filled}")
+
+    grid.flush()
+    del grid
+
+    logger.info("Converted %s to %s (%dx%d)", path, cache_path, header.nrows, header.ncols)
+    return np.load(cache_path, mmap_mode="r")
+
+
+class RasterTerrain:
+    """
+    Terrain source over a memory-mapped elevation grid.
+
+    Attributes:
+        grid: (nrows, ncols) elevation array, row 0 northernmost
+        header: GridHeader of the grid
+        georeferencing: Optional object with local_to_map_points() and
+            map_to_local_points() (e.g. NativeIfcGeoreferencing)
+    """
+
+    def __init__(
+        self,
+        grid: np.ndarray,
+        header: GridHeader,
+        georeferencing: Optional[Any] = None
+    ):
+        self.grid = grid
+        self.header = header
+        self.georeferencing = georeferencing
+        # Top-left cell centre in map coordinates
+        self._x0 = header.x_center
+        self._y0 = header.y_center + (header.nrows - 1) * header.cellsize
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(nrows, ncols) of the grid."""
+        return self.grid.shape
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """(xmin, ymin, xmax, ymax) of the cell centres in map coordinates."""
+        h = self.header
+        return (
+            h.x_center,
+            h.y_center,
+            h.x_center + (h.ncols - 1) * h.cellsize,
+            self._y0,
+        )
+
+    def elevations_at(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Terrain elevations at many plan positions.
+
+        Args:
+            xy: (N, 2) local plan coordinates
+
+        Returns:
+            (N,) local elevations; NaN outside the grid or at NODATA
+        """
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(xy), np.nan)
+        for start in range(0, len(xy), QUERY_CHUNK_SIZE):
+            stop = start + QUERY_CHUNK_SIZE
+            result[start:stop] = self._query_chunk(xy[start:stop])
+        return result
+
+    def _query_chunk(self, xy: np.ndarray) -> np.ndarray:
+        """Elevations for one chunk of queries."""
+        if self.georeferencing is not None:
+            local = np.column_stack([xy, np.zeros(len(xy))])
+            xy = self.georeferencing.local_to_map_points(local)[:, :2]
+
+        nrows, ncols = self.grid.shape
+        col = (xy[:, 0] - self._x0) / self.header.cellsize
+        row = (self._y0 - xy[:, 1]) / self.header.cellsize
+
+        heights = np.full(len(xy), np.nan)
+        inside = (col >= 0) & (col <= ncols - 1) & (row >= 0) & (row <= nrows - 1)
+        if not inside.any():
+            return heights
+
+        col, row = col[inside], row[inside]
+        # Clamp so points on the last row/column use the cell before it
+        c0 = np.minimum(col.astype(np.int64), max(ncols - 2, 0))
+        r0 = np.minimum(row.astype(np.int64), max(nrows - 2, 0))
+        c1 = np.minimum(c0 + 1, ncols - 1)
+        r1 = np.minimum(r0 + 1, nrows - 1)
+        fc = col - c0
+        fr = row - r0
+
+        grid = self.grid
+        z = (
+            grid[r0, c0] * (1.0 - fc) * (1.0 - fr)
+            + grid[r0, c1] * fc * (1.0 - fr)
+            + grid[r1, c0] * (1.0 - fc) * fr
+            + grid[r1, c1] * fc * fr
+        ).astype(np.float64)
+
+        nodata = self.header.nodata
+        if nodata is not None and not np.isnan(nodata):
+            for r, c in ((r0, c0), (r0, c1), (r1, c0), (r1, c1)):
+                z[grid[r, c] == nodata] = np.nan
+
+        if self.georeferencing is not None:
+            mapped = np.column_stack([xy[inside], z])
+            z = self.georeferencing.map_to_local_points(mapped)[:, 2]
+
+        heights[inside] = z
+        return heights
+
+
+def _cache_path(path: str, cache_dir: Optional[str]) -> str:
+    """Path of the .npy cache of an ASCII grid."""
+    source = os.path.abspath(path)
+    name = os.path.splitext(os.path.basename(source))[0]
+    if cache_dir is None:
+        return os.path.join(os.path.dirname(source), name + ".npy")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{name}_{digest}.npy")
+
+
+def open_dem(
+    path: str,
+    cache_dir: Optional[str] = None,
+    georeferencing: Optional[Any] = None
+) -> RasterTerrain:
+    """
+    Open a raster DEM as a terrain source.
+
+    Args:
+        path: Path to an ESRI ASCII grid (.asc) or binary float grid (.flt)
+        cache_dir: Directory for the .npy cache of ASCII grids (default:
+            next to the source file). Cache names in it include a hash of
+            the source path, so one directory can serve many grids.
+        georeferencing: Optional map conversion for local coordinates
+
+    Returns:
+        RasterTerrain over the memory-mapped grid
+
+    Raises:
+        ValueError: If the format is not supported or the file is invalid
+    """
+    stem, ext = os.path.splitext(path)
+    ext = ext.lower()
+
+    if ext == ".flt":
+        header, _ = read_grid_header(stem + ".hdr")
+        grid = np.memmap(
+            path, dtype=np.dtype(np.float32).newbyteorder(header.byteorder),
+            mode="r", shape=(header.nrows, header.ncols)
+        )
+        return RasterTerrain(grid, header, georeferencing)
+
+    if ext in (".asc", ".txt"):
+        header, _ = read_grid_header(path)
+        cache_path = _cache_path(path, cache_dir)
+        if (os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(path)):
+            grid = np.load(cache_path, mmap_mode="r")
+        else:
+            grid = convert_ascii_grid(path, cache_path)
+        # NODATA cells were stored as NaN in the cache
+        header.nodata = None
+        return RasterTerrain(grid, header, georeferencing)
+
+    raise ValueError(f"Unsupported DEM format: {ext}")
+
+
+__all__ = [
+    "GridHeader",
+    "RasterTerrain",
+    "read_grid_header",
+    "convert_ascii_grid",
+    "open_dem",
+]
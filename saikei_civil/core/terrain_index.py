@@ -0,0 +1,310 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Terrain Elevation Index
+=======================
+
+Answers batch "ground elevation at XY" queries against a triangulated
+terrain without Blender ray casting.
+
+Triangles are bucketed into a uniform XY grid stored in CSR form (one
+sorted array of triangle ids plus a start offset per cell). A query finds
+its cell, tests only the triangles bucketed there with barycentric
+coordinates and interpolates the elevation; everything runs as NumPy array
+operations over chunks of queries. Where triangles overlap in plan the
+highest surface wins, matching a ray cast straight down from above.
+
+Indexes are cached by a hash of the vertex and face data, so sampling the
+same terrain again (another alignment, another corridor run) reuses the
+built grid.
+
+This module is part of the CORE layer - pure Python with NO Blender
+dependencies.
+
+Example:
+    >>> index = get_terrain_index(vertices, faces)
+    >>> xy = np.column_stack([xs, ys])
+    >>> z = index.elevations_at(xy)   # NaN where xy is off the terrain
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# Queries are processed in chunks of this many points to bound the size of
+# the (query, candidate triangle) pair arrays
+QUERY_CHUNK_SIZE = 65536
+
+# Barycentric slack so points on shared edges hit at least one triangle
+EDGE_TOLERANCE = 1e-9
+
+# Number of built indexes kept by get_terrain_index()
+MAX_CACHED_INDEXES = 4
+
+
+class TerrainIndex:
+    """
+    Uniform-grid triangle index over a terrain surface.
+
+    Attributes:
+        cell_size: Grid cell edge length (m)
+        origin: (x, y) of the grid's lower-left corner
+        shape: (ny, nx) grid dimensions
+        face_count: Number of indexed triangles (faces with no plan area
+            are dropped)
+    """
+
+    def __init__(
+        self,
+        vertices: np.ndarray,
+        faces: np.ndarray,
+        cell_size: Optional[float] = None
+    ):
+        """
+        Build the index.
+
+        Args:
+            vertices: (V, 3) vertex coordinates
+            faces: (F, 3) vertex indices of each triangle
+            cell_size: Grid cell edge length (m); chosen from the typical
+                triangle size if None
+        """
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+
+        v0 = vertices[faces[:, 0]]
+        e1 = vertices[faces[:, 1]] - v0
+        e2 = vertices[faces[:, 2]] - v0
+        det = e1[:, 0] * e2[:, 1] - e2[:, 0] * e1[:, 1]
+
+        # Vertical and degenerate triangles cannot be hit from above
+        keep = np.abs(det) > 1e-12
+        v0, e1, e2, det = v0[keep], e1[keep], e2[keep], det[keep]
+        self.face_count = int(len(det))
+
+        # Per-triangle data for barycentric tests: u, v = inverse @ (p - v0)
+        self._x0 = v0[:, 0].copy()
+        self._y0 = v0[:, 1].copy()
+        self._z0 = v0[:, 2].copy()
+        self._dz1 = e1[:, 2].copy()
+        self._dz2 = e2[:, 2].copy()
+        self._inverse = np.column_stack([
+            e2[:, 1], -e2[:, 0], -e1[:, 1], e1[:, 0]
+        ]) / det[:, None]
+
+        xs = np.column_stack([v0[:, 0], v0[:, 0] + e1[:, 0], v0[:, 0] + e2[:, 0]])
+        ys = np.column_stack([v0[:, 1], v0[:, 1] + e1[:, 1], v0[:, 1] + e2[:, 1]])
+        self._build_grid(
+            xs.min(axis=1), xs.max(axis=1), ys.min(axis=1), ys.max(axis=1),
+            cell_size
+        )
+
+    def _build_grid(
+        self,
+        xmin: np.ndarray,
+        xmax: np.ndarray,
+        ymin: np.ndarray,
+        ymax: np.ndarray,
+        cell_size: Optional[float]
+    ) -> None:
+        """Bucket triangles by the grid cells their bounding boxes cover."""
+        if self.face_count == 0:
+            self.cell_size = 1.0
+            self.origin = (0.0, 0.0)
+            self.shape = (0, 0)
+            self._cell_start = np.zeros(1, dtype=np.int64)
+            self._cell_faces = np.zeros(0, dtype=np.int64)
+            return
+
+        x0, y0 = float(xmin.min()), float(ymin.min())
+        width = max(float(xmax.max()) - x0, 1e-9)
+        height = max(float(ymax.max()) - y0, 1e-9)
+
+        if cell_size is None:
+            cell_size = float(np.median(np.maximum(xmax - xmin, ymax - ymin)))
+            # Keep the grid at most a few cells per triangle
+            min_cell = np.sqrt(width * height / (4.0 * self.face_count))
+            cell_size = max(cell_size, min_cell, 1e-6)
+
+        nx = int(width // cell_size) + 1
+        ny = int(height // cell_size) + 1
+        self.cell_size = float(cell_size)
+        self.origin = (x0, y0)
+        self.shape = (ny, nx)
+
+        ix0 = ((xmin - x0) // cell_size).astype(np.int64)
+        ix1 = np.minimum(((xmax - x0) // cell_size).astype(np.int64), nx - 1)
+        iy0 = ((ymin - y0) // cell_size).astype(np.int64)
+        iy1 = np.minimum(((ymax - y0) // cell_size).astype(np.int64), ny - 1)
+
+        # Expand every triangle into the cells of its bounding box
+        span_x = ix1 - ix0 + 1
+        counts = span_x * (iy1 - iy0 + 1)
+        face_ids = np.repeat(np.arange(self.face_count), counts)
+        local = np.arange(len(face_ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = (
+            (iy0[face_ids] + local // span_x[face_ids]) * nx
+            + ix0[face_ids] + local % span_x[face_ids]
+        )
+
+        order = np.argsort(cells, kind="stable")
+        self._cell_faces = face_ids[order]
+        self._cell_start = np.zeros(nx * ny + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=nx * ny), out=self._cell_start[1:])
+
+        logger.debug(
+            "Terrain index: %d triangles in %dx%d cells of %.2fm (%d entries)",
+            self.face_count, nx, ny, cell_size, len(face_ids)
+        )
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """(xmin, ymin, xmax, ymax) of the grid."""
+        ny, nx = self.shape
+        x0, y0 = self.origin
+        return (x0, y0, x0 + nx * self.cell_size, y0 + ny * self.cell_size)
+
+    def elevations_at(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Terrain elevations at many plan positions.
+
+        Args:
+            xy: (N, 2) plan coordinates
+
+        Returns:
+            (N,) elevations; NaN where no triangle covers the point
+        """
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(xy), np.nan)
+        for start in range(0, len(xy), QUERY_CHUNK_SIZE):
+            stop = start + QUERY_CHUNK_SIZE
+            result[start:stop] = self._query_chunk(xy[start:stop])
+        return result
+
+    def _query_chunk(self, xy: np.ndarray) -> np.ndarray:
+        """Elevations for one chunk of queries."""
+        ny, nx = self.shape
+        heights = np.full(len(xy), -np.inf)
+        if self.face_count == 0:
+            return np.full(len(xy), np.nan)
+
+        x0, y0 = self.origin
+        fx = (xy[:, 0] - x0) / self.cell_size
+        fy = (xy[:, 1] - y0) / self.cell_size
+        inside = (fx >= 0) & (fx < nx) & (fy >= 0) & (fy < ny)
+        queries = np.flatnonzero(inside)
+        cells = fy[queries].astype(np.int64) * nx + fx[queries].astype(np.int64)
+
+        # Pair every query with the triangles bucketed in its cell
+        starts = self._cell_start[cells]
+        counts = self._cell_start[cells + 1] - starts
+        pair_query = np.repeat(queries, counts)
+        offsets = np.arange(len(pair_query)) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_face = self._cell_faces[np.repeat(starts, counts) + offsets]
+
+        dx = xy[pair_query, 0] - self._x0[pair_face]
+        dy = xy[pair_query, 1] - self._y0[pair_face]
+        inverse = self._inverse[pair_face]
+        u = inverse[:, 0] * dx + inverse[:, 1] * dy
+        v = inverse[:, 2] * dx + inverse[:, 3] * dy
+        hit = (u >= -EDGE_TOLERANCE) & (v >= -EDGE_TOLERANCE) & (u + v <= 1.0 + EDGE_TOLERANCE)
+
+        pair_face = pair_face[hit]
+        z = (self._z0[pair_face] + u[hit] * self._dz1[pair_face]
+             + v[hit] * self._dz2[pair_face])
+        # Highest surface wins, as for a ray cast from above
+        np.maximum.at(heights, pair_query[hit], z)
+
+        heights[np.isneginf(heights)] = np.nan
+        return heights
+
+
+def terrain_data_hash(vertices: np.ndarray, faces: np.ndarray) -> str:
+    """
+    Hash terrain vertex and face data.
+
+    Args:
+        vertices: (V, 3) vertex coordinates
+        faces: (F, 3) triangle vertex indices
+
+    Returns:
+        Hex digest identifying the terrain geometry
+    """
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(vertices, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(faces, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+_index_cache: "OrderedDict[Tuple[str, Optional[float]], TerrainIndex]" = OrderedDict()
+
+
+def get_terrain_index(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    cell_size: Optional[float] = None,
+    data_hash: Optional[str] = None
+) -> TerrainIndex:
+    """
+    Get the index for a terrain, building it only if not cached.
+
+    Args:
+        vertices: (V, 3) vertex coordinates
+        faces: (F, 3) triangle vertex indices
+        cell_size: Grid cell edge length (m); automatic if None
+        data_hash: Precomputed terrain_data_hash(), if known
+
+    Returns:
+        TerrainIndex for the terrain
+    """
+    key = (data_hash or terrain_data_hash(vertices, faces), cell_size)
+    index = _index_cache.get(key)
+    if index is not None:
+        _index_cache.move_to_end(key)
+        return index
+
+    index = TerrainIndex(vertices, faces, cell_size)
+    _index_cache[key] = index
+    while len(_index_cache) > MAX_CACHED_INDEXES:
+        _index_cache.popitem(last=False)
+    return index
+
+
+def clear_terrain_index_cache() -> None:
+    """Drop all cached terrain indexes."""
+    _index_cache.clear()
+
+
+__all__ = [
+    "TerrainIndex",
+    "terrain_data_hash",
+    "get_terrain_index",
+    "clear_terrain_index_cache",
+    "QUERY_CHUNK_SIZE",
+    "MAX_CACHED_INDEXES",
+]
@@ -629,6 +629,16 @@ class Georeference:
         """Check if the file has georeferencing set up."""
         pass
 
+    def get_georeferencing(cls) -> Optional[Any]:
+        """
+        Get the georeferencing of the current IFC file.
+
+        Returns:
+            NativeIfcGeoreferencing for map/local conversions, or None if
+            the file has no georeferencing set up
+        """
+        pass
+
     def get_crs(cls) -> Optional[Dict]:
         """
         Get current CRS information.
@@ -873,6 +883,69 @@ class Corridor:
         pass
 
 
+@interface
+class Terrain:
+    """
+    Interface for existing-ground terrain operations.
+
+    Turns terrain meshes and raster DEMs into sources answering batch
+    elevation queries.
+    """
+
+    def get_mesh_arrays(cls, obj: "bpy.types.Object") -> Tuple[Any, Any]:
+        """
+        Get world-space triangle data of a terrain mesh.
+
+        Args:
+            obj: Terrain mesh object (modifiers applied)
+
+        Returns:
+            Tuple of ((V, 3) vertex array, (F, 3) triangle index array)
+        """
+        pass
+
+    def get_index(cls, obj: "bpy.types.Object") -> Any:
+        """
+        Get the elevation index for a terrain mesh.
+
+        Args:
+            obj: Terrain mesh object
+
+        Returns:
+            TerrainIndex with elevations_at(xy)
+        """
+        pass
+
+    def get_dem(cls, filepath: str) -> Any:
+        """
+        Open a raster DEM georeferenced to the project.
+
+        Args:
+            filepath: Path to the DEM file
+
+        Returns:
+            RasterTerrain with elevations_at(xy)
+        """
+        pass
+
+    def import_landxml_surface(
+        cls,
+        filepath: str,
+        surface_name: Optional[str] = None
+    ) -> "bpy.types.Object":
+        """
+        Import a LandXML TIN surface as a terrain mesh object.
+
+        Args:
+            filepath: Path to the LandXML file
+            surface_name: Surface to import; the first surface if None
+
+        Returns:
+            The created terrain mesh object
+        """
+        pass
+
+
 # =============================================================================
 # Utility Interfaces
 # =============================================================================
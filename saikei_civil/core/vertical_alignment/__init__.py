@@ -56,6 +56,9 @@ from .segments import (
     VerticalSegment,
 )
 
+# Batch evaluation table
+from .profile_table import VerticalProfileTable
+
 # Main manager class
 from .manager import VerticalAlignment
 
@@ -77,6 +80,7 @@ __all__ = [
     "TangentSegment",
     "ParabolicSegment",
     "VerticalAlignment",
+    "VerticalProfileTable",
     # Helper functions
     "calculate_required_curve_length",
     "calculate_k_value",
@@ -26,17 +26,30 @@ Provides the VerticalAlignment class for managing complete vertical alignments
 with PVI-based design, segment generation, and IFC export.
 """
 
-from typing import List, Optional, Tuple, Union
+import bisect
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
 import ifcopenshell
+import numpy as np
 
 from .constants import DESIGN_STANDARDS, MIN_K_CREST_80KPH, MIN_K_SAG_80KPH
 from .pvi import PVI
 from .segments import ParabolicSegment, TangentSegment, VerticalSegment
+from .profile_table import VerticalProfileTable
+from ..corridor_dependencies import get_change_tracker, changed_interval
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Segment chain states closer than this are considered unchanged
+CHAIN_TOLERANCE = 1e-9
+
+
+def _same_state(a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+    """Check whether two (station, elevation) chain states coincide."""
+    return abs(a[0] - b[0]) < CHAIN_TOLERANCE and abs(a[1] - b[1]) < CHAIN_TOLERANCE
+
 
 class VerticalAlignment:
     """Complete vertical alignment with PVI-based design.
@@ -66,8 +79,18 @@ class VerticalAlignment:
         >>> valign.add_pvi(450.0, 103.0, curve_length=100.0)
         >>> valign.add_pvi(650.0, 110.0)
         >>> elev = valign.get_elevation(300.0)
+
+    Bulk construction (segments generated once):
+        >>> valign = VerticalAlignment.from_pvis(
+        ...     [0.0, 200.0, 450.0, 650.0],
+        ...     [100.0, 105.0, 103.0, 110.0],
+        ...     [0.0, 80.0, 100.0, 0.0],
+        ... )
     """
 
+    # Stations closer than this are considered the same PVI
+    STATION_TOLERANCE = 1e-6
+
     def __init__(
         self,
         name: str = "Vertical Alignment",
@@ -85,8 +108,25 @@ class VerticalAlignment:
         self.design_speed = design_speed
         self.description = description
 
+        # GlobalId of the parent IfcAlignment; edits are reported to
+        # dependent corridors when set
+        self.alignment_guid: Optional[str] = None
+
         self.pvis: List[PVI] = []
         self.segments: List[VerticalSegment] = []
+        self._profile_table: Optional[VerticalProfileTable] = None
+
+        # defer_rebuild() nesting depth and whether a rebuild was skipped
+        self._defer_depth = 0
+        self._rebuild_pending = False
+
+        # Sorted PVI stations for bisect lookups (parallel to self.pvis)
+        self._stations: List[float] = []
+
+        # Per PVI pair i (PVI i to i+1): index of its first segment and the
+        # (station, elevation) where its last segment ends
+        self._pair_starts: List[int] = []
+        self._pair_ends: List[Tuple[float, float]] = []
 
         # Design standards based on speed
         if design_speed in DESIGN_STANDARDS:
@@ -138,9 +178,47 @@ class VerticalAlignment:
         # Sort segments by StartDistAlong
         segments.sort(key=lambda s: s.StartDistAlong)
 
-        # Reconstruct PVIs from segments
-        valign._reconstruct_pvis_from_segments(segments)
+        # Reconstruct PVIs from segments (segments generated once at the end)
+        with valign.defer_rebuild():
+            valign._reconstruct_pvis_from_segments(segments)
+
+        for rel in getattr(ifc_vertical, 'Nests', None) or []:
+            if rel.RelatingObject.is_a("IfcAlignment"):
+                valign.alignment_guid = rel.RelatingObject.GlobalId
+
+        return valign
+
+    @classmethod
+    def from_pvis(
+        cls,
+        stations: Sequence[float],
+        elevations: Sequence[float],
+        curve_lengths: Optional[Sequence[float]] = None,
+        name: str = "Vertical Alignment",
+        design_speed: float = 80.0,
+        description: str = ""
+    ) -> "VerticalAlignment":
+        """Create a VerticalAlignment from PVI arrays in one pass.
+
+        Equivalent to calling add_pvi() for every PVI, but the input is
+        validated and sorted once and segments are generated once.
 
+        Args:
+            stations: PVI stations (m), any order
+            elevations: PVI elevations (m)
+            curve_lengths: Vertical curve lengths (m), None = no curves
+            name: Alignment name
+            design_speed: Design speed for K-value validation (km/h)
+            description: Optional description
+
+        Returns:
+            VerticalAlignment object
+
+        Raises:
+            ValueError: If array lengths differ or two PVIs share a station
+        """
+        valign = cls(name=name, design_speed=design_speed, description=description)
+        valign.add_pvis(stations, elevations, curve_lengths)
         return valign
 
     def _reconstruct_pvis_from_segments(
@@ -284,9 +362,8 @@ class VerticalAlignment:
             ValueError: If PVI conflicts with existing PVI
         """
         # Check for duplicate station
-        for existing in self.pvis:
-            if abs(existing.station - station) < 1e-6:
-                raise ValueError(f"PVI already exists at station {station:.3f}m")
+        if self._index_near(station, self.STATION_TOLERANCE) is not None:
+            raise ValueError(f"PVI already exists at station {station:.3f}m")
 
         pvi = PVI(
             station=station,
@@ -296,18 +373,157 @@ class VerticalAlignment:
         )
 
         # Insert in sorted order
-        insert_idx = 0
-        for i, existing in enumerate(self.pvis):
-            if station > existing.station:
-                insert_idx = i + 1
-
+        insert_idx = bisect.bisect_right(self._station_index(), station)
+        self._stations.insert(insert_idx, station)
         self.pvis.insert(insert_idx, pvi)
 
         # Recalculate everything
+        self._rebuild()
+
+        return pvi
+
+    def add_pvis(
+        self,
+        stations: Sequence[float],
+        elevations: Sequence[float],
+        curve_lengths: Optional[Sequence[float]] = None
+    ) -> List[PVI]:
+        """Add many PVIs at once.
+
+        All PVIs are validated against each other and the existing PVIs,
+        merged in station order, and grades and segments are recalculated
+        once. Nothing is added if validation fails.
+
+        Args:
+            stations: PVI stations (m), any order
+            elevations: PVI elevations (m)
+            curve_lengths: Vertical curve lengths (m), None = no curves
+
+        Returns:
+            The created PVI objects, in input order
+
+        Raises:
+            ValueError: If array lengths differ or a station is duplicated
+        """
+        stations = np.asarray(stations, dtype=float).ravel()
+        elevations = np.asarray(elevations, dtype=float).ravel()
+        if curve_lengths is None:
+            curve_lengths = np.zeros_like(stations)
+        else:
+            curve_lengths = np.asarray(curve_lengths, dtype=float).ravel()
+
+        if not (len(stations) == len(elevations) == len(curve_lengths)):
+            raise ValueError(
+                f"PVI arrays differ in length: {len(stations)} stations, "
+                f"{len(elevations)} elevations, {len(curve_lengths)} curve lengths"
+            )
+
+        new_pvis = [
+            PVI(station=station, elevation=elevation, curve_length=curve_length)
+            for station, elevation, curve_length in zip(
+                stations.tolist(), elevations.tolist(), curve_lengths.tolist()
+            )
+        ]
+
+        # Stable sort keeps existing PVIs ahead of new ones at equal stations
+        merged = sorted(self.pvis + new_pvis, key=lambda p: p.station)
+        merged_stations = np.array([p.station for p in merged])
+        duplicates = np.flatnonzero(np.diff(merged_stations) < self.STATION_TOLERANCE)
+        if len(duplicates):
+            station = merged_stations[duplicates[0]]
+            raise ValueError(f"PVI already exists at station {station:.3f}m")
+
+        self.pvis[:] = merged
+        self._stations = merged_stations.tolist()
+        self._rebuild()
+
+        return new_pvis
+
+    @contextmanager
+    def defer_rebuild(self) -> Iterator["VerticalAlignment"]:
+        """Defer grade and segment recalculation until the block exits.
+
+        Use for scripted edits that call add_pvi()/update_pvi()/remove_pvi()
+        many times. Segments and elevation queries are stale inside the
+        block; they are regenerated once on exit (also if the block raises).
+        Blocks may be nested.
+
+        Example:
+            >>> with valign.defer_rebuild():
+            ...     for station, elevation in survey:
+            ...         valign.add_pvi(station, elevation)
+
+        Yields:
+            This alignment
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+            if self._defer_depth == 0 and self._rebuild_pending:
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recalculate grades and segments, unless inside defer_rebuild()."""
+        if self._defer_depth > 0:
+            self._rebuild_pending = True
+            return
+
+        self._rebuild_pending = False
+        previous = self._segment_table() if self._reports_changes() else None
+
+        self._stations = [pvi.station for pvi in self.pvis]
         self._calculate_grades()
         self._generate_segments()
 
-        return pvi
+        if previous is not None:
+            interval = changed_interval(previous, self._segment_table())
+            if interval is not None:
+                get_change_tracker().alignment_changed(self.alignment_guid, *interval)
+
+    def _reports_changes(self) -> bool:
+        """Whether any corridor depends on this profile's alignment."""
+        return (
+            self.alignment_guid is not None
+            and get_change_tracker().is_tracking_alignment(self.alignment_guid)
+        )
+
+    def _segment_table(
+        self,
+        segments: Optional[List[VerticalSegment]] = None
+    ) -> List[Tuple[float, float, Tuple]]:
+        """Station range and shape of each segment, for change detection.
+
+        Args:
+            segments: Segments to describe (default: all segments)
+        """
+        if segments is None:
+            segments = self.segments
+        return [
+            (seg.start_station, seg.end_station, (
+                seg.segment_type,
+                seg.start_elevation,
+                getattr(seg, 'grade', None),
+                getattr(seg, 'g1', None),
+                getattr(seg, 'g2', None),
+            ))
+            for seg in segments
+        ]
+
+    def _station_index(self) -> List[float]:
+        """Sorted PVI stations, resynchronized if self.pvis was replaced."""
+        if len(self._stations) != len(self.pvis):
+            self._stations = [pvi.station for pvi in self.pvis]
+        return self._stations
+
+    def _index_near(self, station: float, tolerance: float) -> Optional[int]:
+        """Binary search for the first PVI within tolerance of a station."""
+        stations = self._station_index()
+        i = bisect.bisect_right(stations, station - tolerance)
+        if i < len(stations) and stations[i] < station + tolerance:
+            return i
+        return None
 
     def remove_pvi(self, index: int) -> None:
         """Remove PVI at given index.
@@ -324,8 +540,8 @@ class VerticalAlignment:
             )
 
         self.pvis.pop(index)
-        self._calculate_grades()
-        self._generate_segments()
+        self._station_index().pop(index)
+        self._rebuild()
 
     def update_pvi(
         self,
@@ -336,6 +552,10 @@ class VerticalAlignment:
     ) -> None:
         """Update PVI parameters.
 
+        If the PVI keeps its place in station order, only the grades and
+        segments next to it are recalculated (see _rebuild_around()).
+        Otherwise the PVIs are re-sorted and everything is rebuilt.
+
         Args:
             index: Index of PVI to update
             station: New station (None = keep existing)
@@ -349,10 +569,17 @@ class VerticalAlignment:
             raise IndexError(f"PVI index {index} out of range")
 
         pvi = self.pvis[index]
+        reordered = False
 
         if station is not None:
             pvi.station = station
-            self.pvis.sort(key=lambda p: p.station)
+            after_prev = index == 0 or self.pvis[index - 1].station < station
+            before_next = index == len(self.pvis) - 1 or station < self.pvis[index + 1].station
+            if after_prev and before_next:
+                self._station_index()[index] = station
+            else:
+                self.pvis.sort(key=lambda p: p.station)
+                reordered = True
 
         if elevation is not None:
             pvi.elevation = elevation
@@ -360,8 +587,10 @@ class VerticalAlignment:
         if curve_length is not None:
             pvi.curve_length = curve_length
 
-        self._calculate_grades()
-        self._generate_segments()
+        if reordered:
+            self._rebuild()
+        else:
+            self._rebuild_around(index)
 
     def get_pvi(self, index: int) -> PVI:
         """Get PVI by index.
@@ -389,26 +618,30 @@ class VerticalAlignment:
         Returns:
             PVI index or None if not found
         """
-        for i, pvi in enumerate(self.pvis):
-            if abs(pvi.station - station) < tolerance:
-                return i
-        return None
+        return self._index_near(station, tolerance)
 
     # ========================================================================
     # GRADE CALCULATIONS
     # ========================================================================
 
-    def _calculate_grades(self) -> None:
-        """Calculate grades between all adjacent PVIs.
+    def _calculate_grades(self, first_pair: int = 0, last_pair: Optional[int] = None) -> None:
+        """Calculate grades between adjacent PVIs.
 
         This is called automatically after PVI changes.
         Sets grade_in and grade_out for each PVI.
+
+        Args:
+            first_pair: First PVI pair (PVI i to i+1) to recalculate
+            last_pair: Last PVI pair to recalculate (None = last pair)
         """
         if len(self.pvis) < 2:
             return
 
+        if last_pair is None:
+            last_pair = len(self.pvis) - 2
+
         # Calculate grade between each pair of PVIs
-        for i in range(len(self.pvis) - 1):
+        for i in range(first_pair, last_pair + 1):
             pvi1 = self.pvis[i]
             pvi2 = self.pvis[i + 1]
 
@@ -433,7 +666,7 @@ class VerticalAlignment:
         self.pvis[-1].grade_out = self.pvis[-1].grade_in
 
         # Calculate K-values for PVIs with curves
-        for pvi in self.pvis:
+        for pvi in self.pvis[first_pair:last_pair + 2]:
             if (pvi.curve_length > 0 and
                 pvi.grade_in is not None and
                 pvi.grade_out is not None):
@@ -452,68 +685,174 @@ class VerticalAlignment:
         Creates tangent and parabolic segments based on PVI configuration.
         """
         self.segments.clear()
+        self._profile_table = None
+        self._pair_starts = []
+        self._pair_ends = []
 
         if len(self.pvis) < 2:
             return
 
-        current_station = self.pvis[0].station
-        current_elevation = self.pvis[0].elevation
+        current = (self.pvis[0].station, self.pvis[0].elevation)
 
         for i in range(len(self.pvis) - 1):
-            pvi1 = self.pvis[i]
-            pvi2 = self.pvis[i + 1]
-
-            grade = pvi1.grade_out
-
-            if pvi2.curve_length > 0:
-                bvc_station = pvi2.bvc_station
+            self._pair_starts.append(len(self.segments))
+            current = self._generate_pair(i, current, self.segments)
+            self._pair_ends.append(current)
 
-                # Create tangent from current position to BVC
-                if bvc_station > current_station:
-                    tangent = TangentSegment(
-                        start_station=current_station,
-                        end_station=bvc_station,
-                        start_elevation=current_elevation,
-                        grade=grade
-                    )
-                    self.segments.append(tangent)
+    def _generate_pair(
+        self,
+        i: int,
+        start: Tuple[float, float],
+        out: List[VerticalSegment]
+    ) -> Tuple[float, float]:
+        """Generate the segments from PVI i to PVI i+1.
 
-                    current_station = bvc_station
-                    current_elevation = tangent.end_elevation
+        Args:
+            i: Index of the first PVI of the pair
+            start: (station, elevation) where the previous pair ended
+            out: List the new segments are appended to
 
-                # Create parabolic curve
-                evc_station = pvi2.evc_station
+        Returns:
+            (station, elevation) where the last new segment ends
+        """
+        current_station, current_elevation = start
+        pvi1 = self.pvis[i]
+        pvi2 = self.pvis[i + 1]
 
-                curve = ParabolicSegment(
-                    start_station=current_station,
-                    end_station=evc_station,
-                    start_elevation=current_elevation,
-                    g1=pvi2.grade_in,
-                    g2=pvi2.grade_out,
-                    pvi_station=pvi2.station
-                )
-                self.segments.append(curve)
+        grade = pvi1.grade_out
 
-                current_station = evc_station
-                current_elevation = curve.end_elevation
+        if pvi2.curve_length > 0:
+            bvc_station = pvi2.bvc_station
 
-            else:
-                # No curve at PVI2 - create tangent segment
+            # Create tangent from current position to BVC
+            if bvc_station > current_station:
                 tangent = TangentSegment(
                     start_station=current_station,
-                    end_station=pvi2.station,
+                    end_station=bvc_station,
                     start_elevation=current_elevation,
                     grade=grade
                 )
-                self.segments.append(tangent)
+                out.append(tangent)
 
-                current_station = pvi2.station
+                current_station = bvc_station
                 current_elevation = tangent.end_elevation
 
+            # Create parabolic curve
+            evc_station = pvi2.evc_station
+
+            curve = ParabolicSegment(
+                start_station=current_station,
+                end_station=evc_station,
+                start_elevation=current_elevation,
+                g1=pvi2.grade_in,
+                g2=pvi2.grade_out,
+                pvi_station=pvi2.station
+            )
+            out.append(curve)
+
+            return evc_station, curve.end_elevation
+
+        # No curve at PVI2 - create tangent segment
+        tangent = TangentSegment(
+            start_station=current_station,
+            end_station=pvi2.station,
+            start_elevation=current_elevation,
+            grade=grade
+        )
+        out.append(tangent)
+
+        return pvi2.station, tangent.end_elevation
+
+    def _rebuild_around(self, index: int) -> None:
+        """Recalculate grades and segments next to an edited PVI.
+
+        Editing PVI k changes the grades of pairs k-1 and k, and with them
+        the segments of pairs k-2 (curve at PVI k-1) through k (curve at
+        PVI k+1). Those pairs are regenerated; later pairs are regenerated
+        only until the segment chain meets its previous end point again,
+        so the result matches a full rebuild.
+
+        Args:
+            index: Index of the edited PVI (station order unchanged)
+        """
+        if self._defer_depth > 0:
+            self._rebuild_pending = True
+            return
+
+        count = len(self.pvis)
+        if count < 2 or len(self._pair_ends) != count - 1:
+            self._rebuild()
+            return
+
+        self._calculate_grades(max(index - 1, 0), min(index, count - 2))
+
+        first = max(index - 2, 0)
+        last = min(index, count - 2)
+        old_ends = self._pair_ends
+
+        if first == 0:
+            current = (self.pvis[0].station, self.pvis[0].elevation)
+        else:
+            current = old_ends[first - 1]
+
+        new_segments: List[VerticalSegment] = []
+        new_starts: List[int] = []
+        new_ends: List[Tuple[float, float]] = []
+        seg_start = self._pair_starts[first]
+
+        stop = first
+        while stop < count - 1:
+            # Past the edited pairs, stop once the chain rejoins the old one
+            if stop > last and _same_state(current, old_ends[stop - 1]):
+                break
+            new_starts.append(seg_start + len(new_segments))
+            current = self._generate_pair(stop, current, new_segments)
+            new_ends.append(current)
+            stop += 1
+
+        seg_stop = self._pair_starts[stop] if stop < count - 1 else len(self.segments)
+        old_segments = self.segments[seg_start:seg_stop]
+        self.segments[seg_start:seg_stop] = new_segments
+
+        shift = len(new_segments) - (seg_stop - seg_start)
+        if shift:
+            for j in range(stop, count - 1):
+                self._pair_starts[j] += shift
+        self._pair_starts[first:stop] = new_starts
+        self._pair_ends[first:stop] = new_ends
+
+        self._profile_table = None
+
+        if self._reports_changes():
+            interval = changed_interval(
+                self._segment_table(old_segments),
+                self._segment_table(new_segments),
+            )
+            if interval is not None:
+                get_change_tracker().alignment_changed(self.alignment_guid, *interval)
+
     # ========================================================================
     # ELEVATION & GRADE QUERIES
     # ========================================================================
 
+    @property
+    def profile_table(self) -> VerticalProfileTable:
+        """Coefficient table for the current segments.
+
+        Built lazily and discarded whenever segments are regenerated
+        (add_pvi, update_pvi, remove_pvi).
+        """
+        if self._profile_table is None:
+            self._profile_table = VerticalProfileTable.from_segments(self.segments)
+        return self._profile_table
+
+    def _raise_out_of_range(self, station: float) -> None:
+        """Raise the standard error for a station outside the profile."""
+        raise ValueError(
+            f"Station {station:.3f}m outside alignment range "
+            f"[{self.start_station:.3f}, {self.end_station:.3f}]"
+        )
+
     def get_elevation(self, station: float) -> float:
         """Get elevation at any station along alignment.
 
@@ -529,14 +868,10 @@ class VerticalAlignment:
         if len(self.segments) == 0:
             raise ValueError("No segments generated (need at least 2 PVIs)")
 
-        for segment in self.segments:
-            if segment.contains_station(station):
-                return segment.get_elevation(station)
-
-        raise ValueError(
-            f"Station {station:.3f}m outside alignment range "
-            f"[{self.start_station:.3f}, {self.end_station:.3f}]"
-        )
+        elevation = self.profile_table.elevation_at(station)
+        if elevation is None:
+            self._raise_out_of_range(station)
+        return elevation
 
     def get_grade(self, station: float) -> float:
         """Get grade at any station along alignment.
@@ -553,14 +888,32 @@ class VerticalAlignment:
         if len(self.segments) == 0:
             raise ValueError("No segments generated (need at least 2 PVIs)")
 
-        for segment in self.segments:
-            if segment.contains_station(station):
-                return segment.get_grade(station)
+        grade = self.profile_table.grade_at(station)
+        if grade is None:
+            self._raise_out_of_range(station)
+        return grade
 
-        raise ValueError(
-            f"Station {station:.3f}m outside alignment range "
-            f"[{self.start_station:.3f}, {self.end_station:.3f}]"
-        )
+    def elevations(self, stations) -> np.ndarray:
+        """Get elevations at many stations in one vectorized call.
+
+        Args:
+            stations: Array-like of stations (m)
+
+        Returns:
+            Elevation array; NaN for stations outside the alignment range
+        """
+        return self.profile_table.elevations(stations)
+
+    def grades(self, stations) -> np.ndarray:
+        """Get grades at many stations in one vectorized call.
+
+        Args:
+            stations: Array-like of stations (m)
+
+        Returns:
+            Grade array (decimal); NaN for stations outside the alignment range
+        """
+        return self.profile_table.grades(stations)
 
     def get_profile_points(
         self,
@@ -579,46 +932,31 @@ class VerticalAlignment:
         if len(self.segments) == 0:
             return []
 
-        points = []
-
         # Sample at regular intervals
-        station = self.start_station
-        while station <= self.end_station:
-            try:
-                elev = self.get_elevation(station)
-                grade = self.get_grade(station)
-                points.append((station, elev, grade))
-            except ValueError:
-                pass
-
-            station += interval
+        sample_count = int((self.end_station - self.start_station) // interval) + 1
+        stations = self.start_station + np.arange(sample_count) * interval
 
         # Add exact PVI locations if requested
         if include_pvis:
-            pvi_points = []
-            for pvi in self.pvis:
-                try:
-                    elev = self.get_elevation(pvi.station)
-                    grade = self.get_grade(pvi.station)
-                    pvi_points.append((pvi.station, elev, grade))
-                except ValueError:
-                    pass
-
-            # Merge and sort
-            all_points = points + pvi_points
-            all_points.sort(key=lambda p: p[0])
-
-            # Remove duplicates
-            unique_points = []
-            last_sta = -float('inf')
-            for sta, elev, grade in all_points:
-                if abs(sta - last_sta) > 1e-6:
-                    unique_points.append((sta, elev, grade))
-                    last_sta = sta
-
-            return unique_points
-
-        return points
+            pvi_stations = np.array([pvi.station for pvi in self.pvis])
+            stations = np.sort(np.concatenate([stations, pvi_stations]), kind='stable')
+
+            # Remove duplicates (keep first of any run closer than 1e-6)
+            if len(stations) > 1:
+                keep = np.empty(len(stations), dtype=bool)
+                keep[0] = True
+                keep[1:] = np.diff(stations) > 1e-6
+                stations = stations[keep]
+
+        elevations = self.elevations(stations)
+        grades = self.grades(stations)
+        valid = ~np.isnan(elevations)
+
+        return list(zip(
+            stations[valid].tolist(),
+            elevations[valid].tolist(),
+            grades[valid].tolist(),
+        ))
 
     # ========================================================================
     # PROPERTIES
@@ -754,6 +1092,8 @@ class VerticalAlignment:
 
         # Link to horizontal if provided
         if horizontal_alignment:
+            if horizontal_alignment.is_a("IfcAlignment"):
+                self.alignment_guid = horizontal_alignment.GlobalId
             ifc_file.create_entity(
                 "IfcRelNests",
                 GlobalId=ifcopenshell.guid.new(),
@@ -972,6 +1312,10 @@ class VerticalAlignment:
                         if (shape_rep.is_a("IfcShapeRepresentation") and
                             shape_rep.Items):
                             for item in shape_rep.Items:
+                                # A previous export leaves only the gradient
+                                # curve; the horizontal curve is its base
+                                if item.is_a("IfcGradientCurve"):
+                                    return item.BaseCurve
                                 if item.is_a("IfcCompositeCurve"):
                                     return item
 
@@ -1055,6 +1399,10 @@ class VerticalAlignment:
                                 if item.is_a("IfcGradientCurve"):
                                     self._remove_gradient_curve(ifc_file, item)
                                 elif item.is_a("IfcCompositeCurve"):
+                                    # The horizontal curve lives on as the
+                                    # new gradient curve's BaseCurve
+                                    if item == gradient_curve.BaseCurve:
+                                        continue
                                     self._remove_composite_curve(ifc_file, item)
                         ifc_file.remove(shape_rep_old)
                     ifc_file.remove(old_rep)
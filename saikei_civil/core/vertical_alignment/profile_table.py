@@ -0,0 +1,372 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Vertical Profile Table Module
+==============================
+
+Coefficient table for evaluating a vertical profile at many stations at once.
+
+Every vertical segment (tangent or parabolic curve) is reduced to the same
+quadratic form:
+
+    E(x) = E0 + g1*x + A*x^2
+    g(x) = g1 + 2*A*x
+
+where x is the distance from the segment start. Tangents have A = 0 and
+parabolic curves have A = (g2 - g1) / (2L).
+
+Tables built from IFC carry a content fingerprint so that repeated corridor
+runs on an unchanged IfcAlignmentVertical reuse the same snapshot.
+"""
+
+import bisect
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .segments import ParabolicSegment, VerticalSegment
+
+# Same station tolerance as VerticalSegment.contains_station()
+STATION_TOLERANCE = 1e-6
+
+# Number of IFC vertical layout snapshots kept by from_ifc_vertical()
+MAX_IFC_SNAPSHOTS = 16
+
+# Snapshots of IFC vertical layouts, keyed by IfcAlignmentVertical GlobalId
+_ifc_snapshots: "OrderedDict[str, VerticalProfileTable]" = OrderedDict()
+
+
+def _read_ifc_records(ifc_segments: Sequence) -> List[tuple]:
+    """Read the parameters of each IfcAlignmentVerticalSegment once."""
+    return [
+        (
+            seg.id(),
+            seg.StartDistAlong,
+            seg.HorizontalLength,
+            seg.StartHeight,
+            seg.StartGradient,
+            seg.EndGradient,
+            seg.PredefinedType,
+        )
+        for seg in ifc_segments
+    ]
+
+
+def _records_fingerprint(records: List[tuple]) -> str:
+    """Content hash of segment records (entity ids and parameters)."""
+    return hashlib.sha1(repr(records).encode()).hexdigest()
+
+
+class VerticalProfileTable:
+    """Array-backed coefficient table for a vertical profile.
+
+    Segments are located with a binary search over segment end stations.
+    A station exactly on a segment boundary belongs to the earlier segment,
+    matching the segment-by-segment contains_station() walk.
+
+    Attributes:
+        start_stations: Station at the start of each segment
+        end_stations: Station at the end of each segment
+        start_elevations: Elevation at the start of each segment
+        g1: Grade at the start of each segment (decimal)
+        a: Quadratic coefficient of each segment (0 for tangents)
+        fingerprint: Content hash of the source IFC parameters (IFC tables only)
+
+    The arrays are read-only; a table is an immutable snapshot.
+    """
+
+    def __init__(
+        self,
+        start_stations: Sequence[float],
+        end_stations: Sequence[float],
+        start_elevations: Sequence[float],
+        g1: Sequence[float],
+        a: Sequence[float]
+    ):
+        """Initialize from per-segment coefficient arrays.
+
+        Args:
+            start_stations: Segment start stations (sorted)
+            end_stations: Segment end stations
+            start_elevations: Segment start elevations
+            g1: Segment start grades
+            a: Segment quadratic coefficients
+        """
+        self.start_stations = np.asarray(start_stations, dtype=float)
+        self.end_stations = np.asarray(end_stations, dtype=float)
+        self.start_elevations = np.asarray(start_elevations, dtype=float)
+        self.g1 = np.asarray(g1, dtype=float)
+        self.a = np.asarray(a, dtype=float)
+        self.fingerprint: Optional[str] = None
+
+        for array in (self.start_stations, self.end_stations,
+                      self.start_elevations, self.g1, self.a):
+            array.setflags(write=False)
+
+        self._search_ends = self.end_stations + STATION_TOLERANCE
+        self._end_list: List[float] = self._search_ends.tolist()
+        self._rows: List[Tuple[float, float, float, float]] = list(zip(
+            self.start_stations.tolist(),
+            self.start_elevations.tolist(),
+            self.g1.tolist(),
+            self.a.tolist(),
+        ))
+
+    @classmethod
+    def from_segments(cls, segments: Sequence[VerticalSegment]) -> "VerticalProfileTable":
+        """Build a table from generated TangentSegment/ParabolicSegment objects.
+
+        Args:
+            segments: Vertical segments sorted by station
+
+        Returns:
+            VerticalProfileTable instance
+        """
+        starts, ends, elevations, grades, coefficients = [], [], [], [], []
+
+        for segment in segments:
+            starts.append(segment.start_station)
+            ends.append(segment.end_station)
+            elevations.append(segment.start_elevation)
+
+            if isinstance(segment, ParabolicSegment):
+                grades.append(segment.g1)
+                coefficients.append((segment.g2 - segment.g1) / (2.0 * segment.length))
+            else:
+                grades.append(segment.grade)
+                coefficients.append(0.0)
+
+        return cls(starts, ends, elevations, grades, coefficients)
+
+    @classmethod
+    def from_ifc_segments(cls, ifc_segments: Sequence) -> "VerticalProfileTable":
+        """Build a snapshot from IfcAlignmentVerticalSegment entities.
+
+        Each entity's attributes are read exactly once. Zero-length segments
+        (BSI ALB015 endpoints) are skipped. CIRCULARARC segments are
+        approximated by the parabola between their start and end gradients.
+
+        Args:
+            ifc_segments: IfcAlignmentVerticalSegment entities (any order)
+
+        Returns:
+            VerticalProfileTable with its fingerprint set
+        """
+        records = _read_ifc_records(ifc_segments)
+        return cls._from_ifc_records(records, _records_fingerprint(records))
+
+    @classmethod
+    def _from_ifc_records(cls, records: List[tuple], fingerprint: str) -> "VerticalProfileTable":
+        """Build a snapshot from records read by _read_ifc_records()."""
+        rows = []
+        for _, start, length, height, g1, g2, segment_type in records:
+            if not length or length <= 0.0:
+                continue
+
+            if segment_type == "CONSTANTGRADIENT":
+                a = 0.0
+            else:
+                a = (g2 - g1) / (2.0 * length)
+
+            rows.append((start, length, height, g1, a))
+
+        rows.sort(key=lambda row: row[0])
+        params = np.array(rows, dtype=float).reshape(-1, 5)
+
+        table = cls(
+            params[:, 0],
+            params[:, 0] + params[:, 1],
+            params[:, 2],
+            params[:, 3],
+            params[:, 4],
+        )
+        table.fingerprint = fingerprint
+        return table
+
+    @classmethod
+    def from_ifc_vertical(cls, ifc_vertical) -> "VerticalProfileTable":
+        """Get a snapshot of an IfcAlignmentVertical's segment layout.
+
+        The segment attributes are fingerprinted before any table is built;
+        when the previous snapshot for the same entity has that fingerprint
+        it is returned as-is, so unchanged alignments share one table across
+        corridor runs. The most recent MAX_IFC_SNAPSHOTS layouts are kept.
+
+        Args:
+            ifc_vertical: IfcAlignmentVertical entity
+
+        Returns:
+            VerticalProfileTable with its fingerprint set
+        """
+        ifc_segments = []
+        for rel in ifc_vertical.IsNestedBy or []:
+            for obj in rel.RelatedObjects:
+                if obj.is_a("IfcAlignmentSegment"):
+                    params = getattr(obj, 'DesignParameters', None)
+                    if params and params.is_a("IfcAlignmentVerticalSegment"):
+                        ifc_segments.append(params)
+
+        records = _read_ifc_records(ifc_segments)
+        fingerprint = _records_fingerprint(records)
+
+        key = getattr(ifc_vertical, 'GlobalId', None)
+        if key:
+            cached = _ifc_snapshots.get(key)
+            if cached is not None and cached.fingerprint == fingerprint:
+                _ifc_snapshots.move_to_end(key)
+                return cached
+
+        table = cls._from_ifc_records(records, fingerprint)
+
+        if key:
+            _ifc_snapshots[key] = table
+            _ifc_snapshots.move_to_end(key)
+            while len(_ifc_snapshots) > MAX_IFC_SNAPSHOTS:
+                _ifc_snapshots.popitem(last=False)
+
+        return table
+
+    # ========================================================================
+    # PROPERTIES
+    # ========================================================================
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments in the table."""
+        return len(self._rows)
+
+    @property
+    def start_station(self) -> float:
+        """First station covered by the table."""
+        return self._rows[0][0] if self._rows else 0.0
+
+    @property
+    def end_station(self) -> float:
+        """Last station covered by the table."""
+        return float(self.end_stations[-1]) if self._rows else 0.0
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def locate(self, stations) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the segment containing each station.
+
+        Args:
+            stations: Array-like of stations
+
+        Returns:
+            Tuple of (segment_indices, in_range_mask). Indices for stations
+            outside the profile are clipped and must be ignored.
+        """
+        stations = np.asarray(stations, dtype=float)
+        count = self.segment_count
+        if count == 0:
+            indices = np.zeros(stations.shape, dtype=int)
+            return indices, np.zeros(stations.shape, dtype=bool)
+
+        indices = np.searchsorted(self._search_ends, stations, side='left')
+        in_range = indices < count
+        indices = np.minimum(indices, count - 1)
+        in_range &= stations >= self.start_stations[indices] - STATION_TOLERANCE
+        return indices, in_range
+
+    def elevations(self, stations) -> np.ndarray:
+        """Evaluate elevations at many stations in one call.
+
+        Args:
+            stations: Array-like of stations
+
+        Returns:
+            Elevation array; NaN where a station is outside the profile
+        """
+        stations = np.asarray(stations, dtype=float)
+        indices, in_range = self.locate(stations)
+        if self.segment_count == 0:
+            return np.full(stations.shape, np.nan)
+
+        x = stations - self.start_stations[indices]
+        result = self.start_elevations[indices] + x * (self.g1[indices] + self.a[indices] * x)
+        return np.where(in_range, result, np.nan)
+
+    def grades(self, stations) -> np.ndarray:
+        """Evaluate grades at many stations in one call.
+
+        Args:
+            stations: Array-like of stations
+
+        Returns:
+            Grade array (decimal); NaN where a station is outside the profile
+        """
+        stations = np.asarray(stations, dtype=float)
+        indices, in_range = self.locate(stations)
+        if self.segment_count == 0:
+            return np.full(stations.shape, np.nan)
+
+        x = stations - self.start_stations[indices]
+        result = self.g1[indices] + 2.0 * self.a[indices] * x
+        return np.where(in_range, result, np.nan)
+
+    def _find_row(self, station: float) -> Optional[Tuple[float, float, float, float]]:
+        """Find the coefficient row for a single station, or None if outside."""
+        i = bisect.bisect_left(self._end_list, station)
+        if i >= len(self._rows):
+            return None
+        row = self._rows[i]
+        if station < row[0] - STATION_TOLERANCE:
+            return None
+        return row
+
+    def elevation_at(self, station: float) -> Optional[float]:
+        """Evaluate the elevation at a single station.
+
+        Args:
+            station: Station (m)
+
+        Returns:
+            Elevation (m), or None if the station is outside the profile
+        """
+        row = self._find_row(station)
+        if row is None:
+            return None
+        start, elevation, g1, a = row
+        x = station - start
+        return elevation + x * (g1 + a * x)
+
+    def grade_at(self, station: float) -> Optional[float]:
+        """Evaluate the grade at a single station.
+
+        Args:
+            station: Station (m)
+
+        Returns:
+            Grade (decimal), or None if the station is outside the profile
+        """
+        row = self._find_row(station)
+        if row is None:
+            return None
+        start, _, g1, a = row
+        return g1 + 2.0 * a * (station - start)
+
+
+__all__ = ["VerticalProfileTable", "STATION_TOLERANCE"]
@@ -25,21 +25,25 @@ Contains Blender persistent handlers for:
 - Undo/redo synchronization
 - Edit tracking
 - File load/save events
+- Corridor regeneration after source edits
 """
 
 from .undo_handler import (
     register_handlers,
     unregister_handlers,
 )
+from . import corridor_handler
 
 
 def register():
     """Register all handlers."""
     register_handlers()
+    corridor_handler.register_handlers()
 
 
 def unregister():
     """Unregister all handlers."""
+    corridor_handler.unregister_handlers()
     unregister_handlers()
 
 
@@ -0,0 +1,159 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Corridor Regeneration Handlers
+==============================
+
+Connects the core CorridorChangeTracker to Blender.
+
+When an alignment, profile or constraint edit is reported to the tracker,
+the affected chunks of each dependent corridor are marked dirty right away
+and a short timer regenerates them once edits settle, so dragging a PI
+does not rebuild the corridor on every step.
+
+Handlers:
+    load_post: Re-registers corridors from their stored dependency records
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from ..core.corridor_dependencies import get_change_tracker
+from ..core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds without further edits before dirty chunks are rebuilt
+REGENERATION_DELAY = 0.5
+
+# Corridor ID -> last known parent object name, to avoid scanning all
+# objects on every change notification
+_corridor_objects = {}
+
+
+def _find_corridor(corridor_id: str):
+    """Find a corridor parent object by ID, remembering its current name."""
+    from .. import tool
+
+    parent_obj = tool.Corridor.find_corridor(corridor_id, _corridor_objects.get(corridor_id))
+    if parent_obj is None:
+        _corridor_objects.pop(corridor_id, None)
+    else:
+        _corridor_objects[corridor_id] = parent_obj.name
+    return parent_obj
+
+
+def _on_corridor_range_changed(corridor_id: str, start: float, end: float) -> None:
+    """Tracker listener: mark chunks dirty and (re)start the rebuild timer."""
+    from .. import tool
+
+    parent_obj = _find_corridor(corridor_id)
+    if parent_obj is None:
+        get_change_tracker().unregister(corridor_id)
+        return
+
+    tool.Corridor.mark_dirty_range(parent_obj, start, end)
+
+    if bpy.app.timers.is_registered(_regenerate_pending_corridors):
+        bpy.app.timers.unregister(_regenerate_pending_corridors)
+    bpy.app.timers.register(_regenerate_pending_corridors, first_interval=REGENERATION_DELAY)
+
+
+def _regenerate_pending_corridors():
+    """Timer callback: rebuild the dirty chunks of every changed corridor."""
+    from .. import tool
+
+    for corridor_id, ranges in get_change_tracker().take_pending().items():
+        parent_obj = _find_corridor(corridor_id)
+        if parent_obj is None:
+            continue
+        try:
+            stats = tool.Corridor.regenerate_from_dependency(parent_obj)
+        except Exception as e:
+            logger.error("Failed to regenerate corridor '%s': %s", parent_obj.name, e)
+            continue
+        if stats is not None:
+            logger.info(
+                "Regenerated corridor '%s' over %s (%d stations)",
+                parent_obj.name,
+                ", ".join(f"{a:.1f}-{b:.1f}" for a, b in ranges),
+                stats.station_count,
+            )
+
+    return None  # Don't repeat
+
+
+def register_corridor(parent_obj, dependency, constraint_manager=None) -> None:
+    """
+    Record a corridor's sources and start tracking them.
+
+    Args:
+        parent_obj: Corridor parent object
+        dependency: CorridorDependency for the corridor, with corridor_id
+            from tool.Corridor.get_corridor_id()
+        constraint_manager: Constraints the corridor was built with
+    """
+    from .. import tool
+
+    tool.Corridor.set_dependency(parent_obj, dependency)
+    _corridor_objects[dependency.corridor_id] = parent_obj.name
+    get_change_tracker().register(dependency, constraint_manager)
+
+
+@persistent
+def load_post_handler(filepath):
+    """Rebuild the tracker from the dependency records in the loaded file."""
+    from .. import tool
+
+    tracker = get_change_tracker()
+    tracker.clear()
+    _corridor_objects.clear()
+
+    for obj in bpy.data.objects:
+        if "saikei_corridor_dependency" not in obj:
+            continue
+        dependency = tool.Corridor.get_dependency(obj)
+        if dependency is None:
+            continue
+        # The saved constraints are the baseline, so the first edit after
+        # loading schedules only the constraints it changed
+        _corridor_objects[dependency.corridor_id] = obj.name
+        tracker.register(dependency, tool.Corridor.get_dependency_constraints(dependency))
+
+    logger.debug("Tracking %d corridors after load", len(tracker.dependencies()))
+
+
+def register_handlers():
+    """Register corridor regeneration handlers."""
+    get_change_tracker().add_listener(_on_corridor_range_changed)
+
+    if load_post_handler not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(load_post_handler)
+
+
+def unregister_handlers():
+    """Unregister corridor regeneration handlers."""
+    get_change_tracker().remove_listener(_on_corridor_range_changed)
+
+    if load_post_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post_handler)
+
+    if bpy.app.timers.is_registered(_regenerate_pending_corridors):
+        bpy.app.timers.unregister(_regenerate_pending_corridors)
@@ -54,6 +54,15 @@ from ..core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _is_corridor_object(obj) -> bool:
+    """Check if an object is a corridor mesh or a chunked corridor parent."""
+    if obj is None:
+        return False
+    if "saikei_chunk_length" in obj:
+        return True
+    return obj.type == 'MESH' and 'Corridor' in obj.name
+
+
 class SAIKEI_OT_generate_corridor(Operator):
     """
     Generate 3D corridor mesh from alignment and cross-section.
@@ -136,6 +145,7 @@ class SAIKEI_OT_generate_corridor(Operator):
                 CorridorParams,
             )
             from ..core.native_ifc_corridor import StationManager
+            from ..core.corridor_chunks import CorridorChunkLayout, DEFAULT_CHUNK_LENGTH
 
             # Get generation parameters from scene properties
             start_station = props.start_station
@@ -158,10 +168,18 @@ class SAIKEI_OT_generate_corridor(Operator):
                 self.report({'ERROR'}, f"Assembly '{assembly.name}' has no components. Add components first.")
                 return {'CANCELLED'}
 
-            # Generate stations using StationManager (pure Python from core)
-            station_manager = StationManager(alignment_3d, interval)
+            # Generate stations using StationManager (pure Python from core),
+            # with a station on every chunk seam
+            chunk_layout = CorridorChunkLayout(
+                start_station, end_station, props.chunk_length or DEFAULT_CHUNK_LENGTH
+            )
+            station_manager = StationManager(
+                alignment_3d, interval, chord_tolerance=props.chord_tolerance
+            )
             stations = station_manager.calculate_stations(
-                curve_densification_factor=curve_densification
+                curve_densification_factor=curve_densification,
+                constraint_manager=assembly_wrapper.constraint_manager,
+                chunk_boundaries=chunk_layout.boundaries
             )
 
             if len(stations) < 2:
@@ -186,7 +204,9 @@ class SAIKEI_OT_generate_corridor(Operator):
                 stations=stations,
                 assembly=assembly_wrapper,
                 name=corridor_name,
-                interval=interval
+                interval=interval,
+                alignment=alignment_3d,
+                use_alignment_curve=props.use_alignment_directrix
             )
 
             if corridor_solid is None:
@@ -195,23 +215,62 @@ class SAIKEI_OT_generate_corridor(Operator):
             else:
                 logger.info(f"Created IfcSectionedSolidHorizontal: #{ifc_summary.get('corridor_solid_id', '?')}")
                 logger.info(f"  Stations: {ifc_summary.get('station_count', 0)}")
+                logger.info(
+                    f"  Sections: {ifc_summary.get('cross_section_count', 0)} "
+                    f"along {ifc_summary.get('directrix_type', '?')}"
+                )
                 logger.info(f"  Length: {ifc_summary.get('length', 0):.1f}m")
 
             # ==========================================
             # Step 2: Generate Blender Mesh (Visualization)
             # ==========================================
-            # This creates the visible Blender mesh for working in the viewport
-            mesh_obj, stats = tool.Corridor.generate_corridor_mesh(
+            # This creates the visible Blender mesh for working in the viewport,
+            # split into station-range chunks under one parent object
+            arrays = None
+            if props.use_parallel:
+                arrays = tool.Corridor.compute_corridor_arrays(
+                    stations, alignment_3d, assembly_wrapper,
+                    min_parallel=props.parallel_min_stations
+                )
+
+            mesh_obj, stats = tool.Corridor.generate_chunked_corridor_mesh(
                 stations=stations,
                 assembly=assembly_wrapper,
                 name=corridor_name,
-                lod=lod
+                lod=lod,
+                chunk_length=props.chunk_length,
+                arrays=arrays
             )
 
             if mesh_obj is None:
                 self.report({'ERROR'}, "Failed to generate corridor mesh")
                 return {'CANCELLED'}
 
+            # Record what the corridor was built from so later alignment,
+            # profile or constraint edits regenerate only affected chunks
+            from ..core.corridor_dependencies import (
+                CorridorDependency,
+                constraint_fingerprint,
+            )
+            from ..handlers.corridor_handler import register_corridor
+
+            dependency = CorridorDependency(
+                corridor_id=tool.Corridor.get_corridor_id(mesh_obj),
+                alignment_guid=alignment.GlobalId,
+                assembly_name=assembly.name,
+                start_station=start_station,
+                end_station=end_station,
+                constraint_fingerprint=constraint_fingerprint(
+                    assembly_wrapper.constraint_manager
+                ),
+                lod=lod,
+                interval=interval,
+                curve_densification=curve_densification,
+                chord_tolerance=props.chord_tolerance,
+                chunk_length=props.chunk_length,
+            )
+            register_corridor(mesh_obj, dependency, assembly_wrapper.constraint_manager)
+
             # Get Road entity and object for proper hierarchy
             road = tool.Spatial.get_road()
             road_obj = None
@@ -283,18 +342,19 @@ class SAIKEI_OT_generate_corridor(Operator):
                 traceback.print_exc()
                 # IFC linkage failed, but we can continue
 
-            # Add to collection - MUST link mesh to make it visible
+            # Add to collection - MUST link the parent and its chunk meshes
+            # to make them visible
             collection_name = "Saikei Civil Project"
             if collection_name in bpy.data.collections:
                 collection = bpy.data.collections[collection_name]
-                if mesh_obj.name not in collection.objects:
-                    collection.objects.link(mesh_obj)
-                    logger.info(f"Linked corridor mesh to '{collection_name}' collection")
             else:
                 # Fallback to scene collection
-                if mesh_obj.name not in context.scene.collection.objects:
-                    context.scene.collection.objects.link(mesh_obj)
-                    logger.info("Linked corridor mesh to scene collection (fallback)")
+                collection = context.scene.collection
+                logger.info("Linking corridor to scene collection (fallback)")
+            for obj in [mesh_obj, *mesh_obj.children]:
+                if obj.name not in collection.objects:
+                    collection.objects.link(obj)
+            logger.info(f"Linked corridor to '{collection.name}' collection")
 
             # Parent to RoadPart object (or Road as fallback) for hierarchy
             parent_obj = road_part_obj if road_part_obj else road_obj
@@ -482,11 +542,7 @@ class SAIKEI_OT_update_corridor_lod(Operator):
     @classmethod
     def poll(cls, context):
         """Check if there's an active corridor object."""
-        return (
-            context.active_object and
-            context.active_object.type == 'MESH' and
-            'Corridor' in context.active_object.name
-        )
+        return _is_corridor_object(context.active_object)
     
     def invoke(self, context, event):
         """Show confirmation dialog."""
@@ -525,11 +581,7 @@ class SAIKEI_OT_export_corridor_ifc(Operator):
     @classmethod
     def poll(cls, context):
         """Check if there's a corridor to export."""
-        return (
-            context.active_object and
-            context.active_object.type == 'MESH' and
-            'Corridor' in context.active_object.name
-        )
+        return _is_corridor_object(context.active_object)
     
     def invoke(self, context, event):
         """Open file browser."""
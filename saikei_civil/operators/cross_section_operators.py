@@ -53,6 +53,23 @@ from ..core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _report_assembly_change(assembly) -> None:
+    """Schedule regeneration of corridors built from an edited assembly."""
+    from ..core.corridor_dependencies import get_change_tracker
+
+    get_change_tracker().assembly_changed(assembly.name)
+
+
+def _report_constraint_change(assembly) -> None:
+    """Schedule regeneration of corridor ranges affected by a constraint edit."""
+    from ..core.corridor_dependencies import get_change_tracker
+    from ..ui.cross_section_properties import assembly_constraints_to_manager
+
+    get_change_tracker().constraints_changed(
+        assembly.name, assembly_constraints_to_manager(assembly)
+    )
+
+
 def update_assembly_total_width(assembly):
     """
     Calculate and update the total width of an assembly.
@@ -450,6 +467,7 @@ class BC_OT_AddComponent(Operator):
 
         # Update total width
         update_assembly_total_width(assembly)
+        _report_assembly_change(assembly)
 
         self.report({'INFO'}, f"Added {comp.name}")
         return {'FINISHED'}
@@ -512,6 +530,7 @@ class BC_OT_RemoveComponent(Operator):
 
             # Update total width
             update_assembly_total_width(assembly)
+            _report_assembly_change(assembly)
 
             self.report({'INFO'}, f"Removed component '{name}'")
             return {'FINISHED'}
@@ -542,6 +561,7 @@ class BC_OT_MoveComponentUp(Operator):
         idx = assembly.active_component_index
         assembly.components.move(idx, idx - 1)
         assembly.active_component_index = idx - 1
+        _report_assembly_change(assembly)
 
         return {'FINISHED'}
 
@@ -568,6 +588,7 @@ class BC_OT_MoveComponentDown(Operator):
         idx = assembly.active_component_index
         assembly.components.move(idx, idx + 1)
         assembly.active_component_index = idx + 1
+        _report_assembly_change(assembly)
 
         return {'FINISHED'}
 
@@ -706,6 +727,8 @@ class BC_OT_AddConstraint(Operator):
                 assembly.active_constraint_index = i
                 break
 
+        _report_constraint_change(assembly)
+
         if self.constraint_type == 'POINT':
             self.report({'INFO'},
                 f"Added point constraint: {self.component_name}.{self.parameter}="
@@ -817,6 +840,8 @@ class BC_OT_RemoveConstraint(Operator):
             if assembly.active_constraint_index >= len(assembly.constraints):
                 assembly.active_constraint_index = max(0, len(assembly.constraints) - 1)
 
+            _report_constraint_change(assembly)
+
             self.report({'INFO'}, f"Removed constraint for '{comp_name}' at station {station:.2f}m")
             return {'FINISHED'}
         else:
@@ -846,6 +871,7 @@ class BC_OT_ToggleConstraint(Operator):
         if assembly.active_constraint_index < len(assembly.constraints):
             constraint = assembly.constraints[assembly.active_constraint_index]
             constraint.enabled = not constraint.enabled
+            _report_constraint_change(assembly)
 
             status = "enabled" if constraint.enabled else "disabled"
             self.report({'INFO'}, f"Constraint {status}")
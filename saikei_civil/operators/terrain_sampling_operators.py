@@ -22,30 +22,40 @@
 Terrain Sampling Operators
 ===========================
 
-Operators for extracting elevation data from terrain meshes and integrating
-it with alignment profiles. These operators enable visualization of existing
-ground conditions alongside proposed designs.
+Operators for extracting elevation data from terrain meshes and raster DEMs
+and integrating it with alignment profiles. These operators enable
+visualization of existing ground conditions alongside proposed designs.
 
 Operators:
     BC_OT_sample_terrain_from_mesh: Extract terrain elevation along alignment
+    BC_OT_sample_terrain_from_dem: Extract terrain elevation from a raster DEM
+    BC_OT_import_landxml_surface: Import a LandXML TIN surface as a terrain mesh
+    BC_OT_sample_corridor_ground: Sample existing-ground sections for a corridor
     BC_OT_clear_terrain_data: Clear sampled terrain data from profile view
 
 Workflow:
-    1. Import or create a terrain mesh representing existing ground
+    1. Import (e.g. a LandXML surface) or create a terrain mesh
+       representing existing ground
     2. Define a horizontal alignment
     3. Use sample_terrain_from_mesh to extract elevation profile
     4. View terrain in profile overlay alongside vertical alignment
     5. Design vertical alignment to optimize cut/fill
 
 Technical Approach:
-    Uses Blender's raycasting system to sample mesh elevation at regular
-    intervals along the horizontal alignment. Supports complex terrain
-    geometry with proper handling of overhangs and discontinuities.
+    The terrain mesh's triangles are bucketed into a cached NumPy grid
+    index (core.terrain_index), and all sample positions along the
+    horizontal alignment are looked up in one batch. Where the terrain
+    overhangs, the highest surface is used, as seen from above.
+    Raster DEMs are memory-mapped (core.terrain_dem) and answer the same
+    batch queries without building a mesh.
 """
 
+import xml.etree.ElementTree as ET
+
 import bpy
+import numpy as np
 from bpy.props import FloatProperty, StringProperty
-from mathutils import Vector
+from .. import tool
 from ..core import alignment_registry
 from ..ui.alignment_properties import get_active_alignment_ifc
 from ..core.logging_config import get_logger
@@ -53,30 +63,112 @@ from ..core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _get_active_alignment(operator, context):
+    """
+    Get the active alignment and its length, reporting why if unusable.
+
+    Args:
+        operator: Calling operator (for reports)
+        context: Blender context
+
+    Returns:
+        Tuple of (alignment object, total length), or None
+    """
+    # Get active horizontal alignment
+    active_alignment_ifc = get_active_alignment_ifc(context)
+    if not active_alignment_ifc:
+        operator.report({'ERROR'}, "No active horizontal alignment")
+        return None
+
+    # Get alignment object from registry
+    alignment_obj = alignment_registry.get_alignment(active_alignment_ifc.GlobalId)
+    if not alignment_obj:
+        operator.report({'ERROR'}, "Alignment not found in registry")
+        return None
+
+    # Check if alignment has segments
+    if not alignment_obj.segments:
+        operator.report({'ERROR'}, "Alignment has no segments")
+        return None
+
+    # Get total alignment length
+    total_length = alignment_obj.get_horizontal_evaluator().total_length
+
+    if total_length <= 0:
+        operator.report({'ERROR'}, "Alignment has zero length")
+        return None
+
+    return alignment_obj, total_length
+
+
+def _sample_along_alignment(terrain, alignment_obj, total_length, interval):
+    """
+    Sample a terrain source at regular intervals along the alignment.
+
+    Args:
+        terrain: Terrain source with elevations_at(xy)
+        alignment_obj: Alignment object
+        total_length: Total length of alignment (m)
+        interval: Sample interval (m)
+
+    Returns:
+        List of (station, elevation) tuples where the terrain has data
+    """
+    # Evaluate all sample positions along the alignment in one batch
+    sample_count = int(total_length // interval) + 1
+    distances = np.arange(sample_count) * interval
+    xs, ys, _, _ = alignment_obj.get_horizontal_evaluator().evaluate(distances)
+    stations = alignment_obj.stations_from_distances(distances)
+
+    elevations = terrain.elevations_at(np.column_stack([xs, ys]))
+    hit = ~np.isnan(elevations)
+    logger.debug("Sampled %d of %d positions", int(hit.sum()), sample_count)
+
+    return list(zip(stations[hit].tolist(), elevations[hit].tolist()))
+
+
+def _show_terrain_profile(context, terrain_points):
+    """Replace the profile view's terrain line with sampled points."""
+    from ..core.profile_view_overlay import get_profile_overlay
+    overlay = get_profile_overlay()
+
+    # Clear existing terrain
+    overlay.data.clear_terrain()
+
+    # Add sampled terrain points
+    for station, elevation in terrain_points:
+        overlay.data.add_terrain_point(station, elevation)
+
+    # Update view extents
+    overlay.data.update_view_extents()
+
+    # Refresh overlay if enabled
+    if overlay.enabled:
+        overlay.refresh(context)
+
+
 class BC_OT_sample_terrain_from_mesh(bpy.types.Operator):
     """
     Sample terrain elevation data from a mesh object along the active alignment.
 
-    Extracts elevation points by raycasting from above the terrain mesh at
-    regular intervals along the horizontal alignment. The sampled data is
-    stored in the profile view overlay for visualization and analysis.
+    Extracts elevation points from the terrain mesh at regular intervals
+    along the horizontal alignment. The sampled data is stored in the
+    profile view overlay for visualization and analysis.
 
     Properties:
         terrain_mesh: Name of the Blender mesh object to sample from
         sample_interval: Distance between sample points (meters)
-        raycast_offset: Height above alignment to start raycast (meters)
 
     Process:
         1. Gets active horizontal alignment from scene
         2. Walks along alignment at specified intervals
-        3. Casts ray downward from offset height at each station
-        4. Records elevation where ray intersects mesh
+        3. Looks up all sample positions in the terrain's elevation index
+        4. Records elevation wherever the mesh covers the position
         5. Stores (station, elevation) pairs in profile overlay
 
     Requirements:
         - Valid terrain mesh object
         - Active horizontal alignment with segments
-        - Terrain mesh must be within raycast range
 
     Usage:
         Called from terrain tools panel after creating or importing a
@@ -101,15 +193,6 @@ class BC_OT_sample_terrain_from_mesh(bpy.types.Operator):
         unit='LENGTH'
     )
 
-    raycast_offset: FloatProperty(
-        name="Raycast Offset",
-        description="Height above alignment to start raycast (meters)",
-        default=1000.0,
-        min=10.0,
-        max=10000.0,
-        unit='LENGTH'
-    )
-
     def execute(self, context):
         """Execute the terrain sampling operation"""
         # Validate terrain mesh selection
@@ -127,31 +210,10 @@ class BC_OT_sample_terrain_from_mesh(bpy.types.Operator):
             self.report({'ERROR'}, "Selected object is not a mesh")
             return {'CANCELLED'}
 
-        # Get active horizontal alignment
-        active_alignment_ifc = get_active_alignment_ifc(context)
-        if not active_alignment_ifc:
-            self.report({'ERROR'}, "No active horizontal alignment")
-            return {'CANCELLED'}
-
-        # Get alignment object from registry
-        alignment_obj = alignment_registry.get_alignment(active_alignment_ifc.GlobalId)
-        if not alignment_obj:
-            self.report({'ERROR'}, "Alignment not found in registry")
-            return {'CANCELLED'}
-
-        # Check if alignment has segments
-        if not alignment_obj.segments:
-            self.report({'ERROR'}, "Alignment has no segments")
-            return {'CANCELLED'}
-
-        # Get total alignment length
-        total_length = sum(seg.DesignParameters.SegmentLength
-                          for seg in alignment_obj.segments
-                          if hasattr(seg.DesignParameters, 'SegmentLength'))
-
-        if total_length <= 0:
-            self.report({'ERROR'}, "Alignment has zero length")
+        alignment = _get_active_alignment(self, context)
+        if alignment is None:
             return {'CANCELLED'}
+        alignment_obj, total_length = alignment
 
         # Sample terrain along alignment
         try:
@@ -159,31 +221,14 @@ class BC_OT_sample_terrain_from_mesh(bpy.types.Operator):
                 mesh_obj,
                 alignment_obj,
                 total_length,
-                self.sample_interval,
-                self.raycast_offset
+                self.sample_interval
             )
 
             if not terrain_points:
                 self.report({'WARNING'}, "No terrain data sampled (mesh may be out of range)")
                 return {'CANCELLED'}
 
-            # Store terrain points in profile view data
-            from ..core.profile_view_overlay import get_profile_overlay
-            overlay = get_profile_overlay()
-
-            # Clear existing terrain
-            overlay.data.clear_terrain()
-
-            # Add sampled terrain points
-            for station, elevation in terrain_points:
-                overlay.data.add_terrain_point(station, elevation)
-
-            # Update view extents
-            overlay.data.update_view_extents()
-
-            # Refresh overlay if enabled
-            if overlay.enabled:
-                overlay.refresh(context)
+            _show_terrain_profile(context, terrain_points)
 
             self.report({'INFO'},
                        f"Sampled {len(terrain_points)} terrain points from mesh '{mesh_obj.name}'")
@@ -195,136 +240,282 @@ class BC_OT_sample_terrain_from_mesh(bpy.types.Operator):
             traceback.print_exc()
             return {'CANCELLED'}
 
-    def _sample_terrain_from_mesh(self, mesh_obj, alignment_obj, total_length, interval, offset):
+    def _sample_terrain_from_mesh(self, mesh_obj, alignment_obj, total_length, interval):
         """
-        Sample elevation data from mesh along the alignment using raycasting.
+        Sample elevation data from mesh along the alignment.
 
         Args:
             mesh_obj: Blender mesh object
             alignment_obj: Alignment object
             total_length: Total length of alignment (m)
             interval: Sample interval (m)
-            offset: Height offset for raycast origin (m)
 
         Returns:
             List of (station, elevation) tuples
         """
-        terrain_points = []
-
-        # Get mesh data with transformations applied
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        mesh_eval = mesh_obj.evaluated_get(depsgraph)
-
-        # Sample along alignment at regular intervals
-        distance = 0.0
-        while distance <= total_length:
-            # Get 2D position at this distance along alignment
-            position_2d = self._get_alignment_position_at_distance(
-                alignment_obj, distance
-            )
+        # Built once per terrain mesh and reused while the mesh is unchanged
+        terrain_index = tool.Terrain.get_index(mesh_obj)
+        return _sample_along_alignment(terrain_index, alignment_obj, total_length, interval)
+
+    def invoke(self, context, event):
+        """Show dialog to select mesh and configure sampling"""
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        """Draw operator properties in dialog"""
+        layout = self.layout
+
+        # Terrain mesh selection
+        layout.label(text="Select Terrain Mesh:", icon='MESH_DATA')
+        layout.prop_search(self, "terrain_mesh", context.scene, "objects", text="")
+
+        # Show mesh info if selected
+        if self.terrain_mesh:
+            mesh_obj = bpy.data.objects.get(self.terrain_mesh)
+            if mesh_obj:
+                box = layout.box()
+                box.label(text=f"Mesh: {mesh_obj.name}", icon='CHECKMARK')
+                if mesh_obj.type == 'MESH':
+                    mesh_data = mesh_obj.data
+                    box.label(text=f"Vertices: {len(mesh_data.vertices):,}")
+                    box.label(text=f"Faces: {len(mesh_data.polygons):,}")
+                else:
+                    box.label(text="WARNING: Not a mesh!", icon='ERROR')
+
+        layout.separator()
+
+        # Sampling parameters
+        layout.label(text="Sampling Parameters:")
+        layout.prop(self, "sample_interval")
 
-            if position_2d is None:
-                distance += interval
-                continue
 
-            x, y = position_2d
+class BC_OT_sample_terrain_from_dem(bpy.types.Operator):
+    """
+    Sample terrain elevation data from a raster DEM along the active alignment.
 
-            # Create raycast from above the terrain downward
-            ray_origin = Vector((x, y, offset))
-            ray_direction = Vector((0, 0, -1))  # Straight down
+    The DEM (ESRI ASCII .asc or binary .flt grid) is memory-mapped rather
+    than imported as a mesh; ASCII grids are converted to a .npy cache on
+    first use. Positions are georeferenced through the project's
+    IfcMapConversion and elevations interpolated bilinearly.
 
-            # Perform raycast
-            success, location, normal, index = mesh_eval.ray_cast(
-                ray_origin,
-                ray_direction,
-                distance=offset * 2  # Max distance to search
+    Properties:
+        filepath: DEM file to sample
+        sample_interval: Distance between sample points (meters)
+    """
+    bl_idname = "bc.sample_terrain_from_dem"
+    bl_label = "Sample Terrain from DEM"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: StringProperty(
+        subtype='FILE_PATH',
+        name="File Path"
+    )
+
+    filter_glob: StringProperty(
+        default="*.asc;*.flt",
+        options={'HIDDEN'}
+    )
+
+    sample_interval: FloatProperty(
+        name="Sample Interval",
+        description="Distance between sample points (meters)",
+        default=10.0,
+        min=0.1,
+        max=100.0,
+        unit='LENGTH'
+    )
+
+    def execute(self, context):
+        """Execute the terrain sampling operation"""
+        if not self.filepath:
+            self.report({'ERROR'}, "No DEM file selected")
+            return {'CANCELLED'}
+
+        alignment = _get_active_alignment(self, context)
+        if alignment is None:
+            return {'CANCELLED'}
+        alignment_obj, total_length = alignment
+
+        try:
+            dem = tool.Terrain.get_dem(self.filepath)
+            terrain_points = _sample_along_alignment(
+                dem, alignment_obj, total_length, self.sample_interval
             )
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Error reading DEM: {str(e)}")
+            return {'CANCELLED'}
 
-            if success:
-                # Get elevation (Z coordinate)
-                elevation = location.z
+        if not terrain_points:
+            self.report({'WARNING'}, "No terrain data sampled (DEM may not cover the alignment)")
+            return {'CANCELLED'}
 
-                # Get station value for this distance
-                station = alignment_obj.get_station_at_distance(distance)
-                terrain_points.append((station, elevation))
+        _show_terrain_profile(context, terrain_points)
 
-                logger.debug("Distance %.1fm -> Station %.1fm, Elevation %.2fm", distance, station, elevation)
+        self.report({'INFO'}, f"Sampled {len(terrain_points)} terrain points from DEM")
+        return {'FINISHED'}
 
-            distance += interval
+    def invoke(self, context, event):
+        """Open file browser."""
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
-        return terrain_points
 
-    def _get_alignment_position_at_distance(self, alignment_obj, distance):
-        """
-        Get 2D position (x, y) at a distance along the alignment.
+class BC_OT_import_landxml_surface(bpy.types.Operator):
+    """
+    Import a LandXML TIN surface as a terrain mesh.
 
-        Args:
-            alignment_obj: Alignment object
-            distance: Distance along alignment (m)
+    The file is streamed rather than loaded as an XML tree, so large
+    survey surfaces import with memory proportional to the resulting mesh.
+    The new mesh can be sampled with Sample from Mesh or used for corridor
+    ground sections; its elevation index is built during import.
 
-        Returns:
-            (x, y) tuple or None
-        """
-        cumulative_distance = 0.0
+    Properties:
+        filepath: LandXML file to import
+        surface_name: Surface to import (first surface if empty)
+    """
+    bl_idname = "bc.import_landxml_surface"
+    bl_label = "Import LandXML Surface"
+    bl_options = {'REGISTER', 'UNDO'}
 
-        for segment in alignment_obj.segments:
-            params = segment.DesignParameters
-            segment_length = params.SegmentLength
+    filepath: StringProperty(
+        subtype='FILE_PATH',
+        name="File Path"
+    )
 
-            if cumulative_distance + segment_length >= distance:
-                # Position is in this segment
-                local_distance = distance - cumulative_distance
+    filter_glob: StringProperty(
+        default="*.xml;*.landxml",
+        options={'HIDDEN'}
+    )
 
-                if params.PredefinedType == "LINE":
-                    # Linear segment
-                    start_point = params.StartPoint.Coordinates
-                    direction_angle = params.StartDirection
+    surface_name: StringProperty(
+        name="Surface",
+        description="Name of the surface to import (first surface if empty)",
+        default=""
+    )
 
-                    import math
-                    x = start_point[0] + local_distance * math.cos(direction_angle)
-                    y = start_point[1] + local_distance * math.sin(direction_angle)
+    def execute(self, context):
+        """Execute the surface import"""
+        if not self.filepath:
+            self.report({'ERROR'}, "No LandXML file selected")
+            return {'CANCELLED'}
 
-                    return (x, y)
+        try:
+            obj = tool.Terrain.import_landxml_surface(
+                self.filepath, self.surface_name
+            )
+        except (OSError, ValueError, ET.ParseError) as e:
+            self.report({'ERROR'}, f"Error reading LandXML surface: {str(e)}")
+            return {'CANCELLED'}
 
-                elif params.PredefinedType == "CIRCULARARC":
-                    # Circular arc segment
-                    import math
+        self.report(
+            {'INFO'},
+            f"Imported surface '{obj.name}' "
+            f"({len(obj.data.vertices)} points, {len(obj.data.polygons)} faces)"
+        )
+        return {'FINISHED'}
 
-                    start_point = params.StartPoint.Coordinates
-                    radius = abs(params.StartRadiusOfCurvature)
-                    start_direction = params.StartDirection
-                    signed_radius = params.StartRadiusOfCurvature
+    def invoke(self, context, event):
+        """Open file browser."""
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
 
-                    # Calculate center of circle
-                    if signed_radius > 0:  # LEFT turn (CCW)
-                        center_angle = start_direction + math.pi / 2
-                    else:  # RIGHT turn (CW)
-                        center_angle = start_direction - math.pi / 2
 
-                    center_x = start_point[0] + radius * math.cos(center_angle)
-                    center_y = start_point[1] + radius * math.sin(center_angle)
+class BC_OT_sample_corridor_ground(bpy.types.Operator):
+    """
+    Sample existing-ground cross-sections at every station of a corridor.
 
-                    # Calculate angle traveled along arc
-                    arc_angle = local_distance / radius
-                    if signed_radius < 0:  # CW turn
-                        arc_angle = -arc_angle
+    Ground is sampled across the full assembly width plus a buffer at each
+    corridor station in one batch query against the terrain's elevation
+    index. The (stations x offsets) elevation array is stored on the
+    corridor parent object for earthwork and daylight calculations.
 
-                    # Current angle on circle
-                    current_angle = start_direction + arc_angle
-                    if signed_radius > 0:  # LEFT
-                        current_angle -= math.pi / 2
-                    else:  # RIGHT
-                        current_angle += math.pi / 2
+    Properties:
+        terrain_mesh: Name of the Blender mesh object to sample from
+        dem_file: Raster DEM to sample instead of a mesh
+        buffer: Width sampled beyond the assembly edges (meters)
+        offset_spacing: Distance between sampled offsets (meters)
 
-                    # Position on circle
-                    x = center_x + radius * math.cos(current_angle)
-                    y = center_y + radius * math.sin(current_angle)
+    Requirements:
+        - Active object is a corridor (or one of its chunks)
+        - Valid terrain mesh object or DEM file
+    """
+    bl_idname = "bc.sample_corridor_ground"
+    bl_label = "Sample Existing Ground"
+    bl_options = {'REGISTER', 'UNDO'}
 
-                    return (x, y)
+    terrain_mesh: StringProperty(
+        name="Terrain Mesh",
+        description="Select the terrain mesh object to sample",
+        default=""
+    )
 
-            cumulative_distance += segment_length
+    dem_file: StringProperty(
+        name="DEM File",
+        description="Raster DEM (.asc or .flt) to sample instead of a terrain mesh",
+        default="",
+        subtype='FILE_PATH'
+    )
 
-        return None
+    buffer: FloatProperty(
+        name="Buffer",
+        description="Width sampled beyond the assembly edges (meters)",
+        default=10.0,
+        min=0.0,
+        max=500.0,
+        unit='LENGTH'
+    )
+
+    offset_spacing: FloatProperty(
+        name="Offset Spacing",
+        description="Distance between sampled offsets across the section (meters)",
+        default=1.0,
+        min=0.1,
+        max=50.0,
+        unit='LENGTH'
+    )
+
+    def execute(self, context):
+        """Sample ground sections for the active corridor"""
+        corridor_obj = context.active_object
+        if corridor_obj is not None and "saikei_corridor_dependency" not in corridor_obj:
+            corridor_obj = corridor_obj.parent
+        if corridor_obj is None or "saikei_corridor_dependency" not in corridor_obj:
+            self.report({'ERROR'}, "Select a corridor")
+            return {'CANCELLED'}
+
+        mesh_obj = bpy.data.objects.get(self.terrain_mesh)
+        if not self.dem_file and (not mesh_obj or mesh_obj.type != 'MESH'):
+            self.report({'ERROR'}, "Select a terrain mesh or DEM file")
+            return {'CANCELLED'}
+
+        try:
+            if self.dem_file:
+                terrain = tool.Terrain.get_dem(self.dem_file)
+            else:
+                terrain = tool.Terrain.get_index(mesh_obj)
+            sections = tool.Corridor.sample_ground_sections(
+                corridor_obj,
+                terrain,
+                buffer=self.buffer,
+                spacing=self.offset_spacing
+            )
+        except Exception as e:
+            self.report({'ERROR'}, f"Error sampling ground sections: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return {'CANCELLED'}
+
+        if sections is None:
+            self.report({'ERROR'}, "Corridor alignment or assembly not found")
+            return {'CANCELLED'}
+
+        n_stations, n_offsets = sections.shape
+        self.report(
+            {'INFO'},
+            f"Sampled {n_stations} sections x {n_offsets} offsets "
+            f"({sections.coverage:.0%} on terrain)"
+        )
+        return {'FINISHED'}
 
     def invoke(self, context, event):
         """Show dialog to select mesh and configure sampling"""
@@ -333,30 +524,12 @@ class BC_OT_sample_terrain_from_mesh(bpy.types.Operator):
     def draw(self, context):
         """Draw operator properties in dialog"""
         layout = self.layout
-
-        # Terrain mesh selection
         layout.label(text="Select Terrain Mesh:", icon='MESH_DATA')
         layout.prop_search(self, "terrain_mesh", context.scene, "objects", text="")
-
-        # Show mesh info if selected
-        if self.terrain_mesh:
-            mesh_obj = bpy.data.objects.get(self.terrain_mesh)
-            if mesh_obj:
-                box = layout.box()
-                box.label(text=f"Mesh: {mesh_obj.name}", icon='CHECKMARK')
-                if mesh_obj.type == 'MESH':
-                    mesh_data = mesh_obj.data
-                    box.label(text=f"Vertices: {len(mesh_data.vertices):,}")
-                    box.label(text=f"Faces: {len(mesh_data.polygons):,}")
-                else:
-                    box.label(text="WARNING: Not a mesh!", icon='ERROR')
-
+        layout.prop(self, "dem_file")
         layout.separator()
-
-        # Sampling parameters
-        layout.label(text="Sampling Parameters:")
-        layout.prop(self, "sample_interval")
-        layout.prop(self, "raycast_offset")
+        layout.prop(self, "buffer")
+        layout.prop(self, "offset_spacing")
 
 
 class BC_OT_clear_terrain_data(bpy.types.Operator):
@@ -402,6 +575,9 @@ class BC_OT_clear_terrain_data(bpy.types.Operator):
 # Registration
 classes = (
     BC_OT_sample_terrain_from_mesh,
+    BC_OT_sample_terrain_from_dem,
+    BC_OT_import_landxml_surface,
+    BC_OT_sample_corridor_ground,
     BC_OT_clear_terrain_data,
 )
 
@@ -53,11 +53,72 @@ logger = get_logger(__name__)
 
 _alignment_registry = {}
 
+# PI object index: Blender object pointer -> (alignment_id, pi dict)
+# Lets the handler map depsgraph updates to PIs and detect deleted PIs
+# without walking every PI of every alignment. AlignmentVisualizer keeps it
+# in step as PI objects are created and removed.
+_pi_object_index = {}
+
+
+def _object_pointer(obj):
+    """Get the Blender object's pointer, or None if it was deleted."""
+    try:
+        return obj.as_pointer()
+    except (ReferenceError, AttributeError):
+        return None
+
+
+def _object_alive(obj):
+    """Check whether a Blender object still exists in bpy.data."""
+    try:
+        return obj is not None and bpy.data.objects.get(obj.name) == obj
+    except (ReferenceError, AttributeError):
+        return False
+
+
+def index_pi_object(alignment, pi):
+    """Add a PI's Blender object to the PI object index.
+
+    Only PIs of alignments registered for updates are indexed; the rest are
+    indexed when their alignment registers.
+
+    Args:
+        alignment: Alignment owning the PI
+        pi: PI data dictionary with a 'blender_object'
+    """
+    if id(alignment) not in _alignment_registry:
+        return
+    pointer = _object_pointer(pi.get('blender_object'))
+    if pointer:
+        _pi_object_index[pointer] = (id(alignment), pi)
+
+
+def unindex_pi_object(obj):
+    """Drop a Blender object from the PI object index.
+
+    Call before the object is removed, while its pointer is still valid.
+
+    Args:
+        obj: PI marker object (other objects are ignored)
+    """
+    pointer = _object_pointer(obj)
+    if pointer:
+        _pi_object_index.pop(pointer, None)
+
+
+def _unindex_alignment(alignment_id):
+    """Drop all PI object index entries of an alignment."""
+    for pointer, (owner_id, _) in list(_pi_object_index.items()):
+        if owner_id == alignment_id:
+            del _pi_object_index[pointer]
+
 
 def register_alignment(alignment):
     """Register an alignment for real-time updates."""
     alignment_id = id(alignment)  # Use Python object ID
     _alignment_registry[alignment_id] = alignment
+    for pi in alignment.pis:
+        index_pi_object(alignment, pi)
     logger.info("Registered alignment: %s", alignment.alignment.Name)
 
 
@@ -66,6 +127,7 @@ def unregister_alignment(alignment):
     alignment_id = id(alignment)
     if alignment_id in _alignment_registry:
         del _alignment_registry[alignment_id]
+        _unindex_alignment(alignment_id)
         logger.info("Unregistered alignment: %s", alignment.alignment.Name)
 
 
@@ -79,6 +141,7 @@ def clear_alignments():
 
     count = len(_alignment_registry)
     _alignment_registry.clear()
+    _pi_object_index.clear()
     _pending_ifc_regeneration.clear()
     _last_update.clear()
     _last_regeneration_time.clear()
@@ -141,6 +204,8 @@ def get_alignment_from_pi(pi_object):
 _last_update = {}
 _throttle_ms = 50  # 20 FPS minimum
 _updating = False  # Reentrancy guard
+_handler_cost_target_ms = 1.0  # Per-event budget when no PI moved or was deleted
+_last_object_count = None  # len(bpy.data.objects) at the last handler call
 
 # DEBOUNCE: Track pending IFC regeneration
 _pending_ifc_regeneration = {}  # alignment_id -> last_movement_time
@@ -223,6 +288,60 @@ def _debounced_ifc_regeneration():
         return None  # Stop timer
 
 
+def _objects_were_removed():
+    """Check whether objects were removed from bpy.data since the last event.
+
+    Compares the object count with the one seen by the previous handler
+    call, which is O(1). Depsgraph ID updates are no deletion signal: the
+    Scene is reported for most edits, including transforms.
+    """
+    global _last_object_count
+
+    count = len(bpy.data.objects)
+    previous = _last_object_count
+    _last_object_count = count
+    return previous is None or count < previous
+
+
+def _find_deleted_pis():
+    """Find indexed PI objects that were deleted from Blender.
+
+    Only does work when the object count dropped since the last event. A PI
+    only counts as deleted when the object its data currently points at is
+    gone; index entries left behind by replaced PI objects are dropped (and
+    the current object indexed) instead.
+
+    Returns:
+        Dict mapping alignment_id to a list of deleted PI indices
+    """
+    if not _objects_were_removed() or not _pi_object_index:
+        return {}
+
+    deleted = {}
+    for pointer, (alignment_id, pi) in list(_pi_object_index.items()):
+        alignment = _alignment_registry.get(alignment_id)
+        if alignment is None:
+            del _pi_object_index[pointer]
+            continue
+
+        obj = pi.get('blender_object')
+        if _object_alive(obj):
+            if obj.as_pointer() != pointer:
+                # Stale entry for an object replaced by a rebuild
+                del _pi_object_index[pointer]
+                index_pi_object(alignment, pi)
+            continue
+
+        del _pi_object_index[pointer]
+        for pi_idx, candidate in enumerate(alignment.pis):
+            if candidate is pi:
+                deleted.setdefault(alignment_id, []).append(pi_idx)
+                logger.debug("PI %s deleted", pi_idx)
+                break
+
+    return deleted
+
+
 @persistent
 def saikei_update_handler(scene, depsgraph):
     """
@@ -237,104 +356,87 @@ def saikei_update_handler(scene, depsgraph):
         return
 
     current_time = time.time()
-
-    # DEBUG: Log handler activity
+    started = time.perf_counter()
     pi_updates_found = 0
 
     # ========================================================================
     # PART 1: Check for deleted PI objects and sync to IFC
     # ========================================================================
+    # Only scan when objects were removed since the last event, and then only
+    # check the indexed PI objects instead of every PI of every alignment.
 
     alignments_to_update = set()
 
-    for alignment in list(_alignment_registry.values()):
-        # Check if any PI objects have been deleted
-        deleted_pis = []
-
-        for pi_idx, pi in enumerate(alignment.pis):
-            blender_obj = pi.get('blender_object')
-
-            if blender_obj is not None:
-                # Check if object still exists in Blender
-                try:
-                    # Try to access the object's name - will raise ReferenceError if deleted
-                    _ = blender_obj.name
-
-                    # Also check if it's in bpy.data.objects
-                    if blender_obj.name not in bpy.data.objects:
-                        deleted_pis.append(pi_idx)
-                        logger.debug("PI %s deleted from outliner", pi_idx)
-                except ReferenceError:
-                    # Object was deleted
-                    deleted_pis.append(pi_idx)
-                    logger.debug("PI %s deleted (reference error)", pi_idx)
-
-        # If any PIs were deleted, remove them from the alignment
-        if deleted_pis:
-            _updating = True
-            try:
-                # Remove PIs in reverse order to maintain indices
-                for pi_idx in reversed(deleted_pis):
-                    pi = alignment.pis[pi_idx]
-
-                    # Remove IFC entity if it exists
-                    if pi.get('ifc_point'):
-                        try:
-                            alignment.ifc.remove(pi['ifc_point'])
-                            logger.debug("Removed IFC point for PI %s", pi_idx)
-                        except Exception as e:
-                            logger.error("Could not remove IFC point: %s", e)
+    for alignment_id, deleted in _find_deleted_pis().items():
+        alignment = _alignment_registry.get(alignment_id)
+        if alignment is None:
+            continue
 
-                    # Remove from alignment.pis list
-                    alignment.pis.pop(pi_idx)
+        _updating = True
+        try:
+            # Remove PIs in reverse order to maintain indices
+            for pi_idx in sorted(deleted, reverse=True):
+                pi = alignment.pis[pi_idx]
 
-                # Reindex remaining PIs
-                for new_idx, pi in enumerate(alignment.pis):
-                    pi['id'] = new_idx
-                    # Update blender object property if it exists
-                    if pi.get('blender_object'):
-                        pi['blender_object']['bc_pi_id'] = new_idx
+                # Remove IFC entity if it exists
+                if pi.get('ifc_point'):
+                    try:
+                        alignment.ifc.remove(pi['ifc_point'])
+                        logger.debug("Removed IFC point for PI %s", pi_idx)
+                    except Exception as e:
+                        logger.error("Could not remove IFC point: %s", e)
+
+                # Remove from alignment.pis list
+                alignment.pis.pop(pi_idx)
+
+            # Reindex remaining PIs
+            for new_idx, pi in enumerate(alignment.pis):
+                pi['id'] = new_idx
+                # Update blender object property if it exists
+                if pi.get('blender_object'):
+                    pi['blender_object']['bc_pi_id'] = new_idx
 
-                # Mark this alignment for regeneration
-                alignments_to_update.add(id(alignment))
+            # Mark this alignment for regeneration
+            alignments_to_update.add(alignment_id)
 
-                logger.info("Removed %s PI(s), %s remaining", len(deleted_pis), len(alignment.pis))
+            logger.info("Removed %s PI(s), %s remaining", len(deleted), len(alignment.pis))
 
-            except Exception as e:
-                logger.error("Error during PI deletion: %s", e)
-                import traceback
-                traceback.print_exc()
-            finally:
-                _updating = False
+        except Exception as e:
+            logger.error("Error during PI deletion: %s", e)
+            import traceback
+            traceback.print_exc()
+        finally:
+            _updating = False
 
     # Regenerate alignments that had deletions
     for alignment_id in alignments_to_update:
-        for alignment in _alignment_registry.values():
-            if id(alignment) == alignment_id:
-                _updating = True
-                try:
-                    # Regenerate segments
-                    has_curves = any('curve' in pi for pi in alignment.pis)
-                    if has_curves:
-                        alignment.regenerate_segments_with_curves()
-                    else:
-                        alignment.regenerate_segments()
+        alignment = _alignment_registry.get(alignment_id)
+        if alignment is None:
+            continue
 
-                    # Update visualization
-                    if hasattr(alignment, 'visualizer') and alignment.visualizer:
-                        try:
-                            alignment.visualizer.update_all()
-                        except (ReferenceError, AttributeError, RuntimeError) as e:
-                            logger.warning("Visualization update skipped: %s", e)
+        _updating = True
+        try:
+            # Regenerate segments
+            has_curves = any('curve' in pi for pi in alignment.pis)
+            if has_curves:
+                alignment.regenerate_segments_with_curves()
+            else:
+                alignment.regenerate_segments()
 
-                    logger.info("Regenerated alignment after PI deletion")
-                except Exception as e:
-                    logger.error("Error regenerating after deletion: %s", e)
-                    import traceback
-                    traceback.print_exc()
-                finally:
-                    _updating = False
-                break
+            # Update visualization
+            if hasattr(alignment, 'visualizer') and alignment.visualizer:
+                try:
+                    alignment.visualizer.update_all()
+                except (ReferenceError, AttributeError, RuntimeError) as e:
+                    logger.warning("Visualization update skipped: %s", e)
+
+            logger.info("Regenerated alignment after PI deletion")
+        except Exception as e:
+            logger.error("Error regenerating after deletion: %s", e)
+            import traceback
+            traceback.print_exc()
+        finally:
+            _updating = False
 
     # ========================================================================
     # PART 2: Process transform updates (existing code)
@@ -363,20 +465,20 @@ def saikei_update_handler(scene, depsgraph):
         if 'bc_pi_id' not in obj or 'bc_alignment_id' not in obj:
             continue
 
-        # DEBUG: We found a PI being moved!
-        logger.info("=== PI MOVEMENT DETECTED: %s ===", obj.name)
-        logger.info("  bc_alignment_id: %s (type: %s, len: %s)",
-                   obj['bc_alignment_id'],
-                   type(obj['bc_alignment_id']).__name__,
-                   len(str(obj['bc_alignment_id'])) if obj['bc_alignment_id'] else 0)
+        logger.debug("=== PI MOVEMENT DETECTED: %s ===", obj.name)
 
-        # Get the alignment
-        alignment = get_alignment_from_pi(obj)
+        # Get the alignment (indexed PI objects skip the GlobalId lookup)
+        pointer = obj.as_pointer()
+        entry = _pi_object_index.get(pointer)
+        alignment = _alignment_registry.get(entry[0]) if entry else None
         if alignment is None:
-            logger.warning("  FAILED to get alignment from PI!")
-            continue
-        else:
-            logger.info("  Got alignment: %s", alignment.alignment.Name)
+            alignment = get_alignment_from_pi(obj)
+            if alignment is None:
+                logger.warning("  FAILED to get alignment from PI!")
+                continue
+            pi_id = obj['bc_pi_id']
+            if pi_id < len(alignment.pis) and id(alignment) in _alignment_registry:
+                _pi_object_index[pointer] = (id(alignment), alignment.pis[pi_id])
         
         # Check auto-update enabled
         if not getattr(alignment, 'auto_update', True):
@@ -412,6 +514,10 @@ def saikei_update_handler(scene, depsgraph):
                 # Update position in memory (this is fast)
                 pi['position'] = new_pos
 
+                # Only segments around this PI are rewritten at regeneration
+                if hasattr(alignment, 'mark_pi_moved'):
+                    alignment.mark_pi_moved(pi_id)
+
                 # ================================================================
                 # VISUAL UPDATE ONLY - Update Blender curves without touching IFC
                 # This gives real-time feedback during dragging
@@ -420,7 +526,7 @@ def saikei_update_handler(scene, depsgraph):
                     try:
                         # Only update the visual curves (move existing points)
                         # Don't recreate them - just update their positions
-                        alignment.visualizer.update_segment_curves_fast(alignment.pis)
+                        alignment.visualizer.update_segment_curves_fast(alignment.pis, pi_id)
                     except (ReferenceError, AttributeError, RuntimeError) as e:
                         logger.debug("Fast visual update skipped: %s", e)
 
@@ -443,6 +549,13 @@ def saikei_update_handler(scene, depsgraph):
                 # Always reset flag, even if there's an error
                 _updating = False
 
+            pi_updates_found += 1
+
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    if not pi_updates_found and not alignments_to_update and elapsed_ms > _handler_cost_target_ms:
+        logger.warning("Update handler took %.2f ms without PI changes (budget %.1f ms)",
+                       elapsed_ms, _handler_cost_target_ms)
+
 
 def register_handler():
     """Register the update handler with Blender."""
@@ -903,20 +903,15 @@ class BC_OT_TraceTerrainAsVertical(Operator):
 
         pvi_elevations = np.interp(pvi_stations, terrain_stations, terrain_elevations)
 
-        # Create VerticalAlignment object
-        valign = VerticalAlignment(
+        # Create VerticalAlignment from all PVIs at once
+        # (no curves - pure tangent alignment, segments generated once)
+        valign = VerticalAlignment.from_pvis(
+            pvi_stations,
+            pvi_elevations,
             name=self.alignment_name,
             description=f"Traced from terrain data at {self.pvi_interval}m intervals"
         )
 
-        # Add PVIs (no curves - all tangents)
-        for station, elevation in zip(pvi_stations, pvi_elevations):
-            valign.add_pvi(
-                station=float(station),
-                elevation=float(elevation),
-                curve_length=0.0  # No curves - pure tangent alignment
-            )
-
         # Get active horizontal alignment
         active_alignment_ifc = get_active_alignment_ifc(context)
         if not active_alignment_ifc:
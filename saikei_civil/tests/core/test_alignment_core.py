@@ -40,6 +40,7 @@ from saikei_civil.core.alignment import (
     interpolate_position_on_line,
     interpolate_position_on_arc,
     get_point_at_station,
+    compile_segments,
     # Segment generation
     compute_tangent_segments,
     compute_segments_with_curves,
@@ -475,6 +476,18 @@ class TestStationQueries:
         result = get_point_at_station(segments, -10.0, start_station=0.0)
         assert result is None
 
+    def test_compile_segments_memoized(self, simple_pis):
+        """Repeated queries with equal segment dicts reuse one compiled layout."""
+        insert_curve(simple_pis, 1, 50.0)
+        compiled = compile_segments(compute_segments_with_curves(simple_pis))
+
+        assert compile_segments(compute_segments_with_curves(simple_pis)) is compiled
+
+        remove_curve(simple_pis, 1)
+        changed = compile_segments(compute_segments_with_curves(simple_pis))
+        assert changed is not compiled
+        assert changed.segment_count == 2
+
 
 # =============================================================================
 # Integration Tests
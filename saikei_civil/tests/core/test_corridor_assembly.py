@@ -0,0 +1,191 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Compiled Corridor Assemblies
+=======================================
+
+Tests for AssemblyWrapper.compile() and AssemblyWrapper.profiles_at().
+"""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from core.corridor import AssemblyWrapper, ComponentData
+from core.parametric_constraints import (
+    ConstraintManager,
+    ParametricConstraint,
+    ConstraintType,
+    InterpolationType,
+)
+
+
+def _components():
+    """Two lanes with shoulders, offsets as create_assembly_wrapper lays them out."""
+    return [
+        ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0, thickness=0.25),
+        ComponentData("Left Shoulder", "SHOULDER", 2.4, 0.04, -6.0, -0.072),
+        ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0, thickness=0.25),
+        ComponentData("Right Shoulder", "SHOULDER", 2.4, 0.04, 3.6, -0.072),
+    ]
+
+
+def _widening(start=100.0, end=200.0, interpolation=InterpolationType.LINEAR):
+    """Right lane widening from 3.6 m to 4.8 m."""
+    return ParametricConstraint(
+        id="widen",
+        component_name="Right Lane",
+        parameter_name="width",
+        constraint_type=ConstraintType.RANGE,
+        start_station=start,
+        end_station=end,
+        start_value=3.6,
+        end_value=4.8,
+        interpolation=interpolation,
+    )
+
+
+@pytest.fixture
+def assembly():
+    """Assembly without constraints."""
+    return AssemblyWrapper("Two Lane", _components())
+
+
+class TestCompiledTemplate:
+    """Tests for the constant profile template."""
+
+    @pytest.mark.unit
+    def test_template_points(self, assembly):
+        """Test closed profile runs left to right on top, back on the bottom."""
+        template = assembly.compile().template
+
+        top = [(-6.0, -0.168), (-3.6, -0.072), (0.0, 0.0),
+               (3.6, -0.072), (6.0, -0.168)]
+        bottom = [(x, z - 0.25) for x, z in reversed(top)]
+        assert template.shape == (10, 2)
+        assert template.ravel() == pytest.approx(np.array(top + bottom).ravel())
+
+    @pytest.mark.unit
+    def test_left_components_in_any_order(self):
+        """Test left components are stacked from the centerline outward."""
+        shuffled = AssemblyWrapper("Shuffled", _components()[::-1])
+        reference = AssemblyWrapper("Reference", _components())
+
+        assert np.allclose(shuffled.compile().template, reference.compile().template)
+        top = shuffled.compile().template[:5, 0]
+        assert np.all(np.diff(top) > 0)
+
+    @pytest.mark.unit
+    def test_empty_assembly_fallback(self):
+        """Test an assembly without components yields a flat 7.2 m slab."""
+        template = AssemblyWrapper("Empty", []).compile().template
+
+        assert template.tolist() == [[-3.6, 0.0], [3.6, 0.0],
+                                     [3.6, -0.15], [-3.6, -0.15]]
+
+    @pytest.mark.unit
+    def test_compile_is_cached_until_components_change(self, assembly):
+        """Test compiled arrays are reused and rebuilt after an edit."""
+        first = assembly.compile()
+        assert assembly.compile() is first
+
+        assembly.components[2] = replace(assembly.components[2], width=4.0)
+        second = assembly.compile()
+
+        assert second is not first
+        assert second.template[4, 0] == pytest.approx(6.4)
+
+
+class TestProfilesAt:
+    """Tests for AssemblyWrapper.profiles_at()."""
+
+    @pytest.mark.unit
+    def test_unconstrained_returns_template(self, assembly):
+        """Test every station shares the template when nothing is constrained."""
+        profiles = assembly.profiles_at(np.linspace(0.0, 500.0, 51))
+
+        assert profiles.shape == (51, 10, 2)
+        assert np.array_equal(profiles[17], assembly.compile().template)
+
+    @pytest.mark.unit
+    def test_constraint_applied_inside_range_only(self, assembly):
+        """Test widening changes only the stations it covers."""
+        manager = ConstraintManager()
+        manager.add_constraint(_widening())
+        assembly.constraint_manager = manager
+
+        stations = np.array([50.0, 100.0, 150.0, 200.0, 250.0])
+        profiles = assembly.profiles_at(stations)
+        template = assembly.compile().template
+
+        assert np.array_equal(profiles[0], template)
+        assert np.array_equal(profiles[4], template)
+        # Right lane outer edge, then the shoulder beyond it
+        assert profiles[2, 3, 0] == pytest.approx(4.2)
+        assert profiles[2, 4, 0] == pytest.approx(6.6)
+        assert profiles[3, 3, 0] == pytest.approx(4.8)
+        assert profiles[2, 3, 1] == pytest.approx(-0.02 * 4.2)
+
+    @pytest.mark.unit
+    def test_matches_per_station_assembly(self, assembly):
+        """Test constrained profiles equal templates rebuilt with the same widths."""
+        manager = ConstraintManager()
+        manager.add_constraint(_widening(interpolation=InterpolationType.SMOOTH))
+        manager.add_constraint(ParametricConstraint(
+            id="superelevation",
+            component_name="Left Lane",
+            parameter_name="cross_slope",
+            constraint_type=ConstraintType.RANGE,
+            start_station=150.0,
+            end_station=300.0,
+            start_value=0.02,
+            end_value=-0.04,
+        ))
+        assembly.constraint_manager = manager
+
+        stations = np.linspace(0.0, 400.0, 41)
+        profiles = assembly.profiles_at(stations)
+
+        for i, station in enumerate(stations):
+            components = [
+                replace(
+                    c,
+                    width=manager.get_effective_value(c.name, "width", station, c.width),
+                    slope=manager.get_effective_value(c.name, "cross_slope", station, c.slope),
+                )
+                for c in assembly.components
+            ]
+            expected = AssemblyWrapper("Reference", components).compile().template
+            assert np.allclose(profiles[i], expected), station
+
+    @pytest.mark.unit
+    def test_disabled_constraint_ignored(self, assembly):
+        """Test disabled constraints leave the template untouched."""
+        constraint = _widening()
+        constraint.enabled = False
+        manager = ConstraintManager()
+        manager.add_constraint(constraint)
+        assembly.constraint_manager = manager
+
+        profiles = assembly.profiles_at([150.0])
+
+        assert np.array_equal(profiles[0], assembly.compile().template)
@@ -0,0 +1,205 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Chunks
+==========================
+
+Tests for station-range chunk layouts, dirty tracking and seam sharing.
+"""
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.corridor import transform_profiles, build_tube_topology
+from core.corridor_chunks import CorridorChunkLayout
+
+
+PROFILE = [(-3.6, -0.072), (0.0, 0.0), (3.6, -0.072),
+           (3.6, -0.222), (0.0, -0.15), (-3.6, -0.222)]
+
+
+def _stations(values):
+    """Station points along a gentle arc."""
+    return [
+        SimpleNamespace(
+            station=v,
+            x=400.0 * math.sin(v / 400.0),
+            y=400.0 * (1.0 - math.cos(v / 400.0)),
+            z=100.0 + 0.02 * v,
+            direction=v / 400.0,
+        )
+        for v in values
+    ]
+
+
+class TestChunkLayout:
+    """Tests for CorridorChunkLayout construction."""
+
+    @pytest.mark.unit
+    def test_boundaries_on_chunk_multiples(self):
+        """Test boundaries fall on multiples of the chunk length."""
+        layout = CorridorChunkLayout(120.0, 1800.0, chunk_length=500.0)
+
+        assert layout.boundaries == [500.0, 1000.0, 1500.0]
+        assert [(c.start_station, c.end_station) for c in layout] == [
+            (120.0, 500.0), (500.0, 1000.0), (1000.0, 1500.0), (1500.0, 1800.0)
+        ]
+        assert layout.chunks[0].is_first and not layout.chunks[0].is_last
+        assert layout.chunks[-1].is_last and not layout.chunks[-1].is_first
+
+    @pytest.mark.unit
+    def test_short_corridor_single_chunk(self):
+        """Test a corridor shorter than one chunk has a single capped chunk."""
+        layout = CorridorChunkLayout(0.0, 300.0)
+
+        assert len(layout) == 1
+        assert layout.chunks[0].is_first and layout.chunks[0].is_last
+
+    @pytest.mark.unit
+    def test_boundary_at_corridor_end_dropped(self):
+        """Test no zero-length chunk is created at the corridor ends."""
+        layout = CorridorChunkLayout(0.0, 1000.0, chunk_length=500.0)
+
+        assert layout.boundaries == [500.0]
+
+    @pytest.mark.unit
+    def test_invalid_range(self):
+        """Test empty station ranges are rejected."""
+        with pytest.raises(ValueError):
+            CorridorChunkLayout(100.0, 100.0)
+
+    @pytest.mark.unit
+    def test_chunk_at(self):
+        """Test station lookup, boundaries belong to the later chunk."""
+        layout = CorridorChunkLayout(0.0, 1800.0)
+
+        assert layout.chunk_at(250.0).index == 0
+        assert layout.chunk_at(500.0).index == 1
+        assert layout.chunk_at(5000.0).index == 3
+
+
+class TestDirtyTracking:
+    """Tests for dirty-range marking."""
+
+    @pytest.mark.unit
+    def test_new_layout_is_dirty(self):
+        """Test all chunks need building initially."""
+        layout = CorridorChunkLayout(0.0, 1800.0)
+
+        assert len(layout.dirty_chunks()) == 4
+
+    @pytest.mark.unit
+    def test_mark_interval(self):
+        """Test only chunks overlapping the interval are marked."""
+        layout = CorridorChunkLayout(0.0, 1800.0)
+        layout.clear_dirty()
+
+        assert layout.mark_dirty(620.0, 1100.0) == [1, 2]
+        assert [c.index for c in layout.dirty_chunks()] == [1, 2]
+
+    @pytest.mark.unit
+    def test_mark_on_seam_dirties_both_sides(self):
+        """Test an edit on a boundary marks both chunks sharing the seam."""
+        layout = CorridorChunkLayout(0.0, 1800.0)
+        layout.clear_dirty()
+
+        assert layout.mark_dirty(1000.0) == [1, 2]
+
+    @pytest.mark.unit
+    def test_reversed_interval(self):
+        """Test interval ends may be given in either order."""
+        layout = CorridorChunkLayout(0.0, 1800.0)
+        layout.clear_dirty()
+
+        assert layout.mark_dirty(1700.0, 1600.0) == [3]
+
+
+class TestStationSplit:
+    """Tests for partitioning stations into chunks."""
+
+    @pytest.mark.unit
+    def test_seam_station_shared(self):
+        """Test neighbouring chunks share the station on their boundary."""
+        layout = CorridorChunkLayout(0.0, 1200.0)
+        stations = _stations(np.arange(0.0, 1200.1, 20.0))
+
+        parts = layout.split_stations(stations)
+
+        assert [len(p) for p in parts] == [26, 26, 11]
+        assert parts[0][-1] is parts[1][0]
+        assert parts[1][-1] is parts[2][0]
+        assert parts[0][0] is stations[0] and parts[-1][-1] is stations[-1]
+
+    @pytest.mark.unit
+    def test_seam_without_boundary_station(self):
+        """Test the seam snaps to the nearest station when none lies on the boundary."""
+        layout = CorridorChunkLayout(0.0, 1000.0)
+        stations = _stations([0.0, 180.0, 360.0, 490.0, 530.0, 700.0, 1000.0])
+
+        first, second = layout.split_stations(stations)
+
+        assert [s.station for s in first] == [0.0, 180.0, 360.0, 490.0]
+        assert [s.station for s in second] == [490.0, 530.0, 700.0, 1000.0]
+
+    @pytest.mark.unit
+    def test_dense_stations_share_one_seam(self):
+        """Test each station belongs to one chunk apart from the seam stations."""
+        layout = CorridorChunkLayout(0.0, 1500.0)
+        stations = _stations(np.arange(0.0, 1500.1, 3.0))
+
+        parts = layout.split_stations(stations)
+
+        assert [p[-1].station for p in parts[:-1]] == [501.0, 999.0]
+        assert sum(len(p) for p in parts) == len(stations) + len(parts) - 1
+        for left, right in zip(parts, parts[1:]):
+            assert left[-1] is right[0]
+
+    @pytest.mark.unit
+    def test_chunks_assemble_watertight(self):
+        """Test the chunk meshes together form one closed surface."""
+        layout = CorridorChunkLayout(0.0, 1300.0, chunk_length=300.0)
+        stations = _stations(np.arange(0.0, 1300.1, 25.0))
+
+        vertex_ids = {}
+        edge_uses = {}
+        for chunk, chunk_stations in zip(layout, layout.split_stations(stations)):
+            positions = np.array([(s.x, s.y, s.z) for s in chunk_stations])
+            bearings = np.array([s.direction for s in chunk_stations])
+            vertices = transform_profiles(positions, bearings, PROFILE)
+            vertices = vertices.astype(np.float32).reshape(-1, 3)
+            loops, starts, totals = build_tube_topology(
+                len(chunk_stations), len(PROFILE),
+                start_cap=chunk.is_first, end_cap=chunk.is_last,
+            )
+
+            # Weld by exact coordinates: seam vertices must coincide
+            ids = [vertex_ids.setdefault(tuple(v), len(vertex_ids)) for v in vertices]
+            for start, total in zip(starts, totals):
+                face = [ids[i] for i in loops[start:start + total]]
+                for a, b in zip(face, face[1:] + face[:1]):
+                    key = (min(a, b), max(a, b))
+                    edge_uses[key] = edge_uses.get(key, 0) + 1
+
+        assert len(vertex_ids) == len(stations) * len(PROFILE)
+        assert set(edge_uses.values()) == {2}
@@ -0,0 +1,255 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Dependency Tracking
+======================================
+
+Tests for change intervals, constraint fingerprints and routing of
+source edits to dependent corridor station ranges.
+"""
+
+import math
+
+import pytest
+
+from core.corridor_dependencies import (
+    CorridorChangeTracker,
+    CorridorDependency,
+    changed_interval,
+    constraint_fingerprint,
+    constraint_set_interval,
+    get_change_tracker,
+    merge_intervals,
+)
+from core.parametric_constraints import ConstraintManager, ParametricConstraint
+from core.vertical_alignment import VerticalAlignment
+
+
+def _dependency(corridor_id="Corridor", guid="ALIGN", assembly="Two Lane", start=0.0, end=1000.0):
+    return CorridorDependency(
+        corridor_id=corridor_id,
+        alignment_guid=guid,
+        assembly_name=assembly,
+        start_station=start,
+        end_station=end,
+    )
+
+
+def _width_constraint(start, end, value, constraint_id=None):
+    return ParametricConstraint.create_range_constraint(
+        "Right Lane", "width", start, end, 3.6, value, constraint_id=constraint_id
+    )
+
+
+@pytest.fixture
+def tracker():
+    """Tracker with one corridor on ALIGN / Two Lane over 0-1000."""
+    tracker = CorridorChangeTracker()
+    tracker.register(_dependency())
+    return tracker
+
+
+class TestChangedInterval:
+    """Tests for changed_interval()."""
+
+    @pytest.mark.unit
+    def test_equal_tables(self):
+        """Test identical tables report no change."""
+        table = [(0.0, 100.0, ("LINE",)), (100.0, 200.0, ("ARC", 50.0))]
+        assert changed_interval(table, list(table)) is None
+
+    @pytest.mark.unit
+    def test_interior_change(self):
+        """Test a changed middle segment is bounded by its neighbours."""
+        before = [(0.0, 100.0, ("A",)), (100.0, 200.0, ("B",)), (200.0, 300.0, ("C",))]
+        after = [(0.0, 100.0, ("A",)), (100.0, 200.0, ("B2",)), (200.0, 300.0, ("C",))]
+        assert changed_interval(before, after) == (100.0, 200.0)
+
+    @pytest.mark.unit
+    def test_length_change_runs_to_end(self):
+        """Test shifted trailing stations extend the interval to inf."""
+        before = [(0.0, 100.0, ("A",)), (100.0, 200.0, ("B",)), (200.0, 300.0, ("C",))]
+        after = [(0.0, 100.0, ("A",)), (100.0, 210.0, ("B2",)), (210.0, 310.0, ("C",))]
+        assert changed_interval(before, after) == (100.0, math.inf)
+
+    @pytest.mark.unit
+    def test_tolerance(self):
+        """Test round-off differences are ignored."""
+        before = [(0.0, 100.0, ("A", 1.0))]
+        after = [(0.0, 100.0 + 1e-12, ("A", 1.0 + 1e-12))]
+        assert changed_interval(before, after) is None
+
+
+class TestConstraintSets:
+    """Tests for constraint fingerprints and constraint_set_interval()."""
+
+    @pytest.mark.unit
+    def test_fingerprint_ignores_ids_and_order(self):
+        """Test fingerprints only depend on constraint content."""
+        a = ConstraintManager()
+        a.add_constraint(_width_constraint(100, 200, 4.0))
+        a.add_constraint(_width_constraint(500, 600, 4.5))
+        b = ConstraintManager()
+        b.add_constraint(_width_constraint(500, 600, 4.5))
+        b.add_constraint(_width_constraint(100, 200, 4.0))
+
+        assert constraint_fingerprint(a) == constraint_fingerprint(b)
+        assert constraint_fingerprint(a) != ""
+        assert constraint_fingerprint(ConstraintManager()) == ""
+        assert constraint_fingerprint(None) == ""
+
+    @pytest.mark.unit
+    def test_disabled_constraints_ignored(self):
+        """Test disabled constraints don't contribute to the fingerprint."""
+        manager = ConstraintManager()
+        constraint = _width_constraint(100, 200, 4.0)
+        constraint.enabled = False
+        manager.add_constraint(constraint)
+        assert constraint_fingerprint(manager) == ""
+
+    @pytest.mark.unit
+    def test_interval_covers_old_and_new_ranges(self):
+        """Test moving a constraint reports both its old and new ranges."""
+        before = [_width_constraint(100, 200, 4.0).to_dict()]
+        after = [_width_constraint(300, 400, 4.0).to_dict()]
+        for entries in (before, after):
+            entries[0].pop('id')
+        assert constraint_set_interval(before, after) == (100.0, 400.0)
+        assert constraint_set_interval(before, before) is None
+
+    @pytest.mark.unit
+    def test_merge_intervals(self):
+        """Test overlapping and touching intervals are merged."""
+        merged = merge_intervals([(500, 600), (0, 100), (50, 200), (200, 250)])
+        assert merged == [(0, 250), (500, 600)]
+
+
+class TestCorridorChangeTracker:
+    """Tests for CorridorChangeTracker routing."""
+
+    @pytest.mark.unit
+    def test_alignment_change_is_clipped(self, tracker):
+        """Test alignment edits are clipped to the corridor range."""
+        assert tracker.alignment_changed("ALIGN", 900.0, math.inf) == ["Corridor"]
+        assert tracker.take_pending() == {"Corridor": [(900.0, 1000.0)]}
+        assert tracker.take_pending() == {}
+
+    @pytest.mark.unit
+    def test_unrelated_changes_ignored(self, tracker):
+        """Test edits to other sources or outside the range are ignored."""
+        assert tracker.alignment_changed("OTHER", 0.0, 100.0) == []
+        assert tracker.alignment_changed("ALIGN", 1500.0, 2000.0) == []
+        assert tracker.assembly_changed("Four Lane") == []
+        assert tracker.take_pending() == {}
+
+    @pytest.mark.unit
+    def test_pending_ranges_merge(self, tracker):
+        """Test repeated edits accumulate into merged ranges."""
+        tracker.alignment_changed("ALIGN", 100.0, 200.0)
+        tracker.alignment_changed("ALIGN", 150.0, 300.0)
+        tracker.alignment_changed("ALIGN", 700.0, 800.0)
+        assert tracker.pending_ranges("Corridor") == [(100.0, 300.0), (700.0, 800.0)]
+
+    @pytest.mark.unit
+    def test_assembly_change_schedules_full_range(self, tracker):
+        """Test component edits regenerate the whole corridor."""
+        tracker.assembly_changed("Two Lane")
+        assert tracker.take_pending() == {"Corridor": [(0.0, 1000.0)]}
+
+    @pytest.mark.unit
+    def test_constraint_change_schedules_changed_range(self, tracker):
+        """Test only the range of an added constraint is scheduled."""
+        manager = ConstraintManager()
+        manager.add_constraint(_width_constraint(100, 200, 4.0))
+        tracker.register(_dependency(), manager)
+
+        manager.add_constraint(_width_constraint(400, 450, 4.2))
+        assert tracker.constraints_changed("Two Lane", manager) == ["Corridor"]
+        assert tracker.take_pending() == {"Corridor": [(400.0, 450.0)]}
+        assert tracker.get("Corridor").constraint_fingerprint == constraint_fingerprint(manager)
+
+        # Same constraints with new IDs (rebuilt from UI properties)
+        rebuilt = ConstraintManager()
+        for c in manager.constraints:
+            rebuilt.add_constraint(_width_constraint(c.start_station, c.end_station, c.end_value))
+        assert tracker.constraints_changed("Two Lane", rebuilt) == []
+
+    @pytest.mark.unit
+    def test_listeners(self, tracker):
+        """Test listeners see each scheduled range and failures are contained."""
+        seen = []
+
+        def failing(name, start, end):
+            raise RuntimeError("listener error")
+
+        tracker.add_listener(failing)
+        tracker.add_listener(lambda name, start, end: seen.append((name, start, end)))
+        tracker.alignment_changed("ALIGN", 10.0, 20.0)
+        assert seen == [("Corridor", 10.0, 20.0)]
+
+    @pytest.mark.unit
+    def test_dependency_round_trip(self):
+        """Test dependency records survive serialization."""
+        dependency = _dependency()
+        dependency.constraint_fingerprint = "abc"
+        data = dependency.to_dict()
+        data["unknown_key"] = 1
+        assert CorridorDependency.from_dict(data) == dependency
+
+
+class TestVerticalAlignmentReporting:
+    """Tests for vertical alignment edits reaching the shared tracker."""
+
+    @pytest.fixture
+    def tracked_profile(self, sample_pvi_data):
+        """Profile on ALIGN with a corridor tracked over 0-400."""
+        tracker = get_change_tracker()
+        tracker.clear()
+        tracker.register(_dependency(end=400.0))
+
+        valign = VerticalAlignment("Profile")
+        valign.alignment_guid = "ALIGN"
+        for p in sample_pvi_data:
+            valign.add_pvi(p["station"], p["elevation"], p["curve_length"])
+        tracker.take_pending()
+
+        yield valign, tracker
+        tracker.clear()
+
+    @pytest.mark.unit
+    def test_pvi_edit_reports_local_range(self, tracked_profile):
+        """Test editing one PVI schedules only the segments around it."""
+        valign, tracker = tracked_profile
+        valign.update_pvi(2, elevation=101.5)
+
+        # Curves at PVIs 1-3 change (BVC 75, EVC 340); the end tangents don't
+        assert tracker.take_pending() == {"Corridor": [(75.0, 340.0)]}
+
+    @pytest.mark.unit
+    def test_untracked_profile_reports_nothing(self, sample_pvi_data):
+        """Test profiles without a tracked alignment don't schedule ranges."""
+        tracker = get_change_tracker()
+        tracker.clear()
+        valign = VerticalAlignment("Profile")
+        for p in sample_pvi_data:
+            valign.add_pvi(p["station"], p["elevation"], p["curve_length"])
+        valign.update_pvi(2, elevation=101.5)
+        assert tracker.take_pending() == {}
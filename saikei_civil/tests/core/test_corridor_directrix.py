@@ -0,0 +1,146 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Directrix Export
+====================================
+
+Tests for find_alignment_directrix(), select_changed_sections() and
+create_section_positions().
+"""
+
+import pytest
+
+pytest.importorskip("ifcopenshell")
+
+import ifcopenshell.guid
+
+from core.native_ifc_corridor import (
+    ProfileCache,
+    create_section_positions,
+    find_alignment_directrix,
+    select_changed_sections,
+)
+
+
+def _curve(ifc_file, ifc_type, **kwargs):
+    """Curve entity with an empty segment list."""
+    return ifc_file.create_entity(
+        ifc_type, Segments=[], SelfIntersect=False, **kwargs
+    )
+
+
+def _alignment(ifc_file, items):
+    """IfcAlignment with an Axis representation holding items."""
+    shape = ifc_file.create_entity(
+        "IfcShapeRepresentation",
+        RepresentationIdentifier="Axis",
+        RepresentationType="Curve3D",
+        Items=items,
+    )
+    return ifc_file.create_entity(
+        "IfcAlignment",
+        GlobalId=ifcopenshell.guid.new(),
+        Representation=ifc_file.create_entity(
+            "IfcProductDefinitionShape", Representations=[shape]
+        ),
+    )
+
+
+def _section(width):
+    """Rectangle points and tags for a section of the given width."""
+    points = [(-width, 0.0), (width, 0.0), (width, -0.3), (-width, -0.3), (-width, 0.0)]
+    return points, ["L", "R", "R_BTM", "L_BTM", "L"]
+
+
+class TestFindAlignmentDirectrix:
+    """Tests for locating the alignment's geometric curve."""
+
+    @pytest.mark.unit
+    def test_prefers_gradient_curve(self, ifc_file):
+        """Test the 3D gradient curve wins over the horizontal curve."""
+        composite = _curve(ifc_file, "IfcCompositeCurve")
+        gradient = _curve(ifc_file, "IfcGradientCurve", BaseCurve=composite)
+        alignment = _alignment(ifc_file, [composite, gradient])
+
+        assert find_alignment_directrix(alignment) == gradient
+
+    @pytest.mark.unit
+    def test_falls_back_to_composite_curve(self, ifc_file):
+        """Test an alignment without a profile uses its horizontal curve."""
+        composite = _curve(ifc_file, "IfcCompositeCurve")
+
+        assert find_alignment_directrix(_alignment(ifc_file, [composite])) == composite
+
+    @pytest.mark.unit
+    def test_no_representation(self, ifc_file):
+        """Test an alignment without geometry has no directrix."""
+        alignment = ifc_file.create_entity(
+            "IfcAlignment", GlobalId=ifcopenshell.guid.new()
+        )
+
+        assert find_alignment_directrix(alignment) is None
+
+
+class TestSelectChangedSections:
+    """Tests for dropping sections IFC can interpolate."""
+
+    @pytest.mark.unit
+    def test_constant_template_keeps_ends(self, ifc_file):
+        """Test a constant corridor needs only its first and last sections."""
+        cache = ProfileCache(ifc_file)
+        profiles = [cache.get_or_create(*_section(3.6), i) for i in range(2000)]
+
+        assert select_changed_sections(profiles).tolist() == [0, 1999]
+
+    @pytest.mark.unit
+    def test_transition_keeps_run_boundaries(self, ifc_file):
+        """Test each run of identical profiles keeps its first and last section."""
+        cache = ProfileCache(ifc_file)
+        widths = [3.6] * 5 + [4.0, 4.4] + [4.8] * 4
+        profiles = [cache.get_or_create(*_section(w), i) for i, w in enumerate(widths)]
+
+        assert select_changed_sections(profiles).tolist() == [0, 4, 5, 6, 7, 10]
+
+    @pytest.mark.unit
+    def test_two_stations(self, ifc_file):
+        """Test a two-station corridor keeps both sections."""
+        cache = ProfileCache(ifc_file)
+        profiles = [cache.get_or_create(*_section(3.6), i) for i in range(2)]
+
+        assert select_changed_sections(profiles).tolist() == [0, 1]
+
+
+class TestCreateSectionPositions:
+    """Tests for positioning sections along the directrix."""
+
+    @pytest.mark.unit
+    def test_positions_measured_along_directrix(self, ifc_file):
+        """Test each position is one point expression and one placement."""
+        directrix = _curve(ifc_file, "IfcCompositeCurve")
+        before = len(list(ifc_file))
+
+        positions = create_section_positions(ifc_file, directrix, [0.0, 125.5, 400.0])
+
+        assert len(list(ifc_file)) - before == 6
+        assert [p.Location.DistanceAlong.wrappedValue for p in positions] == [
+            0.0, 125.5, 400.0
+        ]
+        assert all(p.Location.BasisCurve == directrix for p in positions)
@@ -0,0 +1,195 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Mesh Arrays
+===============================
+
+Tests for the NumPy profile transform and tube topology used to fill
+corridor meshes in bulk.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from core.corridor import (
+    AssemblyWrapper,
+    ComponentData,
+    build_tube_topology,
+    collapse_coincident_points,
+    transform_profiles,
+)
+
+
+PROFILE = [(-3.6, -0.072), (0.0, 0.0), (3.6, -0.072),
+           (3.6, -0.222), (0.0, -0.15), (-3.6, -0.222)]
+
+
+def _reference_vertex(x, y, z, bearing, offset, elevation):
+    """Per-point transform used by the BMesh corridor path."""
+    return (x - offset * math.sin(bearing),
+            y + offset * math.cos(bearing),
+            z + elevation)
+
+
+class TestTransformProfiles:
+    """Tests for transform_profiles()."""
+
+    @pytest.mark.unit
+    def test_matches_per_point_transform(self):
+        """Test array transform equals the scalar station transform."""
+        positions = np.array([[0.0, 0.0, 100.0], [10.0, 5.0, 101.0],
+                              [20.0, 15.0, 102.5]])
+        bearings = np.array([0.0, 0.4, 1.2])
+
+        vertices = transform_profiles(positions, bearings, PROFILE)
+
+        assert vertices.shape == (3, len(PROFILE), 3)
+        for i, (x, y, z) in enumerate(positions):
+            for j, (offset, elevation) in enumerate(PROFILE):
+                expected = _reference_vertex(x, y, z, bearings[i], offset, elevation)
+                assert vertices[i, j] == pytest.approx(expected)
+
+    @pytest.mark.unit
+    def test_per_station_profiles(self):
+        """Test a distinct profile can be supplied for each station."""
+        positions = np.zeros((2, 3))
+        bearings = np.zeros(2)
+        profiles = np.array([PROFILE, PROFILE]) * np.array([[[1.0, 1.0]], [[2.0, 1.0]]])
+
+        vertices = transform_profiles(positions, bearings, profiles)
+
+        # Bearing 0 points along +X, so offsets land on Y
+        assert vertices[0, 0, 1] == pytest.approx(-3.6)
+        assert vertices[1, 0, 1] == pytest.approx(-7.2)
+
+
+class TestBuildTubeTopology:
+    """Tests for build_tube_topology()."""
+
+    @pytest.mark.unit
+    def test_counts(self):
+        """Test quad ring per station interval plus two end caps."""
+        loops, starts, totals = build_tube_topology(5, 6)
+
+        assert len(totals) == 4 * 6 + 2
+        assert np.all(totals[:-2] == 4)
+        assert list(totals[-2:]) == [6, 6]
+        assert len(loops) == totals.sum()
+        assert starts[0] == 0
+        assert np.array_equal(starts[1:], np.cumsum(totals)[:-1])
+
+    @pytest.mark.unit
+    def test_quads_wrap_around_profile(self):
+        """Test quads match the BMesh strip ordering, including wrap-around."""
+        loops, starts, _ = build_tube_topology(2, 4, start_cap=False, end_cap=False)
+
+        quads = loops.reshape(-1, 4).tolist()
+        assert quads == [[0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]]
+
+    @pytest.mark.unit
+    def test_end_caps_face_outward(self):
+        """Test start cap follows profile order and end cap is reversed."""
+        loops, starts, totals = build_tube_topology(3, 4)
+
+        start_cap = loops[starts[-2]:starts[-2] + totals[-2]]
+        end_cap = loops[starts[-1]:starts[-1] + totals[-1]]
+        assert list(start_cap) == [0, 1, 2, 3]
+        assert list(end_cap) == [11, 10, 9, 8]
+
+    @pytest.mark.unit
+    def test_every_edge_is_manifold(self):
+        """Test the capped tube is closed (each edge shared by two faces)."""
+        loops, starts, totals = build_tube_topology(4, 6)
+
+        edges = {}
+        for start, total in zip(starts, totals):
+            face = loops[start:start + total]
+            for a, b in zip(face, np.roll(face, -1)):
+                key = (min(a, b), max(a, b))
+                edges[key] = edges.get(key, 0) + 1
+
+        assert set(edges.values()) == {2}
+
+    @pytest.mark.unit
+    def test_degenerate_input(self):
+        """Test fewer than two stations produces no faces."""
+        loops, starts, totals = build_tube_topology(1, 6)
+
+        assert len(loops) == len(starts) == len(totals) == 0
+
+
+def _edge_counts(loops, starts, totals):
+    """Number of faces using each undirected edge."""
+    edges = {}
+    for start, total in zip(starts, totals):
+        face = loops[start:start + total]
+        for a, b in zip(face, np.roll(face, -1)):
+            key = (min(a, b), max(a, b))
+            edges[key] = edges.get(key, 0) + 1
+    return edges
+
+
+class TestCollapseCoincidentPoints:
+    """Tests for collapse_coincident_points()."""
+
+    @staticmethod
+    def _tube(components, station_count=4):
+        assembly = AssemblyWrapper("Test", components)
+        profiles = assembly.profiles_at(np.arange(station_count) * 10.0)
+        positions = np.zeros((station_count, 3))
+        positions[:, 0] = np.arange(station_count) * 10.0
+        vertices = transform_profiles(positions, np.zeros(station_count), profiles)
+        loops, _, totals = build_tube_topology(*vertices.shape[:2])
+        return vertices, loops, totals
+
+    @pytest.mark.unit
+    def test_zero_width_component(self):
+        """Test a zero-width component adds no vertices or zero-area faces."""
+        lanes = [
+            ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0),
+            ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0),
+        ]
+        tapered = lanes + [ComponentData("Right Turn", "LANE", 0.0, 0.02, 3.6, 0.0)]
+
+        expected = collapse_coincident_points(*self._tube(lanes))
+        vertices, loops, starts, totals = collapse_coincident_points(*self._tube(tapered))
+
+        assert len(vertices) == len(expected[0])
+        assert len(totals) == len(expected[3])
+        assert np.unique(np.round(vertices, 6), axis=0).shape[0] == len(vertices)
+        for start, total in zip(starts, totals):
+            assert len(set(loops[start:start + total])) == total
+        assert set(_edge_counts(loops, starts, totals).values()) == {2}
+
+    @pytest.mark.unit
+    def test_unchanged_without_coincident_points(self):
+        """Test ordinary profiles pass through untouched."""
+        vertices = transform_profiles(np.zeros((3, 3)), np.zeros(3), PROFILE)
+        loops, starts, totals = build_tube_topology(3, len(PROFILE))
+
+        result = collapse_coincident_points(vertices, loops, totals)
+
+        assert np.array_equal(result[0], vertices.reshape(-1, 3))
+        assert np.array_equal(result[1], loops)
+        assert np.array_equal(result[2], starts)
+        assert np.array_equal(result[3], totals)
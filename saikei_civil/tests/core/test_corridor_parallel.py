@@ -0,0 +1,212 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Parallel Corridor Evaluation
+======================================
+
+Tests for CorridorSnapshot, partition_stations() and
+compute_corridor_arrays().
+"""
+
+import math
+import multiprocessing
+import pickle
+
+import numpy as np
+import pytest
+
+from core import corridor_parallel
+from core.corridor import AssemblyWrapper, ComponentData
+from core.corridor_parallel import (
+    CorridorArrays,
+    CorridorSnapshot,
+    compute_corridor_arrays,
+    partition_stations,
+)
+from core.horizontal_alignment import CompiledHorizontalAlignment
+from core.parametric_constraints import ConstraintManager, ParametricConstraint
+from core.vertical_alignment import VerticalAlignment
+from core.vertical_alignment.profile_table import VerticalProfileTable
+
+
+@pytest.fixture
+def snapshot(sample_pvi_data):
+    """Tangent-arc-tangent layout, sample profile, two-lane assembly with a widening."""
+    horizontal = CompiledHorizontalAlignment(
+        start_x=[0.0, 150.0, 150.0 + 100.0],
+        start_y=[0.0, 0.0, 100.0],
+        start_directions=[0.0, 0.0, math.pi / 2],
+        curvatures=[0.0, 1.0 / 100.0, 0.0],
+        lengths=[150.0, math.pi * 50.0, 170.0],
+    )
+
+    valign = VerticalAlignment("Profile")
+    for p in sample_pvi_data:
+        valign.add_pvi(p["station"], p["elevation"], p["curve_length"])
+
+    constraints = ConstraintManager()
+    constraints.add_constraint(ParametricConstraint.create_range_constraint(
+        "Right Lane", "width", 120.0, 220.0, 3.6, 5.0
+    ))
+    assembly = AssemblyWrapper("Two Lane", [
+        ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0),
+        ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0),
+    ], constraint_manager=constraints)
+
+    return CorridorSnapshot(
+        horizontal=horizontal,
+        vertical=VerticalProfileTable.from_segments(valign.segments),
+        assembly=assembly.compile(),
+        constraint_manager=constraints,
+    )
+
+
+def _assert_arrays_equal(a: CorridorArrays, b: CorridorArrays):
+    for name in ("stations", "positions", "bearings", "grades", "profiles"):
+        np.testing.assert_allclose(getattr(a, name), getattr(b, name), err_msg=name)
+
+
+class TestPartitionStations:
+    """Tests for partition_stations()."""
+
+    @pytest.mark.unit
+    def test_ranges_cover_all_stations_in_order(self):
+        """Test partitions are contiguous and cover every index once."""
+        ranges = partition_stations(10007, 8, min_size=100)
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == 10007
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert len(ranges) == 8
+
+    @pytest.mark.unit
+    def test_min_size_limits_partition_count(self):
+        """Test short lists are not split below the minimum range size."""
+        assert partition_stations(250, 16, min_size=100) == [(0, 83), (83, 167), (167, 250)]
+        assert partition_stations(50, 16, min_size=100) == [(0, 50)]
+        assert partition_stations(0, 4) == []
+
+
+class TestCorridorSnapshot:
+    """Tests for serial CorridorSnapshot.evaluate()."""
+
+    @pytest.mark.unit
+    def test_matches_scalar_queries(self, snapshot):
+        """Test bulk evaluation matches the scalar evaluators."""
+        stations = np.linspace(0.0, 400.0, 81)
+        arrays = snapshot.evaluate(stations, stations)
+
+        for i, station in enumerate(stations):
+            x, y, bearing, _ = snapshot.horizontal.evaluate_at(station)
+            z = snapshot.vertical.elevation_at(station)
+            assert arrays.positions[i] == pytest.approx((x, y, z))
+            assert arrays.bearings[i] == pytest.approx(bearing)
+            assert arrays.grades[i] == pytest.approx(snapshot.vertical.grade_at(station))
+
+        expected = snapshot.assembly.profiles_at(stations, snapshot.constraint_manager)
+        np.testing.assert_allclose(arrays.profiles, expected)
+
+    @pytest.mark.unit
+    def test_outside_profile_uses_first_elevation(self, snapshot):
+        """Test stations past the profile fall back like AlignmentWrapper."""
+        arrays = snapshot.evaluate(np.array([500.0]), np.array([500.0]))
+        assert arrays.positions[0, 2] == pytest.approx(snapshot.vertical.start_elevations[0])
+        assert arrays.grades[0] == 0.0
+
+    @pytest.mark.unit
+    def test_pickle_round_trip(self, snapshot):
+        """Test snapshots survive pickling without the spatial index."""
+        snapshot.horizontal.spatial_index
+        restored = pickle.loads(pickle.dumps(snapshot))
+        assert restored.horizontal._spatial_index is None
+
+        stations = np.linspace(0.0, 400.0, 41)
+        _assert_arrays_equal(
+            restored.evaluate(stations, stations),
+            snapshot.evaluate(stations, stations),
+        )
+
+    @pytest.mark.unit
+    def test_slice_and_concatenate(self, snapshot):
+        """Test station ranges split and rejoin losslessly."""
+        stations = np.linspace(0.0, 400.0, 41)
+        arrays = snapshot.evaluate(stations, stations)
+        parts = [arrays.slice(slice(0, 10)), arrays.slice(slice(10, None))]
+        _assert_arrays_equal(CorridorArrays.concatenate(parts), arrays)
+
+
+class TestComputeCorridorArrays:
+    """Tests for compute_corridor_arrays()."""
+
+    @pytest.mark.unit
+    def test_serial_below_threshold(self, snapshot):
+        """Test short corridors are evaluated in-process."""
+        stations = np.linspace(0.0, 400.0, 101)
+        arrays = compute_corridor_arrays(snapshot, stations, stations, workers=4)
+        _assert_arrays_equal(arrays, snapshot.evaluate(stations, stations))
+
+    @pytest.mark.unit
+    def test_shape_mismatch(self, snapshot):
+        """Test stations and distances must line up."""
+        with pytest.raises(ValueError):
+            compute_corridor_arrays(snapshot, np.zeros(3), np.zeros(4))
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="fork start method not available"
+    )
+    def test_parallel_matches_serial(self, snapshot, monkeypatch):
+        """Test a 50 km-scale station list runs on the pool and matches serial."""
+        mapped = []
+
+        class RecordingPool(corridor_parallel.ProcessPoolExecutor):
+            def map(self, fn, *iterables, **kwargs):
+                results = list(super().map(fn, *iterables, **kwargs))
+                mapped.append(len(results))
+                return results
+
+        monkeypatch.setattr(corridor_parallel, "ProcessPoolExecutor", RecordingPool)
+
+        # 25,000 stations: 50 km at 2 m spacing, above the default threshold
+        stations = np.linspace(0.0, 400.0, 25001)
+        assert len(stations) >= corridor_parallel.MIN_PARALLEL_STATIONS
+        arrays = compute_corridor_arrays(
+            snapshot, stations, stations,
+            workers=2,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+
+        partitions = partition_stations(len(stations), 2 * corridor_parallel.PARTITIONS_PER_WORKER)
+        assert mapped == [len(partitions)]
+        _assert_arrays_equal(arrays, snapshot.evaluate(stations, stations))
+
+    @pytest.mark.unit
+    def test_min_parallel_keeps_short_lists_serial(self, snapshot, monkeypatch):
+        """Test station counts below min_parallel never start a pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool started")
+
+        monkeypatch.setattr(corridor_parallel, "ProcessPoolExecutor", no_pool)
+        stations = np.linspace(0.0, 400.0, 5001)
+        arrays = compute_corridor_arrays(
+            snapshot, stations, stations, workers=4, min_parallel=5002
+        )
+        assert len(arrays) == len(stations)
@@ -0,0 +1,188 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Profile Reuse
+=================================
+
+Tests for ProfileCache and create_profile_from_assembly(profile_cache=...).
+"""
+
+import numpy as np
+import pytest
+
+from core.corridor import AssemblyWrapper, ComponentData
+from core.native_ifc_corridor import (
+    ProfileCache,
+    create_profile_from_assembly,
+    create_profiles_from_assembly,
+)
+from core.parametric_constraints import (
+    ConstraintManager,
+    ParametricConstraint,
+    ConstraintType,
+)
+
+
+def _assembly():
+    """Two 3.6 m lanes."""
+    return AssemblyWrapper("Two Lane", [
+        ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0),
+        ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0),
+    ])
+
+
+def _profiles(ifc_file, assembly, stations):
+    """Export one profile per station through a shared cache."""
+    cache = ProfileCache(ifc_file)
+    profiles = [
+        create_profile_from_assembly(ifc_file, assembly, s, profile_cache=cache)
+        for s in stations
+    ]
+    return cache, profiles
+
+
+class TestProfileCache:
+    """Tests for profile reuse across stations."""
+
+    @pytest.mark.unit
+    def test_constant_template_shares_one_profile(self, ifc_file):
+        """Test a constant template creates a single profile entity."""
+        stations = [i * 10.0 for i in range(200)]
+        cache, profiles = _profiles(ifc_file, _assembly(), stations)
+
+        assert len(cache) == 1
+        assert cache.request_count == 200
+        assert len({p.id() for p in profiles}) == 1
+        assert len(ifc_file.by_type("IfcArbitraryClosedProfileDef")) == 1
+        assert len(ifc_file.by_type("IfcCartesianPointList2D")) == 1
+
+    @pytest.mark.unit
+    def test_transition_creates_distinct_profiles(self, ifc_file):
+        """Test only stations inside a widening get their own profiles."""
+        assembly = _assembly()
+        manager = ConstraintManager()
+        manager.add_constraint(ParametricConstraint(
+            id="widen",
+            component_name="Right Lane",
+            parameter_name="width",
+            constraint_type=ConstraintType.RANGE,
+            start_station=100.0,
+            end_station=140.0,
+            start_value=3.6,
+            end_value=4.8,
+        ))
+        assembly.constraint_manager = manager
+
+        stations = [i * 10.0 for i in range(31)]
+        cache, profiles = _profiles(ifc_file, assembly, stations)
+
+        # 110-140 vary, 100 matches the template, 150+ is back to 3.6 m
+        assert len(cache) == 5
+        assert profiles[0] is profiles[30]
+        assert profiles[10] is profiles[0]
+        assert profiles[12] is not profiles[13]
+
+    @pytest.mark.unit
+    def test_key_ignores_rounding_noise_and_signed_zero(self, ifc_file):
+        """Test sub-tolerance differences hash to the same key."""
+        cache = ProfileCache(ifc_file)
+        tags = ["A", "B", "C"]
+
+        a = cache.key([(0.0, 0.0), (1.0, 0.0), (1.0, -0.2)], tags)
+        b = cache.key([(-0.0, 1e-9), (1.0, 0.0), (1.0, -0.2)], tags)
+        c = cache.key([(0.0, 0.0), (1.0, 0.0), (1.0, -0.2)], ["A", "B", "D"])
+
+        assert a == b
+        assert a != c
+
+
+def _rural_assembly():
+    """Lane and shoulder on each side, listed out of offset order."""
+    return AssemblyWrapper("Rural", [
+        ComponentData("Right Shoulder", "SHOULDER", 2.4, 0.04, 3.6, -0.072),
+        ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0),
+        ComponentData("Left Shoulder", "SHOULDER", 2.4, 0.04, -6.0, -0.072),
+        ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0),
+    ])
+
+
+class TestAssemblyProfileExport:
+    """Tests for IFC profiles built from AssemblyWrapper.profiles_at()."""
+
+    @staticmethod
+    def _coords_and_tags(profile):
+        point_list = profile.OuterCurve.Points
+        return np.array(point_list.CoordList), list(point_list.TagList)
+
+    @pytest.mark.unit
+    def test_matches_profiles_at(self, ifc_file):
+        """Test the IFC polygon is the mesh profile, closed on its first point."""
+        assembly = _rural_assembly()
+        expected = np.array(assembly.profiles_at([0.0])[0])
+
+        profile = create_profile_from_assembly(ifc_file, assembly, 0.0)
+        coords, tags = self._coords_and_tags(profile)
+
+        np.testing.assert_allclose(coords[:-1], expected)
+        np.testing.assert_allclose(coords[-1], expected[0])
+        np.testing.assert_allclose(
+            expected[:5],
+            [[-6.0, -0.168], [-3.6, -0.072], [0.0, 0.0], [3.6, -0.072], [6.0, -0.168]],
+        )
+
+        # Top edge runs strictly left to right, so the polygon cannot cross
+        assert np.all(np.diff(coords[:5, 0]) > 0)
+        assert tags[:5] == ["L_SHOULDER_OUT", "L_LANE_OUT", "CL", "R_LANE_OUT", "R_SHOULDER_OUT"]
+        assert tags[5:-1] == [f"{tag}_BTM" for tag in reversed(tags[:5])]
+        assert tags[-1] == tags[0]
+
+    @pytest.mark.unit
+    def test_constrained_stations_match_profiles_at(self, ifc_file):
+        """Test every station of a widening matches profiles_at."""
+        assembly = _rural_assembly()
+        assembly.components.append(
+            ComponentData("Left Lane 2", "LANE", 3.0, 0.02, -9.0, 0.0)
+        )
+        manager = ConstraintManager()
+        manager.add_constraint(ParametricConstraint(
+            id="widen",
+            component_name="Left Shoulder",
+            parameter_name="width",
+            constraint_type=ConstraintType.RANGE,
+            start_station=20.0,
+            end_station=60.0,
+            start_value=2.4,
+            end_value=4.0,
+        ))
+        assembly.constraint_manager = manager
+
+        stations = np.arange(0.0, 90.0, 10.0)
+        expected = assembly.profiles_at(stations)
+        profiles = create_profiles_from_assembly(ifc_file, assembly, stations)
+
+        assert len(profiles) == len(stations)
+        for profile, section in zip(profiles, expected):
+            coords, tags = self._coords_and_tags(profile)
+            np.testing.assert_allclose(coords[:-1], section)
+            assert tags[:6] == [
+                "L_LANE_OUT_2", "L_SHOULDER_OUT", "L_LANE_OUT",
+                "CL", "R_LANE_OUT", "R_SHOULDER_OUT",
+            ]
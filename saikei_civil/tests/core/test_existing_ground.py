@@ -0,0 +1,140 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Existing-Ground Sections
+===================================
+
+Tests for section_offsets() and sample_ground_sections().
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from core.corridor import AssemblyWrapper, ComponentData, transform_profiles
+from core.existing_ground import sample_ground_sections, section_offsets
+from core.native_ifc_corridor import StationPoint
+from core.terrain_index import TerrainIndex
+from core.parametric_constraints import (
+    ConstraintManager,
+    ParametricConstraint,
+    ConstraintType,
+)
+
+
+def _plane(a=0.05, b=-0.02, c=100.0, size=500.0):
+    """Two-triangle planar terrain z = a*x + b*y + c over [-size, size]^2."""
+    corners = np.array([[-size, -size], [size, -size], [size, size], [-size, size]])
+    vertices = np.column_stack([corners, a * corners[:, 0] + b * corners[:, 1] + c])
+    return TerrainIndex(vertices, [[0, 1, 2], [0, 2, 3]])
+
+
+def _assembly():
+    return AssemblyWrapper("Two Lane", [
+        ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0),
+        ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0),
+    ])
+
+
+class TestSectionOffsets:
+    """Tests for the sampled offset range."""
+
+    @pytest.mark.unit
+    def test_covers_assembly_plus_buffer(self):
+        """Test offsets run from the buffered left edge to the right one."""
+        offsets = section_offsets(_assembly(), [0.0, 100.0], buffer=10.0, spacing=1.0)
+
+        assert offsets[0] == pytest.approx(-13.6)
+        assert offsets[-1] == pytest.approx(13.6)
+        assert 0.0 in offsets
+        assert np.all(np.diff(offsets) > 0)
+        assert np.diff(offsets).max() <= 1.0 + 1e-9
+
+    @pytest.mark.unit
+    def test_includes_constraint_widening(self):
+        """Test a widening at one station widens the sampled range."""
+        assembly = _assembly()
+        manager = ConstraintManager()
+        manager.add_constraint(ParametricConstraint(
+            id="widen",
+            component_name="Right Lane",
+            parameter_name="width",
+            constraint_type=ConstraintType.RANGE,
+            start_station=50.0,
+            end_station=150.0,
+            start_value=6.0,
+            end_value=6.0,
+        ))
+        assembly.constraint_manager = manager
+
+        offsets = section_offsets(assembly, [0.0, 100.0, 200.0], buffer=5.0)
+
+        assert offsets[-1] == pytest.approx(11.0)
+        assert offsets[0] == pytest.approx(-8.6)
+
+
+class TestSampleGroundSections:
+    """Tests for bulk ground sampling."""
+
+    @pytest.mark.unit
+    def test_matches_terrain_at_transformed_points(self):
+        """Test every cell equals the terrain under the mesh-space point."""
+        stations = [
+            StationPoint(10.0 * i, 3.0 * i, 2.0 * i, 0.0, 0.3 + 0.1 * i, 0.0)
+            for i in range(20)
+        ]
+        offsets = np.linspace(-15.0, 15.0, 31)
+
+        ground = sample_ground_sections(_plane(), stations, offsets)
+
+        assert ground.shape == (20, 31)
+        assert ground.elevations.dtype == np.float32
+        assert ground.stations.tolist() == [s.station for s in stations]
+
+        positions = np.array([(s.x, s.y, 0.0) for s in stations])
+        bearings = np.array([s.direction for s in stations])
+        points = transform_profiles(
+            positions, bearings, np.column_stack([offsets, np.zeros(31)])
+        )
+        expected = 0.05 * points[..., 0] - 0.02 * points[..., 1] + 100.0
+        assert ground.elevations == pytest.approx(expected, abs=1e-4)
+
+    @pytest.mark.unit
+    def test_offsets_perpendicular_to_bearing(self):
+        """Test offsets run across the alignment, not along it."""
+        station = StationPoint(0.0, 0.0, 0.0, 0.0, math.pi / 2, 0.0)
+
+        # Heading north, so offsets move along X
+        ground = sample_ground_sections(_plane(a=1.0, b=0.0, c=0.0), [station], [-2.0, 2.0])
+
+        assert abs(ground.elevations[0, 1] - ground.elevations[0, 0]) == pytest.approx(4.0)
+
+    @pytest.mark.unit
+    def test_off_terrain_points_are_nan(self):
+        """Test points beyond the terrain are NaN and lower coverage."""
+        station = StationPoint(0.0, 495.0, 0.0, 0.0, math.pi / 2, 0.0)
+
+        ground = sample_ground_sections(_plane(), [station], [-10.0, 0.0, 10.0])
+
+        assert np.isnan(ground.elevations).sum() == 1
+        assert ground.coverage == pytest.approx(2.0 / 3.0)
+        assert ground.section_at(1.0).shape == (3,)
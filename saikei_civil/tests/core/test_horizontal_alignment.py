@@ -27,9 +27,27 @@ Tests for SimpleVector, curve geometry, and stationing calculations.
 
 import math
 
+import numpy as np
 import pytest
 
-from core.horizontal_alignment import SimpleVector, StationingManager
+from core.horizontal_alignment import (
+    SimpleVector,
+    StationingManager,
+    CompiledHorizontalAlignment,
+    NativeIfcAlignment,
+    calculate_curve_geometry,
+    create_tangent_segment,
+    create_curve_segment,
+    update_tangent_segment,
+    update_curve_segment,
+    collect_entity_ids,
+    remove_segment_entities,
+    find_composite_curve,
+)
+from core.vertical_alignment import VerticalAlignment
+from core.alignment import get_station_at_point
+from core.ifc_manager import NativeIfcManager
+from conftest import requires_blender
 
 
 class TestSimpleVector:
@@ -156,6 +174,518 @@ class TestStationingManager:
         assert distance_back == pytest.approx(original_distance)
 
 
+class TestStationEquationLookup:
+    """Tests for array-backed station/distance conversion with equations."""
+
+    @staticmethod
+    def _stationing(outgoing_station):
+        """Start at 10+000 with an equation at 500m (10+500 -> outgoing)."""
+        sm = StationingManager(None, None)
+        sm.set_starting_station(10000.0)
+        sm.add_station_equation(500.0, 10500.0, outgoing_station)
+        return sm
+
+    @pytest.mark.unit
+    def test_forward_equation(self):
+        """Test a forward jump leaves a gap in station values."""
+        sm = self._stationing(11000.0)
+        assert sm.get_station_at_distance(250.0) == pytest.approx(10250.0)
+        assert sm.get_station_at_distance(600.0) == pytest.approx(11100.0)
+        assert sm.get_distance_at_station(11100.0) == pytest.approx(600.0)
+        assert sm.get_distance_at_station(10700.0) is None
+        assert sm.get_distance_at_station(9900.0) == pytest.approx(-100.0)
+
+    @pytest.mark.unit
+    def test_backward_equation(self):
+        """Test a backward jump returns the first occurrence of a station."""
+        sm = self._stationing(10300.0)
+        assert sm.get_station_at_distance(600.0) == pytest.approx(10400.0)
+        assert sm.get_distance_at_station(10400.0) == pytest.approx(400.0)
+        assert sm.get_distance_at_station(10550.0) == pytest.approx(750.0)
+
+    @pytest.mark.unit
+    def test_bulk_matches_scalar(self):
+        """Test vectorized conversion agrees with the scalar lookups."""
+        for outgoing in (11000.0, 10300.0):
+            sm = self._stationing(outgoing)
+            distances = np.linspace(-50.0, 1000.0, 211)
+            stations = sm.stations_from_distances(distances)
+            assert stations.tolist() == pytest.approx(
+                [sm.get_station_at_distance(d) for d in distances]
+            )
+
+            queries = np.linspace(9900.0, 11600.0, 341)
+            expected = [sm.get_distance_at_station(q) for q in queries]
+            result = sm.distances_from_stations(queries)
+            for value, reference in zip(result, expected):
+                if reference is None:
+                    assert np.isnan(value)
+                else:
+                    assert value == pytest.approx(reference)
+
+    @pytest.mark.unit
+    def test_round_stations_per_region(self):
+        """Test round stations are generated within each equation region."""
+        sm = self._stationing(10300.0)
+        stations, distances = sm.round_stations(100.0, 800.0)
+        assert stations.tolist() == pytest.approx([
+            10000.0, 10100.0, 10200.0, 10300.0, 10400.0,
+            10300.0, 10400.0, 10500.0, 10600.0,
+        ])
+        assert distances.tolist() == pytest.approx([
+            0.0, 100.0, 200.0, 300.0, 400.0, 500.0, 600.0, 700.0, 800.0,
+        ])
+
+
+class TestCompiledHorizontalAlignment:
+    """Tests for the array-backed horizontal alignment evaluator."""
+
+    @staticmethod
+    def _tangent_curve_tangent():
+        """Tangent east, 90 degree left curve R=50, tangent north."""
+        radius = 50.0
+        arc_length = radius * math.pi / 2
+        return [
+            {
+                'type': 'LINE',
+                'start': SimpleVector(0.0, 0.0),
+                'direction': 0.0,
+                'length': 100.0,
+            },
+            {
+                'type': 'CIRCULARARC',
+                'center': SimpleVector(100.0, radius),
+                'radius': radius,
+                'start_angle': -math.pi / 2,
+                'is_ccw': True,
+                'length': arc_length,
+            },
+            {
+                'type': 'LINE',
+                'start': SimpleVector(100.0 + radius, radius),
+                'direction': math.pi / 2,
+                'length': 100.0,
+            },
+        ]
+
+    @pytest.mark.unit
+    def test_total_length(self):
+        """Test cumulative length of compiled layout."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            self._tangent_curve_tangent()
+        )
+        assert evaluator.segment_count == 3
+        assert evaluator.total_length == pytest.approx(200.0 + 25.0 * math.pi)
+
+    @pytest.mark.unit
+    def test_evaluate_on_tangent(self):
+        """Test position and bearing on the first tangent."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            self._tangent_curve_tangent()
+        )
+        x, y, bearing, curvature = evaluator.evaluate_at(40.0)
+        assert x == pytest.approx(40.0)
+        assert y == pytest.approx(0.0)
+        assert bearing == pytest.approx(0.0)
+        assert curvature == 0.0
+
+    @pytest.mark.unit
+    def test_evaluate_on_arc(self):
+        """Test position, bearing and curvature at the arc midpoint."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            self._tangent_curve_tangent()
+        )
+        x, y, bearing, curvature = evaluator.evaluate_at(100.0 + 12.5 * math.pi)
+        assert x == pytest.approx(100.0 + 50.0 * math.sin(math.pi / 4))
+        assert y == pytest.approx(50.0 - 50.0 * math.cos(math.pi / 4))
+        assert bearing == pytest.approx(math.pi / 4)
+        assert curvature == pytest.approx(1.0 / 50.0)
+
+    @pytest.mark.unit
+    def test_batch_matches_scalar(self):
+        """Test vectorized evaluation matches scalar evaluation."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            self._tangent_curve_tangent()
+        )
+        distances = np.linspace(0.0, evaluator.total_length, 97)
+        xs, ys, bearings, curvatures = evaluator.evaluate(distances)
+
+        for i, distance in enumerate(distances):
+            x, y, bearing, curvature = evaluator.evaluate_at(float(distance))
+            assert xs[i] == pytest.approx(x)
+            assert ys[i] == pytest.approx(y)
+            assert bearings[i] == pytest.approx(bearing)
+            assert curvatures[i] == pytest.approx(curvature)
+
+    @pytest.mark.unit
+    def test_boundary_belongs_to_earlier_segment(self):
+        """Test a distance on a segment boundary resolves to the earlier segment."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            self._tangent_curve_tangent()
+        )
+        assert evaluator.locate([100.0]).tolist() == [0]
+        assert evaluator.locate([100.001]).tolist() == [1]
+
+    @pytest.mark.unit
+    def test_skips_zero_length_segments(self):
+        """Test zero-length endpoint segments are not compiled."""
+        segments = self._tangent_curve_tangent() + [{
+            'type': 'LINE',
+            'start': SimpleVector(150.0, 150.0),
+            'direction': math.pi / 2,
+            'length': 0.0,
+        }]
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(segments)
+        assert evaluator.segment_count == 3
+        assert evaluator.source_indices.tolist() == [0, 1, 2]
+
+
+class TestAlignmentSpatialIndex:
+    """Tests for point projection onto a compiled alignment."""
+
+    @staticmethod
+    def _winding_layout(count=40, seed=7):
+        """Chain of tangents and left/right arcs with consistent start points."""
+        rng = np.random.default_rng(seed)
+        radii = rng.choice([-1.0, 1.0], count) * rng.uniform(30.0, 200.0, count)
+        curvatures = np.where(np.arange(count) % 2 == 1, 1.0 / radii, 0.0)
+        lengths = rng.uniform(10.0, 80.0, count)
+        x, y, direction = [0.0], [0.0], [0.3]
+        for i in range(count - 1):
+            partial = CompiledHorizontalAlignment(
+                x[-1:], y[-1:], direction[-1:], curvatures[i:i + 1], lengths[i:i + 1]
+            )
+            ex, ey, eb, _ = partial.evaluate_at(lengths[i])
+            x.append(ex)
+            y.append(ey)
+            direction.append(eb)
+        return CompiledHorizontalAlignment(x, y, direction, curvatures, lengths)
+
+    @pytest.mark.unit
+    def test_project_inside_arc(self):
+        """Test a point inside a left curve projects radially with left offset."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            TestCompiledHorizontalAlignment._tangent_curve_tangent()
+        )
+        angle = -math.pi / 4
+        point = (100.0 + 30.0 * math.cos(angle), 50.0 + 30.0 * math.sin(angle))
+        stations, offsets, segments = evaluator.project_points([point], start_station=1000.0)
+
+        assert stations[0] == pytest.approx(1000.0 + 100.0 + 50.0 * math.pi / 4)
+        assert offsets[0] == pytest.approx(20.0)
+        assert segments[0] == 1
+
+    @pytest.mark.unit
+    def test_matches_dense_sampling(self):
+        """Test projected distances match a brute-force nearest sample."""
+        evaluator = self._winding_layout()
+        sx, sy, _, _ = evaluator.evaluate(np.linspace(0.0, evaluator.total_length, 200001))
+
+        rng = np.random.default_rng(3)
+        lo = np.array([sx.min(), sy.min()]) - 50.0
+        hi = np.array([sx.max(), sy.max()]) + 50.0
+        points = rng.uniform(lo, hi, (300, 2))
+
+        stations, offsets, _ = evaluator.project_points(points)
+        brute = np.array([np.hypot(sx - px, sy - py).min() for px, py in points])
+        np.testing.assert_allclose(np.abs(offsets), brute, atol=0.02)
+
+        px, py, _, _ = evaluator.evaluate(stations)
+        np.testing.assert_allclose(np.hypot(points[:, 0] - px, points[:, 1] - py), brute, atol=0.02)
+
+    @pytest.mark.unit
+    def test_max_offset(self):
+        """Test points beyond max_offset are reported as misses."""
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(
+            TestCompiledHorizontalAlignment._tangent_curve_tangent()
+        )
+        stations, offsets, segments = evaluator.project_points(
+            [(50.0, 5.0), (50.0, -500.0)], max_offset=10.0
+        )
+        assert stations[0] == pytest.approx(50.0)
+        assert offsets[0] == pytest.approx(5.0)
+        assert np.isnan(stations[1]) and np.isnan(offsets[1])
+        assert segments.tolist() == [0, -1]
+
+    @pytest.mark.unit
+    def test_get_station_at_point_on_arc(self):
+        """Test the scalar helper projects exactly onto arcs."""
+        segments = TestCompiledHorizontalAlignment._tangent_curve_tangent()
+        angle = -math.pi / 6
+        point = (100.0 + 55.0 * math.cos(angle), 50.0 + 55.0 * math.sin(angle))
+        station = get_station_at_point(segments, point, start_station=10000.0)
+        assert station == pytest.approx(10000.0 + 100.0 + 50.0 * math.pi / 3)
+        assert get_station_at_point(segments, (500.0, 500.0)) is None
+
+    @pytest.mark.unit
+    def test_project_with_station_equation(self):
+        """Test projected stations follow the referents' station equation."""
+        segments = TestCompiledHorizontalAlignment._tangent_curve_tangent()
+        evaluator = CompiledHorizontalAlignment.from_segment_dicts(segments)
+        arc_length = 50.0 * math.pi / 2
+
+        # 10+000 at the start, 10+120 back = 11+000 ahead on the curve
+        stationing = StationingManager(None, None)
+        stationing.set_starting_station(10000.0)
+        stationing.add_station_equation(120.0, 10120.0, 11000.0)
+
+        angle = -math.pi / 4
+        points = [
+            (50.0, 5.0),
+            (100.0 + 30.0 * math.cos(angle), 50.0 + 30.0 * math.sin(angle)),
+            (155.0, 90.0),
+            (50.0, -500.0),
+        ]
+        stations, offsets, segment_indices = evaluator.project_points(
+            points, max_offset=50.0, stationing=stationing
+        )
+
+        assert stations[:3].tolist() == pytest.approx([
+            10050.0,
+            11000.0 + (100.0 + 50.0 * math.pi / 4 - 120.0),
+            11000.0 + (100.0 + arc_length + 40.0 - 120.0),
+        ])
+        assert offsets[:3].tolist() == pytest.approx([5.0, 20.0, -5.0])
+        assert np.isnan(stations[3])
+        assert segment_indices.tolist() == [0, 1, 2, -1]
+
+        station = get_station_at_point(segments, (155.0, 90.0), stationing=stationing)
+        assert station == pytest.approx(stations[2])
+
+
+class TestInPlaceSegmentUpdate:
+    """Tests for editing IFC segments in place instead of recreating them."""
+
+    @pytest.fixture(autouse=True)
+    def _require_ifc(self, ifc_file):
+        if ifc_file is None:
+            pytest.skip("ifcopenshell not installed")
+
+    @staticmethod
+    def _segment_values(segment, curve_geometry):
+        """Flatten the numeric attributes written by the segment builders."""
+        params = segment.DesignParameters
+        placement = curve_geometry.Placement
+        values = list(params.StartPoint.Coordinates) + [
+            params.StartDirection,
+            params.SegmentLength,
+            params.StartRadiusOfCurvature,
+            curve_geometry.SegmentLength.wrappedValue,
+        ]
+        values += list(placement.Location.Coordinates)
+        values += list(placement.RefDirection.DirectionRatios)
+        parent = curve_geometry.ParentCurve
+        if parent.is_a("IfcLine"):
+            values += list(parent.Pnt.Coordinates)
+            values += list(parent.Dir.Orientation.DirectionRatios)
+        else:
+            values += list(parent.Position.Location.Coordinates)
+            values += list(parent.Position.RefDirection.DirectionRatios)
+            values.append(parent.Radius)
+        return values
+
+    @pytest.mark.unit
+    def test_update_tangent_matches_create(self, ifc_file):
+        """Test an updated tangent equals a freshly created one."""
+        segment, geometry, _ = create_tangent_segment(
+            ifc_file, SimpleVector(0.0, 0.0), SimpleVector(100.0, 0.0)
+        )
+        entity_count = len(list(ifc_file))
+
+        end = update_tangent_segment(
+            ifc_file, segment, geometry,
+            SimpleVector(10.0, 5.0), SimpleVector(90.0, 65.0)
+        )
+        assert len(list(ifc_file)) == entity_count
+
+        fresh, fresh_geometry, fresh_end = create_tangent_segment(
+            ifc_file, SimpleVector(10.0, 5.0), SimpleVector(90.0, 65.0)
+        )
+
+        assert end == pytest.approx(fresh_end)
+        assert self._segment_values(segment, geometry) == pytest.approx(
+            self._segment_values(fresh, fresh_geometry)
+        )
+
+    @pytest.mark.unit
+    def test_update_curve_matches_create(self, ifc_file):
+        """Test an updated curve equals a freshly created one."""
+        before = calculate_curve_geometry(
+            SimpleVector(0.0, 0.0), SimpleVector(200.0, 0.0), SimpleVector(300.0, 150.0), 80.0
+        )
+        after = calculate_curve_geometry(
+            SimpleVector(0.0, 0.0), SimpleVector(210.0, 20.0), SimpleVector(250.0, -150.0), 60.0
+        )
+        segment, geometry, _ = create_curve_segment(ifc_file, before)
+        entity_count = len(list(ifc_file))
+
+        end = update_curve_segment(ifc_file, segment, geometry, after)
+        assert len(list(ifc_file)) == entity_count
+
+        fresh, fresh_geometry, fresh_end = create_curve_segment(ifc_file, after)
+
+        assert end == pytest.approx(fresh_end)
+        assert self._segment_values(segment, geometry) == pytest.approx(
+            self._segment_values(fresh, fresh_geometry)
+        )
+
+    @pytest.mark.unit
+    def test_remove_segment_entities_counts_removed(self, ifc_file):
+        """Test removing a segment leaves nothing behind and reports the count."""
+        entity_count = len(list(ifc_file))
+        segment, geometry, _ = create_tangent_segment(
+            ifc_file, SimpleVector(0.0, 0.0), SimpleVector(100.0, 0.0)
+        )
+        created = len(collect_entity_ids(ifc_file, (segment, geometry)))
+
+        removed = remove_segment_entities(ifc_file, segment, geometry)
+
+        assert removed == created
+        assert len(list(ifc_file)) == entity_count
+
+
+@requires_blender
+class TestIncrementalRegeneration:
+    """Tests for regenerating only the segments around a moved PI.
+
+    NativeIfcAlignment registers with the Blender update system, so these
+    run inside Blender only.
+    """
+
+    PI_COORDINATES = [
+        (0.0, 0.0), (200.0, 0.0), (350.0, 150.0), (550.0, 150.0), (700.0, 0.0), (900.0, 0.0)
+    ]
+    CURVES = {1: 60.0, 2: 50.0, 3: 50.0, 4: 60.0}
+
+    @pytest.fixture(autouse=True)
+    def _require_ifc(self, ifc_file):
+        if ifc_file is None:
+            pytest.skip("ifcopenshell not installed")
+        yield
+        NativeIfcManager.clear()
+
+    def _build(self, coordinates):
+        """Alignment through the given PIs with curves at interior PIs."""
+        result = NativeIfcManager.new_file()
+        alignment = NativeIfcAlignment(result['ifc_file'], "Incremental Test")
+        for x, y in coordinates:
+            alignment.add_pi(x, y)
+        for index, radius in self.CURVES.items():
+            alignment.insert_curve_at_pi(index, radius=radius)
+        return alignment
+
+    @staticmethod
+    def _segment_values(alignment):
+        """Type, start point, direction, length and radius of every segment."""
+        values = []
+        for segment in alignment.segments:
+            params = segment.DesignParameters
+            values.append((
+                params.PredefinedType,
+                tuple(params.StartPoint.Coordinates),
+                params.StartDirection,
+                params.SegmentLength,
+                params.StartRadiusOfCurvature,
+            ))
+        return values
+
+    def _assert_same_segments(self, actual, expected):
+        assert len(actual) == len(expected)
+        for (kind, start, direction, length, radius), fresh in zip(actual, expected):
+            assert kind == fresh[0]
+            assert start == pytest.approx(fresh[1], abs=1e-9)
+            assert direction == pytest.approx(fresh[2], abs=1e-12)
+            assert length == pytest.approx(fresh[3], abs=1e-9)
+            assert radius == pytest.approx(fresh[4], abs=1e-9)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pi_index", [0, 2, 5])
+    def test_moved_pi_matches_full_rebuild(self, pi_index):
+        """Test an in-place update equals an alignment built from scratch."""
+        moved = list(self.PI_COORDINATES)
+        x, y = moved[pi_index]
+        moved[pi_index] = (x + 12.5, y - 20.0)
+
+        alignment = self._build(self.PI_COORDINATES)
+        segment_ids = [segment.id() for segment in alignment.segments]
+
+        alignment.pis[pi_index]['position'] = SimpleVector(*moved[pi_index])
+        alignment.mark_pi_moved(pi_index)
+        alignment.regenerate_segments_with_curves()
+
+        # Handled incrementally: same entities, nothing created or removed
+        assert [segment.id() for segment in alignment.segments] == segment_ids
+        assert alignment.last_edit_stats['created'] == 0
+        assert alignment.last_edit_stats['removed'] == 0
+        assert 0 < alignment.last_edit_stats['reused'] < len(segment_ids)
+
+        updated = self._segment_values(alignment)
+        expected = self._segment_values(self._build(moved))
+        self._assert_same_segments(updated, expected)
+
+    @pytest.mark.unit
+    def test_tangent_only_move_matches_full_rebuild(self):
+        """Test the tangent-only path also matches a full rebuild."""
+        moved = list(self.PI_COORDINATES)
+        moved[3] = (560.0, 170.0)
+
+        result = NativeIfcManager.new_file()
+        alignment = NativeIfcAlignment(result['ifc_file'], "Tangent Test")
+        for x, y in self.PI_COORDINATES:
+            alignment.add_pi(x, y)
+
+        alignment.pis[3]['position'] = SimpleVector(*moved[3])
+        alignment.mark_pi_moved(3)
+        alignment.regenerate_segments()
+        assert alignment.last_edit_stats['created'] == 0
+
+        fresh = NativeIfcAlignment(NativeIfcManager.new_file()['ifc_file'], "Fresh")
+        for x, y in moved:
+            fresh.add_pi(x, y)
+
+        self._assert_same_segments(
+            self._segment_values(alignment), self._segment_values(fresh)
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("edit", ["add", "remove"])
+    def test_rebuild_keeps_gradient_curve(self, edit):
+        """Test a full rebuild updates the BaseCurve, not the gradient curve."""
+        alignment = self._build(self.PI_COORDINATES)
+        if edit == "remove":
+            alignment.add_pi(1000.0, 50.0)
+
+        valign = VerticalAlignment("Profile")
+        valign.add_pvi(0.0, 100.0)
+        valign.add_pvi(400.0, 104.0, curve_length=80.0)
+        valign.add_pvi(800.0, 101.0)
+        valign.to_ifc(alignment.ifc, alignment.alignment)
+
+        items = alignment.alignment.Representation.Representations[0].Items
+        gradient = items[0]
+        assert gradient.is_a("IfcGradientCurve")
+        vertical_segments = list(gradient.Segments)
+        assert find_composite_curve(alignment.alignment) == gradient.BaseCurve
+
+        if edit == "add":
+            alignment.add_pi(1000.0, 50.0)
+        else:
+            alignment.remove_pis_from_index(len(alignment.pis) - 1)
+            alignment.regenerate_segments_with_curves()
+
+        # Vertical segments are untouched and still exist
+        assert list(gradient.Segments) == vertical_segments
+        for curve_segment in vertical_segments:
+            assert alignment.ifc.by_id(curve_segment.id()) == curve_segment
+
+        # The horizontal curve holds exactly the rebuilt segments
+        base_curve = gradient.BaseCurve
+        assert not base_curve.is_a("IfcGradientCurve")
+        assert list(base_curve.Segments) == alignment.curve_segments
+        assert len(alignment.curve_segments) == len(alignment.segments)
+        assert find_composite_curve(alignment.alignment) == base_curve
+
+
 class TestCurveGeometry:
     """Tests for horizontal curve geometry calculations."""
 
@@ -0,0 +1,267 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for LandXML TIN Surface Reader
+=====================================
+
+Tests for read_landxml_surface() and count_tin_elements().
+"""
+
+import re
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import core.landxml_surface as landxml_surface
+from core.landxml_surface import count_tin_elements, read_landxml_surface
+
+NAMESPACE = "http://www.landxml.org/schema/LandXML-1.2"
+
+
+def _surface_xml(name, points, faces, invisible=()):
+    """One <Surface> element; points are {id: (northing, easting, z)}."""
+    pnts = "".join(
+        f'<P id="{pid}">{n} {e} {z}</P>' for pid, (n, e, z) in points.items()
+    )
+    fs = "".join(
+        f'<F i="1">{a} {b} {c}</F>' if i in invisible else f"<F>{a} {b} {c}</F>"
+        for i, (a, b, c) in enumerate(faces)
+    )
+    return (
+        f'<Surface name="{name}"><Definition surfType="TIN">'
+        f"<Pnts>{pnts}</Pnts><Faces>{fs}</Faces></Definition></Surface>"
+    )
+
+
+def _write(path, *surfaces, namespace=NAMESPACE):
+    xmlns = f' xmlns="{namespace}"' if namespace else ""
+    path.write_text(
+        f'<?xml version="1.0"?><LandXML{xmlns} version="1.2">'
+        f'<Units><Metric linearUnit="meter"/></Units>'
+        f"<Surfaces>{''.join(surfaces)}</Surfaces></LandXML>"
+    )
+    return str(path)
+
+
+# Unit square split into two triangles; z = 10 + x + 2y
+SQUARE_POINTS = {
+    1: (0.0, 0.0, 10.0),
+    2: (0.0, 1.0, 11.0),
+    3: (1.0, 1.0, 13.0),
+    4: (1.0, 0.0, 12.0),
+}
+SQUARE_FACES = [(1, 2, 3), (1, 3, 4)]
+
+
+@pytest.mark.unit
+class TestReadLandXMLSurface:
+    """Tests for streaming a TIN surface into arrays."""
+
+    def test_points_and_faces(self, tmp_path):
+        """Points are returned as (easting, northing, z), faces 0-based."""
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES))
+
+        surface = read_landxml_surface(path)
+
+        assert surface.name == "EG"
+        assert surface.points.tolist() == [
+            [0.0, 0.0, 10.0], [1.0, 0.0, 11.0], [1.0, 1.0, 13.0], [0.0, 1.0, 12.0]
+        ]
+        assert surface.faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    def test_without_namespace(self, tmp_path):
+        """Files without the LandXML namespace are read the same way."""
+        path = _write(
+            tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES),
+            namespace=None
+        )
+
+        assert read_landxml_surface(path).faces.shape == (2, 3)
+
+    def test_invisible_faces_skipped(self, tmp_path):
+        """Faces flagged i="1" are holes and not returned."""
+        path = _write(
+            tmp_path / "s.xml",
+            _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES, invisible={0})
+        )
+
+        assert read_landxml_surface(path).faces.tolist() == [[0, 2, 3]]
+
+    def test_non_sequential_ids(self, tmp_path):
+        """Face references are mapped from point ids to array rows."""
+        points = {30: (0.0, 0.0, 1.0), 10: (0.0, 5.0, 2.0), 20: (5.0, 0.0, 3.0)}
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", points, [(10, 20, 30)]))
+
+        surface = read_landxml_surface(path)
+
+        assert surface.point_ids.tolist() == [30, 10, 20]
+        assert surface.faces.tolist() == [[1, 2, 0]]
+
+    def test_named_surface(self, tmp_path):
+        """The requested surface is read and the arrays trimmed to it."""
+        other = {1: (0.0, 0.0, 0.0), 2: (0.0, 1.0, 0.0), 3: (1.0, 0.0, 0.0)}
+        path = _write(
+            tmp_path / "s.xml",
+            _surface_xml("Design", other, [(1, 2, 3)]),
+            _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES),
+        )
+
+        surface = read_landxml_surface(path, surface_name="EG")
+
+        assert surface.name == "EG"
+        assert surface.points.shape == (4, 3)
+        assert surface.faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    def test_later_surface_memory(self, tmp_path):
+        """Reading a later surface peaks no higher than reading the first."""
+        rng = np.random.default_rng(3)
+        side = 100
+        points = {
+            i + 1: (float(i // side), float(i % side), float(z))
+            for i, z in enumerate(rng.uniform(0.0, 10.0, side * side))
+        }
+        faces = [
+            (i + 1, i + 2, i + side + 2)
+            for i in range(side * (side - 1)) if (i + 1) % side
+        ]
+        path = _write(
+            tmp_path / "s.xml",
+            _surface_xml("A", points, faces),
+            _surface_xml("B", points, faces),
+        )
+
+        def peak(name):
+            tracemalloc.start()
+            try:
+                surface = read_landxml_surface(path, surface_name=name)
+                return surface, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        first, first_peak = peak("A")
+        later, later_peak = peak("B")
+
+        assert later.name == "B"
+        np.testing.assert_array_equal(later.points, first.points)
+        np.testing.assert_array_equal(later.faces, first.faces)
+        assert later_peak < 1.5 * first_peak
+
+    def test_missing_surface(self, tmp_path):
+        """Asking for a surface that is not in the file raises."""
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES))
+
+        with pytest.raises(ValueError, match="Design"):
+            read_landxml_surface(path, surface_name="Design")
+
+    def test_undefined_point(self, tmp_path):
+        """Faces referencing undefined points raise."""
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, [(1, 2, 9)]))
+
+        with pytest.raises(ValueError, match="undefined"):
+            read_landxml_surface(path)
+
+    def test_batches(self, tmp_path, monkeypatch):
+        """Results do not depend on the parse batch size."""
+        monkeypatch.setattr(landxml_surface, "PARSE_BATCH_SIZE", 1)
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES))
+
+        surface = read_landxml_surface(path)
+
+        assert surface.points[:, 2].tolist() == [10.0, 11.0, 13.0, 12.0]
+        assert surface.faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    def test_prefixed_namespace(self, tmp_path):
+        """Elements with a namespace prefix (<lx:P>) are counted and read."""
+        xml = _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES)
+        xml = re.sub(r"<(/?)(\w)", r"<\1lx:\2", xml)
+        path = tmp_path / "s.xml"
+        path.write_text(
+            f'<?xml version="1.0"?><lx:LandXML xmlns:lx="{NAMESPACE}">'
+            f"<lx:Surfaces>{xml}</lx:Surfaces></lx:LandXML>"
+        )
+
+        assert count_tin_elements(str(path)) == (4, 2)
+        assert read_landxml_surface(str(path)).faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    def test_arrays_grow_past_count(self, tmp_path, monkeypatch):
+        """An element count that comes up short does not lose data."""
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES))
+        monkeypatch.setattr(
+            landxml_surface, "count_tin_elements", lambda p, surface_name=None: (1, 0)
+        )
+
+        surface = read_landxml_surface(path)
+
+        assert surface.points.shape == (4, 3)
+        assert surface.faces.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    @pytest.mark.parametrize("closing, element", [
+        ("</Pnts>", '<P id="5"/>'),
+        ("</Faces>", "<F></F>"),
+    ])
+    def test_empty_element(self, tmp_path, closing, element):
+        """Empty P and F elements raise a ValueError naming the element."""
+        xml = _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES)
+        path = _write(tmp_path / "s.xml", xml.replace(closing, element + closing))
+
+        with pytest.raises(ValueError, match=f"empty {element[1]} element"):
+            read_landxml_surface(path)
+
+    def test_to_terrain_index(self, tmp_path):
+        """The surface answers elevation queries through the terrain index."""
+        path = _write(tmp_path / "s.xml", _surface_xml("EG", SQUARE_POINTS, SQUARE_FACES))
+
+        index = read_landxml_surface(path).to_terrain_index()
+        z = index.elevations_at(np.array([[0.25, 0.5], [0.75, 0.25], [2.0, 2.0]]))
+
+        assert z[:2] == pytest.approx([11.25, 11.25])
+        assert np.isnan(z[2])
+
+
+@pytest.mark.unit
+class TestCountTinElements:
+    """Tests for the pre-allocation byte scan."""
+
+    def test_counts_across_chunks(self, tmp_path, monkeypatch):
+        """Closing tags split across read chunks are counted once."""
+        monkeypatch.setattr(landxml_surface, "SCAN_CHUNK_SIZE", 3)
+        path = _write(
+            tmp_path / "s.xml",
+            _surface_xml("A", SQUARE_POINTS, SQUARE_FACES),
+            _surface_xml("B", SQUARE_POINTS, SQUARE_FACES[:1]),
+        )
+
+        assert count_tin_elements(path) == (4, 2)
+        assert count_tin_elements(path, "B") == (4, 1)
+
+    def test_counts_named_surface_only(self, tmp_path):
+        """Only the requested surface is counted; a missing one counts nothing."""
+        path = _write(
+            tmp_path / "s.xml",
+            _surface_xml("A", SQUARE_POINTS, SQUARE_FACES),
+            '<Surface name="Empty"/>',
+            _surface_xml("B &amp; C", SQUARE_POINTS, SQUARE_FACES[:1]),
+        )
+
+        assert count_tin_elements(path, "B & C") == (4, 1)
+        assert count_tin_elements(path, "Empty") == (0, 0)
+        assert count_tin_elements(path, "D") == (0, 0)
@@ -0,0 +1,362 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Station Planning
+===================================
+
+Tests for StationManager against IFC alignment layouts: stations at
+segment breaks, chord-tolerance densification in horizontal and vertical
+curves, constraint breakpoints, and two-phase planning into a structured
+station array.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ifcopenshell")
+
+import ifcopenshell.guid
+
+from core.corridor import AlignmentWrapper
+from core.native_ifc_corridor import (
+    STATION_DTYPE,
+    STATION_REASONS,
+    StationManager,
+    chord_spacing,
+    parabola_chord_spacing,
+    station_points_from_array,
+)
+from core.parametric_constraints import ConstraintManager, ParametricConstraint
+
+RADIUS = 200.0
+ARC_LENGTH = RADIUS * math.pi / 2
+
+
+def _nest(ifc_file, parent, children):
+    ifc_file.create_entity(
+        "IfcRelNests", GlobalId=ifcopenshell.guid.new(),
+        RelatingObject=parent, RelatedObjects=children
+    )
+
+
+def _horizontal_segment(ifc_file, start, direction, length, radius=None):
+    params = ifc_file.create_entity(
+        "IfcAlignmentHorizontalSegment",
+        StartPoint=ifc_file.create_entity("IfcCartesianPoint", Coordinates=start),
+        StartDirection=direction,
+        StartRadiusOfCurvature=radius or 0.0,
+        EndRadiusOfCurvature=radius or 0.0,
+        SegmentLength=length,
+        PredefinedType="CIRCULARARC" if radius else "LINE",
+    )
+    return ifc_file.create_entity(
+        "IfcAlignmentSegment", GlobalId=ifcopenshell.guid.new(), DesignParameters=params
+    )
+
+
+def _vertical_segment(ifc_file, start, length, height, g1, g2):
+    params = ifc_file.create_entity(
+        "IfcAlignmentVerticalSegment",
+        StartDistAlong=start,
+        HorizontalLength=length,
+        StartHeight=height,
+        StartGradient=g1,
+        EndGradient=g2,
+        PredefinedType="CONSTANTGRADIENT" if g1 == g2 else "PARABOLICARC",
+    )
+    return ifc_file.create_entity(
+        "IfcAlignmentSegment", GlobalId=ifcopenshell.guid.new(), DesignParameters=params
+    )
+
+
+@pytest.fixture
+def alignment(ifc_file):
+    """300 m tangent, 90 degree R=200 curve, 300 m tangent; one crest curve."""
+    alignment = ifc_file.create_entity(
+        "IfcAlignment", GlobalId=ifcopenshell.guid.new(), Name="Test"
+    )
+    horizontal = ifc_file.create_entity(
+        "IfcAlignmentHorizontal", GlobalId=ifcopenshell.guid.new()
+    )
+    vertical = ifc_file.create_entity(
+        "IfcAlignmentVertical", GlobalId=ifcopenshell.guid.new()
+    )
+    _nest(ifc_file, alignment, [horizontal, vertical])
+
+    _nest(ifc_file, horizontal, [
+        _horizontal_segment(ifc_file, (0.0, 0.0), 0.0, 300.0),
+        _horizontal_segment(ifc_file, (300.0, 0.0), 0.0, ARC_LENGTH, RADIUS),
+        _horizontal_segment(
+            ifc_file, (300.0 + RADIUS, RADIUS), math.pi / 2, 300.0
+        ),
+    ])
+    _nest(ifc_file, vertical, [
+        _vertical_segment(ifc_file, 0.0, 500.0, 100.0, 0.03, 0.03),
+        _vertical_segment(ifc_file, 500.0, 100.0, 115.0, 0.03, -0.02),
+        _vertical_segment(ifc_file, 600.0, 314.16, 117.5, -0.02, -0.02),
+    ])
+    return alignment
+
+
+@pytest.fixture
+def wrapper(alignment):
+    """AlignmentWrapper over the full test alignment."""
+    total = 600.0 + ARC_LENGTH
+    return AlignmentWrapper(alignment, 0.0, total)
+
+
+class TestChordSpacing:
+    """Tests for chord_spacing() and parabola_chord_spacing()."""
+
+    @pytest.mark.unit
+    def test_arc_sagitta(self):
+        """Test the returned arc length has the requested sagitta."""
+        length = chord_spacing(RADIUS, 0.01)
+        half_angle = length / RADIUS / 2
+        assert RADIUS * (1 - math.cos(half_angle)) == pytest.approx(0.01)
+
+    @pytest.mark.unit
+    def test_parabola_deviation(self):
+        """Test the returned step keeps the chord within tolerance."""
+        a = 0.00025
+        step = parabola_chord_spacing(a, 0.01)
+        assert a * step ** 2 / 4 == pytest.approx(0.01)
+
+    @pytest.mark.unit
+    def test_straight_geometry(self):
+        """Test lines and constant grades need no densification."""
+        assert chord_spacing(math.inf, 0.01) == math.inf
+        assert parabola_chord_spacing(0.0, 0.01) == math.inf
+
+
+class TestStationPlanning:
+    """Tests for StationManager.calculate_stations() on an IFC layout."""
+
+    @pytest.mark.unit
+    def test_curve_breaks_present(self, wrapper):
+        """Test PC, PT, BVC, PVI and EVC stations are planned."""
+        stations = StationManager(wrapper, 50.0).calculate_stations()
+        reasons = {round(s.station, 3): s.reason for s in stations}
+
+        assert reasons[300.0] == "curve_start"
+        assert reasons[round(300.0 + ARC_LENGTH, 3)] == "curve_end"
+        assert reasons[500.0] == "vertical_curve"
+        assert reasons[550.0] == "pvi"
+        assert reasons[600.0] == "vertical_curve"
+
+    @pytest.mark.unit
+    def test_curve_spacing_meets_tolerance(self, wrapper):
+        """Test stations in the horizontal curve are within the chord tolerance."""
+        tolerance = 0.02
+        stations = StationManager(wrapper, 50.0, chord_tolerance=tolerance).calculate_stations(
+            curve_densification_factor=1.0
+        )
+        values = np.array([s.station for s in stations])
+        in_curve = values[(values >= 300.0) & (values <= 300.0 + ARC_LENGTH)]
+
+        gaps = np.diff(in_curve)
+        sagittas = RADIUS * (1 - np.cos(gaps / RADIUS / 2))
+        assert sagittas.max() <= tolerance + 1e-9
+
+    @pytest.mark.unit
+    def test_tangents_keep_base_interval(self, wrapper):
+        """Test tangents are not densified."""
+        stations = StationManager(wrapper, 50.0).calculate_stations()
+        values = np.array([s.station for s in stations])
+        on_tangent = values[values <= 300.0]
+        assert np.all(np.diff(on_tangent) >= 50.0 - 1e-9)
+
+    @pytest.mark.unit
+    def test_tighter_tolerance_adds_curve_stations(self, wrapper):
+        """Test station count in curves follows the tolerance."""
+        loose = StationManager(wrapper, 50.0, chord_tolerance=0.1).calculate_stations()
+        tight = StationManager(wrapper, 50.0, chord_tolerance=0.001).calculate_stations()
+        assert len(tight) > len(loose)
+
+    @pytest.mark.unit
+    def test_constraint_breakpoints(self, wrapper):
+        """Test enabled constraints add stations at their ends."""
+        manager = ConstraintManager()
+        manager.add_constraint(ParametricConstraint.create_range_constraint(
+            "Right Lane", "width", 123.0, 177.0, 3.6, 4.8
+        ))
+        disabled = ParametricConstraint.create_point_constraint("Right Lane", "width", 222.0, 4.0)
+        disabled.enabled = False
+        manager.add_constraint(disabled)
+
+        stations = StationManager(wrapper, 50.0).calculate_stations(constraint_manager=manager)
+        reasons = {round(s.station, 3): s.reason for s in stations}
+        assert reasons[123.0] == "constraint"
+        assert reasons[177.0] == "constraint"
+        assert 222.0 not in reasons
+
+    @pytest.mark.unit
+    def test_chunk_boundary_stations(self, wrapper):
+        """Test chunk boundaries get a station without displacing nearby breaks."""
+        stations = StationManager(wrapper, 50.0).calculate_stations(
+            chunk_boundaries=[300.2, 512.0, 5000.0]
+        )
+        reasons = {round(s.station, 3): s.reason for s in stations}
+
+        assert reasons[300.0] == "curve_start"
+        assert reasons[300.2] == "chunk_boundary"
+        assert reasons[512.0] == "chunk_boundary"
+        assert max(reasons) == pytest.approx(600.0 + ARC_LENGTH, abs=1e-3)
+
+    @pytest.mark.unit
+    def test_stations_clipped_to_range(self, alignment):
+        """Test layout breaks outside the corridor range are ignored."""
+        wrapper = AlignmentWrapper(alignment, 350.0, 450.0)
+        stations = StationManager(wrapper, 50.0).calculate_stations()
+        values = [s.station for s in stations]
+        assert min(values) == pytest.approx(350.0)
+        assert max(values) == pytest.approx(450.0)
+
+    @pytest.mark.unit
+    def test_extra_stations_clipped_to_range(self, alignment):
+        """Test critical and constraint stations past the corridor ends are ignored."""
+        wrapper = AlignmentWrapper(alignment, 350.0, 450.0)
+        manager = ConstraintManager()
+        manager.add_constraint(ParametricConstraint.create_range_constraint(
+            "Right Lane", "width", 420.0, 900.0, 3.6, 4.8
+        ))
+
+        stations = StationManager(wrapper, 50.0).calculate_stations(
+            critical_stations=[100.0, 375.0, 460.0],
+            constraint_manager=manager
+        )
+        reasons = {round(s.station, 3): s.reason for s in stations}
+
+        assert reasons[375.0] == "critical"
+        assert reasons[420.0] == "constraint"
+        assert min(reasons) == pytest.approx(350.0)
+        assert max(reasons) == pytest.approx(450.0)
+
+
+class TestSpiralStationing:
+    """Tests for chord-tolerance stationing through transition spirals."""
+
+    SPIRAL_LENGTH = 100.0
+
+    @pytest.fixture
+    def spiral_wrapper(self, ifc_file):
+        """300 m tangent, 100 m clothoid into R=200, arc, 300 m tangent."""
+        alignment = ifc_file.create_entity(
+            "IfcAlignment", GlobalId=ifcopenshell.guid.new(), Name="Spiral"
+        )
+        horizontal = ifc_file.create_entity(
+            "IfcAlignmentHorizontal", GlobalId=ifcopenshell.guid.new()
+        )
+        _nest(ifc_file, alignment, [horizontal])
+
+        spiral = _horizontal_segment(ifc_file, (300.0, 0.0), 0.0, self.SPIRAL_LENGTH)
+        spiral.DesignParameters.PredefinedType = "CLOTHOID"
+        spiral.DesignParameters.EndRadiusOfCurvature = RADIUS
+
+        arc_start = 300.0 + self.SPIRAL_LENGTH
+        _nest(ifc_file, horizontal, [
+            _horizontal_segment(ifc_file, (0.0, 0.0), 0.0, 300.0),
+            spiral,
+            _horizontal_segment(ifc_file, (arc_start, 10.0), 0.25, ARC_LENGTH, RADIUS),
+            _horizontal_segment(ifc_file, (arc_start + RADIUS, RADIUS), math.pi / 2, 300.0),
+        ])
+        return AlignmentWrapper(alignment, 0.0, 700.0 + ARC_LENGTH)
+
+    @pytest.mark.unit
+    def test_spiral_keeps_end_curvatures(self, spiral_wrapper):
+        """Test the evaluator keeps spiral design curvatures but evaluates a tangent."""
+        evaluator = spiral_wrapper.horizontal_evaluator
+        assert evaluator.curvatures[1] == 0.0
+        assert evaluator.start_curvatures[1] == 0.0
+        assert evaluator.end_curvatures[1] == pytest.approx(1.0 / RADIUS)
+        assert evaluator.start_curvatures[2] == evaluator.curvatures[2]
+
+    @pytest.mark.unit
+    def test_spiral_spacing_meets_tolerance(self, spiral_wrapper):
+        """Test the spiral is stationed for its sharpest end, not as a tangent."""
+        tolerance = 0.02
+        stations = StationManager(
+            spiral_wrapper, 50.0, chord_tolerance=tolerance
+        ).calculate_stations(curve_densification_factor=1.0)
+        reasons = {round(s.station, 3): s.reason for s in stations}
+        values = np.array(sorted(reasons))
+        in_spiral = values[(values >= 300.0) & (values <= 300.0 + self.SPIRAL_LENGTH)]
+
+        assert reasons[300.0] == "curve_start"
+        assert np.diff(in_spiral).max() <= chord_spacing(RADIUS, tolerance) + 1e-3
+        assert len(in_spiral) > self.SPIRAL_LENGTH / 50.0 + 1
+
+
+class TestTwoPhasePlanning:
+    """Tests for plan_stations() and calculate_station_array()."""
+
+    @pytest.mark.unit
+    def test_geometry_evaluated_once_for_merged_stations(self, wrapper, monkeypatch):
+        """Test candidates dropped by merging are never evaluated."""
+        calls = []
+        evaluate = wrapper.evaluate_stations
+
+        def counting(stations):
+            calls.append(len(stations))
+            return evaluate(stations)
+
+        monkeypatch.setattr(wrapper, "evaluate_stations", counting)
+        monkeypatch.setattr(wrapper, "get_3d_position", None)
+
+        array = StationManager(wrapper, 10.0).calculate_station_array()
+        assert calls == [len(array)]
+
+    @pytest.mark.unit
+    def test_plan_matches_array(self, wrapper):
+        """Test planned values and reasons carry through to the array."""
+        manager = StationManager(wrapper, 25.0)
+        stations, reasons = manager.plan_stations()
+        array = manager.calculate_station_array()
+
+        assert array.dtype == STATION_DTYPE
+        np.testing.assert_array_equal(array['station'], stations)
+        np.testing.assert_array_equal(array['reason'], reasons)
+        assert np.all(np.diff(stations) >= manager.merge_tolerance)
+
+    @pytest.mark.unit
+    def test_array_matches_scalar_queries(self, wrapper):
+        """Test batch geometry equals the per-station alignment queries."""
+        array = StationManager(wrapper, 25.0).calculate_station_array()
+        for record in array[::7]:
+            station = float(record['station'])
+            assert (record['x'], record['y'], record['z']) == pytest.approx(
+                wrapper.get_3d_position(station)
+            )
+            assert record['direction'] == pytest.approx(wrapper.get_direction(station))
+            assert record['grade'] == pytest.approx(wrapper.get_grade(station))
+
+    @pytest.mark.unit
+    def test_station_points_from_array(self, wrapper):
+        """Test calculate_stations() returns the array as StationPoints."""
+        manager = StationManager(wrapper, 25.0)
+        points = manager.calculate_stations()
+        array = manager.station_array
+
+        assert points == station_points_from_array(array)
+        assert [p.reason for p in points] == [STATION_REASONS[r] for r in array['reason']]
+        assert manager.get_station_values() == array['station'].tolist()
@@ -0,0 +1,235 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Raster DEM Terrain
+=============================
+
+Tests for open_dem(), RasterTerrain.elevations_at() and the array
+transforms of NativeIfcGeoreferencing.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+import core.terrain_dem as terrain_dem
+from core.terrain_dem import open_dem, read_grid_header
+
+NROWS, NCOLS, CELL = 40, 50, 2.0
+X_CORNER, Y_CORNER = 1000.0, 5000.0
+
+
+def _height(x, y):
+    """Planar ground, reproduced exactly by bilinear interpolation."""
+    return 0.1 * (x - X_CORNER) - 0.05 * (y - Y_CORNER) + 200.0
+
+
+def _grid():
+    """Cell-centre elevations, row 0 northernmost."""
+    xs = X_CORNER + CELL * (np.arange(NCOLS) + 0.5)
+    ys = Y_CORNER + CELL * (NROWS - np.arange(NROWS) - 0.5)
+    return _height(xs[None, :], ys[:, None]).astype(np.float32)
+
+
+def _write_ascii(path, grid, nodata=-9999.0):
+    with open(path, "w") as f:
+        f.write(f"ncols {NCOLS}\nnrows {NROWS}\n")
+        f.write(f"xllcorner {X_CORNER}\nyllcorner {Y_CORNER}\n")
+        f.write(f"cellsize {CELL}\nNODATA_value {nodata}\n")
+        np.savetxt(f, grid, fmt="%.4f")
+
+
+def _inside_points(n=2000, seed=0):
+    """Points between the outermost cell centres."""
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(X_CORNER + CELL / 2, X_CORNER + CELL * (NCOLS - 0.5), n)
+    y = rng.uniform(Y_CORNER + CELL / 2, Y_CORNER + CELL * (NROWS - 0.5), n)
+    return np.column_stack([x, y])
+
+
+class TestAsciiGrid:
+    """Tests for ESRI ASCII grids and their .npy cache."""
+
+    @pytest.mark.unit
+    def test_header(self, tmp_path):
+        """Test corner coordinates are converted to cell centres."""
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, _grid())
+
+        header, lines = read_grid_header(path)
+
+        assert lines == 6
+        assert (header.nrows, header.ncols) == (NROWS, NCOLS)
+        assert header.x_center == pytest.approx(X_CORNER + 1.0)
+        assert header.nodata == -9999.0
+
+    @pytest.mark.unit
+    def test_bilinear_reproduces_plane(self, tmp_path):
+        """Test interpolated elevations match the planar ground."""
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, _grid())
+
+        dem = open_dem(path)
+        xy = _inside_points()
+
+        assert isinstance(dem.grid, np.memmap)
+        assert dem.elevations_at(xy) == pytest.approx(_height(xy[:, 0], xy[:, 1]), abs=1e-3)
+
+    @pytest.mark.unit
+    def test_converts_in_blocks_and_reuses_cache(self, tmp_path, monkeypatch):
+        """Test tiny parse blocks give the same grid, and reopening skips conversion."""
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, _grid())
+        monkeypatch.setattr(terrain_dem, "ASCII_BLOCK_SIZE", 37)
+
+        first = open_dem(path)
+        assert os.path.exists(str(tmp_path / "ground.npy"))
+        assert np.allclose(first.grid, _grid(), atol=1e-4)
+
+        def fail(*args):
+            raise AssertionError("cache should be reused")
+        monkeypatch.setattr(terrain_dem, "convert_ascii_grid", fail)
+
+        assert np.array_equal(open_dem(path).grid, first.grid)
+
+    @pytest.mark.unit
+    def test_nodata_and_outside_are_nan(self, tmp_path):
+        """Test NODATA cells and points off the grid return NaN."""
+        grid = _grid()
+        grid[10, 10] = -9999.0
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, grid)
+        dem = open_dem(path)
+
+        near_hole = [X_CORNER + CELL * 10.75, Y_CORNER + CELL * (NROWS - 10.25)]
+        z = dem.elevations_at([near_hole, [X_CORNER - 5.0, Y_CORNER + 10.0],
+                               [X_CORNER + 20.0, Y_CORNER + 20.0]])
+
+        assert np.isnan(z[:2]).all()
+        assert not np.isnan(z[2])
+
+    @pytest.mark.unit
+    def test_nodata_replaced_in_every_block(self, tmp_path, monkeypatch):
+        """Test NODATA cells become NaN whichever parse block holds them."""
+        grid = _grid()
+        holes = np.zeros(grid.shape, dtype=bool)
+        holes[0, 0] = holes[7, 3] = holes[-1, -1] = True
+        grid[holes] = -9999.0
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, grid)
+        monkeypatch.setattr(terrain_dem, "ASCII_BLOCK_SIZE", 37)
+
+        dem = open_dem(path)
+
+        assert np.array_equal(np.isnan(dem.grid), holes)
+
+    @pytest.mark.unit
+    def test_cache_dir_keeps_sources_apart(self, tmp_path):
+        """Test grids with the same name get separate caches in a cache directory."""
+        cache_dir = str(tmp_path / "cache")
+        paths = []
+        for folder, offset in (("a", 0.0), ("b", 10.0)):
+            os.makedirs(str(tmp_path / folder))
+            paths.append(str(tmp_path / folder / "ground.asc"))
+            _write_ascii(paths[-1], _grid() + offset)
+
+        first, second = (open_dem(p, cache_dir=cache_dir) for p in paths)
+
+        assert len(os.listdir(cache_dir)) == 2
+        assert not os.path.exists(str(tmp_path / "a" / "ground.npy"))
+        assert np.allclose(second.grid - first.grid, 10.0, atol=1e-3)
+
+    @pytest.mark.unit
+    def test_truncated_file_rejected(self, tmp_path):
+        """Test a grid with missing values raises and leaves no cache."""
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, _grid()[:-1])
+
+        with pytest.raises(ValueError):
+            open_dem(path)
+        assert not os.path.exists(str(tmp_path / "ground.npy"))
+
+
+class TestBinaryGrid:
+    """Tests for ESRI .flt/.hdr grids."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("byteorder,dtype", [("LSBFIRST", "<f4"), ("MSBFIRST", ">f4")])
+    def test_memory_mapped_directly(self, tmp_path, byteorder, dtype):
+        """Test raw floats are mapped without conversion in either byte order."""
+        _grid().astype(dtype).tofile(str(tmp_path / "ground.flt"))
+        with open(str(tmp_path / "ground.hdr"), "w") as f:
+            f.write(f"ncols {NCOLS}\nnrows {NROWS}\nxllcorner {X_CORNER}\n")
+            f.write(f"yllcorner {Y_CORNER}\ncellsize {CELL}\nNODATA_value -9999\n")
+            f.write(f"byteorder {byteorder}\n")
+
+        dem = open_dem(str(tmp_path / "ground.flt"))
+        xy = _inside_points()
+
+        assert not os.path.exists(str(tmp_path / "ground.npy"))
+        assert dem.elevations_at(xy) == pytest.approx(_height(xy[:, 0], xy[:, 1]), abs=1e-3)
+
+    @pytest.mark.unit
+    def test_unsupported_format(self, tmp_path):
+        """Test unknown extensions are rejected."""
+        with pytest.raises(ValueError):
+            open_dem(str(tmp_path / "ground.tif"))
+
+
+class TestGeoreferencedDem:
+    """Tests for querying a map-coordinate DEM with local coordinates."""
+
+    @pytest.fixture
+    def georef(self, ifc_file_with_project):
+        from core.native_ifc_georeferencing import NativeIfcGeoreferencing
+
+        georef = NativeIfcGeoreferencing(ifc_file_with_project)
+        georef.setup_georeferencing(
+            epsg_code=26910,
+            false_origin=(X_CORNER + 30.0, Y_CORNER + 20.0, 150.0),
+            rotation=30.0,
+        )
+        return georef
+
+    @pytest.mark.unit
+    def test_array_transforms_match_scalar(self, georef):
+        """Test the array transforms agree with local_to_map/map_to_local."""
+        points = np.array([[0.0, 0.0, 0.0], [12.5, -3.0, 4.0], [-40.0, 7.0, -2.0]])
+
+        mapped = georef.local_to_map_points(points)
+
+        for point, expected in zip(points, mapped):
+            assert georef.local_to_map(tuple(point)) == pytest.approx(tuple(expected))
+        assert georef.map_to_local_points(mapped) == pytest.approx(points)
+
+    @pytest.mark.unit
+    def test_local_queries(self, tmp_path, georef):
+        """Test local XY maps onto the DEM and heights return to local Z."""
+        path = str(tmp_path / "ground.asc")
+        _write_ascii(path, _grid())
+        dem = open_dem(path, georeferencing=georef)
+
+        local = np.array([[0.0, 0.0], [5.0, -8.0], [-12.0, 3.0]])
+        mapped = georef.local_to_map_points(np.column_stack([local, np.zeros(3)]))
+        expected = _height(mapped[:, 0], mapped[:, 1]) - 150.0
+
+        assert dem.elevations_at(local) == pytest.approx(expected, abs=1e-3)
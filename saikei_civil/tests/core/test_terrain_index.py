@@ -0,0 +1,158 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Terrain Elevation Index
+==================================
+
+Tests for TerrainIndex.elevations_at() and the terrain index cache.
+"""
+
+import numpy as np
+import pytest
+
+import core.terrain_index as terrain_index
+from core.terrain_index import (
+    TerrainIndex,
+    clear_terrain_index_cache,
+    get_terrain_index,
+    terrain_data_hash,
+)
+
+
+def _grid_terrain(n=21, size=100.0, height=lambda x, y: 0.02 * x - 0.01 * y + 50.0):
+    """Regular n x n vertex grid split into two triangles per square."""
+    x, y = np.meshgrid(np.linspace(0.0, size, n), np.linspace(0.0, size, n))
+    vertices = np.column_stack([x.ravel(), y.ravel(), height(x, y).ravel()])
+    i, j = np.meshgrid(np.arange(n - 1), np.arange(n - 1))
+    a = (j * n + i).ravel()
+    faces = np.vstack([
+        np.column_stack([a, a + 1, a + n + 1]),
+        np.column_stack([a, a + n + 1, a + n]),
+    ])
+    return vertices, faces
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty index cache."""
+    clear_terrain_index_cache()
+    yield
+    clear_terrain_index_cache()
+
+
+class TestElevationsAt:
+    """Tests for batch elevation queries."""
+
+    @pytest.mark.unit
+    def test_planar_terrain_exact(self):
+        """Test a planar terrain is reproduced everywhere on the mesh."""
+        index = TerrainIndex(*_grid_terrain())
+        xy = np.random.default_rng(0).uniform(0.0, 100.0, (5000, 2))
+
+        z = index.elevations_at(xy)
+
+        assert z == pytest.approx(0.02 * xy[:, 0] - 0.01 * xy[:, 1] + 50.0)
+
+    @pytest.mark.unit
+    def test_vertices_edges_and_corners_hit(self):
+        """Test points on shared edges and the mesh boundary are covered."""
+        index = TerrainIndex(*_grid_terrain())
+        xy = np.array([[0.0, 0.0], [100.0, 100.0], [5.0, 5.0], [2.5, 2.5], [100.0, 37.0]])
+
+        assert not np.isnan(index.elevations_at(xy)).any()
+
+    @pytest.mark.unit
+    def test_off_terrain_is_nan(self):
+        """Test queries outside the triangles return NaN."""
+        vertices = np.array([[0, 0, 1], [10, 0, 1], [0, 10, 1]], dtype=float)
+        index = TerrainIndex(vertices, [[0, 1, 2]])
+
+        z = index.elevations_at([[2.0, 2.0], [8.0, 8.0], [-1.0, 0.0], [50.0, 50.0]])
+
+        assert z[0] == pytest.approx(1.0)
+        assert np.isnan(z[1:]).all()
+
+    @pytest.mark.unit
+    def test_overlapping_surfaces_highest_wins(self):
+        """Test overhangs resolve to the top surface, like a ray from above."""
+        vertices = np.array([
+            [0, 0, 1], [10, 0, 1], [0, 10, 1],
+            [0, 0, 5], [10, 0, 5], [0, 10, 5],
+        ], dtype=float)
+        index = TerrainIndex(vertices, [[0, 1, 2], [3, 4, 5]])
+
+        assert index.elevations_at([[1.0, 1.0]])[0] == pytest.approx(5.0)
+
+    @pytest.mark.unit
+    def test_vertical_faces_ignored(self):
+        """Test faces without plan area are dropped from the index."""
+        vertices = np.array([[0, 0, 0], [10, 0, 0], [10, 0, 5]], dtype=float)
+        index = TerrainIndex(vertices, [[0, 1, 2]])
+
+        assert index.face_count == 0
+        assert np.isnan(index.elevations_at([[5.0, 0.0]])).all()
+
+    @pytest.mark.unit
+    def test_chunked_queries_match(self, monkeypatch):
+        """Test results do not depend on the query chunk size."""
+        index = TerrainIndex(*_grid_terrain(height=lambda x, y: np.sin(x / 10.0) * y))
+        xy = np.random.default_rng(1).uniform(-10.0, 110.0, (3000, 2))
+        expected = index.elevations_at(xy)
+
+        monkeypatch.setattr(terrain_index, "QUERY_CHUNK_SIZE", 97)
+
+        assert np.array_equal(index.elevations_at(xy), expected, equal_nan=True)
+
+
+class TestTerrainIndexCache:
+    """Tests for get_terrain_index() caching."""
+
+    @pytest.mark.unit
+    def test_same_data_reuses_index(self):
+        """Test an identical terrain (even as new arrays) is not rebuilt."""
+        vertices, faces = _grid_terrain()
+
+        first = get_terrain_index(vertices, faces)
+
+        assert get_terrain_index(vertices.copy(), faces.astype(np.int32)) is first
+
+    @pytest.mark.unit
+    def test_changed_data_rebuilds(self):
+        """Test moving one vertex yields a different hash and index."""
+        vertices, faces = _grid_terrain()
+        first = get_terrain_index(vertices, faces)
+
+        edited = vertices.copy()
+        edited[10, 2] += 1.0
+
+        assert terrain_data_hash(edited, faces) != terrain_data_hash(vertices, faces)
+        assert get_terrain_index(edited, faces) is not first
+
+    @pytest.mark.unit
+    def test_cache_is_bounded(self):
+        """Test the least recently used index is evicted."""
+        indexes = [
+            get_terrain_index(*_grid_terrain(n=5, size=float(10 + i)))
+            for i in range(terrain_index.MAX_CACHED_INDEXES + 1)
+        ]
+
+        assert get_terrain_index(*_grid_terrain(n=5, size=10.0)) is not indexes[0]
+        assert get_terrain_index(*_grid_terrain(n=5, size=14.0)) is indexes[-1]
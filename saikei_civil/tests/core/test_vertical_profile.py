@@ -0,0 +1,179 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Vertical Profile Evaluation
+======================================
+
+Tests for VerticalAlignment elevation/grade queries and the batch
+VerticalProfileTable.
+"""
+
+import numpy as np
+import pytest
+
+import core.vertical_alignment.profile_table as profile_table
+from core.vertical_alignment import VerticalAlignment, VerticalProfileTable
+
+
+@pytest.fixture
+def valign(sample_pvi_data):
+    """Vertical alignment built from the shared sample PVIs."""
+    alignment = VerticalAlignment("Test Profile")
+    for pvi in sample_pvi_data:
+        alignment.add_pvi(pvi["station"], pvi["elevation"], pvi["curve_length"])
+    return alignment
+
+
+def _walk_elevation(alignment, station):
+    """Reference elevation from a linear segment walk."""
+    for segment in alignment.segments:
+        if segment.contains_station(station):
+            return segment.get_elevation(station)
+    return None
+
+
+def _walk_grade(alignment, station):
+    """Reference grade from a linear segment walk."""
+    for segment in alignment.segments:
+        if segment.contains_station(station):
+            return segment.get_grade(station)
+    return None
+
+
+class TestVerticalProfileTable:
+    """Tests for batch elevation and grade evaluation."""
+
+    @pytest.mark.unit
+    def test_batch_matches_segment_walk(self, valign):
+        """Test batch elevations and grades match the per-segment walk."""
+        stations = np.linspace(valign.start_station, valign.end_station, 401)
+        elevations = valign.elevations(stations)
+        grades = valign.grades(stations)
+
+        for i, station in enumerate(stations.tolist()):
+            assert elevations[i] == pytest.approx(_walk_elevation(valign, station))
+            assert grades[i] == pytest.approx(_walk_grade(valign, station))
+
+    @pytest.mark.unit
+    def test_scalar_matches_batch(self, valign):
+        """Test scalar queries agree with batch queries."""
+        stations = [0.0, 75.0, 100.0, 170.0, 260.0, 400.0]
+        elevations = valign.elevations(stations)
+        for i, station in enumerate(stations):
+            assert valign.get_elevation(station) == pytest.approx(elevations[i])
+
+    @pytest.mark.unit
+    def test_out_of_range(self, valign):
+        """Test out-of-range stations give NaN in batch and raise for scalars."""
+        elevations = valign.elevations([-10.0, 50.0, 410.0])
+        assert np.isnan(elevations[0])
+        assert not np.isnan(elevations[1])
+        assert np.isnan(elevations[2])
+
+        with pytest.raises(ValueError):
+            valign.get_elevation(410.0)
+
+    @pytest.mark.unit
+    def test_table_invalidated_on_edit(self, valign):
+        """Test PVI edits rebuild the table."""
+        before = valign.get_elevation(200.0)
+        table = valign.profile_table
+
+        valign.update_pvi(2, elevation=110.0)
+        assert valign.profile_table is not table
+        assert valign.get_elevation(200.0) != pytest.approx(before)
+
+        valign.remove_pvi(2)
+        assert valign.elevations([200.0])[0] == pytest.approx(
+            _walk_elevation(valign, 200.0)
+        )
+
+    @pytest.mark.unit
+    def test_empty_table(self):
+        """Test an empty table returns NaN."""
+        table = VerticalProfileTable.from_segments([])
+        assert np.isnan(table.elevations([0.0])[0])
+        assert table.elevation_at(0.0) is None
+
+    @pytest.mark.unit
+    def test_profile_points_include_pvis(self, valign):
+        """Test profile sampling includes exact PVI stations once."""
+        points = valign.get_profile_points(interval=30.0, include_pvis=True)
+        stations = [p[0] for p in points]
+        assert stations == sorted(stations)
+        for pvi in valign.pvis:
+            assert stations.count(pvi.station) == 1
+
+
+class TestIfcProfileSnapshot:
+    """Tests for VerticalProfileTable snapshots of IfcAlignmentVertical."""
+
+    @pytest.fixture(autouse=True)
+    def _require_ifc(self, ifc_file):
+        if ifc_file is None:
+            pytest.skip("ifcopenshell not installed")
+
+    @pytest.mark.unit
+    def test_snapshot_matches_design(self, valign, ifc_file):
+        """Test the IFC snapshot evaluates like the design-side table."""
+        vertical = valign.to_ifc(ifc_file)
+        snapshot = VerticalProfileTable.from_ifc_vertical(vertical)
+
+        assert snapshot.segment_count == len(valign.segments)
+        stations = np.linspace(valign.pvis[0].station, valign.pvis[-1].station, 101)
+        np.testing.assert_allclose(snapshot.elevations(stations), valign.elevations(stations))
+        np.testing.assert_allclose(snapshot.grades(stations), valign.grades(stations))
+
+    @pytest.mark.unit
+    def test_snapshot_reused_until_changed(self, valign, ifc_file):
+        """Test an unchanged vertical reuses its snapshot by fingerprint."""
+        vertical = valign.to_ifc(ifc_file)
+        first = VerticalProfileTable.from_ifc_vertical(vertical)
+        assert VerticalProfileTable.from_ifc_vertical(vertical) is first
+
+        params = vertical.IsNestedBy[0].RelatedObjects[0].DesignParameters
+        params.StartHeight = params.StartHeight + 1.0
+        changed = VerticalProfileTable.from_ifc_vertical(vertical)
+        assert changed is not first
+        assert changed.fingerprint != first.fingerprint
+
+    @pytest.mark.unit
+    def test_snapshot_hit_skips_table_build(self, valign, ifc_file, monkeypatch):
+        """Test a fingerprint hit returns before any table is built."""
+        vertical = valign.to_ifc(ifc_file)
+        first = VerticalProfileTable.from_ifc_vertical(vertical)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("table rebuilt on a cache hit")
+
+        monkeypatch.setattr(VerticalProfileTable, "_from_ifc_records", classmethod(fail))
+        assert VerticalProfileTable.from_ifc_vertical(vertical) is first
+
+    @pytest.mark.unit
+    def test_snapshot_cache_bounded(self, valign, ifc_file, monkeypatch):
+        """Test only the most recent snapshots are kept."""
+        monkeypatch.setattr(profile_table, "MAX_IFC_SNAPSHOTS", 2)
+        verticals = [valign.to_ifc(ifc_file) for _ in range(3)]
+        for vertical in verticals:
+            VerticalProfileTable.from_ifc_vertical(vertical)
+
+        assert verticals[0].GlobalId not in profile_table._ifc_snapshots
+        assert len(profile_table._ifc_snapshots) <= 2
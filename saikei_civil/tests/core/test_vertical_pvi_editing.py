@@ -0,0 +1,261 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Vertical Alignment PVI Editing
+=========================================
+
+Tests for bulk PVI construction and deferred segment regeneration.
+"""
+
+import numpy as np
+import pytest
+
+from core.vertical_alignment import VerticalAlignment
+
+
+def _layout(alignment):
+    """Comparable summary of PVIs and generated segments."""
+    pvis = [(p.station, p.elevation, p.curve_length, p.grade_in, p.grade_out)
+            for p in alignment.pvis]
+    segments = [(type(s).__name__, s.start_station, s.end_station, s.start_elevation)
+                for s in alignment.segments]
+    return pvis, segments
+
+
+@pytest.fixture
+def pvi_arrays(sample_pvi_data):
+    """Sample PVIs as (stations, elevations, curve_lengths) lists."""
+    return (
+        [p["station"] for p in sample_pvi_data],
+        [p["elevation"] for p in sample_pvi_data],
+        [p["curve_length"] for p in sample_pvi_data],
+    )
+
+
+class TestBulkPviConstruction:
+    """Tests for VerticalAlignment.from_pvis() and add_pvis()."""
+
+    @pytest.mark.unit
+    def test_from_pvis_matches_add_pvi(self, pvi_arrays):
+        """Test bulk construction equals PVI-by-PVI construction."""
+        stations, elevations, curve_lengths = pvi_arrays
+        reference = VerticalAlignment("Reference")
+        for args in zip(stations, elevations, curve_lengths):
+            reference.add_pvi(*args)
+
+        # Reversed input order must not matter
+        bulk = VerticalAlignment.from_pvis(
+            stations[::-1], elevations[::-1], curve_lengths[::-1], name="Bulk"
+        )
+
+        assert _layout(bulk) == _layout(reference)
+
+    @pytest.mark.unit
+    def test_add_pvis_merges_with_existing(self, pvi_arrays):
+        """Test add_pvis() interleaves new PVIs with existing ones."""
+        stations, elevations, curve_lengths = pvi_arrays
+        valign = VerticalAlignment()
+        for i in (0, 2):
+            valign.add_pvi(stations[i], elevations[i], curve_lengths[i])
+
+        rest = [i for i in range(len(stations)) if i not in (0, 2)][::-1]
+        valign.add_pvis(
+            [stations[i] for i in rest],
+            [elevations[i] for i in rest],
+            [curve_lengths[i] for i in rest],
+        )
+
+        assert [p.station for p in valign.pvis] == sorted(stations)
+        assert _layout(valign) == _layout(VerticalAlignment.from_pvis(*pvi_arrays))
+
+    @pytest.mark.unit
+    def test_duplicate_station_rejected(self, pvi_arrays):
+        """Test duplicates are rejected and nothing is added."""
+        valign = VerticalAlignment.from_pvis(*pvi_arrays)
+        before = _layout(valign)
+
+        with pytest.raises(ValueError):
+            valign.add_pvis([50.0, pvi_arrays[0][1]], [1.0, 2.0])
+        with pytest.raises(ValueError):
+            VerticalAlignment.from_pvis([0.0, 10.0, 10.0], [1.0, 2.0, 3.0])
+
+        assert _layout(valign) == before
+
+    @pytest.mark.unit
+    def test_mismatched_lengths_rejected(self):
+        """Test arrays of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            VerticalAlignment.from_pvis([0.0, 100.0], [1.0])
+
+
+class TestDeferredRebuild:
+    """Tests for VerticalAlignment.defer_rebuild()."""
+
+    @pytest.mark.unit
+    def test_segments_generated_once_on_exit(self, pvi_arrays, monkeypatch):
+        """Test edits inside the block regenerate segments only once."""
+        valign = VerticalAlignment()
+        calls = []
+        original = valign._generate_segments
+        monkeypatch.setattr(valign, "_generate_segments",
+                            lambda: (calls.append(1), original())[1])
+
+        with valign.defer_rebuild():
+            for args in zip(*pvi_arrays):
+                valign.add_pvi(*args)
+            with valign.defer_rebuild():
+                valign.update_pvi(1, elevation=valign.pvis[1].elevation + 1.0)
+            assert calls == []
+
+        assert calls == [1]
+        assert len(valign.segments) > 0
+
+    @pytest.mark.unit
+    def test_rebuild_runs_when_block_raises(self, pvi_arrays):
+        """Test segments are regenerated even if the block fails."""
+        valign = VerticalAlignment()
+
+        with pytest.raises(RuntimeError):
+            with valign.defer_rebuild():
+                for args in zip(*pvi_arrays):
+                    valign.add_pvi(*args)
+                raise RuntimeError("scripted edit failed")
+
+        assert _layout(valign) == _layout(VerticalAlignment.from_pvis(*pvi_arrays))
+
+
+# PVIs are at least MIN_SPACING apart. Curves up to 0.9*MIN_SPACING never
+# overlap; up to 1.8*MIN_SPACING neighbouring curves may overlap, but no
+# curve reaches past the next PVI.
+MIN_SPACING = 40.0
+
+
+def _max_curve(overlapping):
+    return (1.8 if overlapping else 0.9) * MIN_SPACING
+
+
+def _random_profile(seed, count=40, overlapping=False):
+    """Random PVI arrays (stations, elevations, curve lengths)."""
+    rng = np.random.default_rng(seed)
+    stations = np.cumsum(rng.uniform(MIN_SPACING, 3.0 * MIN_SPACING, count))
+    elevations = 100.0 + np.cumsum(rng.uniform(-4.0, 4.0, count))
+    curve_lengths = np.where(
+        rng.random(count) < 0.6, rng.uniform(10.0, _max_curve(overlapping), count), 0.0
+    )
+    curve_lengths[0] = curve_lengths[-1] = 0.0
+    return stations, elevations, curve_lengths
+
+
+def _assert_same_layout(actual, expected):
+    """Assert two alignments have the same PVIs and segments (within 1e-9)."""
+    actual_pvis, actual_segments = _layout(actual)
+    expected_pvis, expected_segments = _layout(expected)
+    assert [s[0] for s in actual_segments] == [s[0] for s in expected_segments]
+
+    def values(pvis, segments, alignment):
+        flat = [v for row in pvis for v in row]
+        flat += [v for row in segments for v in row[1:]]
+        flat += [p.k_value for p in alignment.pvis if p.curve_length > 0]
+        return flat
+
+    assert values(actual_pvis, actual_segments, actual) == pytest.approx(
+        values(expected_pvis, expected_segments, expected), abs=1e-9
+    )
+
+
+class TestIncrementalPviUpdate:
+    """Tests that update_pvi()'s local rebuild equals a full rebuild."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("overlapping", [False, True])
+    def test_random_edits_match_full_rebuild(self, overlapping):
+        """Test many random edits against rebuilding from scratch."""
+        stations, elevations, curve_lengths = _random_profile(7, overlapping=overlapping)
+        valign = VerticalAlignment.from_pvis(stations, elevations, curve_lengths)
+        rng = np.random.default_rng(11)
+
+        for _ in range(60):
+            index = int(rng.integers(len(stations)))
+            edit = rng.integers(3)
+            if edit == 0:
+                elevations[index] += rng.uniform(-5.0, 5.0)
+                valign.update_pvi(index, elevation=elevations[index])
+            elif edit == 1 and 0 < index < len(stations) - 1:
+                low = stations[index - 1] + MIN_SPACING
+                high = stations[index + 1] - MIN_SPACING
+                if low >= high:
+                    continue
+                stations[index] = rng.uniform(low, high)
+                valign.update_pvi(index, station=stations[index])
+            elif 0 < index < len(stations) - 1:
+                curve_lengths[index] = rng.choice(
+                    [0.0, rng.uniform(10.0, _max_curve(overlapping))]
+                )
+                valign.update_pvi(index, curve_length=curve_lengths[index])
+
+            expected = VerticalAlignment.from_pvis(stations, elevations, curve_lengths)
+            _assert_same_layout(valign, expected)
+
+        assert valign.elevations(stations) == pytest.approx(
+            expected.elevations(stations), abs=1e-9
+        )
+
+    @pytest.mark.unit
+    def test_reordering_update_rebuilds(self):
+        """Test moving a PVI past its neighbour re-sorts the PVIs."""
+        stations, elevations, curve_lengths = _random_profile(3, count=10)
+        valign = VerticalAlignment.from_pvis(stations, elevations, curve_lengths)
+
+        valign.update_pvi(2, station=stations[5] + MIN_SPACING)
+
+        stations[2] = stations[5] + MIN_SPACING
+        expected = VerticalAlignment.from_pvis(stations, elevations, curve_lengths)
+        _assert_same_layout(valign, expected)
+        assert valign.find_pvi_at_station(stations[2]) == 5
+
+
+class TestPviStationIndex:
+    """Tests for bisect-based PVI lookups."""
+
+    @pytest.mark.unit
+    def test_find_pvi_at_station(self):
+        """Test lookups at, near and between PVIs."""
+        valign = VerticalAlignment.from_pvis([0.0, 100.0, 250.0], [10.0, 12.0, 9.0])
+
+        assert valign.find_pvi_at_station(100.0) == 1
+        assert valign.find_pvi_at_station(100.0005) == 1
+        assert valign.find_pvi_at_station(249.9995) == 2
+        assert valign.find_pvi_at_station(150.0) is None
+        assert valign.find_pvi_at_station(150.0, tolerance=60.0) == 1
+
+    @pytest.mark.unit
+    def test_add_and_remove_keep_index_sorted(self):
+        """Test single-PVI edits keep the station index in sync."""
+        valign = VerticalAlignment()
+        for station in (300.0, 0.0, 150.0, 75.0):
+            valign.add_pvi(station, 100.0 + station / 100.0)
+        valign.remove_pvi(1)
+
+        assert [p.station for p in valign.pvis] == [0.0, 150.0, 300.0]
+        assert valign.find_pvi_at_station(150.0) == 1
+        assert valign.find_pvi_at_station(75.0) is None
+        with pytest.raises(ValueError):
+            valign.add_pvi(150.0000001, 1.0)
@@ -39,6 +39,10 @@ Tests cover:
 import sys
 import os
 import json
+import random
+
+import numpy as np
+import pytest
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -650,6 +654,119 @@ class TestEdgeCases:
         assert value == 3.6
 
 
+class TestIntervalIndex:
+    """Tests for interval-indexed and vectorized constraint evaluation."""
+
+    INTERPOLATIONS = [InterpolationType.LINEAR, InterpolationType.SMOOTH,
+                      InterpolationType.STEP]
+
+    def _random_manager(self, seed, count=200):
+        """Manager with overlapping constraints over two components."""
+        rng = random.Random(seed)
+        manager = ConstraintManager()
+        for i in range(count):
+            start = rng.uniform(0.0, 1000.0)
+            if rng.random() < 0.2:
+                constraint = ParametricConstraint.create_point_constraint(
+                    component_name=rng.choice(["Lane", "Shoulder"]),
+                    parameter_name=rng.choice(["width", "cross_slope"]),
+                    station=start,
+                    value=rng.uniform(0.0, 5.0),
+                )
+            else:
+                constraint = ParametricConstraint.create_range_constraint(
+                    component_name=rng.choice(["Lane", "Shoulder"]),
+                    parameter_name=rng.choice(["width", "cross_slope"]),
+                    start_station=start,
+                    end_station=start + rng.uniform(0.0, 150.0),
+                    start_value=rng.uniform(0.0, 5.0),
+                    end_value=rng.uniform(0.0, 5.0),
+                    interpolation=rng.choice(self.INTERPOLATIONS),
+                )
+            constraint.enabled = rng.random() > 0.1
+            manager.add_constraint(constraint)
+        return manager
+
+    def _brute_force(self, manager, component, parameter, station, default):
+        """Reference resolution: scan every constraint, last wins."""
+        value = default
+        for c in manager.constraints:
+            if c.component_name == component and c.parameter_name == parameter:
+                v = c.get_value_at_station(station)
+                if v is not None:
+                    value = v
+        return value
+
+    def test_scalar_matches_full_scan(self):
+        """Test get_effective_value against a full scan."""
+        manager = self._random_manager(seed=1)
+        rng = random.Random(2)
+        for _ in range(500):
+            station = rng.uniform(-50.0, 1200.0)
+            for component in ("Lane", "Shoulder", "Median"):
+                expected = self._brute_force(manager, component, "width", station, 3.6)
+                value = manager.get_effective_value(component, "width", station, 3.6)
+                assert value == pytest.approx(expected)
+
+    def test_vectorized_matches_scalar(self):
+        """Test effective_values against get_effective_value at every station."""
+        manager = self._random_manager(seed=3)
+        stations = np.concatenate([
+            np.random.default_rng(4).uniform(-50.0, 1200.0, 2000),
+            [c.start_station for c in manager.constraints],
+            [c.end_station for c in manager.constraints],
+        ])
+
+        for component in ("Lane", "Shoulder"):
+            for parameter in ("width", "cross_slope"):
+                values = manager.effective_values(component, parameter, stations, 3.6)
+                expected = [self._brute_force(manager, component, parameter, s, 3.6)
+                            for s in stations]
+                assert values == pytest.approx(np.array(expected))
+
+    def test_vectorized_without_constraints(self):
+        """Test unconstrained parameters return the default everywhere."""
+        manager = self._random_manager(seed=5, count=20)
+
+        values = manager.effective_values("Median", "width", [0.0, 500.0], 1.2)
+
+        assert values.tolist() == [1.2, 1.2]
+
+    def test_constraints_at_station_in_list_order(self):
+        """Test get_constraints_at_station equals a filtered scan."""
+        manager = self._random_manager(seed=6)
+        for station in np.linspace(-10.0, 1160.0, 300):
+            expected = [c for c in manager.constraints if c.applies_to_station(station)]
+            assert manager.get_constraints_at_station(station) == expected
+
+    def test_index_follows_manager_edits(self):
+        """Test the index is refreshed after update, remove and clear."""
+        manager = ConstraintManager()
+        constraint = ParametricConstraint.create_range_constraint(
+            component_name="Lane",
+            parameter_name="width",
+            start_station=100.0,
+            end_station=200.0,
+            start_value=4.0,
+            end_value=4.0,
+        )
+        manager.add_constraint(constraint)
+        assert manager.get_effective_value("Lane", "width", 150.0, 3.6) == 4.0
+
+        manager.update_constraint(constraint.id, start_station=160.0)
+        assert manager.get_effective_value("Lane", "width", 150.0, 3.6) == 3.6
+
+        manager.update_constraint(constraint.id, enabled=False)
+        assert manager.get_effective_value("Lane", "width", 170.0, 3.6) == 3.6
+        assert not manager.has_constraints("Lane", "width")
+
+        manager.update_constraint(constraint.id, enabled=True)
+        assert manager.has_constraints("Lane", "width")
+
+        manager.remove_constraint(constraint.id)
+        assert manager.effective_values("Lane", "width", [170.0], 3.6).tolist() == [3.6]
+
+
 def run_all_tests():
     """Run all tests and print results."""
     import traceback
@@ -658,6 +775,7 @@ def run_all_tests():
         TestParametricConstraint,
         TestConstraintManager,
         TestEdgeCases,
+        TestIntervalIndex,
     ]
 
     total_tests = 0
@@ -0,0 +1,6 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""Tool layer tests (require Blender)."""
@@ -0,0 +1,200 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Alignment Editing
+============================
+
+Regression tests for horizontal alignment edits that reuse IFC entities in
+place, and for the update system's PI object index. Runs inside Blender
+only.
+
+    blender --background --python-expr \
+        "import pytest; pytest.main(['-m', 'blender', '-s', 'tests/tool'])"
+"""
+
+import statistics
+import time
+from types import SimpleNamespace
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+ifc_manager = pytest.importorskip("saikei_civil.core.native_ifc_manager")
+horizontal = pytest.importorskip("saikei_civil.core.horizontal_alignment")
+update_system = pytest.importorskip("saikei_civil.operators.update_system_operators")
+visualizer_tool = pytest.importorskip("saikei_civil.tool.alignment_visualizer")
+
+NativeIfcAlignment = horizontal.NativeIfcAlignment
+NativeIfcManager = ifc_manager.NativeIfcManager
+
+PI_COORDINATES = [(0.0, 0.0), (150.0, 0.0), (150.0, 150.0), (300.0, 200.0)]
+
+
+@pytest.fixture
+def alignment():
+    """Four-PI tangent alignment in a fresh IFC project."""
+    result = NativeIfcManager.new_file()
+    alignment = NativeIfcAlignment(result['ifc_file'], "Edit Test")
+    for x, y in PI_COORDINATES:
+        alignment.add_pi(x, y)
+    yield alignment
+    NativeIfcManager.clear()
+
+
+def _reference_length(alignment):
+    """Length of a freshly compiled evaluator for the current segments."""
+    return horizontal.CompiledHorizontalAlignment.from_ifc_segments(
+        alignment.segments
+    ).total_length
+
+
+@pytest.mark.blender
+class TestEvaluatorAfterEdit:
+    """The cached evaluator follows edits that reuse segment entities."""
+
+    def test_insert_curve(self, alignment):
+        """Test inserting a curve invalidates the cached evaluator."""
+        before = alignment.get_horizontal_evaluator().total_length
+
+        alignment.insert_curve_at_pi(1, radius=80.0)
+        assert alignment.last_edit_stats['reused'] > 0
+
+        after = alignment.get_horizontal_evaluator().total_length
+        assert after < before
+        assert after == pytest.approx(_reference_length(alignment))
+
+    def test_change_radius(self, alignment):
+        """Test changing a curve radius invalidates the cached evaluator."""
+        alignment.insert_curve_at_pi(1, radius=80.0)
+        curved = alignment.get_horizontal_evaluator().total_length
+
+        alignment.insert_curve_at_pi(1, radius=40.0)
+
+        after = alignment.get_horizontal_evaluator().total_length
+        assert after > curved
+        assert after == pytest.approx(_reference_length(alignment))
+
+    def test_cache_hit_without_edit(self, alignment):
+        """Test repeated queries reuse the evaluator until the layout changes."""
+        evaluator = alignment.get_horizontal_evaluator()
+        assert alignment.get_horizontal_evaluator() is evaluator
+
+        alignment.pis[2]['position'] = horizontal.SimpleVector(160.0, 140.0)
+        alignment.mark_pi_moved(2)
+        alignment.regenerate_segments()
+
+        moved = alignment.get_horizontal_evaluator()
+        assert moved is not evaluator
+        assert moved.total_length == pytest.approx(_reference_length(alignment))
+        assert alignment.get_horizontal_evaluator() is moved
+
+
+def _scene_update(scene, *moved):
+    """Depsgraph stand-in reporting the Scene and transform updates of objects.
+
+    Blender reports the Scene for object removals and transforms alike.
+    """
+    updates = [SimpleNamespace(id=scene, is_updated_transform=False)]
+    updates += [SimpleNamespace(id=obj, is_updated_transform=True) for obj in moved]
+    return SimpleNamespace(updates=updates)
+
+
+@pytest.mark.blender
+class TestPIObjectIndex:
+    """The PI object index follows PI objects through visualization rebuilds."""
+
+    @pytest.fixture
+    def visualizer(self, alignment):
+        visualizer = visualizer_tool.AlignmentVisualizer(alignment)
+        visualizer.update_visualizations()
+        return visualizer
+
+    def test_rebuild_indexes_live_objects(self, alignment, visualizer):
+        """Test a rebuild leaves exactly the new PI objects indexed."""
+        visualizer.update_visualizations()
+
+        expected = {pi['blender_object'].as_pointer() for pi in alignment.pis}
+        indexed = {
+            pointer for pointer, (owner, _) in update_system._pi_object_index.items()
+            if owner == id(alignment)
+        }
+        assert indexed == expected
+
+    def test_unrelated_delete_keeps_pis(self, alignment, visualizer):
+        """Test deleting an unrelated object does not delete PIs."""
+        visualizer.update_visualizations()
+        scene = bpy.context.scene
+        update_system.saikei_update_handler(scene, _scene_update(scene))
+        other = bpy.data.objects.new("Unrelated", None)
+        scene.collection.objects.link(other)
+        bpy.data.objects.remove(other, do_unlink=True)
+
+        update_system.saikei_update_handler(scene, _scene_update(scene))
+
+        assert len(alignment.pis) == len(PI_COORDINATES)
+
+    def test_deleted_pi_detected(self, alignment, visualizer):
+        """Test deleting a PI object removes that PI."""
+        scene = bpy.context.scene
+        update_system.saikei_update_handler(scene, _scene_update(scene))
+        pi_object = alignment.pis[1]['blender_object']
+        visualizer.pi_objects.remove(pi_object)
+        bpy.data.objects.remove(pi_object, do_unlink=True)
+
+        update_system.saikei_update_handler(scene, _scene_update(scene))
+
+        assert len(alignment.pis) == len(PI_COORDINATES) - 1
+
+    def test_transform_event_skips_index_scan(self, alignment, visualizer, monkeypatch):
+        """Test a transform event that removes nothing never scans the index."""
+        scene = bpy.context.scene
+        other = bpy.data.objects.new("Moved", None)
+        scene.collection.objects.link(other)
+        update_system.saikei_update_handler(scene, _scene_update(scene))
+
+        checked = []
+        object_alive = update_system._object_alive
+        monkeypatch.setattr(
+            update_system, "_object_alive",
+            lambda obj: checked.append(obj) or object_alive(obj)
+        )
+        try:
+            other.location.x += 1.0
+            update_system.saikei_update_handler(scene, _scene_update(scene, other))
+        finally:
+            bpy.data.objects.remove(other, do_unlink=True)
+
+        assert checked == []
+        assert len(alignment.pis) == len(PI_COORDINATES)
+
+    def test_idle_event_within_budget(self, alignment, visualizer):
+        """Test events without PI changes stay within the handler budget."""
+        scene = bpy.context.scene
+        depsgraph = _scene_update(scene)
+        update_system.saikei_update_handler(scene, depsgraph)
+
+        timings = []
+        for _ in range(50):
+            started = time.perf_counter()
+            update_system.saikei_update_handler(scene, depsgraph)
+            timings.append((time.perf_counter() - started) * 1000.0)
+
+        assert statistics.median(timings) < update_system._handler_cost_target_ms
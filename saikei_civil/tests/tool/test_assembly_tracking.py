@@ -0,0 +1,179 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Assembly Edit Tracking
+================================
+
+Checks that component and constraint edits made through the assembly
+operators and properties reach the corridor change tracker, and that
+corridors registered on file load keep their constraint baseline and ID.
+Runs inside Blender only, with the add-on registered.
+
+    blender --background --python-expr \
+        "import pytest; pytest.main(['-m', 'blender', '-s', 'tests/tool'])"
+"""
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+dependencies = pytest.importorskip("saikei_civil.core.corridor_dependencies")
+
+CORRIDOR = "Tracked Corridor"
+
+
+@pytest.fixture
+def assembly():
+    """Assembly with two lanes, tracked by a 0-1000 m corridor."""
+    scene = bpy.context.scene
+    if not hasattr(scene, "bc_cross_section"):
+        pytest.skip("Saikei Civil add-on not registered")
+
+    cs = scene.bc_cross_section
+    assembly = cs.assemblies.add()
+    assembly.name = "Tracked Assembly"
+    for name, side in (("Left Lane", 'LEFT'), ("Right Lane", 'RIGHT')):
+        comp = assembly.components.add()
+        comp.name = name
+        comp.side = side
+    cs.active_assembly_index = len(cs.assemblies) - 1
+
+    tracker = dependencies.get_change_tracker()
+    tracker.register(dependencies.CorridorDependency(
+        corridor_id=CORRIDOR,
+        alignment_guid="ALIGN",
+        assembly_name=assembly.name,
+        start_station=0.0,
+        end_station=1000.0,
+    ))
+    yield assembly
+
+    tracker.unregister(CORRIDOR)
+    cs.assemblies.remove(len(cs.assemblies) - 1)
+    cs.active_assembly_index = 0
+
+
+@pytest.fixture
+def scheduled():
+    """Ranges the tracker schedules for the test corridor."""
+    ranges = []
+
+    def listener(corridor_id, start, end):
+        if corridor_id == CORRIDOR:
+            ranges.append((start, end))
+
+    tracker = dependencies.get_change_tracker()
+    tracker.add_listener(listener)
+    yield ranges
+    tracker.remove_listener(listener)
+
+
+@pytest.mark.blender
+class TestAssemblyEditTracking:
+    """Tests for assembly edits reported to CorridorChangeTracker."""
+
+    def test_component_width_edit(self, assembly, scheduled):
+        """Test editing a component width schedules the whole corridor."""
+        assembly.components[0].width = 4.2
+        assert scheduled == [(0.0, 1000.0)]
+
+    def test_component_reorder(self, assembly, scheduled):
+        """Test moving a component schedules the whole corridor."""
+        assembly.active_component_index = 0
+        assert bpy.ops.bc.move_component_down() == {'FINISHED'}
+        assert scheduled == [(0.0, 1000.0)]
+
+    def test_component_removed(self, assembly, scheduled):
+        """Test removing a component schedules the whole corridor."""
+        assembly.active_component_index = 1
+        assert bpy.ops.bc.remove_component() == {'FINISHED'}
+        assert scheduled == [(0.0, 1000.0)]
+
+    def test_constraint_station_edit(self, assembly, scheduled):
+        """Test moving a constraint schedules its old and new ranges only."""
+        constraint = assembly.constraints.add()
+        constraint.component_name = "Right Lane"
+        constraint.start_station = 100.0
+        constraint.end_station = 200.0
+        constraint.start_value = 4.2
+        scheduled.clear()
+
+        constraint.end_station = 300.0
+        assert scheduled == [(100.0, 300.0)]
+
+
+@pytest.fixture
+def stored_corridor(assembly):
+    """Object with a stored dependency record on the tracked assembly."""
+    from saikei_civil import tool
+
+    obj = bpy.data.objects.new("Stored Corridor", None)
+    tool.Corridor.set_dependency(obj, dependencies.CorridorDependency(
+        corridor_id=tool.Corridor.get_corridor_id(obj),
+        alignment_guid="ALIGN",
+        assembly_name=assembly.name,
+        start_station=0.0,
+        end_station=1000.0,
+    ))
+    yield obj
+    bpy.data.objects.remove(obj)
+
+
+@pytest.mark.blender
+class TestCorridorReload:
+    """Tests for corridors registered from stored records on file load."""
+
+    def test_reload_seeds_constraint_baseline(self, assembly, stored_corridor):
+        """Test the first edit after load schedules only the edited constraint."""
+        corridor_handler = pytest.importorskip("saikei_civil.handlers.corridor_handler")
+
+        for start, end in ((100.0, 200.0), (600.0, 700.0)):
+            constraint = assembly.constraints.add()
+            constraint.component_name = "Right Lane"
+            constraint.start_station = start
+            constraint.end_station = end
+            constraint.start_value = 4.2
+
+        corridor_handler.load_post_handler(None)
+        corridor_id = stored_corridor["saikei_corridor_id"]
+        ranges = []
+
+        def listener(changed_id, start, end):
+            if changed_id == corridor_id:
+                ranges.append((start, end))
+
+        tracker = dependencies.get_change_tracker()
+        tracker.add_listener(listener)
+        try:
+            assembly.constraints[0].end_station = 300.0
+        finally:
+            tracker.remove_listener(listener)
+        assert ranges == [(100.0, 300.0)]
+
+    def test_rename_keeps_tracking(self, stored_corridor):
+        """Test a renamed corridor is still found by its ID."""
+        corridor_handler = pytest.importorskip("saikei_civil.handlers.corridor_handler")
+
+        corridor_handler.load_post_handler(None)
+        corridor_id = stored_corridor["saikei_corridor_id"]
+        stored_corridor.name = "Renamed Corridor"
+
+        assert dependencies.get_change_tracker().get(corridor_id) is not None
+        assert corridor_handler._find_corridor(corridor_id) == stored_corridor
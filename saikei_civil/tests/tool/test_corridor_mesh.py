@@ -0,0 +1,181 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+
+"""
+Tests for Corridor Mesh Generation
+===================================
+
+Compares the bulk ``foreach_set`` corridor mesh path against a
+vertex-by-vertex BMesh reference, and benchmarks the two. Runs inside
+Blender only.
+
+    blender --background --python-expr \
+        "import pytest; pytest.main(['-m', 'blender', '-s', 'tests/tool'])"
+"""
+
+import math
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+bmesh = pytest.importorskip("bmesh")
+corridor_tool = pytest.importorskip("saikei_civil.tool.corridor")
+core_corridor = pytest.importorskip("saikei_civil.core.corridor")
+
+Corridor = corridor_tool.Corridor
+
+
+@pytest.fixture
+def assembly():
+    """Two-lane assembly with shoulders."""
+    components = [
+        core_corridor.ComponentData("Left Shoulder", "SHOULDER", 2.4, 0.04, -6.0, -0.072),
+        core_corridor.ComponentData("Left Lane", "LANE", 3.6, 0.02, -3.6, 0.0),
+        core_corridor.ComponentData("Right Lane", "LANE", 3.6, 0.02, 0.0, 0.0),
+        core_corridor.ComponentData("Right Shoulder", "SHOULDER", 2.4, 0.04, 3.6, -0.072),
+    ]
+    return core_corridor.AssemblyWrapper("Test", components)
+
+
+def _stations(count):
+    """Stations along a gentle arc."""
+    return [
+        SimpleNamespace(
+            station=i * 5.0,
+            x=300.0 * math.sin(i * 0.005),
+            y=300.0 * (1.0 - math.cos(i * 0.005)),
+            z=100.0 + 0.01 * i,
+            direction=i * 0.005,
+        )
+        for i in range(count)
+    ]
+
+
+def _fill_mesh_bmesh(mesh, stations, profiles, smooth=False):
+    """Reference mesh fill: one BMesh vertex and face at a time."""
+    bm = bmesh.new()
+    try:
+        rings = []
+        for station, profile in zip(stations, profiles):
+            cos_b, sin_b = math.cos(station.direction), math.sin(station.direction)
+            rings.append([
+                bm.verts.new((
+                    station.x - offset * sin_b,
+                    station.y + offset * cos_b,
+                    station.z + elevation,
+                ))
+                for offset, elevation in profile
+            ])
+
+        for ring, next_ring in zip(rings, rings[1:]):
+            count = len(ring)
+            for j in range(count):
+                k = (j + 1) % count
+                bm.faces.new([ring[j], ring[k], next_ring[k], next_ring[j]])
+
+        bm.faces.new(rings[0])
+        bm.faces.new(list(reversed(rings[-1])))
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+
+    if smooth:
+        for poly in mesh.polygons:
+            poly.use_smooth = True
+
+
+def _build(method, stations, profile):
+    """Fill a fresh mesh with the given method and return it with timing."""
+    mesh = bpy.data.meshes.new("CorridorTest")
+    start = time.perf_counter()
+    method(mesh, stations, [profile] * len(stations), True)
+    return mesh, time.perf_counter() - start
+
+
+@pytest.mark.blender
+class TestBulkCorridorMesh:
+    """Tests for Corridor._fill_mesh_arrays()."""
+
+    def test_matches_bmesh_geometry(self, assembly):
+        """Test the bulk path produces the same vertices and faces as BMesh."""
+        stations = _stations(50)
+        profile = Corridor._get_profile_points(assembly)
+
+        fast, _ = _build(Corridor._fill_mesh_arrays, stations, profile)
+        reference, _ = _build(_fill_mesh_bmesh, stations, profile)
+        try:
+            assert len(fast.vertices) == len(reference.vertices)
+            assert len(fast.polygons) == len(reference.polygons)
+            assert len(fast.edges) == len(reference.edges)
+
+            fast_co = np.empty(len(fast.vertices) * 3, dtype=np.float32)
+            ref_co = np.empty(len(reference.vertices) * 3, dtype=np.float32)
+            fast.vertices.foreach_get("co", fast_co)
+            reference.vertices.foreach_get("co", ref_co)
+            assert np.allclose(fast_co, ref_co, atol=1e-4)
+
+            assert fast.validate() is False
+            assert all(p.use_smooth for p in fast.polygons)
+        finally:
+            bpy.data.meshes.remove(fast)
+            bpy.data.meshes.remove(reference)
+
+    @pytest.mark.slow
+    def test_benchmark_against_bmesh(self, assembly):
+        """Benchmark bulk fill against BMesh for a long corridor."""
+        stations = _stations(5000)
+        profile = Corridor._get_profile_points(assembly)
+
+        fast, fast_time = _build(Corridor._fill_mesh_arrays, stations, profile)
+        reference, bmesh_time = _build(_fill_mesh_bmesh, stations, profile)
+        bpy.data.meshes.remove(fast)
+        bpy.data.meshes.remove(reference)
+
+        print(f"\nCorridor mesh, {len(stations)} stations x {len(profile)} points: "
+              f"BMesh {bmesh_time * 1000:.1f} ms, "
+              f"foreach_set {fast_time * 1000:.1f} ms "
+              f"({bmesh_time / fast_time:.1f}x)")
+        assert fast_time < bmesh_time
+
+
+@pytest.mark.blender
+class TestChunkDirtyState:
+    """Tests for chunk dirty state stored on the corridor parent."""
+
+    def test_dirty_state_follows_rename(self, assembly):
+        """Test dirty chunks are kept on the object, not under its name."""
+        parent, _ = Corridor.generate_chunked_corridor_mesh(
+            _stations(300), assembly, name="ChunkTest"
+        )
+        try:
+            assert Corridor.get_chunk_layout(parent).dirty_chunks() == []
+
+            parent.name = "ChunkTestRenamed"
+            assert Corridor.mark_dirty_range(parent, 620.0) == [1]
+
+            dirty = Corridor.get_chunk_layout(parent).dirty_chunks()
+            assert [chunk.index for chunk in dirty] == [1]
+        finally:
+            for child in list(parent.children):
+                bpy.data.objects.remove(child)
+            bpy.data.objects.remove(parent)
@@ -36,6 +36,7 @@ from .vertical_alignment import VerticalAlignment
 from .georeference import Georeference
 from .cross_section import CrossSection
 from .corridor import Corridor
+from .terrain import Terrain
 from .spatial import Spatial
 from .visualizer import Visualizer
 
@@ -47,6 +48,7 @@ __all__ = [
     "Georeference",
     "CrossSection",
     "Corridor",
+    "Terrain",
     "Spatial",
     "Visualizer",
 ]
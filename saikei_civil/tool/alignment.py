@@ -39,7 +39,6 @@ import math
 import logging
 
 import bpy
-from mathutils import Vector
 
 from ..core import tool as core_tool
 from . import Ifc, Blender
@@ -47,6 +46,8 @@ from . import Ifc, Blender
 # Import core alignment logic
 from ..core import alignment as core_alignment
 from ..core.alignment import SimpleVector
+from ..core.horizontal_alignment.evaluator import CompiledHorizontalAlignment
+from ..core.horizontal_alignment.stationing import StationingManager
 
 if TYPE_CHECKING:
     import ifcopenshell
@@ -339,42 +340,28 @@ class Alignment(core_tool.Alignment):
         Returns:
             Station value, or None if point is too far from alignment
         """
-        segments = cls.get_horizontal_segments(alignment)
-        if not segments:
+        horizontal = cls._get_horizontal_layout(alignment)
+        if not horizontal:
             return None
 
-        start_station = cls._get_starting_station(alignment)
-
-        # Simplified implementation - find closest segment
-        # Full implementation would use core_alignment.get_station_at_point
-
-        target = Vector((point[0], point[1]))
-        best_station = None
-        best_distance = float('inf')
-        cumulative = 0.0
-
-        for seg in segments:
-            if seg['type'] == 'LINE':
-                start = Vector((seg['start_x'], seg['start_y']))
-                direction = seg.get('start_direction', 0.0)
-                length = seg['length']
-
-                # Project point onto line
-                dir_vec = Vector((math.cos(direction), math.sin(direction)))
-                to_target = target - start
-                proj_dist = to_target.dot(dir_vec)
-                proj_dist = max(0, min(proj_dist, length))
-
-                proj_point = start + dir_vec * proj_dist
-                dist = (target - proj_point).length
-
-                if dist < best_distance:
-                    best_distance = dist
-                    best_station = start_station + cumulative + proj_dist
+        evaluator = CompiledHorizontalAlignment.from_horizontal(horizontal)
+        if evaluator.segment_count == 0:
+            return None
 
-            cumulative += seg['length']
+        # Map through the stationing referents so station equations apply
+        native = cls._get_native_alignment(alignment)
+        if native is not None and getattr(native, 'stationing', None) is not None:
+            stationing = native.stationing
+        else:
+            stationing = StationingManager(Ifc.get(), alignment)
+            stationing.load_from_ifc(create_default=False)
+        if not stationing.referents:
+            stationing = None
 
-        return best_station if best_distance < 100.0 else None
+        start_station = cls._get_starting_station(alignment)
+        return core_alignment.get_station_at_point(
+            evaluator, point, start_station, tolerance=100.0, stationing=stationing
+        )
 
     @classmethod
     def update_visualization(cls, alignment: "ifcopenshell.entity_instance") -> None:
@@ -35,11 +35,53 @@ import math
 import ifcopenshell
 import ifcopenshell.guid
 from mathutils import Vector
+from ..core.horizontal_alignment.curve_geometry import calculate_curve_geometry
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def _line_points(start, end, num_points):
+    """Flat (x, y, z, w) spline coordinates evenly spaced from start to end."""
+    coords = []
+    for j in range(num_points):
+        t = j / (num_points - 1)
+        coords.extend((
+            start.x + (end.x - start.x) * t,
+            start.y + (end.y - start.y) * t,
+            0.0,
+            1.0,
+        ))
+    return coords
+
+
+def _arc_points(curve, num_points):
+    """Flat (x, y, z, w) spline coordinates along a curve from BC to EC.
+
+    Args:
+        curve: Curve dictionary from calculate_curve_geometry()
+        num_points: Number of spline points to generate
+    """
+    bc = curve['bc']
+    start_dir = curve['start_direction']
+    deflection = curve['deflection']
+    # Signed radius: positive for left (CCW) turns
+    signed_radius = curve['radius'] if deflection > 0 else -curve['radius']
+
+    sin0 = math.sin(start_dir)
+    cos0 = math.cos(start_dir)
+    coords = []
+    for j in range(num_points):
+        angle = start_dir + deflection * j / (num_points - 1)
+        coords.extend((
+            bc.x + signed_radius * (math.sin(angle) - sin0),
+            bc.y - signed_radius * (math.cos(angle) - cos0),
+            0.0,
+            1.0,
+        ))
+    return coords
+
+
 class AlignmentVisualizer:
     """Create Blender visualization of IFC alignment"""
 
@@ -186,7 +228,9 @@ class AlignmentVisualizer:
         obj['bc_alignment_id'] = self.alignment.alignment.GlobalId
 
         # CRITICAL: Store reference!
+        previous = pi_data.get('blender_object')
         pi_data['blender_object'] = obj
+        self._update_pi_index(pi_data, previous)
 
         # Always GREEN for PIs (they're just intersection points)
         obj.color = (0.0, 1.0, 0.0, 1.0)
@@ -348,11 +392,30 @@ class AlignmentVisualizer:
 
         return obj
 
+    def _update_pi_index(self, pi_data, previous=None):
+        """Keep the update system's PI object index in step with pi_data.
+
+        Args:
+            pi_data: PI whose 'blender_object' was just (re)created
+            previous: Object the PI pointed at before, if any
+        """
+        from ..operators.update_system_operators import (
+            index_pi_object,
+            unindex_pi_object,
+        )
+
+        if previous is not None:
+            unindex_pi_object(previous)
+        index_pi_object(self.alignment, pi_data)
+
     def clear_visualizations(self):
         """Clear all existing visualizations"""
+        from ..operators.update_system_operators import unindex_pi_object
+
         # Remove all objects in tracked lists
         for obj in self.pi_objects + self.segment_objects:
             try:
+                unindex_pi_object(obj)
                 if obj and obj.name in bpy.data.objects:
                     bpy.data.objects.remove(obj, do_unlink=True)
             except (ReferenceError, AttributeError, RuntimeError):
@@ -370,6 +433,7 @@ class AlignmentVisualizer:
                 # Remove all children of the alignment empty
                 for child in list(self.alignment_empty.children):
                     try:
+                        unindex_pi_object(child)
                         bpy.data.objects.remove(child, do_unlink=True)
                     except:
                         pass
@@ -596,47 +660,78 @@ class AlignmentVisualizer:
         # Use in-place updates to avoid conflicts with modal operators
         self.update_segments_in_place()
 
-    def update_segment_curves_fast(self, pis):
+    def update_segment_curves_fast(self, pis, moved_pi=None):
         """Fast update: Move existing curve points based on PI positions.
 
         This is called during PI dragging to provide real-time visual feedback
         WITHOUT reading from IFC (which hasn't been regenerated yet).
 
-        IMPORTANT: This only works correctly for TANGENT-ONLY alignments.
-        For alignments with curves, tangent segments connect to BC/EC points,
-        not directly to PIs, so fast updates are skipped.
+        Curves are previewed in memory: BC/EC points and arc points are
+        recomputed with calculate_curve_geometry() for the curves next to
+        the moved PI only, and the existing spline points are moved in place.
+        The stored PI curve data is left for the IFC regeneration to update.
+
+        If the segment objects no longer match the PI layout (a curve was
+        added or removed), nothing is updated and the debounced full update
+        takes over.
 
         Args:
             pis: List of PI data dictionaries with updated positions
+            moved_pi: Index of the PI being dragged (None = update all segments)
         """
-        # DEBUG: Track fast updates
-        logger.info("=== update_segment_curves_fast() called with %d PIs ===", len(pis))
-        logger.info("  segment_objects count: %d", len(self.segment_objects) if hasattr(self, 'segment_objects') else 0)
+        logger.debug("=== update_segment_curves_fast() called with %d PIs ===", len(pis))
 
         if len(pis) < 2:
-            logger.info("  Skipping - less than 2 PIs")
+            logger.debug("  Skipping - less than 2 PIs")
             return
 
         if not hasattr(self, 'segment_objects') or not self.segment_objects:
-            logger.info("  Skipping - no segment_objects")
+            logger.debug("  Skipping - no segment_objects")
             return
 
-        # Check if any PI has a curve defined
-        # If so, fast updates won't work correctly (tangents connect to BC/EC, not PIs)
-        has_curves = any(pi.get('curve') for pi in pis)
-        if has_curves:
-            logger.info("  Skipping fast update - alignment has curves (use debounced full update)")
+        # Segment objects follow the layout: tangent i, then the curve at PI i+1
+        layout = []
+        for i in range(len(pis) - 1):
+            layout.append(("LINE", i))
+            if pis[i + 1].get('curve'):
+                layout.append(("CIRCULARARC", i + 1))
+
+        if len(layout) != len(self.segment_objects):
+            logger.debug("  Skipping - %d segment objects for %d layout segments",
+                         len(self.segment_objects), len(layout))
             return
 
-        # For tangent-only alignments:
-        # - N PIs produce N-1 tangent segments
-        # - segment[i] connects PI[i] to PI[i+1]
+        # Curves whose BC/EC depend on the moved PI
+        if moved_pi is None:
+            affected_pis = set(range(len(pis)))
+        else:
+            affected_pis = {moved_pi - 1, moved_pi, moved_pi + 1}
+
+        preview_curves = {}
+        for i in affected_pis:
+            if 0 < i < len(pis) - 1 and pis[i].get('curve'):
+                preview_curves[i] = calculate_curve_geometry(
+                    pis[i - 1]['position'],
+                    pis[i]['position'],
+                    pis[i + 1]['position'],
+                    pis[i]['curve']['radius']
+                )
+
+        def curve_at(i):
+            if i in preview_curves:
+                return preview_curves[i]
+            return pis[i].get('curve')
+
         updated_count = 0
 
-        for seg_idx, curve_obj in enumerate(self.segment_objects):
-            if seg_idx >= len(pis) - 1:
-                break  # No more PI pairs
+        for seg_idx, (kind, i) in enumerate(layout):
+            if kind == "LINE":
+                if moved_pi is not None and not (moved_pi - 2 <= i <= moved_pi + 1):
+                    continue
+            elif i not in preview_curves:
+                continue
 
+            curve_obj = self.segment_objects[seg_idx]
             try:
                 # Check object still exists
                 if not curve_obj or curve_obj.name not in bpy.data.objects:
@@ -647,21 +742,31 @@ class AlignmentVisualizer:
                     continue
 
                 spline = curve_data.splines[0]
+                num_points = len(spline.points)
+                if num_points < 2:
+                    continue
 
-                # Only update LINE segments (2 points)
-                if len(spline.points) == 2:
-                    # Get PI positions for this tangent segment
-                    start_pos = pis[seg_idx]['position']
-                    end_pos = pis[seg_idx + 1]['position']
+                if kind == "LINE":
+                    start_curve = curve_at(i)
+                    end_curve = curve_at(i + 1)
+                    start = start_curve['ec'] if start_curve else pis[i]['position']
+                    end = end_curve['bc'] if end_curve else pis[i + 1]['position']
+                    coords = _line_points(start, end, num_points)
+                else:
+                    curve = preview_curves[i]
+                    if curve:
+                        coords = _arc_points(curve, num_points)
+                    else:
+                        # Collinear PIs: the curve collapses onto its PI
+                        position = pis[i]['position']
+                        coords = [position.x, position.y, 0.0, 1.0] * num_points
 
-                    # Update the spline points directly
-                    spline.points[0].co = (start_pos.x, start_pos.y, 0, 1)
-                    spline.points[1].co = (end_pos.x, end_pos.y, 0, 1)
+                spline.points.foreach_set("co", coords)
 
-                    # CRITICAL: Tag curve data as modified so Blender redraws it
-                    curve_data.update_tag()
+                # CRITICAL: Tag curve data as modified so Blender redraws it
+                curve_data.update_tag()
 
-                    updated_count += 1
+                updated_count += 1
 
             except (ReferenceError, KeyError, IndexError, AttributeError) as e:
                 logger.debug("Fast curve update skipped for segment %d: %s", seg_idx, e)
@@ -672,7 +777,7 @@ class AlignmentVisualizer:
             if bpy.context.view_layer:
                 bpy.context.view_layer.update()
 
-        logger.info("  Updated %d segment curves", updated_count)
+        logger.debug("  Updated %d segment curves", updated_count)
 
     def visualize_all(self):
         """Create complete visualization - Legacy method for compatibility"""
@@ -757,7 +862,6 @@ class AlignmentVisualizer:
             label_size: Size of text labels
         """
         from ..core.station_formatting import format_station_short
-        import math
 
         # Clear existing markers
         self.clear_station_markers()
@@ -768,182 +872,51 @@ class AlignmentVisualizer:
             return
 
         # Get total length of alignment
-        total_length = 0.0
-        for segment in self.alignment.segments:
-            if hasattr(segment.DesignParameters, 'SegmentLength'):
-                total_length += segment.DesignParameters.SegmentLength
+        evaluator = self.alignment.get_horizontal_evaluator()
+        total_length = evaluator.total_length
 
         if total_length <= 0:
             logger.warning("Alignment has zero length")
             return
 
-        # Get station range
-        starting_station = self.alignment.get_station_at_distance(0.0)
-        ending_station = self.alignment.get_station_at_distance(total_length)
-
-        # Find first round minor station value (round up to next interval)
-        first_station = math.ceil(starting_station / minor_interval) * minor_interval
+        # Round station values within each station equation region
+        stations, distances = self.alignment.stationing.round_stations(
+            minor_interval, total_length
+        )
+        if len(stations) == 0:
+            logger.info("No round stations within alignment")
+            return
 
         logger.info("Creating station markers from %s to %s (interval: %sm)",
-                   format_station_short(first_station), format_station_short(ending_station), minor_interval)
-
-        # Iterate through round station values
-        current_station = first_station
-        while current_station <= ending_station:
-            # Determine if this is a major or minor station
-            is_major = abs(current_station % major_interval) < 0.01
+                   format_station_short(stations[0]), format_station_short(stations[-1]),
+                   minor_interval)
 
-            # Convert station value to distance along alignment
-            distance = self._get_distance_at_station(current_station)
+        # Evaluate every marker position in one batch
+        xs, ys, bearings, _ = evaluator.evaluate(distances)
 
-            if distance is not None and 0 <= distance <= total_length:
-                # Get position and direction at this distance
-                pos_data = self._get_position_at_distance(distance)
-                if pos_data:
-                    position = pos_data['position']
-                    direction = pos_data['direction']
+        for station, x, y, bearing in zip(stations.tolist(), xs.tolist(),
+                                          ys.tolist(), bearings.tolist()):
+            # Determine if this is a major or minor station
+            is_major = abs(station % major_interval) < 0.01
 
-                    # Create tick mark perpendicular to alignment
-                    tick_obj = self._create_tick_mark(position, direction, tick_size, is_major)
-                    if tick_obj:
-                        self.station_markers.append(tick_obj)
+            position = Vector((x, y, 0.0))
+            direction = Vector((math.cos(bearing), math.sin(bearing), 0.0))
 
-                    # Create label for major stations
-                    if is_major:
-                        label_obj = self._create_station_label(
-                            position, direction, current_station, label_size
-                        )
-                        if label_obj:
-                            self.station_markers.append(label_obj)
+            # Create tick mark perpendicular to alignment
+            tick_obj = self._create_tick_mark(position, direction, tick_size, is_major)
+            if tick_obj:
+                self.station_markers.append(tick_obj)
 
-            current_station += minor_interval
+            # Create label for major stations
+            if is_major:
+                label_obj = self._create_station_label(
+                    position, direction, station, label_size
+                )
+                if label_obj:
+                    self.station_markers.append(label_obj)
 
         logger.info("Created %d station marker objects", len(self.station_markers))
 
-    def _get_distance_at_station(self, station_value):
-        """Convert station value to distance along alignment.
-
-        This handles simple stationing. For alignments with station equations,
-        this provides basic support but may need enhancement for complex cases.
-
-        Args:
-            station_value: Station value in meters
-
-        Returns:
-            Distance along alignment in meters, or None if station is out of range
-        """
-        if not self.alignment.referents:
-            # No stationing defined, assume 1:1 relationship
-            return station_value
-
-        # Get starting station (at distance = 0)
-        starting_station = None
-        for ref in self.alignment.referents:
-            if ref['distance_along'] == 0.0:
-                starting_station = ref['station']
-                break
-
-        if starting_station is None:
-            return None
-
-        # Simple conversion: works correctly without station equations
-        # With station equations, this is an approximation
-        distance = station_value - starting_station
-
-        return distance if distance >= 0 else None
-
-    def _get_position_at_distance(self, distance_along):
-        """Get position and direction at a distance along the alignment.
-
-        Args:
-            distance_along: Distance in meters from start of alignment
-
-        Returns:
-            dict with 'position' (Vector) and 'direction' (Vector), or None if not found
-        """
-        # Walk through segments to find the position
-        cumulative_distance = 0.0
-
-        for segment in self.alignment.segments:
-            params = segment.DesignParameters
-            segment_length = params.SegmentLength
-
-            if cumulative_distance + segment_length >= distance_along:
-                # Position is in this segment
-                local_distance = distance_along - cumulative_distance
-
-                if params.PredefinedType == "LINE":
-                    # Linear interpolation along line
-                    start_point = params.StartPoint.Coordinates
-                    direction_angle = params.StartDirection
-
-                    position = Vector((
-                        start_point[0] + local_distance * math.cos(direction_angle),
-                        start_point[1] + local_distance * math.sin(direction_angle),
-                        0.0
-                    ))
-
-                    direction = Vector((
-                        math.cos(direction_angle),
-                        math.sin(direction_angle),
-                        0.0
-                    ))
-
-                    return {'position': position, 'direction': direction}
-
-                elif params.PredefinedType == "CIRCULARARC":
-                    # Calculate position on circular arc
-                    start_point = params.StartPoint.Coordinates
-                    radius = abs(params.StartRadiusOfCurvature)
-                    start_direction = params.StartDirection
-                    signed_radius = params.StartRadiusOfCurvature
-
-                    # Calculate center of circle
-                    if signed_radius > 0:  # LEFT turn (CCW)
-                        center_angle = start_direction + math.pi / 2
-                    else:  # RIGHT turn (CW)
-                        center_angle = start_direction - math.pi / 2
-
-                    center_x = start_point[0] + radius * math.cos(center_angle)
-                    center_y = start_point[1] + radius * math.sin(center_angle)
-
-                    # Calculate angle traveled along arc
-                    arc_angle = local_distance / radius
-                    if signed_radius < 0:  # CW turn
-                        arc_angle = -arc_angle
-
-                    # Current angle on circle
-                    current_angle = start_direction + arc_angle
-                    if signed_radius > 0:  # LEFT
-                        current_angle -= math.pi / 2
-                    else:  # RIGHT
-                        current_angle += math.pi / 2
-
-                    # Position on circle
-                    position = Vector((
-                        center_x + radius * math.cos(current_angle),
-                        center_y + radius * math.sin(current_angle),
-                        0.0
-                    ))
-
-                    # Tangent direction at this point
-                    if signed_radius > 0:  # LEFT
-                        tangent_angle = current_angle + math.pi / 2
-                    else:  # RIGHT
-                        tangent_angle = current_angle - math.pi / 2
-
-                    direction = Vector((
-                        math.cos(tangent_angle),
-                        math.sin(tangent_angle),
-                        0.0
-                    ))
-
-                    return {'position': position, 'direction': direction}
-
-            cumulative_distance += segment_length
-
-        return None
-
     def _create_tick_mark(self, position, direction, tick_size, is_major):
         """Create a tick mark perpendicular to the alignment.
 
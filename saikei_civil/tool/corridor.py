@@ -44,22 +44,26 @@ Usage:
 """
 from typing import TYPE_CHECKING, Optional, List, Any, Dict, Tuple
 from dataclasses import dataclass
-import math
 import time
 
 import bpy
-import bmesh
+import numpy as np
 
 if TYPE_CHECKING:
     import ifcopenshell
-    from ..core.corridor import AssemblyWrapper, MeshStats
+    from ..core.corridor import AlignmentWrapper, AssemblyWrapper, MeshStats
+    from ..core.corridor_parallel import CorridorArrays
     from ..core.native_ifc_corridor import StationPoint
+    from ..core.parametric_constraints import ConstraintManager
 
 from ..core import tool as core_tool
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Custom property holding a corridor's stable ID (see Corridor.get_corridor_id)
+CORRIDOR_ID_PROPERTY = "saikei_corridor_id"
+
 
 # =============================================================================
 # LOD Settings
@@ -202,10 +206,12 @@ class Corridor(core_tool.Corridor):
         Generate Blender mesh geometry from corridor data.
 
         This is the main mesh generation method. It:
-        1. Creates vertices at each station
-        2. Connects stations with quad strips
-        3. Applies smooth shading based on LOD
-        4. Creates and applies materials
+        1. Evaluates all station profiles as one (N, P, 2) array
+        2. Transforms the profiles to world space as one (N, P, 3) array
+        3. Fills the mesh through bulk ``foreach_set`` calls (quad strips
+           plus end caps)
+        4. Applies smooth shading based on LOD
+        5. Creates and applies materials
 
         Args:
             stations: List of StationPoint objects from core
@@ -224,77 +230,598 @@ class Corridor(core_tool.Corridor):
         if not stations or len(stations) < 2:
             raise ValueError("Need at least 2 stations to generate mesh")
 
+        # Check if we have parametric constraints (variable cross-section)
+        has_constraints = (
+            hasattr(assembly, 'constraint_manager') and
+            assembly.constraint_manager is not None
+        )
+
+        if has_constraints:
+            logger.info("Generating corridor with %d parametric constraints",
+                       len(assembly.constraint_manager.constraints))
+
+        # Evaluate every station profile in one pass (constraints applied)
+        profiles = assembly.profiles_at(
+            np.array([station.station for station in stations], dtype=np.float64)
+        )
+
         # Create new mesh
         mesh = bpy.data.meshes.new(name)
         mesh_obj = bpy.data.objects.new(name, mesh)
 
-        # Generate geometry using BMesh
-        bm = bmesh.new()
+        cls._fill_mesh_arrays(
+            mesh, stations, profiles, lod_settings.smooth_shading
+        )
 
-        try:
-            # Check if we have parametric constraints (variable cross-section)
-            has_constraints = (
-                hasattr(assembly, 'constraint_manager') and
-                assembly.constraint_manager is not None
-            )
+        # Apply materials
+        cls._apply_materials(mesh_obj, assembly)
 
-            if has_constraints:
-                logger.info("Generating corridor with %d parametric constraints",
-                           len(assembly.constraint_manager.constraints))
-
-            # Generate vertices for each station
-            all_vertices = []
-            for station in stations:
-                # Get profile points for this station (applies constraints if present)
-                profile_points = cls._get_profile_points(
-                    assembly,
-                    station=station.station
-                )
+        # Update statistics
+        vertex_count = len(mesh.vertices)
+        face_count = len(mesh.polygons)
+        generation_time = time.time() - start_time
+
+        stats = MeshStats(
+            vertex_count=vertex_count,
+            face_count=face_count,
+            generation_time=generation_time,
+            station_count=len(stations)
+        )
+
+        logger.info("Corridor mesh generated:")
+        logger.info("  LOD: %s", lod_settings.name)
+        logger.info("  Vertices: %s", f"{vertex_count:,}")
+        logger.info("  Faces: %s", f"{face_count:,}")
+        logger.info("  Time: %.2fs", generation_time)
+
+        return mesh_obj, stats
+
+    # =========================================================================
+    # Parallel Evaluation
+    # =========================================================================
+
+    @classmethod
+    def compute_corridor_arrays(
+        cls,
+        stations: List["StationPoint"],
+        alignment: "AlignmentWrapper",
+        assembly: "AssemblyWrapper",
+        workers: Optional[int] = None,
+        min_parallel: Optional[int] = None
+    ) -> "CorridorArrays":
+        """
+        Evaluate positions, bearings and profiles for all stations.
+
+        Long station lists are split across worker processes (see
+        core.corridor_parallel). Workers are forked from Blender so they
+        inherit the loaded add-on; where fork is unavailable the arrays
+        are computed serially, since spawned workers would start a new
+        Blender executable.
+
+        Args:
+            stations: Sorted StationPoint objects for the whole corridor
+            alignment: AlignmentWrapper the stations were planned on
+            assembly: AssemblyWrapper with component data and constraints
+            workers: Worker process count (None = all cores)
+            min_parallel: Station count from which workers are used
+                (None = MIN_PARALLEL_STATIONS)
+
+        Returns:
+            CorridorArrays in station order
+        """
+        import multiprocessing
+        from ..core.corridor_parallel import (
+            CorridorSnapshot,
+            compute_corridor_arrays,
+            MIN_PARALLEL_STATIONS,
+        )
+
+        station_values = np.array([s.station for s in stations], dtype=np.float64)
+        snapshot = CorridorSnapshot.from_wrappers(alignment, assembly)
+
+        mp_context = None
+        if "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        else:
+            workers = 1
+
+        return compute_corridor_arrays(
+            snapshot,
+            station_values,
+            alignment.distances_at(station_values),
+            workers=workers,
+            mp_context=mp_context,
+            min_parallel=MIN_PARALLEL_STATIONS if min_parallel is None else min_parallel,
+        )
+
+    # =========================================================================
+    # Chunked Corridor Meshes
+    # =========================================================================
+
+    @classmethod
+    def generate_chunked_corridor_mesh(
+        cls,
+        stations: List["StationPoint"],
+        assembly: "AssemblyWrapper",
+        name: str = "Corridor",
+        lod: str = 'medium',
+        chunk_length: Optional[float] = None,
+        arrays: Optional["CorridorArrays"] = None
+    ) -> Tuple[bpy.types.Object, "MeshStats"]:
+        """
+        Generate a corridor as station-range chunks under one parent empty.
+
+        Each chunk is its own mesh datablock so edits can regenerate only
+        the affected range (see ``mark_dirty_range`` and
+        ``regenerate_dirty_chunks``). Neighbouring chunks share their seam
+        station, so the chunk meshes meet without gaps.
+
+        Args:
+            stations: Sorted StationPoint objects for the whole corridor
+            assembly: AssemblyWrapper with component data
+            name: Name for the parent object
+            lod: Level of detail ('low', 'medium', 'high')
+            chunk_length: Nominal chunk length (m). Defaults to
+                DEFAULT_CHUNK_LENGTH.
+            arrays: Precomputed geometry for ``stations`` (see
+                ``compute_corridor_arrays``)
+
+        Returns:
+            Tuple of (parent_object, MeshStats) with totals over all chunks
+        """
+        from ..core.corridor_chunks import CorridorChunkLayout, DEFAULT_CHUNK_LENGTH
+
+        if not stations or len(stations) < 2:
+            raise ValueError("Need at least 2 stations to generate mesh")
+
+        layout = CorridorChunkLayout(
+            stations[0].station,
+            stations[-1].station,
+            chunk_length or DEFAULT_CHUNK_LENGTH,
+        )
+
+        parent_obj = bpy.data.objects.new(name, None)
+        parent_obj.empty_display_type = 'PLAIN_AXES'
+        parent_obj.empty_display_size = 1.0
+        parent_obj["saikei_corridor_start"] = layout.start_station
+        parent_obj["saikei_corridor_end"] = layout.end_station
+        parent_obj["saikei_chunk_length"] = layout.chunk_length
+        cls._store_dirty_chunks(parent_obj, layout)
+
+        stats = cls.regenerate_dirty_chunks(parent_obj, stations, assembly, lod, arrays)
+        logger.info("Corridor '%s' split into %d chunks", name, len(layout))
+        return parent_obj, stats
+
+    @classmethod
+    def get_chunk_layout(cls, parent_obj: bpy.types.Object) -> Optional[Any]:
+        """
+        Get the chunk layout of a chunked corridor.
+
+        The layout, including which chunks are dirty, is rebuilt from the
+        parent's custom properties, so it follows the object through
+        renames, undo and file reloads and goes away with it. Changes to
+        dirty flags are written back by ``mark_dirty_range`` and
+        ``regenerate_dirty_chunks``.
+
+        Args:
+            parent_obj: Corridor parent object
+
+        Returns:
+            CorridorChunkLayout, or None if the object is not a chunked corridor
+        """
+        from ..core.corridor_chunks import CorridorChunkLayout
+
+        if "saikei_chunk_length" not in parent_obj:
+            return None
+        layout = CorridorChunkLayout(
+            parent_obj["saikei_corridor_start"],
+            parent_obj["saikei_corridor_end"],
+            parent_obj["saikei_chunk_length"],
+        )
+        dirty = set(parent_obj.get("saikei_dirty_chunks", ()))
+        for chunk in layout:
+            chunk.dirty = chunk.index in dirty
+        return layout
+
+    @classmethod
+    def _store_dirty_chunks(cls, parent_obj: bpy.types.Object, layout: Any) -> None:
+        """Record which chunks of a layout are dirty on the corridor parent."""
+        parent_obj["saikei_dirty_chunks"] = [chunk.index for chunk in layout.dirty_chunks()]
+
+    @classmethod
+    def mark_dirty_range(
+        cls,
+        parent_obj: bpy.types.Object,
+        start_station: float,
+        end_station: Optional[float] = None
+    ) -> List[int]:
+        """
+        Flag the chunks touching a station interval for regeneration.
+
+        Args:
+            parent_obj: Corridor parent object
+            start_station: Start of the changed interval (m)
+            end_station: End of the changed interval (m), defaults to start
 
-                station_vertices = cls._create_station_vertices(
-                    station, profile_points, bm
+        Returns:
+            Indices of chunks now dirty because of this interval
+        """
+        layout = cls.get_chunk_layout(parent_obj)
+        if layout is None:
+            return []
+        marked = layout.mark_dirty(start_station, end_station)
+        cls._store_dirty_chunks(parent_obj, layout)
+        return marked
+
+    @classmethod
+    def regenerate_dirty_chunks(
+        cls,
+        parent_obj: bpy.types.Object,
+        stations: List["StationPoint"],
+        assembly: "AssemblyWrapper",
+        lod: str = 'medium',
+        arrays: Optional["CorridorArrays"] = None
+    ) -> "MeshStats":
+        """
+        Rebuild the mesh of every dirty chunk of a corridor.
+
+        Clean chunks are left untouched. A dirty chunk keeps its object
+        (and so its parenting, collections and IFC link); only the mesh
+        datablock is replaced.
+
+        Args:
+            parent_obj: Corridor parent object
+            stations: Sorted StationPoint objects for the whole corridor
+            assembly: AssemblyWrapper with component data
+            lod: Level of detail ('low', 'medium', 'high')
+            arrays: Precomputed positions, bearings and profiles for
+                ``stations``; chunks are sliced from it instead of being
+                evaluated here
+
+        Returns:
+            MeshStats for the regenerated chunks only
+        """
+        from ..core.corridor import MeshStats
+
+        start_time = time.time()
+        smooth = LODSettings.from_string(lod).smooth_shading
+        layout = cls.get_chunk_layout(parent_obj)
+        dirty = layout.dirty_chunks() if layout else []
+
+        chunk_objects = {
+            child.get("saikei_chunk_index"): child
+            for child in parent_obj.children
+            if "saikei_chunk_index" in child
+        }
+        station_values = [s.station for s in stations]
+
+        vertex_count = face_count = station_count = 0
+        for chunk in dirty:
+            rows = layout.station_slice(chunk, station_values)
+            chunk_stations = stations[rows]
+            if len(chunk_stations) < 2:
+                logger.warning("Chunk %d has fewer than 2 stations, skipped", chunk.index)
+                continue
+
+            mesh_name = f"{parent_obj.name}_{chunk.index:03d}"
+            mesh = bpy.data.meshes.new(mesh_name)
+            if arrays is not None:
+                chunk_arrays = arrays.slice(rows)
+                cls._fill_mesh_from_arrays(
+                    mesh, chunk_arrays.positions, chunk_arrays.bearings,
+                    chunk_arrays.profiles, smooth,
+                    start_cap=chunk.is_first, end_cap=chunk.is_last
                 )
-                all_vertices.append(station_vertices)
+            else:
+                profiles = assembly.profiles_at(
+                    np.array([s.station for s in chunk_stations], dtype=np.float64)
+                )
+                cls._fill_mesh_arrays(
+                    mesh, chunk_stations, profiles, smooth,
+                    start_cap=chunk.is_first, end_cap=chunk.is_last
+                )
+
+            chunk_obj = chunk_objects.get(chunk.index)
+            if chunk_obj is None:
+                chunk_obj = bpy.data.objects.new(mesh_name, mesh)
+                chunk_obj["saikei_chunk_index"] = chunk.index
+                chunk_obj.parent = parent_obj
+                for collection in parent_obj.users_collection:
+                    collection.objects.link(chunk_obj)
+                cls._apply_materials(chunk_obj, assembly)
+            else:
+                old_mesh = chunk_obj.data
+                for material in old_mesh.materials:
+                    mesh.materials.append(material)
+                chunk_obj.data = mesh
+                if old_mesh.users == 0:
+                    bpy.data.meshes.remove(old_mesh)
+
+            chunk.dirty = False
+            vertex_count += len(mesh.vertices)
+            face_count += len(mesh.polygons)
+            station_count += len(chunk_stations)
+
+        if layout is not None:
+            cls._store_dirty_chunks(parent_obj, layout)
+
+        generation_time = time.time() - start_time
+        logger.info("Regenerated %d corridor chunks in %.2fs", len(dirty), generation_time)
+
+        return MeshStats(
+            vertex_count=vertex_count,
+            face_count=face_count,
+            generation_time=generation_time,
+            station_count=station_count
+        )
+
+    # =========================================================================
+    # Dependency Tracking
+    # =========================================================================
+
+    @classmethod
+    def set_dependency(cls, parent_obj: bpy.types.Object, dependency: Any) -> None:
+        """
+        Store a corridor's dependency record on its parent object.
 
-            # Connect adjacent stations with quad strips
-            cls._create_quad_strips(bm, all_vertices)
+        Args:
+            parent_obj: Corridor parent object
+            dependency: CorridorDependency for the corridor
+        """
+        import json
 
-            # Add end caps
-            cls._create_end_caps(bm, all_vertices)
+        parent_obj[CORRIDOR_ID_PROPERTY] = dependency.corridor_id
+        parent_obj["saikei_corridor_dependency"] = json.dumps(dependency.to_dict())
+
+    @classmethod
+    def get_corridor_id(cls, parent_obj: bpy.types.Object) -> str:
+        """
+        Get the stable ID of a corridor, assigning one if it has none.
 
-            # Convert BMesh to mesh
-            bm.to_mesh(mesh)
+        The ID is stored as a custom property, so it survives renaming the
+        object and saving the file.
 
-            # Apply smooth shading if requested
-            if lod_settings.smooth_shading:
-                for poly in mesh.polygons:
-                    poly.use_smooth = True
+        Args:
+            parent_obj: Corridor parent object
 
-            # Apply materials
-            cls._apply_materials(mesh_obj, assembly)
+        Returns:
+            Corridor GUID
+        """
+        import ifcopenshell.guid
 
-            # Update statistics
-            vertex_count = len(mesh.vertices)
-            face_count = len(mesh.polygons)
-            generation_time = time.time() - start_time
+        corridor_id = parent_obj.get(CORRIDOR_ID_PROPERTY)
+        if not corridor_id:
+            corridor_id = ifcopenshell.guid.new()
+            parent_obj[CORRIDOR_ID_PROPERTY] = corridor_id
+        return corridor_id
 
-            stats = MeshStats(
-                vertex_count=vertex_count,
-                face_count=face_count,
-                generation_time=generation_time,
-                station_count=len(stations)
-            )
+    @classmethod
+    def find_corridor(
+        cls,
+        corridor_id: str,
+        hint: Optional[str] = None
+    ) -> Optional[bpy.types.Object]:
+        """
+        Find a corridor parent object by its stable ID.
 
-            logger.info("Corridor mesh generated:")
-            logger.info("  LOD: %s", lod_settings.name)
-            logger.info("  Vertices: %s", f"{vertex_count:,}")
-            logger.info("  Faces: %s", f"{face_count:,}")
-            logger.info("  Time: %.2fs", generation_time)
+        Args:
+            corridor_id: Corridor GUID from get_corridor_id()
+            hint: Object name to try before scanning all objects
 
-            return mesh_obj, stats
+        Returns:
+            The corridor parent object, or None if it no longer exists
+        """
+        if hint is not None:
+            obj = bpy.data.objects.get(hint)
+            if obj is not None and obj.get(CORRIDOR_ID_PROPERTY) == corridor_id:
+                return obj
+        for obj in bpy.data.objects:
+            if obj.get(CORRIDOR_ID_PROPERTY) == corridor_id:
+                return obj
+        return None
 
-        finally:
-            bm.free()
+    @classmethod
+    def get_dependency(cls, parent_obj: bpy.types.Object) -> Optional[Any]:
+        """
+        Read the dependency record stored on a corridor parent object.
+
+        Args:
+            parent_obj: Corridor parent object
+
+        Returns:
+            CorridorDependency, or None if the object has no record
+        """
+        import json
+        from ..core.corridor_dependencies import CorridorDependency
+
+        data = parent_obj.get("saikei_corridor_dependency")
+        if not data:
+            return None
+        try:
+            return CorridorDependency.from_dict(json.loads(data))
+        except (ValueError, TypeError) as e:
+            logger.warning("Invalid corridor dependency on '%s': %s", parent_obj.name, e)
+            return None
+
+    @classmethod
+    def get_dependency_constraints(cls, dependency: Any) -> Optional["ConstraintManager"]:
+        """
+        Build the current constraints of a corridor's assembly.
+
+        Used as the change tracker's baseline when corridors are registered
+        from a loaded file, so the first constraint edit is diffed against
+        the saved constraints rather than an empty set.
+
+        Args:
+            dependency: CorridorDependency of the corridor
+
+        Returns:
+            ConstraintManager, or None if the assembly is not in the scene
+        """
+        from ..ui.cross_section_properties import assembly_constraints_to_manager
+
+        assembly_props = cls._find_assembly_props(dependency.assembly_name)
+        if assembly_props is None:
+            return None
+        return assembly_constraints_to_manager(assembly_props)
+
+    @classmethod
+    def _find_assembly_props(cls, assembly_name: str) -> Optional[Any]:
+        """Find an assembly's properties in the active scene by name."""
+        cs_props = getattr(bpy.context.scene, 'bc_cross_section', None)
+        if cs_props is None:
+            return None
+        return next((a for a in cs_props.assemblies if a.name == assembly_name), None)
+
+    @classmethod
+    def _load_dependency_sources(
+        cls,
+        parent_obj: bpy.types.Object,
+        dependency: Optional[Any]
+    ) -> Optional[Tuple[List["StationPoint"], "AssemblyWrapper"]]:
+        """
+        Recompute a corridor's stations and assembly from its dependency record.
+
+        Args:
+            parent_obj: Corridor parent object (for messages)
+            dependency: CorridorDependency of the corridor
+
+        Returns:
+            Tuple of (stations, assembly wrapper), or None if a source is missing
+        """
+        from ..core.corridor import AlignmentWrapper, create_assembly_wrapper
+        from ..core.native_ifc_corridor import StationManager
+        from .ifc import Ifc
+
+        ifc_file = Ifc.get()
+        if dependency is None or ifc_file is None:
+            return None
+
+        try:
+            alignment = ifc_file.by_guid(dependency.alignment_guid)
+        except RuntimeError:
+            logger.warning("Alignment %s of corridor '%s' no longer exists",
+                           dependency.alignment_guid, parent_obj.name)
+            return None
+
+        assembly_props = cls._find_assembly_props(dependency.assembly_name)
+        if assembly_props is None:
+            logger.warning("Assembly '%s' of corridor '%s' not found",
+                           dependency.assembly_name, parent_obj.name)
+            return None
+
+        alignment_3d = AlignmentWrapper(
+            alignment, dependency.start_station, dependency.end_station
+        )
+        assembly = create_assembly_wrapper(assembly_props)
+        station_manager = StationManager(
+            alignment_3d, dependency.interval, chord_tolerance=dependency.chord_tolerance
+        )
+        layout = cls.get_chunk_layout(parent_obj)
+        stations = station_manager.calculate_stations(
+            curve_densification_factor=dependency.curve_densification,
+            constraint_manager=assembly.constraint_manager,
+            chunk_boundaries=layout.boundaries if layout is not None else None
+        )
+        return stations, assembly
+
+    @classmethod
+    def regenerate_from_dependency(cls, parent_obj: bpy.types.Object) -> Optional["MeshStats"]:
+        """
+        Rebuild the dirty chunks of a corridor from its recorded sources.
+
+        Stations are recomputed from the current alignment and the assembly
+        is re-read from the scene, so edits to either are picked up.
+
+        Args:
+            parent_obj: Corridor parent object with a dependency record
+
+        Returns:
+            MeshStats for the regenerated chunks, or None if a source is missing
+        """
+        dependency = cls.get_dependency(parent_obj)
+        sources = cls._load_dependency_sources(parent_obj, dependency)
+        if sources is None:
+            return None
+
+        stations, assembly = sources
+        return cls.regenerate_dirty_chunks(parent_obj, stations, assembly, dependency.lod)
+
+    @classmethod
+    def set_ground_sections(cls, parent_obj: bpy.types.Object, sections: Any) -> None:
+        """
+        Store existing-ground sections on a corridor parent object.
+
+        Elevations are kept as one flat float32 array property.
+
+        Args:
+            parent_obj: Corridor parent object
+            sections: GroundSections for the corridor
+        """
+        parent_obj["saikei_ground_stations"] = sections.stations.tolist()
+        parent_obj["saikei_ground_offsets"] = sections.offsets.tolist()
+        parent_obj["saikei_ground_elevations"] = np.ascontiguousarray(
+            sections.elevations, dtype=np.float32
+        ).ravel()
+
+    @classmethod
+    def get_ground_sections(cls, parent_obj: bpy.types.Object) -> Optional[Any]:
+        """
+        Read the existing-ground sections stored on a corridor parent object.
+
+        Args:
+            parent_obj: Corridor parent object
+
+        Returns:
+            GroundSections, or None if the corridor has none
+        """
+        from ..core.existing_ground import GroundSections
+
+        if "saikei_ground_elevations" not in parent_obj:
+            return None
+
+        stations = np.array(parent_obj["saikei_ground_stations"], dtype=np.float64)
+        offsets = np.array(parent_obj["saikei_ground_offsets"], dtype=np.float64)
+        elevations = np.array(parent_obj["saikei_ground_elevations"], dtype=np.float32)
+        return GroundSections(
+            stations=stations,
+            offsets=offsets,
+            elevations=elevations.reshape(len(stations), len(offsets)),
+        )
+
+    @classmethod
+    def sample_ground_sections(
+        cls,
+        parent_obj: bpy.types.Object,
+        terrain: Any,
+        buffer: float = 10.0,
+        spacing: float = 1.0
+    ) -> Optional[Any]:
+        """
+        Sample existing ground at every station of a corridor and store it.
+
+        Args:
+            parent_obj: Corridor parent object with a dependency record
+            terrain: Terrain source with elevations_at(xy)
+            buffer: Width sampled beyond the assembly edges (m)
+            spacing: Distance between sampled offsets (m)
+
+        Returns:
+            GroundSections, or None if the corridor's sources are missing
+        """
+        from ..core.existing_ground import sample_ground_sections, section_offsets
+
+        sources = cls._load_dependency_sources(parent_obj, cls.get_dependency(parent_obj))
+        if sources is None:
+            return None
+
+        stations, assembly = sources
+        offsets = section_offsets(
+            assembly, [s.station for s in stations], buffer=buffer, spacing=spacing
+        )
+        sections = sample_ground_sections(terrain, stations, offsets)
+        cls.set_ground_sections(parent_obj, sections)
+        return sections
 
     @classmethod
     def generate_mesh(cls, corridor: Any, lod: int = 1) -> Optional[bpy.types.Object]:
@@ -382,7 +909,9 @@ class Corridor(core_tool.Corridor):
         stations: List["StationPoint"],
         assembly: "AssemblyWrapper",
         name: str = "Corridor",
-        interval: float = 10.0
+        interval: float = 10.0,
+        alignment: Optional["AlignmentWrapper"] = None,
+        use_alignment_curve: bool = True
     ) -> Tuple[Optional[Any], Dict[str, Any]]:
         """
         Create an IFC IfcSectionedSolidHorizontal corridor solid.
@@ -390,23 +919,31 @@ class Corridor(core_tool.Corridor):
         This is the proper IFC 4.3 method for creating corridors - it creates
         native IFC geometry instead of converting Blender mesh to IFC.
 
+        When an alignment is given and its IfcAlignment has a geometric
+        representation, the solid sweeps along that IfcGradientCurve (or
+        IfcCompositeCurve) and only sections where the profile changes are
+        written; IFC interpolates the tagged profiles in between. Otherwise
+        a polyline through every station is used as the directrix.
+
         Args:
             stations: List of StationPoint objects from core
             assembly: AssemblyWrapper with component data
             name: Name for the corridor
             interval: Station interval (for metadata)
+            alignment: AlignmentWrapper the stations were generated from
+            use_alignment_curve: Use the alignment's own curve as directrix
 
         Returns:
             Tuple of (IfcSectionedSolidHorizontal entity, summary dict)
         """
         from .ifc import Ifc
         from ..core.native_ifc_corridor import (
-            CorridorModeler,
-            create_profile_from_assembly,
-            create_tagged_cross_section_profile,
-            PointTags
+            create_profiles_from_assembly,
+            create_section_positions,
+            find_alignment_directrix,
+            select_changed_sections,
+            ProfileCache,
         )
-        from ..core.corridor import AlignmentWrapper
 
         ifc_file = Ifc.get()
         if ifc_file is None:
@@ -418,66 +955,62 @@ class Corridor(core_tool.Corridor):
             return None, {"error": "Need at least 2 stations"}
 
         try:
-            # Create directrix (3D alignment curve) from stations
-            points = []
-            for station_point in stations:
-                point = ifc_file.create_entity(
-                    "IfcCartesianPoint",
-                    Coordinates=(station_point.x, station_point.y, station_point.z)
-                )
-                points.append(point)
-
-            directrix = ifc_file.create_entity(
-                "IfcPolyline",
-                Points=points
+            # Create cross-section profiles for each station
+            # Note: pavement_thickness is calculated from assembly components automatically
+            # Stations with identical tagged profiles share one profile entity
+            profile_cache = ProfileCache(ifc_file)
+            profiles = create_profiles_from_assembly(
+                ifc_file=ifc_file,
+                assembly=assembly,
+                stations=[s.station for s in stations],
+                # pavement_thickness auto-calculated from assembly.components
+                profile_cache=profile_cache
             )
 
-            logger.info(f"Created directrix with {len(points)} points")
+            directrix = None
+            if use_alignment_curve and alignment is not None:
+                directrix = find_alignment_directrix(alignment.ifc_alignment)
+                if directrix is None:
+                    logger.warning(
+                        "Alignment has no geometric representation, "
+                        "using a station polyline as directrix"
+                    )
+
+            station_values = np.array(
+                [s.station for s in stations], dtype=np.float64
+            )
 
-            # Create cross-section profiles for each station
-            # Note: pavement_thickness is calculated from assembly components automatically
-            cross_sections = []
-            for station_point in stations:
-                profile = create_profile_from_assembly(
-                    ifc_file=ifc_file,
-                    assembly=assembly,
-                    station=station_point.station
-                    # pavement_thickness auto-calculated from assembly.components
+            if directrix is not None:
+                # Sweep along the alignment curve; only profile changes
+                # need a section. Positions are distances along the curve.
+                keep = select_changed_sections(profiles)
+                distances = alignment.distances_at(station_values[keep])
+                cross_sections = [profiles[i] for i in keep]
+                logger.info(
+                    f"Using {directrix.is_a()} #{directrix.id()} as directrix"
                 )
-                cross_sections.append(profile)
-
-            logger.info(f"Created {len(cross_sections)} cross-section profiles")
+            else:
+                # Create directrix (3D alignment curve) from stations
+                points = [
+                    ifc_file.create_entity(
+                        "IfcCartesianPoint", Coordinates=(s.x, s.y, s.z)
+                    )
+                    for s in stations
+                ]
+                directrix = ifc_file.create_entity("IfcPolyline", Points=points)
+                distances = station_values
+                cross_sections = profiles
+                logger.info(f"Created directrix with {len(points)} points")
+
+            logger.info(
+                f"Created {len(profile_cache)} profiles for "
+                f"{len(cross_sections)} cross-sections"
+            )
 
             # Create positions for each cross-section
             # Per IFC 4.3: IfcAxis2PlacementLinear.Location must be IfcPointByDistanceExpression
             # (NOT IfcDistanceExpression which doesn't exist in IFC 4.3)
-            #
-            # CRITICAL: DistanceAlong is IfcCurveMeasureSelect which requires a wrapped
-            # entity instance (IfcLengthMeasure), NOT a raw float value.
-            # See ifc_geometry_builders.py for the same pattern with SegmentStart/SegmentLength.
-            positions = []
-            for station_point in stations:
-                # Wrap distance value as IfcLengthMeasure entity
-                distance_along = ifc_file.create_entity(
-                    "IfcLengthMeasure",
-                    float(station_point.station)
-                )
-
-                point_by_distance = ifc_file.create_entity(
-                    "IfcPointByDistanceExpression",
-                    DistanceAlong=distance_along,
-                    OffsetLateral=0.0,
-                    OffsetVertical=0.0,
-                    BasisCurve=directrix  # Required in IFC 4.3
-                )
-
-                placement = ifc_file.create_entity(
-                    "IfcAxis2PlacementLinear",
-                    Location=point_by_distance,
-                    Axis=None,
-                    RefDirection=None
-                )
-                positions.append(placement)
+            positions = create_section_positions(ifc_file, directrix, distances)
 
             logger.info(f"Created {len(positions)} cross-section positions")
 
@@ -498,7 +1031,9 @@ class Corridor(core_tool.Corridor):
                 "start_station": stations[0].station,
                 "end_station": stations[-1].station,
                 "length": stations[-1].station - stations[0].station,
-                "profile_count": len(cross_sections),
+                "profile_count": len(profile_cache),
+                "cross_section_count": len(cross_sections),
+                "directrix_type": directrix.is_a(),
                 "corridor_solid_id": corridor_solid.id(),
                 "ifc_type": "IfcSectionedSolidHorizontal"
             }
@@ -516,263 +1051,141 @@ class Corridor(core_tool.Corridor):
     # =========================================================================
 
     @classmethod
-    def _get_profile_points(
+    def _fill_mesh_arrays(
         cls,
-        assembly: "AssemblyWrapper",
-        station: float = 0.0,
-        pavement_thickness: float = None
-    ) -> List[Tuple[float, float]]:
+        mesh: bpy.types.Mesh,
+        stations: List["StationPoint"],
+        profiles: np.ndarray,
+        smooth: bool = False,
+        start_cap: bool = True,
+        end_cap: bool = True
+    ) -> None:
         """
-        Create a CLOSED cross-section profile polygon from assembly components.
+        Populate an empty mesh from stacked station profiles in bulk.
 
-        The profile forms a complete closed loop suitable for creating a solid:
-        - Top edge: left to right across all components
-        - Right edge: vertical closure going down
-        - Bottom edge: right to left (offset down by pavement thickness)
-        - Left edge: vertical closure going up to start
-
-        IMPORTANT: If the assembly has a constraint_manager, constraints are
-        applied at the given station to modify component widths and slopes.
+        Vertices, loops and polygons are written with ``foreach_set`` so no
+        per-vertex Python objects are created.
 
         Args:
-            assembly: AssemblyWrapper instance (may include constraint_manager)
-            station: Current station along alignment for constraint evaluation
-            pavement_thickness: Thickness of pavement layer. If None, uses the
-                maximum thickness from all assembly components.
-
-        Returns:
-            List of (offset, elevation) tuples forming a closed polygon
+            mesh: Empty Blender mesh to fill
+            stations: StationPoint objects (one per profile)
+            profiles: (N, P, 2) array of (offset, elevation) points
+            smooth: Whether to mark all polygons as smooth shaded
+            start_cap: Close the mesh at the first station
+            end_cap: Close the mesh at the last station
         """
-        # Calculate actual thickness from assembly components if not provided
-        if pavement_thickness is None:
-            if assembly.components:
-                # Use maximum thickness across all components
-                pavement_thickness = max(
-                    getattr(c, 'thickness', 0.15) for c in assembly.components
-                )
-                logger.debug(f"Using component thickness: {pavement_thickness}m")
-            else:
-                pavement_thickness = 0.15  # Default fallback
-
-        # Check if we have constraints to apply
-        has_constraints = (
-            hasattr(assembly, 'constraint_manager') and
-            assembly.constraint_manager is not None
+        positions = np.array(
+            [(s.x, s.y, s.z) for s in stations], dtype=np.float64
+        )
+        bearings = np.array([s.direction for s in stations], dtype=np.float64)
+        cls._fill_mesh_from_arrays(
+            mesh, positions, bearings, profiles, smooth,
+            start_cap=start_cap, end_cap=end_cap
         )
-
-        # Separate left and right components
-        left_components = [c for c in assembly.components if c.offset < 0]
-        right_components = [c for c in assembly.components if c.offset >= 0]
-
-        # Sort: left components by offset descending (furthest left first)
-        # right components by offset ascending (centerline first)
-        left_components.sort(key=lambda c: c.offset)  # Most negative first
-        right_components.sort(key=lambda c: c.offset)  # Least positive first
-
-        # Build TOP edge points (left to right)
-        top_points = []
-
-        # Track cumulative offsets with constraints applied
-        left_cumulative = 0.0
-        left_elev = 0.0
-
-        # Process left side (furthest left to centerline)
-        for component in left_components:
-            # Apply constraints if available
-            if has_constraints:
-                width = assembly.get_component_value(
-                    component.name, "width", station, component.width
-                )
-                slope = assembly.get_component_value(
-                    component.name, "cross_slope", station, component.slope
-                )
-            else:
-                width = component.width
-                slope = component.slope
-
-            # Left components: offset is negative, width extends toward center
-            outer_offset = -(left_cumulative + width)
-            inner_offset = -left_cumulative
-            outer_elev = left_elev - slope * width
-            inner_elev = left_elev
-
-            # Update cumulative for next component
-            left_cumulative += width
-            left_elev = outer_elev
-
-            # Add outer point first (further from center)
-            if not top_points or abs(top_points[-1][0] - outer_offset) > 0.001:
-                top_points.append((outer_offset, outer_elev))
-            # Add inner point (closer to center)
-            if abs(top_points[-1][0] - inner_offset) > 0.001:
-                top_points.append((inner_offset, inner_elev))
-
-        # Track cumulative offsets for right side
-        right_cumulative = 0.0
-        right_elev = 0.0
-
-        # Process right side (centerline to furthest right)
-        for component in right_components:
-            # Apply constraints if available
-            if has_constraints:
-                width = assembly.get_component_value(
-                    component.name, "width", station, component.width
-                )
-                slope = assembly.get_component_value(
-                    component.name, "cross_slope", station, component.slope
-                )
-            else:
-                width = component.width
-                slope = component.slope
-
-            # Right components: offset is positive, width extends away from center
-            inner_offset = right_cumulative
-            outer_offset = right_cumulative + width
-            inner_elev = right_elev
-            outer_elev = right_elev - slope * width
-
-            # Update cumulative for next component
-            right_cumulative += width
-            right_elev = outer_elev
-
-            # Add inner point first (closer to center)
-            if not top_points or abs(top_points[-1][0] - inner_offset) > 0.001:
-                top_points.append((inner_offset, inner_elev))
-            # Add outer point (further from center)
-            if abs(top_points[-1][0] - outer_offset) > 0.001:
-                top_points.append((outer_offset, outer_elev))
-
-        if not top_points:
-            # Fallback: create a simple rectangular profile
-            top_points = [(-3.6, 0.0), (3.6, 0.0)]
-
-        # Build BOTTOM edge points (reverse of top, offset down by thickness)
-        bottom_points = []
-        for offset, elev in reversed(top_points):
-            bottom_points.append((offset, elev - pavement_thickness))
-
-        # Combine into closed polygon:
-        # top points (L→R) + bottom points (R→L) + close back to start
-        closed_profile = top_points + bottom_points
-
-        # Ensure loop is closed (first point == last point conceptually)
-        # The mesh generation will handle connecting last to first via faces
-
-        return closed_profile
 
     @classmethod
-    def _create_station_vertices(
+    def _fill_mesh_from_arrays(
         cls,
-        station: "StationPoint",
-        profile_points: List[Tuple[float, float]],
-        bm: bmesh.types.BMesh
-    ) -> List[bmesh.types.BMVert]:
+        mesh: bpy.types.Mesh,
+        positions: np.ndarray,
+        bearings: np.ndarray,
+        profiles: np.ndarray,
+        smooth: bool = False,
+        start_cap: bool = True,
+        end_cap: bool = True
+    ) -> None:
         """
-        Create vertices at a specific station from closed profile polygon.
-
-        Transforms 2D cross-section points to 3D space based on
-        station position and bearing.
+        Populate an empty mesh from station frames and profiles in bulk.
 
         Args:
-            station: StationPoint with position and bearing
-            profile_points: List of (offset, elevation) tuples forming closed polygon
-            bm: BMesh to add vertices to
-
-        Returns:
-            List of created BMesh vertices (in profile order)
+            mesh: Empty Blender mesh to fill
+            positions: (N, 3) centerline positions
+            bearings: (N,) horizontal bearings (radians)
+            profiles: (N, P, 2) array of (offset, elevation) points
+            smooth: Whether to mark all polygons as smooth shaded
+            start_cap: Close the mesh at the first station
+            end_cap: Close the mesh at the last station
         """
-        vertices = []
+        from ..core.corridor import (
+            transform_profiles,
+            build_tube_topology,
+            collapse_coincident_points,
+        )
 
-        x, y, z = station.x, station.y, station.z
-        bearing = station.direction
+        vertices = transform_profiles(
+            np.asarray(positions, dtype=np.float64),
+            np.asarray(bearings, dtype=np.float64),
+            np.asarray(profiles, dtype=np.float64)
+        )
+        station_count, point_count = vertices.shape[:2]
 
-        cos_bearing = math.cos(bearing)
-        sin_bearing = math.sin(bearing)
+        loop_vertices, _, loop_totals = build_tube_topology(
+            station_count, point_count, start_cap=start_cap, end_cap=end_cap
+        )
+        # Zero-width components would leave duplicate vertices and
+        # zero-area quads
+        vertices, loop_vertices, loop_starts, loop_totals = collapse_coincident_points(
+            vertices, loop_vertices, loop_totals
+        )
 
-        for offset, elevation in profile_points:
-            # Transform 2D profile point to 3D world coordinates
-            # offset is perpendicular to alignment direction
-            # positive offset = right side, negative = left side
-            vert_x = x - offset * sin_bearing
-            vert_y = y + offset * cos_bearing
-            vert_z = z + elevation
+        mesh.vertices.add(len(vertices))
+        mesh.vertices.foreach_set(
+            "co", vertices.astype(np.float32).ravel()
+        )
 
-            vert = bm.verts.new((vert_x, vert_y, vert_z))
-            vertices.append(vert)
+        mesh.loops.add(len(loop_vertices))
+        mesh.loops.foreach_set("vertex_index", loop_vertices)
 
-        return vertices
+        mesh.polygons.add(len(loop_starts))
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        if bpy.app.version < (4, 0, 0):
+            # Derived from loop_start from Blender 4.0 onwards
+            mesh.polygons.foreach_set("loop_total", loop_totals)
 
-    @classmethod
-    def _create_quad_strips(
-        cls,
-        bm: bmesh.types.BMesh,
-        all_vertices: List[List[bmesh.types.BMVert]]
-    ):
-        """
-        Connect adjacent stations with quad faces, forming a closed tube.
+        mesh.update(calc_edges=True)
 
-        For closed profile polygons, this creates quad strips that wrap around
-        completely, connecting the last profile vertex back to the first.
+        if smooth:
+            mesh.polygons.foreach_set(
+                "use_smooth", np.ones(len(loop_starts), dtype=bool)
+            )
 
-        Args:
-            bm: BMesh to add faces to
-            all_vertices: List of vertex lists (one per station)
+    @classmethod
+    def _get_profile_points(
+        cls,
+        assembly: "AssemblyWrapper",
+        station: float = 0.0,
+        pavement_thickness: float = None
+    ) -> List[Tuple[float, float]]:
         """
-        for i in range(len(all_vertices) - 1):
-            station_verts_1 = all_vertices[i]
-            station_verts_2 = all_vertices[i + 1]
-            num_verts = len(station_verts_1)
+        Create a CLOSED cross-section profile polygon from assembly components.
 
-            # Create quad faces connecting adjacent vertices
-            for j in range(num_verts):
-                # Use modulo to wrap from last vertex back to first
-                j_next = (j + 1) % num_verts
+        The profile forms a complete closed loop suitable for creating a solid:
+        - Top edge: left to right across all components
+        - Right edge: vertical closure going down
+        - Bottom edge: right to left (offset down by pavement thickness)
+        - Left edge: vertical closure going up to start
 
-                v1 = station_verts_1[j]
-                v2 = station_verts_1[j_next]
-                v3 = station_verts_2[j_next]
-                v4 = station_verts_2[j]
+        IMPORTANT: If the assembly has a constraint_manager, constraints are
+        applied at the given station to modify component widths and slopes.
 
-                try:
-                    bm.faces.new([v1, v2, v3, v4])
-                except ValueError:
-                    # Face may already exist or be degenerate
-                    pass
+        Single-station form of ``AssemblyWrapper.profiles_at``.
 
-        bm.verts.index_update()
-        bm.faces.index_update()
+        Args:
+            assembly: AssemblyWrapper instance (may include constraint_manager)
+            station: Current station along alignment for constraint evaluation
+            pavement_thickness: Thickness of pavement layer. If None, uses the
+                maximum thickness from all assembly components.
 
-    @classmethod
-    def _create_end_caps(
-        cls,
-        bm: bmesh.types.BMesh,
-        all_vertices: List[List[bmesh.types.BMVert]]
-    ):
+        Returns:
+            List of (offset, elevation) tuples forming a closed polygon
         """
-        Create end cap faces at corridor start and end.
+        profile = np.array(assembly.profiles_at([station])[0])
 
-        Args:
-            bm: BMesh to add faces to
-            all_vertices: List of vertex lists
-        """
-        if len(all_vertices) < 2:
-            return
-
-        start_verts = all_vertices[0]
-        if len(start_verts) > 2:
-            try:
-                bm.faces.new(start_verts)
-            except ValueError:
-                pass
-
-        end_verts = all_vertices[-1]
-        if len(end_verts) > 2:
-            try:
-                bm.faces.new(list(reversed(end_verts)))
-            except ValueError:
-                pass
-
-        bm.faces.index_update()
+        if pavement_thickness is not None:
+            half = len(profile) // 2
+            profile[half:, 1] = profile[:half][::-1, 1] - pavement_thickness
+
+        return [(float(offset), float(elev)) for offset, elev in profile]
 
     @classmethod
     def _apply_materials(cls, mesh_obj: bpy.types.Object, assembly: "AssemblyWrapper"):
@@ -122,6 +122,19 @@ class Georeference(core_tool.Georeference):
 
         return bool(map_conversion and projected_crs)
 
+    @classmethod
+    def get_georeferencing(cls):
+        """
+        Get the georeferencing of the current IFC file.
+
+        Returns:
+            NativeIfcGeoreferencing for map/local conversions, or None if
+            the file has no georeferencing set up
+        """
+        if not cls.has_georeferencing():
+            return None
+        return cls._get_georef_manager()
+
     @classmethod
     def get_crs(cls) -> Optional[Dict]:
         """
@@ -429,19 +429,20 @@ class ProfileViewRenderer:
 
                 # Sample at regular intervals along the entire alignment
                 num_samples = 100  # More samples for smooth display
-                for i in range(num_samples):
-                    t = i / (num_samples - 1)
-                    station = start_station + t * (end_station - start_station)
-
-                    # Query elevation at this station
-                    try:
-                        elevation = valign.get_elevation(station)
-                        if elevation is not None:
-                            x, y = self.world_to_screen(station, elevation, data)
-                            vertices.append((x, y))
-                    except Exception as e:
-                        # Log error for debugging but continue
-                        logger.warning("Could not query elevation at station %s: %s", station, e)
+                stations = np.linspace(start_station, end_station, num_samples)
+
+                # Query all elevations in one batch
+                try:
+                    elevations = valign.elevations(stations)
+                except Exception as e:
+                    # Log error for debugging but continue
+                    logger.warning("Could not query elevations for %s: %s", valign.name, e)
+                    elevations = np.full(num_samples, np.nan)
+
+                valid = ~np.isnan(elevations)
+                for station, elevation in zip(stations[valid].tolist(), elevations[valid].tolist()):
+                    x, y = self.world_to_screen(station, elevation, data)
+                    vertices.append((x, y))
 
             # Draw vertical alignment line
             if len(vertices) >= 2:
@@ -0,0 +1,214 @@
+# ==============================================================================
+# Saikei Civil - Civil Engineering Tools for Blender
+# Copyright (c) 2025 Michael Yoder / Desert Springs Civil Engineering PLLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+#
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# Primary Author: Michael Yoder
+# Company: Desert Springs Civil Engineering PLLC
+# ==============================================================================
+"""
+Terrain tool implementation - Blender-specific terrain operations.
+
+This module implements the terrain interface from core.tool. It reads the
+evaluated triangles of terrain mesh objects in bulk and hands them to the
+cached, pure-NumPy TerrainIndex in core.terrain_index, opens raster
+DEMs (core.terrain_dem) georeferenced through the project's
+IfcMapConversion, and imports LandXML TIN surfaces
+(core.landxml_surface) as terrain meshes.
+
+Usage:
+    from saikei_civil.tool import Terrain
+
+    index = Terrain.get_index(bpy.data.objects["Existing Ground"])
+    elevations = index.elevations_at(xy)
+
+    dem = Terrain.get_dem("/data/ground.asc")
+    elevations = dem.elevations_at(xy)
+
+    obj = Terrain.import_landxml_surface("/data/survey.xml", "EG")
+"""
+import os
+import tempfile
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import bpy
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..core.terrain_dem import RasterTerrain
+    from ..core.terrain_index import TerrainIndex
+
+from ..core import tool as core_tool
+from ..core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class Terrain(core_tool.Terrain):
+    """Blender implementation of terrain operations."""
+
+    @classmethod
+    def get_mesh_arrays(
+        cls,
+        obj: bpy.types.Object
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get world-space triangle data of a terrain mesh.
+
+        Modifiers are applied and polygons triangulated; vertices and
+        triangles are read with ``foreach_get``.
+
+        Args:
+            obj: Terrain mesh object
+
+        Returns:
+            Tuple of ((V, 3) float64 vertices, (F, 3) int64 triangle indices)
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        try:
+            mesh.calc_loop_triangles()
+
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+            mesh.vertices.foreach_get("co", coords)
+            triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int64)
+            mesh.loop_triangles.foreach_get("vertices", triangles)
+        finally:
+            obj_eval.to_mesh_clear()
+
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        vertices = coords.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        return vertices, triangles.reshape(-1, 3)
+
+    @classmethod
+    def get_index(cls, obj: bpy.types.Object) -> "TerrainIndex":
+        """
+        Get the elevation index for a terrain mesh.
+
+        The index is cached by a hash of the mesh data, so unchanged
+        terrain is only indexed once.
+
+        Args:
+            obj: Terrain mesh object
+
+        Returns:
+            TerrainIndex over the mesh's world-space triangles
+        """
+        from ..core.terrain_index import get_terrain_index
+
+        vertices, faces = cls.get_mesh_arrays(obj)
+        index = get_terrain_index(vertices, faces)
+        logger.debug(
+            "Terrain index for '%s': %d triangles", obj.name, index.face_count
+        )
+        return index
+
+    @classmethod
+    def get_dem(cls, filepath: str) -> "RasterTerrain":
+        """
+        Open a raster DEM georeferenced to the project.
+
+        When the IFC file has an IfcMapConversion, the DEM is taken to be
+        in its map coordinates and queried with local coordinates;
+        otherwise DEM coordinates are used as local coordinates.
+
+        ASCII grids are cached as .npy files under the system temp
+        directory, so DEMs in read-only or shared folders can be opened.
+
+        Args:
+            filepath: Path to an .asc or .flt grid (Blender-relative paths
+                are resolved)
+
+        Returns:
+            RasterTerrain over the memory-mapped grid
+        """
+        from ..core.terrain_dem import open_dem
+        from .georeference import Georeference
+
+        georeferencing = Georeference.get_georeferencing()
+        if georeferencing is None:
+            logger.info("No IfcMapConversion, using DEM coordinates as local")
+
+        cache_dir = os.path.join(tempfile.gettempdir(), "saikei_civil", "dem_cache")
+        return open_dem(
+            bpy.path.abspath(filepath), cache_dir=cache_dir, georeferencing=georeferencing
+        )
+
+    @classmethod
+    def import_landxml_surface(
+        cls,
+        filepath: str,
+        surface_name: Optional[str] = None
+    ) -> bpy.types.Object:
+        """
+        Import a LandXML TIN surface as a terrain mesh object.
+
+        The surface is streamed into NumPy arrays, converted from map to
+        local coordinates when the project has an IfcMapConversion, and
+        written to the mesh with ``foreach_set``. The elevation index is
+        built straight away so the first sampling query hits the cache.
+
+        Args:
+            filepath: Path to the LandXML file (Blender-relative paths are
+                resolved)
+            surface_name: Surface to import; the first surface if None
+
+        Returns:
+            The created terrain mesh object, linked to the active collection
+
+        Raises:
+            ValueError: If the surface is missing or malformed
+        """
+        from ..core.landxml_surface import read_landxml_surface
+        from ..core.terrain_index import get_terrain_index
+        from .georeference import Georeference
+
+        georeferencing = Georeference.get_georeferencing()
+
+        surface = read_landxml_surface(
+            bpy.path.abspath(filepath),
+            surface_name=surface_name or None,
+            georeferencing=georeferencing,
+        )
+        # Blender stores float32 coordinates; index those so the cache key
+        # matches what get_mesh_arrays() reads back from the mesh
+        coords = surface.points.astype(np.float32)
+        face_count = len(surface.faces)
+
+        mesh = bpy.data.meshes.new(surface.name or "Surface")
+        mesh.vertices.add(len(coords))
+        mesh.vertices.foreach_set("co", coords.ravel())
+        mesh.loops.add(face_count * 3)
+        mesh.loops.foreach_set("vertex_index", surface.faces.astype(np.int32).ravel())
+        mesh.polygons.add(face_count)
+        mesh.polygons.foreach_set(
+            "loop_start", np.arange(0, face_count * 3, 3, dtype=np.int32)
+        )
+        if bpy.app.version < (4, 0, 0):
+            # Derived from loop_start from Blender 4.0 onwards
+            mesh.polygons.foreach_set(
+                "loop_total", np.full(face_count, 3, dtype=np.int32)
+            )
+        mesh.update(calc_edges=True)
+
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        bpy.context.collection.objects.link(obj)
+
+        get_terrain_index(coords.astype(np.float64), surface.faces)
+        logger.info(
+            "Imported LandXML surface '%s' as '%s'", surface.name, obj.name
+        )
+        return obj
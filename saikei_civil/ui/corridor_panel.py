@@ -152,6 +152,13 @@ class SAIKEI_PT_corridor_generation(Panel):
         if corridor_props:
             col.prop(corridor_props, "station_interval")
             col.prop(corridor_props, "curve_densification")
+            col.prop(corridor_props, "chord_tolerance")
+            col.prop(corridor_props, "chunk_length")
+            col.prop(corridor_props, "use_parallel")
+            row = col.row()
+            row.active = corridor_props.use_parallel
+            row.prop(corridor_props, "parallel_min_stations")
+            col.prop(corridor_props, "use_alignment_directrix")
             col.prop(corridor_props, "lod")
             col.separator()
             col.prop(corridor_props, "apply_materials")
@@ -190,6 +197,12 @@ class SAIKEI_PT_corridor_generation(Panel):
             icon='TRASH'
         )
 
+        col.operator(
+            "bc.sample_corridor_ground",
+            text="Sample Existing Ground",
+            icon='MESH_GRID'
+        )
+
         # Show last generation stats if available
         if corridor_props and corridor_props.last_vertex_count > 0:
             layout.separator()
@@ -130,6 +130,43 @@ class BC_CorridorProperties(PropertyGroup):
         max=3.0
     )
 
+    chord_tolerance: FloatProperty(
+        name="Chord Tolerance",
+        description="Maximum gap between a curve and the straight mesh edge between stations; sharper curves get more stations (meters)",
+        default=0.01,
+        min=0.001,
+        max=0.5,
+        precision=3,
+        unit='LENGTH'
+    )
+
+    chunk_length: FloatProperty(
+        name="Chunk Length",
+        description="Station length of each corridor mesh chunk; edits only regenerate the chunks they touch (meters)",
+        default=500.0,
+        min=50.0,
+        unit='LENGTH'
+    )
+
+    use_parallel: BoolProperty(
+        name="Parallel Evaluation",
+        description="Evaluate corridor geometry on all CPU cores (speeds up very long corridors)",
+        default=False
+    )
+
+    parallel_min_stations: IntProperty(
+        name="Parallel From",
+        description="Station count from which parallel evaluation is used; shorter corridors are evaluated on one core",
+        default=20000,
+        min=0
+    )
+
+    use_alignment_directrix: BoolProperty(
+        name="Sweep Along Alignment",
+        description="Export the IFC corridor along the alignment's own curve, writing sections only where the cross-section changes",
+        default=True
+    )
+
     lod: EnumProperty(
         name="Level of Detail",
         description="Mesh detail level for corridor generation",
@@ -40,6 +40,35 @@ from ..core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _owning_assembly(props):
+    """Get the assembly a component or constraint PropertyGroup belongs to."""
+    path = props.path_from_id()
+    return props.id_data.path_resolve(path.rsplit('.', 1)[0])
+
+
+def _update_component(self, context):
+    """
+    Update callback for component geometry properties.
+    Schedules regeneration of corridors built from the owning assembly.
+    """
+    from ..core.corridor_dependencies import get_change_tracker
+
+    get_change_tracker().assembly_changed(_owning_assembly(self).name)
+
+
+def _update_constraint(self, context):
+    """
+    Update callback for constraint properties.
+    Schedules regeneration of the station ranges whose constraints changed.
+    """
+    from ..core.corridor_dependencies import get_change_tracker
+
+    assembly = _owning_assembly(self)
+    get_change_tracker().constraints_changed(
+        assembly.name, assembly_constraints_to_manager(assembly)
+    )
+
+
 class BC_ComponentProperties(PropertyGroup):
     """Properties for a single cross-section component (lane, shoulder, etc.)"""
 
@@ -63,6 +92,7 @@ class BC_ComponentProperties(PropertyGroup):
         description="Component name",
         default="Component",
         maxlen=64,
+        update=_update_component,
     )
     
     component_type: EnumProperty(
@@ -78,6 +108,7 @@ class BC_ComponentProperties(PropertyGroup):
             ('CUSTOM', "Custom", "Custom component"),
         ],
         default='LANE',
+        update=_update_component,
     )
     
     # Geometric properties
@@ -89,6 +120,7 @@ class BC_ComponentProperties(PropertyGroup):
         max=20.0,
         precision=3,
         unit='LENGTH',
+        update=_update_component,
     )
     
     cross_slope: FloatProperty(
@@ -98,6 +130,7 @@ class BC_ComponentProperties(PropertyGroup):
         min=-0.20,
         max=0.20,
         precision=4,
+        update=_update_component,
     )
     
     offset: FloatProperty(
@@ -106,6 +139,7 @@ class BC_ComponentProperties(PropertyGroup):
         default=0.0,
         precision=3,
         unit='LENGTH',
+        update=_update_component,
     )
     
     side: EnumProperty(
@@ -117,6 +151,7 @@ class BC_ComponentProperties(PropertyGroup):
             ('RIGHT', "Right", "Right side of alignment"),
         ],
         default='CENTER',
+        update=_update_component,
     )
     
     # Material layers (simplified)
@@ -135,6 +170,7 @@ class BC_ComponentProperties(PropertyGroup):
         max=1.0,
         precision=3,
         unit='LENGTH',
+        update=_update_component,
     )
     
     # Component-specific properties
@@ -221,6 +257,7 @@ class BC_ComponentProperties(PropertyGroup):
         max=1.5,
         precision=2,
         unit='LENGTH',
+        update=_update_component,
     )
     
     # Status
@@ -259,6 +296,7 @@ class BC_ConstraintProperties(PropertyGroup):
             ('RANGE', "Range", "Station range with interpolation"),
         ],
         default='RANGE',
+        update=_update_constraint,
     )
 
     # Component to modify
@@ -267,6 +305,7 @@ class BC_ConstraintProperties(PropertyGroup):
         description="Name of component to modify",
         default="",
         maxlen=64,
+        update=_update_constraint,
     )
 
     # Parameter to modify
@@ -279,6 +318,7 @@ class BC_ConstraintProperties(PropertyGroup):
             ('offset', "Offset", "Offset from centerline"),
         ],
         default='width',
+        update=_update_constraint,
     )
 
     # Station range (start_station == end_station for POINT constraints)
@@ -289,6 +329,7 @@ class BC_ConstraintProperties(PropertyGroup):
         min=0.0,
         precision=3,
         unit='LENGTH',
+        update=_update_constraint,
     )
 
     end_station: FloatProperty(
@@ -298,6 +339,7 @@ class BC_ConstraintProperties(PropertyGroup):
         min=0.0,
         precision=3,
         unit='LENGTH',
+        update=_update_constraint,
     )
 
     # Value range (start_value == end_value for POINT constraints)
@@ -306,6 +348,7 @@ class BC_ConstraintProperties(PropertyGroup):
         description="Parameter value at start station",
         default=3.6,
         precision=4,
+        update=_update_constraint,
     )
 
     end_value: FloatProperty(
@@ -313,6 +356,7 @@ class BC_ConstraintProperties(PropertyGroup):
         description="Parameter value at end station",
         default=3.6,
         precision=4,
+        update=_update_constraint,
     )
 
     # Interpolation method for range constraints
@@ -325,6 +369,7 @@ class BC_ConstraintProperties(PropertyGroup):
             ('STEP', "Step", "Instant change at end station"),
         ],
         default='LINEAR',
+        update=_update_constraint,
     )
 
     # Enable/disable without deleting
@@ -332,6 +377,7 @@ class BC_ConstraintProperties(PropertyGroup):
         name="Enabled",
         description="Enable or disable this constraint",
         default=True,
+        update=_update_constraint,
     )
 
     # User notes
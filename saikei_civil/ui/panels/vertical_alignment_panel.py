@@ -80,6 +80,8 @@ class VIEW3D_PT_bc_vertical_terrain(Panel):
 
         col = box.column(align=True)
         col.operator("bc.sample_terrain_from_mesh", text="Sample from Mesh", icon='MESH_DATA')
+        col.operator("bc.sample_terrain_from_dem", text="Sample from DEM", icon='IMAGE_DATA')
+        col.operator("bc.import_landxml_surface", text="Import LandXML Surface", icon='MESH_GRID')
 
         # Show terrain data status
         if overlay and len(overlay.data.terrain_points) > 0:
@@ -109,7 +111,7 @@ class VIEW3D_PT_bc_vertical_terrain(Panel):
         col = box.column(align=True)
         col.scale_y = 0.8
         col.label(text="Sample elevation from terrain mesh", icon='INFO')
-        col.label(text="(OBJ/STL) along the active")
+        col.label(text="(OBJ/STL) or DEM grid along the active")
         col.label(text="horizontal alignment.")
 
 